@@ -3,20 +3,22 @@
 Hiring routes are used for hiring based on TA Applications."""
 
 from fastapi import APIRouter, Depends
-import io
-import csv
 from fastapi.responses import StreamingResponse
 
 from backend.models.pagination import Paginated, PaginationParams
 
 from ...services.academics import HiringService
 
-from ...models.academics.hiring.application_review import HiringStatus
+from ...models.academics.hiring.application_review import (
+    HiringStatus,
+    ApplicationReviewCsvRow,
+)
 from ...models.academics.hiring.hiring_assignment import *
 from ...models.academics.hiring.hiring_level import *
 from ...models.academics.hiring.conflict_check import ConflictCheck
 
 from ...api.authentication import registered_user
+from ...api.csv_export import csv_response
 from ...models.user import User
 
 __authors__ = ["Ajay Gandecha"]
@@ -193,21 +195,8 @@ def get_hiring_summary_csv(
     """
     Returns the state of hiring as a summary.
     """
-    # Get the data
-    data = hiring_service.get_hiring_summary_for_csv(subject, term_id)
-    # Create IO Stream
-    stream = io.StringIO()
-    # Create dictionary writer to convert objects to CSV rows
-    # Note: __dict__ converts the Pydantic model into a dictionary of key-value
-    # pairs, enabling access of the object's keys.
-    wr = csv.DictWriter(stream, delimiter=",", fieldnames=list(data[0].__dict__.keys()))
-    wr.writeheader()
-    wr.writerows([d.__dict__ for d in data])
-    # Create HTTP response of type `text/csv`
-    response = StreamingResponse(iter([stream.getvalue()]), media_type="text/csv")
-    response.headers["Content-Disposition"] = "attachment; filename=export.csv"
-    # Return the response
-    return response
+    rows = hiring_service.get_hiring_summary_for_csv(subject, term_id)
+    return csv_response(rows, list(HiringAssignmentCsvRow.model_fields))
 
 
 @api.get("/{course_site_id}/csv", tags=["Hiring"])
@@ -219,21 +208,8 @@ def get_applicants_for_site_csv(
     """
     Returns the state of hiring as a summary.
     """
-    # Get the data
-    data = hiring_service.get_course_site_hiring_status_csv(subject, course_site_id)
-    # Create IO Stream
-    stream = io.StringIO()
-    # Create dictionary writer to convert objects to CSV rows
-    # Note: __dict__ converts the Pydantic model into a dictionary of key-value
-    # pairs, enabling access of the object's keys.
-    wr = csv.DictWriter(stream, delimiter=",", fieldnames=list(data[0].__dict__.keys()))
-    wr.writeheader()
-    wr.writerows([d.__dict__ for d in data])
-    # Create HTTP response of type `text/csv`
-    response = StreamingResponse(iter([stream.getvalue()]), media_type="text/csv")
-    response.headers["Content-Disposition"] = "attachment; filename=export.csv"
-    # Return the response
-    return response
+    rows = hiring_service.get_course_site_hiring_status_csv(subject, course_site_id)
+    return csv_response(rows, list(ApplicationReviewCsvRow.model_fields))
 
 
 @api.get("/summary/{term_id}/phd_applicants", tags=["Hiring"])
@@ -246,11 +222,6 @@ def get_hiring_summary_csv(
     Returns the state of hiring as a summary.
     """
     data = hiring_service.get_phd_applicants(subject, term_id)
-    # Create IO Stream
-    stream = io.StringIO()
-    # Create dictionary writer to convert objects to CSV rows
-    # Note: __dict__ converts the Pydantic model into a dictionary of key-value
-    # pairs, enabling access of the object's keys.
     keys = [
         "id",
         "last_name",
@@ -264,33 +235,23 @@ def get_hiring_summary_csv(
         "student_preferences",
         "instructor_preferences",
     ]
-    wr = csv.DictWriter(stream, delimiter=",", fieldnames=keys)
-    wr.writeheader()
-    rows = []
-    for d in data:
-        rows.append(
-            {
-                "id": d.id,
-                "last_name": d.applicant.last_name,
-                "first_name": d.applicant.first_name,
-                "pid": d.applicant.pid,
-                "onyen": d.applicant.onyen,
-                "email": d.applicant.email,
-                "advisor": d.advisor,
-                "program_pursued": d.program_pursued,
-                "intro_video_url": d.intro_video_url,
-                "student_preferences": ", ".join(d.student_preferences),
-                "instructor_preferences": ", ".join(d.instructor_preferences),
-            }
-        )
-    wr.writerows(rows)
-    # Create HTTP response of type `text/csv`
-    response = StreamingResponse(iter([stream.getvalue()]), media_type="text/csv")
-    response.headers["Content-Disposition"] = (
-        f"attachment; filename=phd_applicants_{term_id}.csv"
+    rows = (
+        {
+            "id": d.id,
+            "last_name": d.applicant.last_name,
+            "first_name": d.applicant.first_name,
+            "pid": d.applicant.pid,
+            "onyen": d.applicant.onyen,
+            "email": d.applicant.email,
+            "advisor": d.advisor,
+            "program_pursued": d.program_pursued,
+            "intro_video_url": d.intro_video_url,
+            "student_preferences": ", ".join(d.student_preferences),
+            "instructor_preferences": ", ".join(d.instructor_preferences),
+        }
+        for d in data
     )
-    # Return the response
-    return response
+    return csv_response(rows, keys, f"phd_applicants_{term_id}.csv")
 
 
 @api.get("/assignments/{course_site_id}", tags=["Hiring"])
@@ -321,38 +282,14 @@ def get_assignments_csv(
     """
     Returns the state of hiring as a summary.
     """
-    data = hiring_service.get_assignment_summary_for_instructors_csv(
+    rows = hiring_service.get_assignment_summary_for_instructors_csv(
         subject, course_site_id
     )
-    # Create IO Stream
-    stream = io.StringIO()
-    # Create dictionary writer to convert objects to CSV rows
-    # Note: __dict__ converts the Pydantic model into a dictionary of key-value
-    # pairs, enabling access of the object's keys.
-    keys = ["first_name", "last_name", "onyen", "pid", "email", "level_title"]
-
-    wr = csv.DictWriter(stream, delimiter=",", fieldnames=keys)
-    wr.writeheader()
-    rows = []
-    for d in data:
-        rows.append(
-            {
-                "first_name": d.first_name,
-                "last_name": d.last_name,
-                "pid": d.pid,
-                "onyen": d.onyen,
-                "email": d.email,
-                "level_title": d.level_title,
-            }
-        )
-    wr.writerows(rows)
-    # Create HTTP response of type `text/csv`
-    response = StreamingResponse(iter([stream.getvalue()]), media_type="text/csv")
-    response.headers["Content-Disposition"] = (
-        f"attachment; filename=hiring_assignments.csv"
+    return csv_response(
+        rows,
+        list(HiringAssignmentSummaryCsvRow.model_fields),
+        "hiring_assignments.csv",
     )
-    # Return the response
-    return response
 
 
 @api.get("/conflict_check/{application_id}", tags=["Hiring"])
@@ -3,7 +3,9 @@
 APIs relative to a specific user."""
 
 from fastapi import APIRouter, Depends
+from fastapi.responses import StreamingResponse
 from ..authentication import registered_user
+from ..csv_export import csv_response
 from ...services.academics.course_site import CourseSiteService
 
 from ...models.user import User
@@ -86,6 +88,24 @@ def get_course_site_roster(
     )
 
 
+@api.get("/{course_site_id}/roster/csv", tags=["My Courses"])
+def get_course_site_roster_csv(
+    course_site_id: int,
+    subject: User = Depends(registered_user),
+    course_site_svc: CourseSiteService = Depends(),
+) -> StreamingResponse:
+    """
+    Export the roster of a course as a CSV file.
+
+    Returns:
+        StreamingResponse
+    """
+    rows = course_site_svc.get_course_site_roster_csv(subject, course_site_id)
+    return csv_response(
+        rows, list(CourseMemberOverview.model_fields), f"roster_{course_site_id}.csv"
+    )
+
+
 @api.get("/{course_site_id}/oh-events/current", tags=["My Courses"])
 def get_current_oh_events(
     course_site_id: int,
@@ -0,0 +1,122 @@
+"""Exposes runtime metrics of CSXL services to administrators."""
+
+from fastapi import APIRouter, Depends
+from sqlalchemy import Engine
+from sqlalchemy.orm import Session
+
+from ...database import database_engines, db_session, pool_stats
+from ...models import User
+from ...models.background_jobs import BackgroundJobStats
+from ...models.database import DatabasePoolStats
+from ...models.identity import IdentityCacheStats
+from ...models.office_hours.live_queue import LiveQueueConsistency
+from ...models.office_hours.similar_tickets_ai import (
+    SimilarTicketCacheStats,
+    SimilarTicketPromptStats,
+)
+from ...services import PermissionService
+from ...services.background_jobs import BackgroundJobRunner, background_job_runner
+from ...services.identity import IdentityCache, identity_cache
+from ...services.office_hours.live_queue import LiveQueueRegistry, live_queue_registry
+from ...services.office_hours.similar_tickets_cache import (
+    SimilarTicketCache,
+    similar_ticket_cache,
+)
+from ...services.office_hours.similar_tickets_prompt import (
+    SimilarTicketPromptMetrics,
+    similar_ticket_prompt_metrics,
+)
+from ...services.permission_engine import PermissionEngine, permission_engine
+from ..authentication import registered_user
+
+__authors__ = ["Riley Chapman"]
+__copyright__ = "Copyright 2025"
+__license__ = "MIT"
+
+openapi_tags = {
+    "name": "(Admin) Metrics",
+    "description": "Retrieve runtime metrics of CSXL services.",
+}
+
+api = APIRouter(prefix="/api/admin/metrics")
+
+
+@api.get("/similar-tickets-cache", tags=["(Admin) Metrics"])
+def get_similar_tickets_cache_metrics(
+    subject: User = Depends(registered_user),
+    permission_service: PermissionService = Depends(),
+    cache: SimilarTicketCache = Depends(similar_ticket_cache),
+) -> SimilarTicketCacheStats:
+    """Returns the hit and miss counters of the similar ticket cache in this worker process."""
+    permission_service.enforce(subject, "*", "*")
+    return cache.stats()
+
+
+@api.get("/background-jobs", tags=["(Admin) Metrics"])
+def get_background_job_metrics(
+    subject: User = Depends(registered_user),
+    permission_service: PermissionService = Depends(),
+    runner: BackgroundJobRunner = Depends(background_job_runner),
+) -> BackgroundJobStats:
+    """Returns the queue depth and job counters of the background job runner in this worker process."""
+    permission_service.enforce(subject, "*", "*")
+    return runner.stats()
+
+
+@api.get("/similar-tickets-prompt", tags=["(Admin) Metrics"])
+def get_similar_tickets_prompt_metrics(
+    subject: User = Depends(registered_user),
+    permission_service: PermissionService = Depends(),
+    metrics: SimilarTicketPromptMetrics = Depends(similar_ticket_prompt_metrics),
+) -> SimilarTicketPromptStats:
+    """Returns the sizes of the similar tickets prompts built in this worker process."""
+    permission_service.enforce(subject, "*", "*")
+    return metrics.stats()
+
+
+@api.get("/live-queues", tags=["(Admin) Metrics"])
+def check_live_queues(
+    subject: User = Depends(registered_user),
+    permission_service: PermissionService = Depends(),
+    session: Session = Depends(db_session),
+    live_queue: LiveQueueRegistry = Depends(live_queue_registry),
+) -> list[LiveQueueConsistency]:
+    """Compares the live office hours queues of this worker process with the database."""
+    permission_service.enforce(subject, "*", "*")
+    return live_queue.check_all(session, repair=False)
+
+
+@api.post("/live-queues/repair", tags=["(Admin) Metrics"])
+def repair_live_queues(
+    subject: User = Depends(registered_user),
+    permission_service: PermissionService = Depends(),
+    session: Session = Depends(db_session),
+    live_queue: LiveQueueRegistry = Depends(live_queue_registry),
+) -> list[LiveQueueConsistency]:
+    """Compares the live office hours queues of this worker process with the database and replaces
+    the inconsistent ones with the database state."""
+    permission_service.enforce(subject, "*", "*")
+    return live_queue.check_all(session)
+
+
+@api.get("/identity", tags=["(Admin) Metrics"])
+def get_identity_metrics(
+    subject: User = Depends(registered_user),
+    permission_service: PermissionService = Depends(),
+    identity: IdentityCache = Depends(identity_cache),
+    engine: PermissionEngine = Depends(permission_engine),
+) -> IdentityCacheStats:
+    """Returns how many database round trips the identity and permission caches of this worker process saved."""
+    permission_service.enforce(subject, "*", "*")
+    return identity.stats(engine)
+
+
+@api.get("/database-pools", tags=["(Admin) Metrics"])
+def get_database_pool_metrics(
+    subject: User = Depends(registered_user),
+    permission_service: PermissionService = Depends(),
+    engines: list[Engine] = Depends(database_engines),
+) -> list[DatabasePoolStats]:
+    """Returns the connection pool counters of the primary and replica databases in this worker process."""
+    permission_service.enforce(subject, "*", "*")
+    return [pool_stats(engine) for engine in engines]
@@ -2,9 +2,10 @@
 
 from fastapi import APIRouter, Depends
 
-from ..api.authentication import registered_user
+from ..api.authentication import bridged_registered_user, registered_user
 
 from ..services.article import ArticleService
+from ..services.bridged import bridged_article_svc
 
 from ..models import User
 from ..models.articles import WelcomeOverview, ArticleOverview, ArticleDraft
@@ -22,19 +23,20 @@ openapi_tags = {
 
 
 @api.get("/welcome", tags=["Articles"])
-def get_welcome_status(
-    subject: User = Depends(registered_user), article_svc: ArticleService = Depends()
+async def get_welcome_status(
+    subject: User = Depends(bridged_registered_user),
+    article_svc: ArticleService = Depends(bridged_article_svc),
 ) -> WelcomeOverview:
     """Retrieves the welcome status."""
-    return article_svc.get_welcome_overview(subject)
+    return await article_svc.get_welcome_overview_async(subject)
 
 
 @api.get("/welcome/unauthenticated", tags=["Articles"])
-def get_welcome_status_unauthenticated(
-    article_svc: ArticleService = Depends(),
+async def get_welcome_status_unauthenticated(
+    article_svc: ArticleService = Depends(bridged_article_svc),
 ) -> WelcomeOverview:
     """Retrieves the welcome status for an unauthenticated user."""
-    return article_svc.get_welcome_overview(None)
+    return await article_svc.get_welcome_overview_async(None)
 
 
 @api.get("/list", tags=["Articles"])
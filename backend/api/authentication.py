@@ -56,18 +56,46 @@ In development, the proxy is not present. Instead, there are two options for aut
 Finally, the `authenticated_pid` function ensures a user is authenticated with PID and Onyen, 
 but does not require that the user be registered in the database. This is only really useful 
 for routes used in the process of registering a user.
+
+Async route handlers use `bridged_registered_user` instead of `registered_user`. It resolves the user
+in the same way, on the `sync_session` of the request's `AsyncSession` through `run_sync`, so that
+authenticating does not hold a thread of the threadpool or a connection of the sync pool.
+
+WebSocket routes use `registered_websocket_user` instead of `registered_user`. Browsers cannot set
+the Authorization header on a WebSocket handshake, so the same JWT is read from a `token` query
+parameter, and invalid tokens close the WebSocket with a policy violation.
+
+Both resolve the user through `UserService.get_by_token`, which reuses users resolved for the same
+token within the last `IDENTITY_CACHE_TTL` seconds (see `backend/services/identity.py`). Tokens carry
+an `iat` claim so that a newly issued token always reads its user from the database.
 """
 
 import jwt
 import requests
-from datetime import datetime, timedelta
-from fastapi import APIRouter, Header, HTTPException, Request, Response, Depends
+from datetime import datetime, timedelta, timezone
+from typing import Callable
+from fastapi import (
+    APIRouter,
+    Header,
+    HTTPException,
+    Request,
+    Response,
+    Depends,
+    WebSocketException,
+    status,
+)
 from fastapi.exceptions import HTTPException
 from fastapi.security import HTTPBearer
 from fastapi.security.http import HTTPAuthorizationCredentials
 from fastapi.responses import RedirectResponse
 from ..env import getenv
-from ..services import UserService, GitHubService
+from sqlalchemy.orm import Session
+from ..database import db_session_factory, run_sync
+from ..services import UserService, GitHubService, PermissionService
+from ..services.bridged import bridged_user_svc
+from ..services.identity import IdentityCache, identity_cache
+from ..services.permission_engine import PermissionEngine, permission_engine
+from ..services.user_search import UserSearch, user_search
 from ..models import User
 
 
@@ -83,24 +111,66 @@ _JWT_SECRET = getenv("JWT_SECRET")
 _JST_ALGORITHM = "HS256"
 
 
+def _user_from_token(user_service: UserService, token: str) -> User | None:
+    """Returns the registered user a JWT was issued to, or None if the token is not valid."""
+    try:
+        auth_info = jwt.decode(token, _JWT_SECRET, algorithms=[_JST_ALGORITHM])
+        return user_service.get_by_token(auth_info["pid"], auth_info.get("iat"))
+    except:
+        return None
+
+
 def registered_user(
     user_service: UserService = Depends(),
     token: HTTPAuthorizationCredentials | None = Depends(HTTPBearer()),
 ) -> User:
     """Returns the authenticated user or raises a 401 HTTPException if the user is not authenticated."""
     if token:
-        try:
-            auth_info = jwt.decode(
-                token.credentials, _JWT_SECRET, algorithms=[_JST_ALGORITHM]
-            )
-            user = user_service.get(auth_info["pid"])
-            if user:
-                return user
-        except:
-            ...
+        user = _user_from_token(user_service, token.credentials)
+        if user:
+            return user
+    raise HTTPException(status_code=401, detail="Unauthorized")
+
+
+async def bridged_registered_user(
+    user_service: UserService = Depends(bridged_user_svc),
+    token: HTTPAuthorizationCredentials | None = Depends(HTTPBearer()),
+) -> User:
+    """Returns the authenticated user like `registered_user`, without holding a thread while querying."""
+    if token:
+        user = await run_sync(_user_from_token, user_service, token.credentials)
+        if user:
+            return user
     raise HTTPException(status_code=401, detail="Unauthorized")
 
 
+def registered_websocket_user(
+    token: str | None = None,
+    session_factory: Callable[[], Session] = Depends(db_session_factory),
+    engine: PermissionEngine = Depends(permission_engine),
+    identity: IdentityCache = Depends(identity_cache),
+    search: UserSearch = Depends(user_search),
+) -> User:
+    """Returns the user of the JWT `token` query parameter or closes the WebSocket with a policy violation.
+
+    The user is loaded with a short-lived session so that open WebSockets do not hold database connections.
+    """
+    if token:
+        with session_factory() as session:
+            user = _user_from_token(
+                UserService(
+                    session,
+                    PermissionService(session, engine),
+                    identity,
+                    search,
+                ),
+                token,
+            )
+        if user:
+            return user
+    raise WebSocketException(code=status.WS_1008_POLICY_VIOLATION)
+
+
 def authenticated_pid(
     token: HTTPAuthorizationCredentials | None = Depends(HTTPBearer()),
 ) -> tuple[int, str]:
@@ -265,7 +335,12 @@ def _handle_auth_in_production(
 
 def _generate_token(uid: any, pid: any):
     token = jwt.encode(
-        {"uid": uid, "pid": pid, "exp": datetime.now() + timedelta(days=90)},
+        {
+            "uid": uid,
+            "pid": pid,
+            "iat": datetime.now(timezone.utc),
+            "exp": datetime.now() + timedelta(days=90),
+        },
         _JWT_SECRET,
         algorithm=_JST_ALGORITHM,
     )
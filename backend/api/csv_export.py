@@ -0,0 +1,33 @@
+"""Responses streaming CSV exports.
+
+Exports are encoded as their rows are read by `stream_csv`, and compressed as they are sent by
+the application's `GZipMiddleware` for clients accepting gzip."""
+
+from typing import Any, Iterable, Mapping
+
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+
+from ..services.csv_export import stream_csv
+
+__authors__ = ["Riley Chapman"]
+__copyright__ = "Copyright 2025"
+__license__ = "MIT"
+
+
+def csv_response(
+    rows: Iterable[BaseModel | Mapping[str, Any]],
+    fieldnames: list[str],
+    filename: str = "export.csv",
+) -> StreamingResponse:
+    """
+    Creates an HTTP response of type `text/csv` streaming rows as an attachment.
+
+    Args:
+        rows (Iterable[BaseModel | Mapping[str, Any]]): Models or dictionaries of the rows.
+        fieldnames (list[str]): Columns of the export, in order.
+        filename (str): Name the export is downloaded as.
+    """
+    response = StreamingResponse(stream_csv(rows, fieldnames), media_type="text/csv")
+    response.headers["Content-Disposition"] = f"attachment; filename={filename}"
+    return response
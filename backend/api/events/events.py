@@ -6,7 +6,13 @@ from fastapi import APIRouter, Depends, HTTPException
 from datetime import datetime, timedelta
 from typing import Sequence
 from backend.models.public_user import PublicUser
-from backend.models.pagination import EventPaginationParams, Paginated, PaginationParams
+from backend.models.pagination import (
+    CursorPaginated,
+    EventCursorParams,
+    EventPaginationParams,
+    Paginated,
+    PaginationParams,
+)
 
 from backend.services.organization import OrganizationService
 
@@ -78,6 +84,59 @@ def list_events(
     return event_service.get_paginated_events(pagination_params, subject)
 
 
+@api.get("/unauthenticated/cursor", tags=["Events"])
+def list_events_by_cursor(
+    event_service: EventService = Depends(),
+    after: str = "",
+    page_size: int = 10,
+    ascending: bool = True,
+    filter: str = "",
+    range_start: str = "",
+    range_end: str = "",
+) -> CursorPaginated[EventOverview]:
+    """List events in order of start time, a page at a time, starting after a cursor."""
+
+    cursor_params = EventCursorParams(
+        after=after,
+        page_size=page_size,
+        ascending=ascending,
+        filter=filter,
+        range_start=range_start,
+        range_end=range_end,
+    )
+    try:
+        return event_service.get_events_by_cursor(cursor_params, None)
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+
+
+@api.get("/cursor", tags=["Events"])
+def list_events_by_cursor(
+    subject: User = Depends(registered_user),
+    event_service: EventService = Depends(),
+    after: str = "",
+    page_size: int = 10,
+    ascending: bool = True,
+    filter: str = "",
+    range_start: str = "",
+    range_end: str = "",
+) -> CursorPaginated[EventOverview]:
+    """List events in order of start time, a page at a time, starting after a cursor."""
+
+    cursor_params = EventCursorParams(
+        after=after,
+        page_size=page_size,
+        ascending=ascending,
+        filter=filter,
+        range_start=range_start,
+        range_end=range_end,
+    )
+    try:
+        return event_service.get_events_by_cursor(cursor_params, subject)
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+
+
 @api.get("/unauthenticated/status", tags=["Events"])
 def get_status(
     event_service: EventService = Depends(),
@@ -35,10 +35,12 @@ def health_check(health_svc: Annotated[HealthService, Depends()]) -> str:
 
 
 @api.get("/openai", tags=["System Health"])
-def openai_check(health_svc: Annotated[HealthService, Depends()]) -> OpenAITestResponse:
+async def openai_check(
+    health_svc: Annotated[HealthService, Depends()],
+) -> OpenAITestResponse:
     """Check the OpenAI service integration.
 
     Returns:
         OpenAITestResponse: Response containing basketball player information.
     """
-    return health_svc.check_openai()
+    return await health_svc.check_openai()
@@ -13,8 +13,9 @@ from ...models.office_hours.office_hours_recurrence_pattern import (
 from ...services.office_hours.office_hours_recurrence import (
     OfficeHoursRecurrenceService,
 )
-from ..authentication import registered_user
+from ..authentication import bridged_registered_user, registered_user
 from ...services.office_hours.office_hours import OfficeHoursService
+from ...services.bridged import bridged_office_hours_svc
 from ...models.user import User
 from ...models.office_hours.office_hours import OfficeHours, NewOfficeHours
 from ...models.academics.my_courses import (
@@ -31,10 +32,10 @@ api = APIRouter(prefix="/api/office-hours")
 
 
 @api.get("/{id}/queue", tags=["Office Hours"])
-def get_office_hours_queue(
+async def get_office_hours_queue(
     id: int,
-    subject: User = Depends(registered_user),
-    oh_event_svc: OfficeHoursService = Depends(),
+    subject: User = Depends(bridged_registered_user),
+    oh_event_svc: OfficeHoursService = Depends(bridged_office_hours_svc),
 ) -> OfficeHourQueueOverview:
     """
     Gets the queue overview for an office hour event.
@@ -42,7 +43,7 @@ def get_office_hours_queue(
     Returns:
         OfficeHourQueueOverview
     """
-    return oh_event_svc.get_office_hour_queue(subject, id)
+    return await oh_event_svc.get_office_hour_queue_async(subject, id)
 
 
 @api.get("/{id}/role", tags=["Office Hours"])
@@ -16,8 +16,9 @@ from ...models.office_hours.office_hours_recurrence_pattern import (
 from ...services.office_hours.office_hours_recurrence import (
     OfficeHoursRecurrenceService,
 )
+from ...services.bridged import bridged_similar_ticket_svc
 from ...services.office_hours.similar_tickets import OfficeHourSimilarTicketService
-from ..authentication import registered_user
+from ..authentication import bridged_registered_user
 from ...services.office_hours.office_hours import OfficeHoursService
 from ...models.user import User
 from ...models.office_hours.office_hours import OfficeHours, NewOfficeHours
@@ -46,7 +47,7 @@ api = APIRouter(prefix="/api/office-hours/ticket")
     },
     tags=["Office Hours"],
 )
-def get_similar_tickets(
+async def get_similar_tickets(
     id: Annotated[
         int,
         Path(
@@ -54,8 +55,8 @@ def get_similar_tickets(
             examples=[1, 2],
         ),
     ],
-    subject: User = Depends(registered_user),
-    oh_ticket_svc: OfficeHourSimilarTicketService = Depends(),
+    subject: User = Depends(bridged_registered_user),
+    oh_ticket_svc: OfficeHourSimilarTicketService = Depends(bridged_similar_ticket_svc),
 ) -> SimilarTicketsResponse:
     """
     Uses AI to search through past tickets to find those that are similar to the open ticket.
@@ -69,4 +70,4 @@ def get_similar_tickets(
         SimilarTicketsResponse: List of similar tickets
 
     """
-    return oh_ticket_svc.find_similar_tickets(subject, id)
+    return await oh_ticket_svc.find_similar_tickets(subject, id)
@@ -1,7 +1,12 @@
 """Signage API"""
 
-from fastapi import APIRouter, Depends
-from ..services import SignageService
+from fastapi import APIRouter, Depends, Header, Response
+from starlette.concurrency import run_in_threadpool
+from ..services.signage_snapshot import (
+    SignageKind,
+    SignageSnapshotService,
+    signage_snapshot_svc,
+)
 from ..models import SignageOverviewFast, SignageOverviewSlow
 
 __authors__ = ["Will Zahrt", "Andrew Lockard", "Audrey Toney"]
@@ -15,27 +20,43 @@ openapi_tags = {
 }
 
 
-@api.get("/slow", tags=["Signage"])
-def get_slow_signage(signage_svc: SignageService = Depends()) -> SignageOverviewSlow:
+async def _respond(
+    snapshots: SignageSnapshotService, kind: SignageKind, if_none_match: str | None
+) -> Response:
+    # Only the first poll of a process, before the refresh thread's first snapshot, computes
+    snapshot = snapshots.current(kind) or await run_in_threadpool(snapshots.get, kind)
+    return snapshot.response(if_none_match)
+
+
+@api.get("/slow", tags=["Signage"], response_model=SignageOverviewSlow)
+async def get_slow_signage(
+    if_none_match: str | None = Header(default=None),
+    snapshots: SignageSnapshotService = Depends(signage_snapshot_svc),
+) -> Response:
     """Gets signage data that does not need to be updated frequently.
-    
+
     Parameters:
-        None
+        if_none_match: ETag of the data the screen already has, if any
 
     Returns:
-        SignageOverviewSlow - contains news, top users, events, and announcements
+        SignageOverviewSlow - contains news, top users, events, and announcements, or an empty
+        304 response if they are unchanged
     """
-    return signage_svc.get_slow_data()
+    return await _respond(snapshots, "slow", if_none_match)
 
 
-@api.get("/fast", tags=["Signage"])
-def get_fast_signage(signage_svc: SignageService = Depends()) -> SignageOverviewFast:
+@api.get("/fast", tags=["Signage"], response_model=SignageOverviewFast)
+async def get_fast_signage(
+    if_none_match: str | None = Header(default=None),
+    snapshots: SignageSnapshotService = Depends(signage_snapshot_svc),
+) -> Response:
     """Gets signage data that needs to be updated in real time.
 
     Parameters:
-        None
-    
+        if_none_match: ETag of the data the screen already has, if any
+
     Returns:
-        SignageOverviewFast - contains office hours information for queue time, room and seat availability
+        SignageOverviewFast - contains office hours information for queue time, room and seat
+        availability, or an empty 304 response if they are unchanged
     """
-    return signage_svc.get_fast_data()
+    return await _respond(snapshots, "fast", if_none_match)
@@ -1,8 +1,43 @@
-from fastapi import APIRouter
+"""
+WebSocket endpoints, including the live office hours queues.
+
+The queue endpoints replace polling `GET /api/office-hours/{id}/queue` and `/get-help`. Each
+client loads one snapshot when it connects and is then pushed the changes published by
+`OfficeHourTicketService` through the `OfficeHoursQueueBroker`. Clients authenticate with their
+JWT in the `token` query parameter.
+"""
+
+import asyncio
+from typing import Awaitable, Callable, TypeVar
+
+from fastapi import APIRouter, Depends, WebSocketException, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy.orm import Session
 from starlette.types import Scope, Receive, Send
 from fastapi.websockets import WebSocket, WebSocketDisconnect
 from starlette.middleware.base import BaseHTTPMiddleware
 
+from ..database import db_session_factory
+from ..models.academics.my_courses import (
+    OfficeHourGetHelpOverview,
+    OfficeHourQueueOverview,
+)
+from ..models.office_hours.queue_event import OfficeHoursQueueEvent
+from ..models.user import User
+from ..services.exceptions import CoursePermissionException, ResourceNotFoundException
+from ..services.office_hours import OfficeHoursService
+from ..services.office_hours.live_queue import live_queue_registry
+from ..services.office_hours.queue_broker import (
+    GetHelpQueueTracker,
+    OfficeHoursQueueBroker,
+    OfficeHoursQueueSubscription,
+    office_hours_queue_broker,
+)
+from .authentication import registered_websocket_user
+
+T = TypeVar("T")
+
 
 class WebSocketMiddleware(BaseHTTPMiddleware):
 
@@ -27,3 +62,135 @@ async def echo(websocket: WebSocket):
             await websocket.send_json({"type": "echo", "data": message})
     except WebSocketDisconnect:
         ...
+
+
+async def _forward_events(
+    websocket: WebSocket,
+    subscription: OfficeHoursQueueSubscription,
+    on_event: Callable[[OfficeHoursQueueEvent | None], Awaitable[None]],
+) -> None:
+    """Hands queue events to `on_event` until the client disconnects."""
+
+    async def wait_for_disconnect() -> None:
+        try:
+            while True:
+                await websocket.receive_text()
+        except WebSocketDisconnect:
+            ...
+
+    disconnected = asyncio.create_task(wait_for_disconnect())
+    try:
+        while True:
+            next_event = asyncio.create_task(subscription.get())
+            await asyncio.wait(
+                {disconnected, next_event}, return_when=asyncio.FIRST_COMPLETED
+            )
+            if disconnected.done():
+                next_event.cancel()
+                return
+            await on_event(next_event.result())
+    finally:
+        disconnected.cancel()
+
+
+def _load_queue(
+    session_factory: Callable[[], Session], user: User, office_hours_id: int
+) -> OfficeHourQueueOverview:
+    with session_factory() as session:
+        return OfficeHoursService(session, live_queue_registry()).get_office_hour_queue(
+            user, office_hours_id
+        )
+
+
+def _load_get_help(
+    session_factory: Callable[[], Session], user: User, office_hours_id: int
+) -> OfficeHourGetHelpOverview:
+    with session_factory() as session:
+        return OfficeHoursService(
+            session, live_queue_registry()
+        ).get_office_hour_get_help_overview(user, office_hours_id)
+
+
+async def _snapshot(load: Callable[..., T], *args) -> T:
+    """Loads a snapshot in the threadpool, closing the WebSocket if it may not be viewed."""
+    try:
+        return await run_in_threadpool(load, *args)
+    except (CoursePermissionException, ResourceNotFoundException) as e:
+        raise WebSocketException(code=status.WS_1008_POLICY_VIOLATION, reason=str(e))
+
+
+@api.websocket("/office-hours/{office_hours_id}/queue")
+async def office_hours_queue(
+    websocket: WebSocket,
+    office_hours_id: int,
+    user: User = Depends(registered_websocket_user),
+    broker: OfficeHoursQueueBroker = Depends(office_hours_queue_broker),
+    session_factory: Callable[[], Session] = Depends(db_session_factory),
+):
+    """
+    Pushes an office hours queue to its staff.
+
+    Sends a `snapshot` message with the `OfficeHourQueueOverview` of `GET /api/office-hours/{id}/queue`,
+    followed by one message per ticket change with the `OfficeHoursQueueEvent` as its data.
+    """
+    # Subscribe before loading the snapshot so no change between the two is missed
+    with broker.subscription(office_hours_id) as subscription:
+        snapshot = await _snapshot(_load_queue, session_factory, user, office_hours_id)
+        await websocket.accept()
+        await websocket.send_json(
+            {"type": "snapshot", "data": jsonable_encoder(snapshot)}
+        )
+
+        async def send_event(event: OfficeHoursQueueEvent | None) -> None:
+            if event is None:
+                snapshot = await _snapshot(
+                    _load_queue, session_factory, user, office_hours_id
+                )
+                await websocket.send_json(
+                    {"type": "snapshot", "data": jsonable_encoder(snapshot)}
+                )
+            else:
+                await websocket.send_json(
+                    {"type": event.type, "data": jsonable_encoder(event)}
+                )
+
+        await _forward_events(websocket, subscription, send_event)
+
+
+@api.websocket("/office-hours/{office_hours_id}/get-help")
+async def office_hours_get_help(
+    websocket: WebSocket,
+    office_hours_id: int,
+    user: User = Depends(registered_websocket_user),
+    broker: OfficeHoursQueueBroker = Depends(office_hours_queue_broker),
+    session_factory: Callable[[], Session] = Depends(db_session_factory),
+):
+    """
+    Pushes a student's view of an office hours queue.
+
+    Sends a `snapshot` message with the `OfficeHourGetHelpOverview` of
+    `GET /api/office-hours/{id}/get-help`, then an `update` message with the whole overview
+    whenever it changes. Other students' tickets are never sent.
+    """
+    with broker.subscription(office_hours_id) as subscription:
+        tracker = GetHelpQueueTracker(
+            user,
+            await _snapshot(_load_get_help, session_factory, user, office_hours_id),
+        )
+        await websocket.accept()
+        await websocket.send_json(
+            {"type": "snapshot", "data": jsonable_encoder(tracker.overview)}
+        )
+
+        async def send_update(event: OfficeHoursQueueEvent | None) -> None:
+            if event is None or tracker.needs_reload(event):
+                tracker.overview = await _snapshot(
+                    _load_get_help, session_factory, user, office_hours_id
+                )
+            elif not tracker.apply(event):
+                return
+            await websocket.send_json(
+                {"type": "update", "data": jsonable_encoder(tracker.overview)}
+            )
+
+        await _forward_events(websocket, subscription, send_update)
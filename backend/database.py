@@ -1,13 +1,48 @@
 """SQLAlchemy DB Engine and Session niceties for FastAPI dependency injection."""
 
+import functools
+import threading
+import time
+from typing import Callable, TypeVar
+
 import sqlalchemy
+from fastapi import Depends
+from sqlalchemy import event, exc
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
 from sqlalchemy.orm import Session
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+from sqlalchemy.util import greenlet_spawn
 from .env import getenv
+from .models.database import DatabasePoolStats
 
 __authors__ = ["Kris Jordan"]
 __copyright__ = "Copyright 2023"
 __license__ = "MIT"
 
+T = TypeVar("T")
+
+POOL_SIZE = int(getenv("POSTGRES_POOL_SIZE", default="5"))
+"""Number of connections each worker process keeps open."""
+
+POOL_MAX_OVERFLOW = int(getenv("POSTGRES_POOL_MAX_OVERFLOW", default="10"))
+"""Number of connections opened beyond `POOL_SIZE` under load and closed once returned."""
+
+POOL_TIMEOUT = float(getenv("POSTGRES_POOL_TIMEOUT", default="30"))
+"""Seconds a checkout waits for a connection when the pool is exhausted before failing."""
+
+POOL_RECYCLE = int(getenv("POSTGRES_POOL_RECYCLE", default="1800"))
+"""Seconds after which a connection is replaced when checked out, or -1 to keep connections."""
+
+POOL_PRE_PING = getenv("POSTGRES_POOL_PRE_PING", default="true").lower() == "true"
+"""Whether connections are tested on checkout and transparently replaced if they were dropped."""
+
+ECHO = getenv("POSTGRES_ECHO", default="false").lower() == "true"
+"""Whether every SQL statement is logged, which is slow and noisy enough to be off by default."""
+
+REPLICA_URL = getenv("POSTGRES_REPLICA_URL", default="")
+"""Connection string of a read replica serving `db_read_session`, or empty to read from the primary."""
+
 
 def _engine_str(database: str = getenv("POSTGRES_DATABASE")) -> str:
     """Helper function for reading settings from environment variables to produce connection string."""
@@ -19,14 +54,198 @@ def _engine_str(database: str = getenv("POSTGRES_DATABASE")) -> str:
     return f"{dialect}://{user}:{password}@{host}:{port}/{database}"
 
 
-def _in_production() -> bool:
-    """Helper function for reading settings from environment variables to determine verbosity of SQL output."""
-    return getenv("MODE") == "production"
+class PoolMetrics:
+    """Counters of the connection pool of one engine, maintained by pool events."""
+
+    def __init__(self, name: str, engine: sqlalchemy.Engine, max_overflow: int):
+        self.name = name
+        self._engine = engine
+        self._max_overflow = max_overflow
+        self._lock = threading.Lock()
+        self._connects = 0
+        self._checkouts = 0
+        self._overflow_checkouts = 0
+        self._invalidations = 0
+        self._timeouts = 0
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+        # Pool events registered on the engine also apply to the pools it recreates.
+        event.listen(engine, "connect", self._on_connect)
+        event.listen(engine, "checkout", self._on_checkout)
+        event.listen(engine, "invalidate", self._on_invalidate)
+
+    def _on_connect(self, dbapi_connection, connection_record) -> None:
+        with self._lock:
+            self._connects += 1
+
+    def _on_checkout(
+        self, dbapi_connection, connection_record, connection_proxy
+    ) -> None:
+        overflowing = self._engine.pool.overflow() > 0
+        with self._lock:
+            self._checkouts += 1
+            if overflowing:
+                self._overflow_checkouts += 1
+
+    def _on_invalidate(self, dbapi_connection, connection_record, exception) -> None:
+        with self._lock:
+            self._invalidations += 1
+
+    def record_wait(self, seconds: float) -> None:
+        """Records how long a checkout took to be handed a connection."""
+        with self._lock:
+            self._wait_total += seconds
+            self._wait_max = max(self._wait_max, seconds)
+
+    def record_timeout(self) -> None:
+        """Records a checkout that gave up waiting for a connection."""
+        with self._lock:
+            self._timeouts += 1
+
+    def stats(self) -> DatabasePoolStats:
+        pool = self._engine.pool
+        with self._lock:
+            return DatabasePoolStats(
+                name=self.name,
+                size=pool.size(),
+                max_overflow=self._max_overflow,
+                checked_out=pool.checkedout(),
+                overflow=pool.overflow(),
+                connects=self._connects,
+                checkouts=self._checkouts,
+                overflow_checkouts=self._overflow_checkouts,
+                invalidations=self._invalidations,
+                timeouts=self._timeouts,
+                checkout_wait_ms_avg=(
+                    self._wait_total * 1000 / self._checkouts
+                    if self._checkouts
+                    else 0.0
+                ),
+                checkout_wait_ms_max=self._wait_max * 1000,
+            )
+
+
+class InstrumentedQueuePool(QueuePool):
+    """`QueuePool` reporting how long checkouts wait for a connection.
+
+    SQLAlchemy has no pool event preceding a checkout, so the wait is measured around `connect`.
+    """
+
+    metrics: PoolMetrics | None = None
+
+    def connect(self):
+        started = time.perf_counter()
+        try:
+            connection = super().connect()
+        except exc.TimeoutError:
+            if self.metrics is not None:
+                self.metrics.record_timeout()
+            raise
+        if self.metrics is not None:
+            self.metrics.record_wait(time.perf_counter() - started)
+        return connection
+
+    def recreate(self) -> "InstrumentedQueuePool":
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+
+
+class InstrumentedAsyncQueuePool(InstrumentedQueuePool, AsyncAdaptedQueuePool):
+    """`AsyncAdaptedQueuePool` reporting how long checkouts wait for a connection."""
+
+
+def _pool_options(
+    pool_size: int,
+    max_overflow: int,
+    pool_timeout: float,
+    pool_recycle: int,
+    pool_pre_ping: bool,
+) -> dict:
+    return {
+        "echo": ECHO,
+        "pool_size": pool_size,
+        "max_overflow": max_overflow,
+        "pool_timeout": pool_timeout,
+        "pool_recycle": pool_recycle,
+        "pool_pre_ping": pool_pre_ping,
+    }
+
+
+def create_pooled_engine(
+    url: str,
+    name: str,
+    pool_size: int = POOL_SIZE,
+    max_overflow: int = POOL_MAX_OVERFLOW,
+    pool_timeout: float = POOL_TIMEOUT,
+    pool_recycle: int = POOL_RECYCLE,
+    pool_pre_ping: bool = POOL_PRE_PING,
+) -> sqlalchemy.Engine:
+    """Creates an engine whose connection pool is configured by the settings above and instrumented.
+
+    Args:
+        url (str): Connection string of the database.
+        name (str): Name of the engine in its pool metrics, such as `primary` or `replica`.
+    """
+    engine = sqlalchemy.create_engine(
+        url,
+        poolclass=InstrumentedQueuePool,
+        **_pool_options(
+            pool_size, max_overflow, pool_timeout, pool_recycle, pool_pre_ping
+        ),
+    )
+    engine.pool.metrics = PoolMetrics(name, engine, max_overflow)
+    return engine
+
 
+def create_pooled_async_engine(
+    url: str,
+    name: str,
+    pool_size: int = POOL_SIZE,
+    max_overflow: int = POOL_MAX_OVERFLOW,
+    pool_timeout: float = POOL_TIMEOUT,
+    pool_recycle: int = POOL_RECYCLE,
+    pool_pre_ping: bool = POOL_PRE_PING,
+) -> AsyncEngine:
+    """Creates an asyncpg engine for the database of a connection string, pooled like `create_pooled_engine`.
 
-engine = sqlalchemy.create_engine(_engine_str(), echo=not _in_production())
+    The pool metrics are those of the engine's `sync_engine`.
+    """
+    async_engine = create_async_engine(
+        make_url(url).set(drivername="postgresql+asyncpg"),
+        poolclass=InstrumentedAsyncQueuePool,
+        **_pool_options(
+            pool_size, max_overflow, pool_timeout, pool_recycle, pool_pre_ping
+        ),
+    )
+    sync_engine = async_engine.sync_engine
+    sync_engine.pool.metrics = PoolMetrics(name, sync_engine, max_overflow)
+    return async_engine
+
+
+def pool_stats(engine: sqlalchemy.Engine) -> DatabasePoolStats:
+    """Returns the pool metrics of an engine created by `create_pooled_engine`."""
+    return engine.pool.metrics.stats()
+
+
+engine = create_pooled_engine(_engine_str(), "primary")
 """Application-level SQLAlchemy database engine."""
 
+replica_engine = (
+    create_pooled_engine(REPLICA_URL, "replica") if REPLICA_URL != "" else engine
+)
+"""Engine of the read replica, or the application-level engine when no replica is configured."""
+
+async_engine = create_pooled_async_engine(_engine_str(), "async")
+"""Application-level engine of async route handlers, connected to the primary through asyncpg."""
+
+replica_async_engine = (
+    create_pooled_async_engine(REPLICA_URL, "async-replica")
+    if REPLICA_URL != ""
+    else async_engine
+)
+"""Engine of async route handlers on the read replica, or `async_engine` when no replica is configured."""
+
 
 def db_session():
     """Generator function offering dependency injection of SQLAlchemy Sessions."""
@@ -35,3 +254,72 @@ def db_session():
         yield session
     finally:
         session.close()
+
+
+def db_read_session(session: Session = Depends(db_session)):
+    """Generator function offering dependency injection of read-only SQLAlchemy Sessions.
+
+    Service methods that only read data which tolerates replication lag, such as signage and
+    listings, use these sessions so that they can be served by the read replica. Sessions must
+    not be used for writes, and do not observe the writes of the request they are part of.
+
+    Without a replica, this is the request's `db_session`, so that a request never holds two
+    connections of the same pool. Otherwise, threads holding one connection while waiting for
+    a second could exhaust the pool.
+    """
+    if replica_engine is engine:
+        yield session
+        return
+    read_session = Session(replica_engine)
+    try:
+        yield read_session
+    finally:
+        read_session.close()
+
+
+async def async_db_session():
+    """Async generator function offering dependency injection of SQLAlchemy AsyncSessions."""
+    async with AsyncSession(async_engine) as session:
+        yield session
+
+
+async def async_db_read_session(session: AsyncSession = Depends(async_db_session)):
+    """Async generator function offering dependency injection of read-only AsyncSessions.
+
+    The async counterpart of `db_read_session`: served by the read replica when configured, and
+    otherwise the request's `async_db_session`.
+    """
+    if replica_async_engine is async_engine:
+        yield session
+        return
+    async with AsyncSession(replica_async_engine) as read_session:
+        yield read_session
+
+
+async def run_sync(operation: Callable[..., T], *args) -> T:
+    """Runs synchronous ORM code whose sessions are the `sync_session` of AsyncSessions.
+
+    Services keep a single, synchronous implementation. Built on the `sync_session` of an
+    `AsyncSession` and run through here, their queries, including lazy loads, are sent by asyncpg
+    and the event loop serves other requests while they wait, rather than each request holding
+    a thread of the server's threadpool. Code run through here must not hold a threading lock
+    while it queries, since other requests on the event loop's thread would block on it.
+    """
+    return await greenlet_spawn(operation, *args)
+
+
+def db_session_factory() -> Callable[[], Session]:
+    """Dependency offering a factory of short-lived SQLAlchemy Sessions.
+
+    Long-lived handlers, such as WebSockets, open a session per unit of work instead of holding
+    a database connection for as long as the client stays connected."""
+    return functools.partial(Session, engine)
+
+
+def database_engines() -> list[sqlalchemy.Engine]:
+    """Dependency offering the engines whose pools the application uses."""
+    engines = [engine] if replica_engine is engine else [engine, replica_engine]
+    engines.append(async_engine.sync_engine)
+    if replica_async_engine is not async_engine:
+        engines.append(replica_async_engine.sync_engine)
+    return engines
@@ -0,0 +1,43 @@
+"""Definition of SQLAlchemy table-backed object mapping entity for monthly check-in counts."""
+
+from datetime import date
+from sqlalchemy import Date, ForeignKey, Index, Integer
+from sqlalchemy.orm import Mapped, mapped_column
+
+from ..entity_base import EntityBase
+
+__authors__ = ["Riley Chapman"]
+__copyright__ = "Copyright 2025"
+__license__ = "MIT"
+
+
+class CheckinCountEntity(EntityBase):
+    """Serves as the database model schema defining the shape of the `CheckinCount` table.
+
+    Each row counts the reservations of one user checked out in one month, maintained as
+    reservations are checked out so that the check-in leaderboard does not group every
+    reservation of the month."""
+
+    # Name for the check-in counts table in the PostgreSQL database
+    __tablename__ = "coworking__checkin_count"
+
+    # First day of the month the reservations ended in
+    month: Mapped[date] = mapped_column(Date, primary_key=True)
+
+    # User party to the reservations
+    user_id: Mapped[int] = mapped_column(
+        ForeignKey("user.id", ondelete="CASCADE"), primary_key=True
+    )
+
+    # Number of reservations of the user checked out in the month
+    count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    __table_args__ = (
+        # Leaderboard: the top counts of a month are the first entries of the index
+        Index(
+            "coworking__checkin_count_leaderboard_idx",
+            "month",
+            count.desc(),
+            "user_id",
+        ),
+    )
@@ -1,6 +1,7 @@
 """Definition of SQLAlchemy table-backed object mapping entity for Events."""
 
-from sqlalchemy import Integer, String, Boolean, DateTime, ForeignKey
+from sqlalchemy import Integer, String, Boolean, DateTime, ForeignKey, Computed, Index
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from ..models.event import EventOverview
 from .entity_base import EntityBase
@@ -21,6 +22,14 @@ class EventEntity(EntityBase):
 
     # Name for the events table in the PostgreSQL database
     __tablename__ = "event"
+    __table_args__ = (
+        # Listings: events in order of start time, with the ID breaking ties
+        Index("event_start_id_idx", "start", "id"),
+        # Search: events whose name or description match a text query
+        Index("event_search_idx", "search_vector", postgresql_using="gin"),
+        # Search: events of the organizations matching a text query
+        Index("event_organization_idx", "organization_id"),
+    )
 
     # Event properties (columns in the database table)
 
@@ -40,6 +49,27 @@ class EventEntity(EntityBase):
     public: Mapped[bool] = mapped_column(Boolean)
     # Maximim number of people who can register for the event
     registration_limit: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    # Number of attendees registered for the event
+    # NOTE: Maintained by `EventService` along with the registrations, so that overviews do not
+    # load every registration and registering can check the limit atomically.
+    attendee_count: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
+    # Number of organizers of the event, maintained like `attendee_count`
+    organizer_count: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
+    # Full-text search document of the name and description, ranking name matches higher
+    # NOTE: Generated by the database, and only read in queries.
+    search_vector: Mapped[str] = mapped_column(
+        TSVECTOR,
+        Computed(
+            "setweight(to_tsvector('english', coalesce(name, '')), 'A') || "
+            "setweight(to_tsvector('english', coalesce(description, '')), 'B')",
+            persisted=True,
+        ),
+        deferred=True,
+    )
     # URL for the image for an event.
     image_url: Mapped[str] = mapped_column(String, nullable=True)
     # This field provides a registration URL if external registration is used.
@@ -55,6 +85,12 @@ class EventEntity(EntityBase):
     registrations: Mapped[list["EventRegistrationEntity"]] = relationship(
         back_populates="event", cascade="all,delete"
     )
+    # Registrations of the organizers of the event, the only ones its overview shows
+    organizer_registrations: Mapped[list["EventRegistrationEntity"]] = relationship(
+        primaryjoin="and_(EventEntity.id == EventRegistrationEntity.event_id, "
+        "EventRegistrationEntity.registration_type == 'ORGANIZER')",
+        viewonly=True,
+    )
 
     @classmethod
     def from_draft_model(cls, model: EventDraft, organization_id: int) -> Self:
@@ -79,42 +115,17 @@ class EventEntity(EntityBase):
             override_registration_url=model.override_registration_url,
         )
 
-    def to_overview_model(self, subject: User | None = None) -> EventOverview:
-        """Creates an overview model from an event."""
-        attendees = [
-            registration.to_flat_model()
-            for registration in self.registrations
-            if registration.registration_type == RegistrationType.ATTENDEE
-        ]
-
-        user_registration = (
-            [
-                registration
-                for registration in self.registrations
-                if registration.user_id == subject.id
-            ][0]
-            if subject is not None
-            and len(
-                [
-                    registration
-                    for registration in self.registrations
-                    if registration.user_id == subject.id
-                ]
-            )
-            > 0
-            else None
-        )
-
-        # Hide organizer info for unauthenticated users
-        organizer_registrations = [
-            registration
-            for registration in self.registrations
-            if registration.registration_type == RegistrationType.ORGANIZER
-        ]
+    def to_overview_model(
+        self, user_registration_type: RegistrationType | None = None
+    ) -> EventOverview:
+        """Creates an overview model from an event.
 
+        Args:
+            user_registration_type: How the user viewing the event is registered for it, if at all.
+        """
         organizers = [
             registration.user.to_public_model()
-            for registration in organizer_registrations
+            for registration in self.organizer_registrations
         ]
 
         return EventOverview(
@@ -126,15 +137,13 @@ class EventEntity(EntityBase):
             description=self.description,
             public=self.public,
             registration_limit=self.registration_limit,
-            number_registered=len(attendees),
+            number_registered=self.attendee_count,
             organization_slug=self.organization.slug,
             organization_icon=self.organization.logo,
             organization_name=self.organization.shorthand,
             organization_id=self.organization.id,
             organizers=organizers,
-            user_registration_type=(
-                user_registration.registration_type if user_registration else None
-            ),
+            user_registration_type=user_registration_type,
             image_url=self.image_url,
             override_registration_url=self.override_registration_url,
         )
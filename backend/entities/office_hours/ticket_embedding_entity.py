@@ -0,0 +1,36 @@
+"""Definition of SQLAlchemy table-backed object mapping entity for the similar ticket embedding index."""
+
+from datetime import datetime
+from sqlalchemy import ARRAY, DateTime, Float, ForeignKey
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from ..entity_base import EntityBase
+
+__authors__ = ["Riley Chapman"]
+__copyright__ = "Copyright 2025"
+__license__ = "MIT"
+
+
+class OfficeHoursTicketEmbeddingEntity(EntityBase):
+    """Serves as the database model schema defining the shape of the `OfficeHoursTicketEmbedding` table.
+
+    Each row stores the embedding vector of one closed office hours ticket so that similar
+    ticket lookups can run a nearest-neighbour search instead of sending every past ticket
+    to the AI service."""
+
+    # Name for the embeddings table in the PostgreSQL database
+    __tablename__ = "office_hours__ticket_embedding"
+
+    # Ticket that the embedding was computed from
+    ticket_id: Mapped[int] = mapped_column(
+        ForeignKey("office_hours__ticket.id", ondelete="CASCADE"), primary_key=True
+    )
+    ticket: Mapped["OfficeHoursTicketEntity"] = relationship(back_populates="embedding")
+
+    # Unit-length embedding vector of the ticket's prompt fields
+    embedding: Mapped[list[float]] = mapped_column(ARRAY(Float), nullable=False)
+
+    # Time the embedding was (re)computed
+    indexed_at: Mapped[datetime] = mapped_column(
+        DateTime, default=datetime.now, nullable=False
+    )
@@ -1,7 +1,7 @@
 """Definition of SQLAlchemy table-backed object mapping entity for Office Hour tickets."""
 
 from datetime import datetime
-from sqlalchemy import Boolean, DateTime, ForeignKey, Integer, String
+from sqlalchemy import Boolean, DateTime, ForeignKey, Index, Integer, String, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 # from backend.entities.user_entity import UserEntity
@@ -36,6 +36,23 @@ class OfficeHoursTicketEntity(EntityBase):
 
     # Name for the events table in the PostgreSQL database
     __tablename__ = "office_hours__ticket"
+    __table_args__ = (
+        # Queues, get help, live queues, and duplicate ticket checks: the open tickets of
+        # an event in order of ID. Predicates on QUEUED alone are answered by it as well.
+        Index(
+            "office_hours__ticket_open_idx",
+            "office_hours_id",
+            "id",
+            postgresql_where=text("state IN ('QUEUED', 'CALLED')"),
+        ),
+        # Similar tickets: the CLOSED tickets of an event by type
+        Index(
+            "office_hours__ticket_closed_idx",
+            "office_hours_id",
+            "type",
+            postgresql_where=text("state = 'CLOSED'"),
+        ),
+    )
 
     # Unique id for OfficeHoursTicket
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
@@ -97,6 +114,11 @@ class OfficeHoursTicketEntity(EntityBase):
         back_populates="called_oh_tickets"
     )
 
+    # One-to-one relationship to the ticket's entry in the similar ticket embedding index
+    embedding: Mapped["OfficeHoursTicketEmbeddingEntity | None"] = relationship(
+        back_populates="ticket", cascade="all, delete"
+    )
+
     @classmethod
     def from_new_model(cls, model: NewOfficeHoursTicket) -> Self:
         """
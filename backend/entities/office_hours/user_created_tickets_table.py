@@ -1,6 +1,6 @@
 """Definition of SQLAlchemy table-backed object mapping entity for Office Hour tickets."""
 
-from sqlalchemy import Column, ForeignKey, Table
+from sqlalchemy import Column, ForeignKey, Index, Table
 from ..entity_base import EntityBase
 
 
@@ -14,4 +14,6 @@ user_created_tickets_table = Table(
     EntityBase.metadata,
     Column("ticket_id", ForeignKey("office_hours__ticket.id"), primary_key=True),
     Column("member_id", ForeignKey("academics__user_section.id"), primary_key=True),
+    # The primary key leads with `ticket_id`, so lookups by creator need their own index
+    Index("office_hours__user_created_ticket_member_idx", "member_id"),
 )
@@ -1,6 +1,6 @@
 """Definition of SQLAlchemy table-backed object mapping entity for Users."""
 
-from sqlalchemy import Boolean, Integer, String
+from sqlalchemy import DDL, Boolean, Computed, Connection, Integer, String, event, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from typing import Self
 
@@ -54,6 +54,17 @@ class UserEntity(EntityBase):
     linkedin: Mapped[str | None] = mapped_column(String(), nullable=True)
     # Website of the user
     website: Mapped[str | None] = mapped_column(String(), nullable=True)
+    # Lowercase text searched by `UserService.search`: the name, onyen, email and PID
+    # NOTE: Generated by the database, and only read in queries.
+    search_text: Mapped[str] = mapped_column(
+        String(),
+        Computed(
+            "lower(first_name || ' ' || last_name || ' ' || coalesce(onyen, '') || ' ' || "
+            "email || ' ' || coalesce(CAST(pid AS TEXT), ''))",
+            persisted=True,
+        ),
+        deferred=True,
+    )
 
     # All of the roles for the given user.
     # NOTE: This field establishes a many-to-many relationship between the users and roles table.
@@ -186,3 +197,29 @@ class UserEntity(EntityBase):
             linkedin=self.linkedin,
             website=self.website,
         )
+
+
+def _trigram_available(ddl: DDL, target, bind: Connection, **kw) -> bool:
+    """Whether the PostgreSQL server can index text by its trigrams."""
+    return (
+        bind.execute(
+            text("SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm'")
+        ).first()
+        is not None
+    )
+
+
+# Search: users whose `search_text` contains a query, with `LIKE '%query%'`
+# NOTE: The index needs the `pg_trgm` extension, which some PostgreSQL installations lack.
+# Searches run the same query without it, scanning every user.
+for ddl in [
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm"),
+    DDL(
+        'CREATE INDEX user_search_trgm_idx ON "user" USING gin (search_text gin_trgm_ops)'
+    ),
+]:
+    event.listen(
+        UserEntity.__table__,
+        "after_create",
+        ddl.execute_if(dialect="postgresql", callable_=_trigram_available),
+    )
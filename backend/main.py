@@ -1,10 +1,15 @@
 """Entrypoint of backend API exposing the FastAPI `app` to be served by an application server such as uvicorn."""
 
+import contextlib
+import logging
 from pathlib import Path
 from fastapi import FastAPI, Request
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import JSONResponse
 from fastapi.middleware.gzip import GZipMiddleware
 
+from sqlalchemy.orm import Session
+
 from backend.services.coworking.reservation import ReservationException
 
 from .api.events import events
@@ -28,12 +33,23 @@ from .api.office_hours import (
     office_hours as office_hours_event,
     ticket as office_hours_ticket,
     # added similar ticket import
-    similar_tickets
+    similar_tickets,
 )
 from .api.admin import users as admin_users
 from .api.admin import roles as admin_roles
 from .api.admin import facts as admin_facts
-
+from .api.admin import metrics as admin_metrics
+
+from .database import async_engine, engine, replica_async_engine
+from .services.background_jobs import background_job_runner
+from .services.coworking.reservation_sweeper import reservation_sweeper
+from .services.office_hours.live_queue import live_queue_registry
+from .services.office_hours.similar_tickets_cache import similar_ticket_cache
+from .services.openai import (
+    create_async_openai_client,
+    create_openai_concurrency_limiter,
+)
+from .services.signage_snapshot import signage_snapshot_svc
 from .services.exceptions import (
     RecurringOfficeHourEventException,
     UserPermissionException,
@@ -50,11 +66,45 @@ description = """
 Welcome to the UNC Computer Science **Experience Labs** RESTful Application Programming Interface.
 """
 
+
+@contextlib.asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Loads the open office hours queues into memory before serving requests, and starts
+    refreshing the signage snapshots and sweeping the reservations in the background.
+
+    Creates the asynchronous OpenAI client and concurrency limiter on the event loop serving
+    requests. On shutdown, waits for the background jobs running on that loop, then closes the
+    client and the connections of the async engine while their event loop still runs.
+    """
+    app.state.async_openai_client = create_async_openai_client()
+    app.state.openai_concurrency_limiter = create_openai_concurrency_limiter()
+    try:
+        with Session(engine) as session:
+            live_queue_registry().rehydrate(session)
+    except Exception:
+        # Live queues also load on first use, so a failed warm-up must not stop the API
+        logging.getLogger(__name__).exception("Could not rehydrate live queues")
+    # Fails fast if the shared similar ticket cache is misconfigured
+    similar_ticket_cache()
+    signage_snapshot_svc().start()
+    reservation_sweeper().start()
+    yield
+    reservation_sweeper().stop()
+    signage_snapshot_svc().stop()
+    # Jobs run on this event loop, so wait for them without blocking it
+    await run_in_threadpool(background_job_runner().shutdown)
+    await app.state.async_openai_client.close()
+    await async_engine.dispose()
+    if replica_async_engine is not async_engine:
+        await replica_async_engine.dispose()
+
+
 # Metadata to improve the usefulness of OpenAPI Docs /docs API Explorer
 app = FastAPI(
     title="UNC CS Experience Labs API",
     version="0.0.1",
     description=description,
+    lifespan=lifespan,
     openapi_tags=[
         profile.openapi_tags,
         user.openapi_tags,
@@ -71,6 +121,7 @@ app = FastAPI(
         my_courses.openapi_tags,
         hiring.openapi_tags,
         admin_facts.openapi_tags,
+        admin_metrics.openapi_tags,
         article.openapi_tags,
         signage.openapi_tags,
     ],
@@ -104,12 +155,12 @@ feature_apis = [
     office_hours_ticket,
     hiring,
     admin_facts,
+    admin_metrics,
     article,
     signage,
     websocket,
     # add similar tickets
     similar_tickets,
-
 ]
 
 for feature_api in feature_apis:
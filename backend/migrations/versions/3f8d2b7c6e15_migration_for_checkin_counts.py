@@ -0,0 +1,60 @@
+"""Migration for the monthly check-in counts of the signage leaderboard.
+
+The counts of the current month are backfilled from its checked out reservations. To
+recount a month later, run `python3 -m backend.script.rebuild_checkin_leaderboard`.
+
+Revision ID: 3f8d2b7c6e15
+Revises: 8b4f0e6a2c91
+Create Date: 2025-05-16 11:02:37.514920
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "3f8d2b7c6e15"
+down_revision = "8b4f0e6a2c91"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "coworking__checkin_count",
+        sa.Column("month", sa.Date(), nullable=False),
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("count", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["user_id"], ["user.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("month", "user_id"),
+    )
+    op.create_index(
+        "coworking__checkin_count_leaderboard_idx",
+        "coworking__checkin_count",
+        ["month", sa.text("count DESC"), "user_id"],
+        unique=False,
+    )
+    op.execute(
+        """
+        INSERT INTO coworking__checkin_count (month, user_id, count)
+        SELECT
+            date_trunc('month', CURRENT_DATE)::date,
+            coworking__reservation_user.user_id,
+            COUNT(coworking__reservation.id)
+        FROM coworking__reservation
+        JOIN coworking__reservation_user
+            ON coworking__reservation_user.reservation_id = coworking__reservation.id
+        WHERE coworking__reservation.state = 'CHECKED_OUT'
+        AND coworking__reservation."end" >= date_trunc('month', CURRENT_DATE)
+        AND coworking__reservation."end" < date_trunc('month', CURRENT_DATE) + interval '1 month'
+        GROUP BY coworking__reservation_user.user_id
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "coworking__checkin_count_leaderboard_idx",
+        table_name="coworking__checkin_count",
+    )
+    op.drop_table("coworking__checkin_count")
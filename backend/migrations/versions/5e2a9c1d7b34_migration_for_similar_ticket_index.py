@@ -0,0 +1,36 @@
+"""Migration for the similar ticket embedding index.
+
+After upgrading, backfill embeddings for existing closed tickets with
+`python3 -m backend.script.index_similar_tickets`.
+
+Revision ID: 5e2a9c1d7b34
+Revises: 41c5d192f495
+Create Date: 2025-05-02 10:14:52.318406
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "5e2a9c1d7b34"
+down_revision = "41c5d192f495"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "office_hours__ticket_embedding",
+        sa.Column("ticket_id", sa.Integer(), nullable=False),
+        sa.Column("embedding", sa.ARRAY(sa.Float()), nullable=False),
+        sa.Column("indexed_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["ticket_id"], ["office_hours__ticket.id"], ondelete="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint("ticket_id"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("office_hours__ticket_embedding")
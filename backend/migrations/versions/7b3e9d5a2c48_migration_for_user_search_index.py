@@ -0,0 +1,54 @@
+"""Migration for the trigram search index of users.
+
+The index needs the `pg_trgm` extension, and is only created where the server offers it. Searches
+match users without it, by scanning the user table.
+
+Revision ID: 7b3e9d5a2c48
+Revises: e2a7f4c9d1b6
+Create Date: 2025-06-03 14:12:07.539201
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "7b3e9d5a2c48"
+down_revision = "e2a7f4c9d1b6"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "user",
+        sa.Column(
+            "search_text",
+            sa.String(),
+            sa.Computed(
+                "lower(first_name || ' ' || last_name || ' ' || coalesce(onyen, '') || ' ' || "
+                "email || ' ' || coalesce(CAST(pid AS TEXT), ''))",
+                persisted=True,
+            ),
+        ),
+    )
+    trigram_available = op.get_bind().scalar(
+        sa.text(
+            "SELECT EXISTS (SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm')"
+        )
+    )
+    if trigram_available:
+        op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        op.create_index(
+            "user_search_trgm_idx",
+            "user",
+            ["search_text"],
+            unique=False,
+            postgresql_using="gin",
+            postgresql_ops={"search_text": "gin_trgm_ops"},
+        )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS user_search_trgm_idx")
+    op.drop_column("user", "search_text")
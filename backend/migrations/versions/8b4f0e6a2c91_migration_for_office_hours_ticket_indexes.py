@@ -0,0 +1,51 @@
+"""Migration for the office hours ticket indexes.
+
+Adds partial indexes for the open and closed tickets of an office hours event and an index on
+the creators of tickets, which the association table's primary key does not cover.
+
+Revision ID: 8b4f0e6a2c91
+Revises: 5e2a9c1d7b34
+Create Date: 2025-05-09 15:27:41.902113
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "8b4f0e6a2c91"
+down_revision = "5e2a9c1d7b34"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "office_hours__ticket_open_idx",
+        "office_hours__ticket",
+        ["office_hours_id", "id"],
+        unique=False,
+        postgresql_where=sa.text("state IN ('QUEUED', 'CALLED')"),
+    )
+    op.create_index(
+        "office_hours__ticket_closed_idx",
+        "office_hours__ticket",
+        ["office_hours_id", "type"],
+        unique=False,
+        postgresql_where=sa.text("state = 'CLOSED'"),
+    )
+    op.create_index(
+        "office_hours__user_created_ticket_member_idx",
+        "office_hours__user_created_ticket",
+        ["member_id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "office_hours__user_created_ticket_member_idx",
+        table_name="office_hours__user_created_ticket",
+    )
+    op.drop_index("office_hours__ticket_closed_idx", table_name="office_hours__ticket")
+    op.drop_index("office_hours__ticket_open_idx", table_name="office_hours__ticket")
@@ -0,0 +1,50 @@
+"""Migration for the registration counts of events.
+
+The counts are backfilled from the existing registrations. To recount them later,
+run `python3 -m backend.script.recount_event_registrations`.
+
+Revision ID: c5e91a4d7b32
+Revises: 3f8d2b7c6e15
+Create Date: 2025-05-23 14:26:08.317402
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "c5e91a4d7b32"
+down_revision = "3f8d2b7c6e15"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "event",
+        sa.Column("attendee_count", sa.Integer(), nullable=False, server_default="0"),
+    )
+    op.add_column(
+        "event",
+        sa.Column("organizer_count", sa.Integer(), nullable=False, server_default="0"),
+    )
+    op.execute(
+        """
+        UPDATE event SET
+            attendee_count = (
+                SELECT COUNT(*) FROM event_registration
+                WHERE event_registration.event_id = event.id
+                AND event_registration.registration_type = 'ATTENDEE'
+            ),
+            organizer_count = (
+                SELECT COUNT(*) FROM event_registration
+                WHERE event_registration.event_id = event.id
+                AND event_registration.registration_type = 'ORGANIZER'
+            )
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("event", "organizer_count")
+    op.drop_column("event", "attendee_count")
@@ -0,0 +1,50 @@
+"""Migration for the search document and listing indexes of events.
+
+Revision ID: e2a7f4c9d1b6
+Revises: c5e91a4d7b32
+Create Date: 2025-05-27 09:41:52.208163
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = "e2a7f4c9d1b6"
+down_revision = "c5e91a4d7b32"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "event",
+        sa.Column(
+            "search_vector",
+            postgresql.TSVECTOR(),
+            sa.Computed(
+                "setweight(to_tsvector('english', coalesce(name, '')), 'A') || "
+                "setweight(to_tsvector('english', coalesce(description, '')), 'B')",
+                persisted=True,
+            ),
+        ),
+    )
+    op.create_index(
+        "event_search_idx",
+        "event",
+        ["search_vector"],
+        unique=False,
+        postgresql_using="gin",
+    )
+    op.create_index("event_start_id_idx", "event", ["start", "id"], unique=False)
+    op.create_index(
+        "event_organization_idx", "event", ["organization_id"], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("event_organization_idx", table_name="event")
+    op.drop_index("event_start_id_idx", table_name="event")
+    op.drop_index("event_search_idx", table_name="event")
+    op.drop_column("event", "search_vector")
@@ -1,7 +1,13 @@
 """Package for all models in the application."""
 
 from .application import Application
-from .pagination import Paginated, PaginationParams, EventPaginationParams
+from .pagination import (
+    Paginated,
+    PaginationParams,
+    EventPaginationParams,
+    CursorPaginated,
+    EventCursorParams,
+)
 from .permission import Permission
 from .user import User, ProfileForm
 from .user_details import UserDetails
@@ -96,6 +96,7 @@ class OfficeHourTicketOverview(BaseModel):
     meeting_summary: str | None
     solutions_used: str | None
     concepts_for_review: str | None
+    creators: list[PublicUser] = []
     caller: PublicUser | None
     caller_id: int | None
     office_hours_id: int  # test
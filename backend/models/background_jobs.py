@@ -0,0 +1,20 @@
+"""Models describing the state of the in-process background job runner."""
+
+from pydantic import BaseModel
+
+__authors__ = ["Riley Chapman"]
+__copyright__ = "Copyright 2025"
+__license__ = "MIT"
+
+
+class BackgroundJobStats(BaseModel):
+    """Counters of a `BackgroundJobRunner`.
+
+    `queued` is the queue depth: jobs submitted but not yet picked up by a worker.
+    """
+
+    queued: int
+    running: int
+    succeeded: int
+    failed: int
+    retried: int
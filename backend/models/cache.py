@@ -0,0 +1,15 @@
+"""Models describing the process-local caches of services."""
+
+from pydantic import BaseModel
+
+__authors__ = ["Riley Chapman"]
+__copyright__ = "Copyright 2025"
+__license__ = "MIT"
+
+
+class CacheStats(BaseModel):
+    """Counters of a `TTLCache` in one worker process."""
+
+    hits: int
+    misses: int
+    entries: int
@@ -0,0 +1,30 @@
+"""Models describing the database connection pools of a worker process."""
+
+from pydantic import BaseModel
+
+__authors__ = ["Riley Chapman"]
+__copyright__ = "Copyright 2025"
+__license__ = "MIT"
+
+
+class DatabasePoolStats(BaseModel):
+    """Counters of the connection pool of one database engine.
+
+    `checked_out` and `overflow` describe the pool right now. `overflow` is the number of
+    connections open beyond `size`, and it is negative while the pool has not yet opened `size`
+    connections. `overflow_checkouts` counts checkouts served while the pool was beyond its size,
+    and `timeouts` counts checkouts that gave up after waiting for a connection.
+    """
+
+    name: str
+    size: int
+    max_overflow: int
+    checked_out: int
+    overflow: int
+    connects: int
+    checkouts: int
+    overflow_checkouts: int
+    invalidations: int
+    timeouts: int
+    checkout_wait_ms_avg: float
+    checkout_wait_ms_max: float
@@ -0,0 +1,24 @@
+"""Models describing how authenticated requests resolve their subject."""
+
+from pydantic import BaseModel
+
+__authors__ = ["Riley Chapman"]
+__copyright__ = "Copyright 2025"
+__license__ = "MIT"
+
+
+class IdentityCacheStats(BaseModel):
+    """Counters of the identity and permission caches of one worker process.
+
+    Every user hit skips the user query and every permission hit skips the grants query, so
+    `round_trips_saved` is their sum and `round_trips_saved_per_request` spreads it over the
+    authenticated requests.
+    """
+
+    requests: int
+    user_hits: int
+    user_misses: int
+    permission_hits: int
+    permission_misses: int
+    round_trips_saved: int
+    round_trips_saved_per_request: float
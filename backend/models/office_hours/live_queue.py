@@ -0,0 +1,23 @@
+"""
+Pydantic models to represent checks of the in-memory live office hours queues.
+"""
+
+from pydantic import BaseModel
+
+__authors__ = ["Riley Chapman"]
+__copyright__ = "Copyright 2025"
+__license__ = "MIT"
+
+
+class LiveQueueConsistency(BaseModel):
+    """
+    Pydantic model to represent the differences between a live queue and the database.
+    """
+
+    office_hours_id: int
+    consistent: bool
+    missing_queued: list[int]
+    unexpected_queued: list[int]
+    missing_called: list[int]
+    unexpected_called: list[int]
+    out_of_order: bool
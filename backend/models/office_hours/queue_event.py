@@ -0,0 +1,30 @@
+"""
+Pydantic models to represent changes pushed to subscribers of an office hours queue.
+"""
+
+from typing import Literal
+
+from pydantic import BaseModel
+
+from ..academics.my_courses import OfficeHourTicketOverview
+
+__authors__ = ["Riley Chapman"]
+__copyright__ = "Copyright 2025"
+__license__ = "MIT"
+
+
+OfficeHoursQueueEventType = Literal[
+    "ticket_created", "ticket_called", "ticket_canceled", "ticket_closed"
+]
+
+
+class OfficeHoursQueueEvent(BaseModel):
+    """
+    Pydantic model to represent a change to one ticket of an office hours queue.
+    """
+
+    type: OfficeHoursQueueEventType
+    office_hours_id: int
+    ticket: OfficeHourTicketOverview
+    creator_ids: list[int]
+    previous_state: str | None
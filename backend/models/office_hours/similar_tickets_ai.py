@@ -23,3 +23,27 @@ class SimilarTicketsAIResponse(BaseModel):
     """
 
     similar_ticket_ids: List[int]
+
+
+class SimilarTicketCacheStats(BaseModel):
+    """
+    Pydantic model to represent the hit and miss counters of the Similar Ticket result cache.
+    """
+
+    hits: int
+    misses: int
+
+
+class SimilarTicketPromptStats(BaseModel):
+    """
+    Pydantic model to represent the sizes of the prompts sent to the Similar Ticket OpenAI Service Layer.
+    """
+
+    prompts: int
+    total_chars: int
+    total_tokens: int
+    last_chars: int
+    last_tokens: int
+    tickets_included: int
+    tickets_dropped: int
+    fields_truncated: int
@@ -29,9 +29,36 @@ class EventPaginationParams(PaginationParams):
     range_end: str = ""
 
 
+class EventCursorParams(BaseModel):
+    """Parameters passed from the client to page through events in order of start time.
+
+    `after` is the `next` cursor of the previous page, or empty for the first page.
+    """
+
+    after: str = ""
+    page_size: int = 10
+    ascending: bool = True
+    filter: str = ""
+    range_start: str = ""
+    range_end: str = ""
+
+
 class Paginated(BaseModel, Generic[T]):
     """Generic class for returning paginating results to the client."""
 
     items: list[T]
     length: int
     params: PaginationParams | EventPaginationParams
+
+
+class CursorPaginated(BaseModel, Generic[T]):
+    """Generic class for returning a page of results, and the cursor of the next, to the client.
+
+    `length` is the total number of results, which may be up to a minute out of date.
+    `next` is None on the last page.
+    """
+
+    items: list[T]
+    length: int
+    next: str | None
+    params: EventCursorParams
@@ -0,0 +1,4 @@
+"""Benchmark scripts measuring the cost of hot backend paths on synthetic data.
+
+Each benchmark is run as a module, e.g. `python3 -m backend.script.benchmarks.similar_tickets`,
+and seeds its own throwaway database so that development data is never touched."""
@@ -0,0 +1,200 @@
+"""
+Load-tests the sync and async paths of the welcome overview.
+
+The app under test serves the welcome overview twice: from a sync route handler, which FastAPI
+runs in its threadpool of 40 threads, and from an async route handler built on `bridged` services,
+whose queries are sent by asyncpg from the event loop. Both use pools of the same size against a
+database loaded with the test data. For each handler the script sends a burst of 500 concurrent
+requests through `httpx.ASGITransport` and reports the p50 and p99 latency.
+
+Alongside every burst, 50 requests go to a sync `/ping` route that does no work. Its p99 latency
+shows how long other sync routes wait for a thread while the burst runs.
+
+When every thread of the threadpool waits for a connection, the sessions of finished sync requests
+cannot be closed, since FastAPI closes them on the same threadpool, and the waiting requests only
+fail once the pool times out. The pools time out after `POOL_TIMEOUT` seconds rather than the
+default 30, so that bursts finish in reasonable time. Latencies are those of successful requests,
+and failures are counted separately.
+
+Usage: python3 -m backend.script.benchmarks.async_reads
+"""
+
+import asyncio
+import statistics
+import time
+
+import httpx
+from fastapi import Depends, FastAPI
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from ...database import (
+    async_db_session,
+    create_pooled_async_engine,
+    create_pooled_engine,
+    db_session,
+)
+from ...models.articles import WelcomeOverview
+from ...services.article import ArticleService
+from ...services.bridged import bridged_article_svc
+from ...test.services import role_data, user_data, permission_data, room_data
+from ...test.services.articles import article_data
+from ...test.services.coworking import (
+    operating_hours_data,
+    seat_data,
+    time as time_data,
+)
+from ...test.services.coworking.reservation import reservation_data
+from ...test.services.event import event_test_data
+from ...test.services.organization import organization_test_data
+from .harness import benchmark_engine, print_table
+
+__authors__ = ["Riley Chapman"]
+__copyright__ = "Copyright 2025"
+__license__ = "MIT"
+
+CLIENTS = 500
+PINGS = 50
+POOL_TIMEOUT = 5
+
+
+def _seed(session: Session) -> None:
+    """Loads the data of the test suite, as `reset_testing` does."""
+    moments = time_data.time_data()
+    role_data.insert_fake_data(session)
+    user_data.insert_fake_data(session)
+    permission_data.insert_fake_data(session)
+    organization_test_data.insert_fake_data(session)
+    event_test_data.insert_fake_data(session)
+    operating_hours_data.insert_fake_data(session, moments)
+    room_data.insert_fake_data(session)
+    seat_data.insert_fake_data(session)
+    reservation_data.insert_fake_data(session, moments)
+    article_data.insert_fake_data(session)
+    session.commit()
+
+
+def _app() -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/sync/welcome")
+    def sync_welcome(article_svc: ArticleService = Depends()) -> WelcomeOverview:
+        return article_svc.get_welcome_overview(None)
+
+    @app.get("/async/welcome")
+    async def async_welcome(
+        article_svc: ArticleService = Depends(bridged_article_svc),
+    ) -> WelcomeOverview:
+        return await article_svc.get_welcome_overview_async(None)
+
+    @app.get("/ping")
+    def ping() -> str:
+        return "pong"
+
+    return app
+
+
+def _percentile(latencies: list[float], percent: int) -> float:
+    return statistics.quantiles(latencies, n=100, method="inclusive")[percent - 1]
+
+
+async def _timed(client: httpx.AsyncClient, path: str) -> float | None:
+    """Returns the latency of a request in milliseconds, or None if it failed."""
+    start = time.perf_counter()
+    response = await client.get(path)
+    if response.is_error:
+        return None
+    return (time.perf_counter() - start) * 1000
+
+
+async def _burst(client: httpx.AsyncClient, path: str) -> list[object]:
+    """Sends `CLIENTS` concurrent requests to a path, and pings while they run."""
+    for _ in range(10):
+        await _timed(client, path)
+
+    # Interleave the pings with the burst, as requests of other users would arrive
+    calls, pings = [], []
+    for index in range(CLIENTS):
+        calls.append(_timed(client, path))
+        if index % (CLIENTS // PINGS) == 0:
+            pings.append(len(calls))
+            calls.append(_timed(client, "/ping"))
+
+    start = time.perf_counter()
+    results = await asyncio.gather(*calls)
+    elapsed = time.perf_counter() - start
+
+    ping_indices = set(pings)
+    ping_latencies = [results[index] for index in pings]
+    outcomes = [
+        result for index, result in enumerate(results) if index not in ping_indices
+    ]
+    latencies = [latency for latency in outcomes if latency is not None]
+    return [
+        _percentile(latencies, 50),
+        _percentile(latencies, 99),
+        len(latencies) / elapsed,
+        len(outcomes) - len(latencies),
+        _percentile(ping_latencies, 99),
+    ]
+
+
+async def _run(app: FastAPI) -> list[list[object]]:
+    rows = []
+    transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://benchmark", timeout=None
+    ) as client:
+        for path in ["welcome"]:
+            for mode in ["sync", "async"]:
+                rows.append([path, mode] + await _burst(client, f"/{mode}/{path}"))
+    return rows
+
+
+def main() -> None:
+    url = benchmark_engine().url
+    engine = create_pooled_engine(url, "sync", pool_timeout=POOL_TIMEOUT)
+    engine.echo = False
+    with Session(engine) as session:
+        _seed(session)
+
+    async def run() -> list[list[object]]:
+        async_engine = create_pooled_async_engine(
+            url, "async", pool_timeout=POOL_TIMEOUT
+        )
+        async_engine.echo = False
+
+        def sync_session():
+            with Session(engine) as session:
+                yield session
+
+        async def async_session():
+            async with AsyncSession(async_engine) as session:
+                yield session
+
+        app = _app()
+        app.dependency_overrides[db_session] = sync_session
+        app.dependency_overrides[async_db_session] = async_session
+        try:
+            return await _run(app)
+        finally:
+            await async_engine.dispose()
+
+    rows = asyncio.run(run())
+    print(f"{CLIENTS:,} concurrent requests per burst, with {PINGS} pings\n")
+    print_table(
+        [
+            "path",
+            "handler",
+            "p50 ms",
+            "p99 ms",
+            "requests/s",
+            "failed",
+            "ping p99 ms",
+        ],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
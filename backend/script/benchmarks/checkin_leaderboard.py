@@ -0,0 +1,190 @@
+"""
+Compares the signage check-in leaderboard grouped from reservations with the materialized counts.
+
+For semesters of increasing traffic, the script loads `USERS` users and the reservations of the
+120 days up to today, four in five of which were checked out, and reports the median time of:
+
+* group by: the query signage used before the counts, grouping every checked out reservation
+  of the current month by user,
+* top users: `CheckinLeaderboardService.top_users`, reading the first entries of the counts'
+  index for the month,
+* record check-out: adding one checked out reservation to the counts, as `ReservationService`
+  does when it checks one out, and
+* rebuild: recounting the current month from its reservations, as the reconciliation script does.
+
+Usage: python3 -m backend.script.benchmarks.checkin_leaderboard
+"""
+
+import random
+from datetime import date, datetime, timedelta
+
+from sqlalchemy import delete, func, insert, select, text
+from sqlalchemy.orm import Session
+
+from ...entities import UserEntity
+from ...entities.coworking import CheckinCountEntity, ReservationEntity
+from ...entities.coworking.reservation_user_table import reservation_user_table
+from ...models.coworking import ReservationState
+from ...services.coworking.checkin_leaderboard import (
+    CheckinLeaderboardService,
+    month_of,
+)
+from ...services.signage import MAX_LEADERBOARD_SLOTS
+from .harness import benchmark_engine, median_ms, print_table
+
+__authors__ = ["Riley Chapman"]
+__copyright__ = "Copyright 2025"
+__license__ = "MIT"
+
+USERS = 5_000
+SEMESTER_DAYS = 120
+RESERVATIONS_PER_DAY = [250, 1_000, 4_000]
+
+
+def _insert_users(session: Session) -> None:
+    session.execute(
+        insert(UserEntity),
+        [
+            {
+                "id": index + 1,
+                "pid": 700_000_000 + index,
+                "onyen": f"user{index}",
+                "email": f"user{index}@unc.edu",
+                "first_name": "First",
+                "last_name": f"Last{index}",
+            }
+            for index in range(USERS)
+        ],
+    )
+
+
+def _insert_semester(session: Session, per_day: int) -> None:
+    """Replaces the reservations with a semester of `per_day` reservations a day."""
+    session.execute(delete(reservation_user_table))
+    session.execute(delete(ReservationEntity))
+    rng = random.Random(per_day)
+    # Heavy users account for most check-ins, as on the real leaderboard
+    weights = [1 / (rank + 1) for rank in range(USERS)]
+    today = datetime.combine(date.today(), datetime.min.time())
+    reservations, parties = [], []
+    for day in range(SEMESTER_DAYS):
+        opens = today - timedelta(days=day) + timedelta(hours=9)
+        for _ in range(per_day):
+            start = opens + timedelta(minutes=rng.randrange(0, 12 * 60, 30))
+            reservations.append(
+                {
+                    "id": len(reservations) + 1,
+                    "start": start,
+                    "end": start + timedelta(hours=2),
+                    "state": (
+                        ReservationState.CHECKED_OUT
+                        if rng.random() < 0.8
+                        else ReservationState.CANCELLED
+                    ),
+                    "walkin": False,
+                    "created_at": start,
+                    "updated_at": start,
+                }
+            )
+            parties.append(
+                {
+                    "reservation_id": len(reservations),
+                    "user_id": rng.choices(range(1, USERS + 1), weights)[0],
+                }
+            )
+    session.execute(insert(ReservationEntity), reservations)
+    session.execute(insert(reservation_user_table), parties)
+    session.commit()
+    session.execute(text("ANALYZE"))
+
+
+def _group_by(session: Session, month: date) -> list:
+    """The leaderboard query signage ran on every request before the counts."""
+    query = (
+        select(UserEntity, func.count(ReservationEntity.id).label("reservation_count"))
+        .join(ReservationEntity.users)
+        .where(ReservationEntity.end >= datetime.combine(month, datetime.min.time()))
+        .where(ReservationEntity.state == ReservationState.CHECKED_OUT)
+        .group_by(UserEntity.id)
+        .order_by(func.count(ReservationEntity.id).desc())
+        .limit(MAX_LEADERBOARD_SLOTS)
+    )
+    return session.execute(query).all()
+
+
+def main() -> None:
+    engine = benchmark_engine()
+    rows = []
+    with Session(engine) as session:
+        _insert_users(session)
+        session.commit()
+        leaderboard_svc = CheckinLeaderboardService(session)
+        month = month_of(date.today())
+
+        for per_day in RESERVATIONS_PER_DAY:
+            _insert_semester(session, per_day)
+            month_reservations = session.scalar(
+                select(func.count(ReservationEntity.id)).where(
+                    ReservationEntity.end
+                    >= datetime.combine(month, datetime.min.time())
+                )
+            )
+
+            rebuild_ms = median_ms(lambda: leaderboard_svc.rebuild(month))
+            session.commit()
+            session.execute(text("ANALYZE coworking__checkin_count"))
+
+            reservation = session.scalars(
+                select(ReservationEntity)
+                .where(ReservationEntity.state == ReservationState.CHECKED_OUT)
+                .where(
+                    ReservationEntity.end
+                    >= datetime.combine(month, datetime.min.time())
+                )
+                .limit(1)
+            ).one()
+
+            def record_checkout():
+                leaderboard_svc.record_checkouts([reservation])
+                session.flush()
+
+            record_ms = median_ms(record_checkout)
+            session.rollback()
+
+            def top_users():
+                session.expunge_all()
+                leaderboard_svc.top_users(month, MAX_LEADERBOARD_SLOTS)
+
+            def group_by():
+                session.expunge_all()
+                _group_by(session, month)
+
+            rows.append(
+                [
+                    per_day * SEMESTER_DAYS,
+                    month_reservations,
+                    median_ms(group_by),
+                    median_ms(top_users),
+                    record_ms,
+                    rebuild_ms,
+                ]
+            )
+            session.execute(delete(CheckinCountEntity))
+            session.commit()
+
+    print(f"{USERS:,} users, top {MAX_LEADERBOARD_SLOTS} of the current month\n")
+    print_table(
+        [
+            "semester reservations",
+            "this month",
+            "group by ms",
+            "top users ms",
+            "record check-out ms",
+            "rebuild ms",
+        ],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
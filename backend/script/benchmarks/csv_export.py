@@ -0,0 +1,213 @@
+"""
+Compares building the hiring summary CSV in memory with streaming it.
+
+`HiringService.get_hiring_summary_for_csv` exports the committed hires of a term. With `ROWS`
+assignments across `COURSE_SITES` course sites, the script reports the time and the peak memory
+allocated by Python of exporting every row with:
+
+* in memory: the approach the export used before, loading every assignment, converting them all
+  to rows, writing the rows to a `StringIO` and taking its whole content, and
+* streaming: `get_hiring_summary_for_csv` and `encode_csv`, fetching and encoding the rows a batch
+  of `CSV_EXPORT_BATCH_SIZE` at a time, as the export endpoint sends them.
+
+Usage: python3 -m backend.script.benchmarks.csv_export
+"""
+
+import csv
+import io
+import time
+import tracemalloc
+from datetime import datetime
+from typing import Callable
+
+from sqlalchemy import Engine, insert, select
+from sqlalchemy.orm import Session
+
+from ...entities import PermissionEntity, UserEntity
+from ...entities.academics import CourseEntity, SectionEntity, TermEntity
+from ...entities.academics.hiring.hiring_assignment_entity import (
+    HiringAssignmentEntity,
+)
+from ...entities.academics.hiring.hiring_level_entity import HiringLevelEntity
+from ...entities.academics.section_member_entity import SectionMemberEntity
+from ...entities.office_hours import CourseSiteEntity
+from ...models import User
+from ...models.academics.hiring.hiring_assignment import (
+    HiringAssignmentCsvRow,
+    HiringAssignmentStatus,
+)
+from ...models.academics.hiring.hiring_level import HiringLevelClassification
+from ...models.academics.section_member import RosterRole
+from ...services import PermissionService
+from ...services.academics import HiringService
+from ...services.csv_export import CSV_EXPORT_BATCH_SIZE, encode_csv
+from ...services.permission_engine import PermissionEngine
+from .harness import benchmark_engine, print_table
+
+__authors__ = ["Riley Chapman"]
+__copyright__ = "Copyright 2025"
+__license__ = "MIT"
+
+TERM_ID = "F25"
+ROWS = 100_000
+COURSE_SITES = 200
+USERS = 5_000
+BATCH = 10_000
+
+
+def _insert_assignments(engine: Engine) -> None:
+    now = datetime.now()
+    site_ids = range(1, COURSE_SITES + 1)
+    with Session(engine) as session:
+        session.execute(
+            insert(UserEntity),
+            [
+                {
+                    "id": index + 1,
+                    "pid": 700_000_000 + index,
+                    "onyen": f"user{index}",
+                    "email": f"user{index}@unc.edu",
+                    "first_name": f"First{index}",
+                    "last_name": f"Last{index % 997}",
+                }
+                for index in range(USERS)
+            ],
+        )
+        session.add(PermissionEntity(user_id=1, action="*", resource="*"))
+        session.add(
+            TermEntity(
+                id=TERM_ID,
+                name="Fall 2025",
+                start=datetime(2025, 8, 18),
+                end=datetime(2025, 12, 12),
+            )
+        )
+        session.add(
+            HiringLevelEntity(
+                id=1,
+                title="UTA",
+                salary=2_000.0,
+                load=1.0,
+                classification=HiringLevelClassification.UG,
+            )
+        )
+        session.execute(
+            insert(CourseEntity),
+            [
+                {"id": f"comp{id}", "subject_code": "COMP", "number": f"{id}"}
+                for id in site_ids
+            ],
+        )
+        session.execute(
+            insert(CourseSiteEntity),
+            [{"id": id, "title": f"COMP {id}", "term_id": TERM_ID} for id in site_ids],
+        )
+        session.execute(
+            insert(SectionEntity),
+            [
+                {
+                    "id": id,
+                    "course_id": f"comp{id}",
+                    "number": "001",
+                    "term_id": TERM_ID,
+                    "course_site_id": id,
+                }
+                for id in site_ids
+            ],
+        )
+        session.execute(
+            insert(SectionMemberEntity),
+            [
+                {
+                    "user_id": 2 + id,
+                    "section_id": id,
+                    "member_role": RosterRole.INSTRUCTOR,
+                }
+                for id in site_ids
+            ],
+        )
+        for offset in range(0, ROWS, BATCH):
+            session.execute(
+                insert(HiringAssignmentEntity),
+                [
+                    {
+                        "term_id": TERM_ID,
+                        "course_site_id": index % COURSE_SITES + 1,
+                        "user_id": index % USERS + 1,
+                        "hiring_level_id": 1,
+                        "status": HiringAssignmentStatus.COMMIT,
+                        "position_number": f"{index}",
+                        "epar": f"{index}",
+                        "i9": True,
+                        "notes": "",
+                        "created": now,
+                        "modified": now,
+                    }
+                    for index in range(offset, offset + BATCH)
+                ],
+            )
+        session.commit()
+
+
+def _in_memory(session: Session) -> int:
+    """Builds the export the way the hiring summary CSV endpoint did before streaming."""
+    assignments = session.scalars(
+        select(HiringAssignmentEntity)
+        .join(HiringAssignmentEntity.user)
+        .where(HiringAssignmentEntity.term_id == TERM_ID)
+        .order_by(UserEntity.last_name, UserEntity.first_name)
+    ).all()
+    data = [assignment.to_csv_row() for assignment in assignments]
+    stream = io.StringIO()
+    writer = csv.DictWriter(stream, fieldnames=list(data[0].__dict__.keys()))
+    writer.writeheader()
+    writer.writerows([row.__dict__ for row in data])
+    return len(stream.getvalue())
+
+
+def _streaming(hiring_svc: HiringService, subject: User) -> int:
+    rows = hiring_svc.get_hiring_summary_for_csv(subject, TERM_ID)
+    return sum(
+        len(chunk)
+        for chunk in encode_csv(rows, list(HiringAssignmentCsvRow.model_fields))
+    )
+
+
+def _measure(export: Callable[[], int]) -> tuple[int, float, float]:
+    """Returns the length of an export, its time in ms and its peak memory in MB."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    length = export()
+    elapsed = (time.perf_counter() - start) * 1000
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return length, elapsed, peak / 1024 / 1024
+
+
+def main() -> None:
+    engine = benchmark_engine()
+    _insert_assignments(engine)
+
+    with Session(engine) as session:
+        hiring_svc = HiringService(
+            session, PermissionService(session, PermissionEngine())
+        )
+        subject = User(id=1, pid=700_000_000, onyen="user0")
+        # Loads the permissions of the subject before measuring
+        hiring_svc.get_hiring_summary_for_csv(subject, TERM_ID)
+
+        rows = []
+        for name, export in [
+            ("in memory", lambda: _in_memory(session)),
+            ("streaming", lambda: _streaming(hiring_svc, subject)),
+        ]:
+            session.expunge_all()
+            length, elapsed, peak = _measure(export)
+            rows.append([name, length, elapsed, peak])
+
+    print(f"{ROWS:,} rows, {CSV_EXPORT_BATCH_SIZE:,} per batch when streaming\n")
+    print_table(["export", "bytes", "ms", "peak MB"], rows)
+
+
+if __name__ == "__main__":
+    main()
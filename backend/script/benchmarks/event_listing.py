@@ -0,0 +1,227 @@
+"""
+Compares listing events by offset with listing them by cursor, and searching them with `ILIKE`
+with searching them through the full-text index.
+
+With `EVENTS` events across `ORGANIZATIONS` organizations, the script reports the median time of
+loading one page of events:
+
+* offset: the query `EventService.get_paginated_events` used before, skipping the events of the
+  previous pages with OFFSET and counting every matching event with COUNT(*) each time, and
+* cursor: `EventService.get_events_by_cursor`, starting after the last event of the previous page
+  through the (start, id) index, with the total served from the count cache.
+
+It then compares searching for words with the `ILIKE '%word%'` criteria used before, on event
+names and descriptions and on organization names and slugs, with the `search_vector` criteria.
+
+Usage: python3 -m backend.script.benchmarks.event_listing
+"""
+
+import random
+from datetime import datetime, timedelta
+
+from sqlalchemy import Engine, exists, func, insert, or_, select, text
+from sqlalchemy.orm import Session
+
+from ...entities import EventEntity, OrganizationEntity
+from ...models import EventCursorParams, EventPaginationParams
+from ...services import EventService, PermissionService
+from ...services.event import encode_cursor
+from ...services.event_count_cache import EventCountCache
+from ...services.permission_engine import PermissionEngine
+from .harness import benchmark_engine, median_ms, print_table
+
+__authors__ = ["Riley Chapman"]
+__copyright__ = "Copyright 2025"
+__license__ = "MIT"
+
+EVENTS = 100_000
+ORGANIZATIONS = 40
+PAGE_SIZE = 10
+PAGES = [0, 100, 1_000, 9_000]
+SEARCHES = ["hackathon", "resume review", "career", "Robotics Club"]
+BATCH = 10_000
+
+TOPICS = [
+    "hackathon",
+    "workshop",
+    "info session",
+    "resume review",
+    "career fair",
+    "tech talk",
+    "social",
+    "study hall",
+    "interview prep",
+    "game night",
+]
+WORDS = (
+    "learn build meet students faculty industry python web mobile data machine learning "
+    "systems design security cloud research internship free food pizza prizes mentors teams"
+).split()
+
+
+def _insert_events(engine: Engine) -> None:
+    rng = random.Random(0)
+    start = datetime(2025, 1, 1, 9)
+    with Session(engine) as session:
+        session.execute(
+            insert(OrganizationEntity),
+            [
+                {
+                    "id": index + 1,
+                    "name": f"{rng.choice(['Robotics', 'Chess', 'Data', 'Design'])} Club {index}",
+                    "shorthand": f"C{index}",
+                    "slug": f"club-{index}",
+                    "logo": "",
+                    "short_description": "",
+                    "long_description": "",
+                    "website": "",
+                    "email": "",
+                    "instagram": "",
+                    "linked_in": "",
+                    "youtube": "",
+                    "heel_life": "",
+                    "public": True,
+                }
+                for index in range(ORGANIZATIONS)
+            ],
+        )
+        for offset in range(0, EVENTS, BATCH):
+            session.execute(
+                insert(EventEntity),
+                [
+                    {
+                        "name": f"{rng.choice(TOPICS).title()} {index}",
+                        "start": start + timedelta(minutes=37 * index),
+                        "end": start + timedelta(minutes=37 * index + 60),
+                        "location": "Sitterson Hall",
+                        "description": " ".join(rng.choices(WORDS, k=40)),
+                        "public": True,
+                        "registration_limit": 50,
+                        "organization_id": rng.randrange(ORGANIZATIONS) + 1,
+                    }
+                    for index in range(offset, offset + BATCH)
+                ],
+            )
+        session.commit()
+
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+        connection.execute(text("VACUUM ANALYZE"))
+
+
+def _offset_page(
+    session: Session, event_svc: EventService, page: int, filter: str = ""
+) -> None:
+    """Loads a page of events the way `get_paginated_events` did before the cursor."""
+    statement = select(EventEntity)
+    length_statement = select(func.count()).select_from(EventEntity)
+    if filter != "":
+        criteria = or_(
+            EventEntity.name.ilike(f"%{filter}%"),
+            EventEntity.description.ilike(f"%{filter}%"),
+            exists().where(
+                OrganizationEntity.id == EventEntity.organization_id,
+                OrganizationEntity.name.ilike(f"%{filter}%"),
+            ),
+            exists().where(
+                OrganizationEntity.id == EventEntity.organization_id,
+                OrganizationEntity.slug.ilike(f"%{filter}%"),
+            ),
+        )
+        statement = statement.where(criteria)
+        length_statement = length_statement.where(criteria)
+    statement = (
+        statement.order_by(EventEntity.start).offset(page * PAGE_SIZE).limit(PAGE_SIZE)
+    )
+    session.execute(length_statement).scalar()
+    entities = session.execute(statement).scalars().all()
+    event_svc._to_overview_models(session, entities, None)
+
+
+def _cursor_before(session: Session, page: int) -> str:
+    """Returns the cursor of the last event before a page."""
+    if page == 0:
+        return ""
+    entity = session.scalars(
+        select(EventEntity)
+        .order_by(EventEntity.start, EventEntity.id)
+        .offset(page * PAGE_SIZE - 1)
+        .limit(1)
+    ).one()
+    return encode_cursor(entity)
+
+
+def main() -> None:
+    engine = benchmark_engine()
+    _insert_events(engine)
+
+    with Session(engine) as session:
+        event_svc = EventService(
+            session,
+            PermissionService(session, PermissionEngine()),
+            read_session=session,
+            count_cache=EventCountCache(),
+        )
+
+        page_rows = []
+        for page in PAGES:
+            after = _cursor_before(session, page)
+
+            def offset_page():
+                session.expunge_all()
+                _offset_page(session, event_svc, page)
+
+            def cursor_page():
+                session.expunge_all()
+                event_svc.get_events_by_cursor(
+                    EventCursorParams(after=after, page_size=PAGE_SIZE)
+                )
+
+            page_rows.append([page, median_ms(offset_page), median_ms(cursor_page)])
+
+        search_rows = []
+        for search in SEARCHES:
+            params = EventPaginationParams(
+                filter=search, order_by="relevance", page_size=PAGE_SIZE
+            )
+            matches = event_svc.get_paginated_events(params).length
+
+            def ilike_search():
+                session.expunge_all()
+                _offset_page(session, event_svc, 0, search)
+
+            def uncached_search():
+                session.expunge_all()
+                event_svc._count_cache.clear()
+                event_svc.get_paginated_events(params)
+
+            def cached_search():
+                session.expunge_all()
+                event_svc.get_paginated_events(params)
+
+            search_rows.append(
+                [
+                    search,
+                    matches,
+                    median_ms(ilike_search),
+                    median_ms(uncached_search),
+                    median_ms(cached_search),
+                ]
+            )
+
+    print(f"{EVENTS:,} events, {PAGE_SIZE} per page\n")
+    print_table(["page", "offset ms", "cursor ms"], page_rows)
+    print()
+    print_table(
+        [
+            "search",
+            "full-text matches",
+            "ilike ms",
+            "full-text ms",
+            "full-text, count cached ms",
+        ],
+        search_rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
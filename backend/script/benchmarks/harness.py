@@ -0,0 +1,68 @@
+"""Shared helpers for benchmark scripts.
+
+Benchmarks run against a `<POSTGRES_DATABASE>_benchmark` database that is dropped and
+recreated on every run, mirroring how the test suite manages its own database."""
+
+import statistics
+import sys
+import time
+from typing import Callable
+
+from sqlalchemy import Engine, create_engine, text
+
+from ...database import _engine_str
+from ...env import getenv
+from ... import entities
+
+__authors__ = ["Riley Chapman"]
+__copyright__ = "Copyright 2025"
+__license__ = "MIT"
+
+BENCHMARK_DATABASE = f'{getenv("POSTGRES_DATABASE")}_benchmark'
+
+
+def benchmark_engine() -> Engine:
+    """Recreates the benchmark database with an empty schema and returns an engine for it."""
+    if getenv("MODE") != "development":
+        print("Benchmarks can only be run in development mode.", file=sys.stderr)
+        exit(1)
+
+    server = create_engine(_engine_str(""), isolation_level="AUTOCOMMIT")
+    with server.connect() as connection:
+        connection.execute(text(f"DROP DATABASE IF EXISTS {BENCHMARK_DATABASE}"))
+        connection.execute(text(f"CREATE DATABASE {BENCHMARK_DATABASE}"))
+    server.dispose()
+
+    engine = create_engine(_engine_str(BENCHMARK_DATABASE))
+    entities.EntityBase.metadata.create_all(engine)
+    return engine
+
+
+def median_ms(operation: Callable[[], object], repeat: int = 5) -> float:
+    """Runs an operation `repeat` times and returns its median wall time in milliseconds."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        operation()
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def print_table(headers: list[str], rows: list[list[object]]) -> None:
+    """Prints rows as a plain-text table with right-aligned columns."""
+    cells = [headers] + [
+        [
+            (
+                f"{cell:,.1f}"
+                if isinstance(cell, float)
+                else f"{cell:,}" if isinstance(cell, int) else str(cell)
+            )
+            for cell in row
+        ]
+        for row in rows
+    ]
+    widths = [max(len(row[column]) for row in cells) for column in range(len(headers))]
+    for index, row in enumerate(cells):
+        print("  ".join(cell.rjust(width) for cell, width in zip(row, widths)))
+        if index == 0:
+            print("  ".join("-" * width for width in widths))
@@ -0,0 +1,291 @@
+"""
+Compares building the hiring admin overview site by site with building it from aggregates.
+
+`HiringService.get_hiring_admin_overview` returns, for each course site of a term, its sections,
+instructors, enrollment, assignments, and their cost and coverage. For terms with an increasing
+number of course sites, each with `SECTIONS_PER_SITE` sections and `ASSIGNMENTS_PER_SITE`
+assignments, the script reports the median time and the number of SQL statements of:
+
+* per site: the approach the service used before, loading the course sites with their sections
+  and walking the staff, assignments, levels and users of each, totaling them in Python, and
+* aggregates: `get_hiring_admin_overview`, totaling enrollment, cost and coverage by course site
+  in SQL and loading the sections, instructors and assignments of every site at once.
+
+Usage: python3 -m backend.script.benchmarks.hiring_admin_overview
+"""
+
+import random
+from datetime import datetime
+
+from sqlalchemy import Engine, event, insert, select
+from sqlalchemy.orm import Session, joinedload
+
+from ...entities import PermissionEntity, UserEntity
+from ...entities.academics import CourseEntity, SectionEntity, TermEntity
+from ...entities.academics.hiring.hiring_assignment_entity import (
+    HiringAssignmentEntity,
+)
+from ...entities.academics.hiring.hiring_level_entity import HiringLevelEntity
+from ...entities.academics.section_member_entity import SectionMemberEntity
+from ...entities.office_hours import CourseSiteEntity
+from ...models import PublicUser, User
+from ...models.academics.hiring.hiring_assignment import (
+    HiringAdminOverview,
+    HiringAssignmentStatus,
+    HiringCourseSiteOverview,
+)
+from ...models.academics.hiring.hiring_level import HiringLevelClassification
+from ...models.academics.section_member import RosterRole
+from ...services import PermissionService
+from ...services.academics import HiringService
+from ...services.permission_engine import PermissionEngine
+from .harness import benchmark_engine, median_ms, print_table
+
+__authors__ = ["Riley Chapman"]
+__copyright__ = "Copyright 2025"
+__license__ = "MIT"
+
+TERM_ID = "F25"
+COURSE_SITES = [25, 100, 300]
+SECTIONS_PER_SITE = 3
+ASSIGNMENTS_PER_SITE = 8
+USERS = 2_000
+LEVELS = [
+    ("UTA", 2_000.0, 1.0, HiringLevelClassification.UG),
+    ("MS TA", 6_000.0, 1.0, HiringLevelClassification.MS),
+    ("PhD TA", 9_000.0, 1.0, HiringLevelClassification.PHD),
+    ("Instructor", 12_000.0, 0.0, HiringLevelClassification.IOR),
+]
+
+
+def _insert_term(session: Session) -> None:
+    session.execute(
+        insert(UserEntity),
+        [
+            {
+                "id": index + 1,
+                "pid": 700_000_000 + index,
+                "onyen": f"user{index}",
+                "email": f"user{index}@unc.edu",
+                "first_name": f"First{index}",
+                "last_name": f"Last{index}",
+            }
+            for index in range(USERS)
+        ],
+    )
+    session.add(PermissionEntity(user_id=1, action="*", resource="*"))
+    session.add(
+        TermEntity(
+            id=TERM_ID,
+            name="Fall 2025",
+            start=datetime(2025, 8, 18),
+            end=datetime(2025, 12, 12),
+        )
+    )
+    session.execute(
+        insert(HiringLevelEntity),
+        [
+            {
+                "id": index + 1,
+                "title": title,
+                "salary": salary,
+                "load": load,
+                "classification": classification,
+            }
+            for index, (title, salary, load, classification) in enumerate(LEVELS)
+        ],
+    )
+    session.commit()
+
+
+def _insert_course_sites(session: Session, start: int, stop: int) -> None:
+    rng = random.Random(start)
+    now = datetime.now()
+    site_ids = range(start + 1, stop + 1)
+    session.execute(
+        insert(CourseEntity),
+        [
+            {"id": f"comp{id}", "subject_code": "COMP", "number": f"{id}"}
+            for id in site_ids
+        ],
+    )
+    session.execute(
+        insert(CourseSiteEntity),
+        [{"id": id, "title": f"COMP {id}", "term_id": TERM_ID} for id in site_ids],
+    )
+    session.execute(
+        insert(SectionEntity),
+        [
+            {
+                "id": id * SECTIONS_PER_SITE + index,
+                "course_id": f"comp{id}",
+                "number": f"00{index + 1}",
+                "term_id": TERM_ID,
+                "course_site_id": id,
+                "enrolled": rng.randrange(20, 300),
+            }
+            for id in site_ids
+            for index in range(SECTIONS_PER_SITE)
+        ],
+    )
+    session.execute(
+        insert(SectionMemberEntity),
+        [
+            {
+                "user_id": rng.randrange(2, USERS + 1),
+                "section_id": id * SECTIONS_PER_SITE + index,
+                "member_role": RosterRole.INSTRUCTOR,
+            }
+            for id in site_ids
+            for index in range(SECTIONS_PER_SITE)
+        ],
+    )
+    session.execute(
+        insert(HiringAssignmentEntity),
+        [
+            {
+                "term_id": TERM_ID,
+                "course_site_id": id,
+                "user_id": rng.randrange(2, USERS + 1),
+                "hiring_level_id": rng.randrange(len(LEVELS)) + 1,
+                "status": HiringAssignmentStatus.COMMIT,
+                "position_number": "",
+                "epar": "",
+                "i9": False,
+                "notes": "",
+                "created": now,
+                "modified": now,
+            }
+            for id in site_ids
+            for _ in range(ASSIGNMENTS_PER_SITE)
+        ],
+    )
+    session.commit()
+
+
+def _per_site(session: Session) -> HiringAdminOverview:
+    """Builds the overview the way `get_hiring_admin_overview` did before the aggregates."""
+    course_site_entities = (
+        session.scalars(
+            select(CourseSiteEntity)
+            .where(CourseSiteEntity.term_id == TERM_ID)
+            .options(joinedload(CourseSiteEntity.sections))
+        )
+        .unique()
+        .all()
+    )
+    sites = []
+    for course_site_entity in course_site_entities:
+        instructors: list[PublicUser] = []
+        total_enrollment = 0
+        for section_entity in course_site_entity.sections:
+            instructors += [
+                staff.user.to_public_model()
+                for staff in section_entity.staff
+                if staff.member_role == RosterRole.INSTRUCTOR
+            ]
+            total_enrollment += section_entity.enrolled
+        assignments = sorted(
+            [
+                assignment.to_overview_model()
+                for assignment in course_site_entity.hiring_assignments
+            ],
+            key=lambda x: x.user.last_name,
+        )
+        coverage = 0.0
+        for assignment in course_site_entity.hiring_assignments:
+            level = assignment.hiring_level
+            if level.classification == HiringLevelClassification.UG:
+                coverage += level.load * 0.25
+            elif level.classification != HiringLevelClassification.IOR:
+                coverage += level.load
+        sites.append(
+            HiringCourseSiteOverview(
+                course_site_id=course_site_entity.id,
+                sections=[
+                    section.to_catalog_identity_model()
+                    for section in course_site_entity.sections
+                ],
+                instructors=list(set(instructors)),
+                total_enrollment=total_enrollment,
+                total_cost=sum(assignment.level.salary for assignment in assignments),
+                coverage=total_enrollment / 60.0 - coverage,
+                assignments=assignments,
+            )
+        )
+    return HiringAdminOverview(sites=sites)
+
+
+def _count_statements(engine: Engine, operation) -> int:
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, many):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        operation()
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+    return len(statements)
+
+
+def main() -> None:
+    engine = benchmark_engine()
+    rows = []
+    with Session(engine) as session:
+        _insert_term(session)
+        hiring_svc = HiringService(
+            session, PermissionService(session, PermissionEngine())
+        )
+        subject = User(id=1, pid=700_000_000, onyen="user0")
+
+        inserted = 0
+        for course_sites in COURSE_SITES:
+            _insert_course_sites(session, inserted, course_sites)
+            inserted = course_sites
+
+            def per_site():
+                session.expunge_all()
+                return _per_site(session)
+
+            def aggregates():
+                session.expunge_all()
+                return hiring_svc.get_hiring_admin_overview(subject, TERM_ID)
+
+            # Both must agree on the totals before their speed is compared
+            assert [
+                (site.course_site_id, site.total_enrollment, round(site.total_cost))
+                for site in per_site().sites
+            ] == [
+                (site.course_site_id, site.total_enrollment, round(site.total_cost))
+                for site in aggregates().sites
+            ]
+            rows.append(
+                [
+                    course_sites,
+                    median_ms(per_site),
+                    _count_statements(engine, per_site),
+                    median_ms(aggregates),
+                    _count_statements(engine, aggregates),
+                ]
+            )
+
+    print(
+        f"{SECTIONS_PER_SITE} sections and {ASSIGNMENTS_PER_SITE} assignments per course "
+        "site\n"
+    )
+    print_table(
+        [
+            "course sites",
+            "per site ms",
+            "per site queries",
+            "aggregates ms",
+            "aggregates queries",
+        ],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
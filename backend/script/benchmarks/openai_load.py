@@ -0,0 +1,152 @@
+"""
+Load-tests the OpenAI call paths of the similar tickets and health features without network access.
+
+Every request is answered by `FakeOpenAITransport` after a fixed simulated model latency. For
+bursts of increasing size the script compares:
+
+* sync, 8 threads: the blocking `OpenAIService` called from a pool of 8 threads, the way sync
+  FastAPI routes occupy the server's threadpool while they wait, and
+* async: `AsyncOpenAIService.prompt_many`, which waits on the completions without holding a
+  thread, once with the same limit of 8 and once with a limit of 32.
+
+With equal limits the throughput matches, but the async path leaves every server thread free
+for other requests. Raising the async limit raises throughput without adding threads.
+
+Usage: python3 -m backend.script.benchmarks.openai_load
+"""
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+from openai import AsyncAzureOpenAI, AzureOpenAI
+
+from ...models.academics.my_courses import OfficeHourTicketOverview
+from ...models.office_hours.similar_tickets_ai import SimilarTicketsAIResponse
+from ...models.openai_test_response import OpenAITestResponse
+from ...services.office_hours.similar_tickets_prompt import SimilarTicketPromptBuilder
+from ...services.openai import AsyncOpenAIService, OpenAIService
+from ...services.openai_fake import FakeOpenAITransport
+from .harness import print_table
+
+__authors__ = ["Riley Chapman"]
+__copyright__ = "Copyright 2025"
+__license__ = "MIT"
+
+LATENCY = 0.2
+"""Simulated seconds per completion."""
+
+BURST_SIZES = [8, 32, 128]
+THREADS = 8
+ASYNC_LIMITS = [8, 32]
+
+SYSTEM_PROMPT = "Return the IDs of the past tickets similar to the current one."
+
+
+def _similar_ticket_prompt() -> str:
+    """Builds a similar tickets prompt with a full candidate budget of past tickets."""
+    past_tickets = [
+        OfficeHourTicketOverview(
+            id=ticket_id,
+            created_at="2025-01-01T12:00:00",
+            type="Assignment Help",
+            state="Closed",
+            assignment_section_description="Stuck on red black tree rotations.",
+            code_to_english_description="Rotate left when the uncle is black.",
+            concepts_needed_description="Rotations and recoloring.",
+            tactics_tried="Drew the tree on paper.",
+            meeting_summary="Walked through an insertion.",
+            solutions_used="Traced the rotation cases.",
+            concepts_for_review="Tree invariants.",
+            called_at=None,
+            concept_help_description=None,
+            caller=None,
+            caller_id=None,
+            office_hours_id=1,
+        )
+        for ticket_id in range(10)
+    ]
+    return SimilarTicketPromptBuilder().build(
+        {"assignment_section_description": "Red black tree insertion"},
+        past_tickets,
+    )
+
+
+def _client_kwargs() -> dict:
+    return {
+        "api_version": "2024-10-21",
+        "azure_endpoint": "https://openai.test",
+        "api_key": "benchmark",
+    }
+
+
+def _sync_burst(svc: OpenAIService, prompts: list[tuple[str, type]]) -> None:
+    with ThreadPoolExecutor(max_workers=THREADS) as pool:
+        list(
+            pool.map(
+                lambda prompt: svc.prompt(SYSTEM_PROMPT, prompt[0], prompt[1]),
+                prompts,
+            )
+        )
+
+
+async def _async_burst(prompts: list[tuple[str, type]], limit: int) -> None:
+    svc = AsyncOpenAIService(
+        AsyncAzureOpenAI(
+            **_client_kwargs(),
+            http_client=httpx.AsyncClient(transport=FakeOpenAITransport(LATENCY)),
+        ),
+        asyncio.Semaphore(limit),
+    )
+    similar = [prompt for prompt, model in prompts if model is SimilarTicketsAIResponse]
+    health = [prompt for prompt, model in prompts if model is OpenAITestResponse]
+    await asyncio.gather(
+        svc.prompt_many(SYSTEM_PROMPT, similar, SimilarTicketsAIResponse),
+        svc.prompt_many(SYSTEM_PROMPT, health, OpenAITestResponse),
+    )
+
+
+def _elapsed_ms(operation) -> float:
+    start = time.perf_counter()
+    operation()
+    return (time.perf_counter() - start) * 1000
+
+
+def main() -> None:
+    similar_prompt = _similar_ticket_prompt()
+    sync_svc = OpenAIService(
+        AzureOpenAI(
+            **_client_kwargs(),
+            http_client=httpx.Client(transport=FakeOpenAITransport(LATENCY)),
+        )
+    )
+
+    rows = []
+    for burst in BURST_SIZES:
+        # Half the burst opens similar tickets, the other half hits the health check
+        prompts = [
+            (
+                (similar_prompt, SimilarTicketsAIResponse)
+                if index % 2 == 0
+                else ("Orange", OpenAITestResponse)
+            )
+            for index in range(burst)
+        ]
+        sync_ms = _elapsed_ms(lambda: _sync_burst(sync_svc, prompts))
+        async_ms = [
+            _elapsed_ms(lambda: asyncio.run(_async_burst(prompts, limit)))
+            for limit in ASYNC_LIMITS
+        ]
+        rows.append([burst, sync_ms, *async_ms])
+
+    print(f"Simulated latency: {LATENCY * 1000:.0f} ms per completion\n")
+    print_table(
+        ["requests", f"sync, {THREADS} threads: ms"]
+        + [f"async, limit {limit}: ms" for limit in ASYNC_LIMITS],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
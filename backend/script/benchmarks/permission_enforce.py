@@ -0,0 +1,140 @@
+"""
+Benchmarks `PermissionService.enforce` throughput as the grants of a user grow.
+
+Half of each user's grants are direct and half come from a role. The checks cycle through an
+action granted by the last grant, an action granted by a wildcard grant, and a denied action, so
+every grant is visited before a check fails. For each grant count the script compares:
+
+* per-check queries: the original approach of reading the user's direct grants, the user's
+  roles, and the role grants on every check, then matching grant by grant,
+* compiled, uncached: one query per check and the grants compiled each time, and
+* compiled, cached: the `PermissionEngine` cache, where checks issue no queries.
+
+Usage: python3 -m backend.script.benchmarks.permission_enforce
+"""
+
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from ...entities import PermissionEntity, RoleEntity, UserEntity
+from ...entities.user_role_table import user_role_table
+from ...models import User
+from ...services.permission import PermissionService
+from ...services.permission_engine import PermissionEngine
+from .harness import benchmark_engine, median_ms, print_table
+
+__authors__ = ["Riley Chapman"]
+__copyright__ = "Copyright 2025"
+__license__ = "MIT"
+
+GRANT_COUNTS = [10, 100, 500]
+CHECKS = 1_000
+
+
+def _seed_user(session: Session, user_id: int, grants: int) -> list[tuple[str, str]]:
+    """Creates a user with `grants` grants and returns the checks to run against them."""
+    session.add(
+        UserEntity(
+            id=user_id,
+            pid=100_000_000 + user_id,
+            onyen=f"user{user_id}",
+            email=f"user{user_id}@unc.edu",
+        )
+    )
+    session.add(RoleEntity(id=user_id, name=f"role{user_id}"))
+    session.flush()
+    session.execute(insert(user_role_table).values(user_id=user_id, role_id=user_id))
+
+    rows = []
+    for index in range(grants):
+        owner = {"user_id": user_id} if index % 2 == 0 else {"role_id": user_id}
+        rows.append(
+            {
+                "action": f"organization.{index}.update",
+                "resource": f"organization/{index}",
+                **owner,
+            }
+        )
+    rows[-1] = {**rows[-1], "action": "academics.section.*", "resource": "section/*"}
+    session.execute(insert(PermissionEntity), rows)
+    session.commit()
+
+    return [
+        (f"organization.{grants - 2}.update", f"organization/{grants - 2}"),
+        ("academics.section.update", "section/42"),
+        ("user.delete", "user/1"),
+    ]
+
+
+def _per_check_queries(svc: PermissionService, subject: User, action, resource):
+    """The original check: direct grants, then role grants, matched one by one."""
+    if svc._has_permission(svc._get_user_permissions(subject), action, resource):
+        return True
+    return svc._has_permission(
+        svc._get_user_roles_permissions(subject), action, resource
+    )
+
+
+def _checks_per_second(check, checks: list[tuple[str, str]]) -> float:
+    """Runs `CHECKS` checks and returns their throughput."""
+
+    def run():
+        for index in range(CHECKS):
+            action, resource = checks[index % len(checks)]
+            check(action, resource)
+
+    return CHECKS / (median_ms(run, repeat=3) / 1000)
+
+
+def main() -> None:
+    engine = benchmark_engine()
+    rows = []
+    with Session(engine) as session:
+        for user_id, grants in enumerate(GRANT_COUNTS, start=1):
+            checks = _seed_user(session, user_id, grants)
+            subject = User(
+                id=user_id, pid=100_000_000 + user_id, onyen=f"user{user_id}"
+            )
+
+            legacy = PermissionService(session, PermissionEngine())
+            uncached = PermissionService(session, PermissionEngine(ttl=-1))
+            cached = PermissionService(session, PermissionEngine())
+
+            for svc in (legacy, uncached, cached):
+                # All three must agree before their speed is compared
+                assert [
+                    svc.check(subject, action, resource) for action, resource in checks
+                ] == [
+                    _per_check_queries(legacy, subject, action, resource)
+                    for action, resource in checks
+                ]
+
+            rows.append(
+                [
+                    grants,
+                    _checks_per_second(
+                        lambda a, r: _per_check_queries(legacy, subject, a, r), checks
+                    ),
+                    _checks_per_second(
+                        lambda a, r: uncached.check(subject, a, r), checks
+                    ),
+                    _checks_per_second(
+                        lambda a, r: cached.check(subject, a, r), checks
+                    ),
+                ]
+            )
+
+    print(f"{CHECKS:,} checks per measurement\n")
+    print_table(
+        [
+            "grants",
+            "per-check queries: checks/s",
+            "compiled, uncached: checks/s",
+            "compiled, cached: checks/s",
+        ],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
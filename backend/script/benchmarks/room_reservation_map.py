@@ -0,0 +1,270 @@
+"""
+Compares building the room reservation map room by room with building it from one query.
+
+`ReservationService.get_map_reserved_times_by_date` returns, for each reservable room, the state
+of every 30-minute slot of a day. For days with `ROOMS` rooms and an increasing number of
+reservations each, the script reports the median time and the number of SQL statements of:
+
+* per room: the approach the service used before, querying the reservations of each room with
+  their users and seats, converting them to models and painting them slot by slot into lists, and
+* slot grid: `get_map_reserved_times_by_date`, querying the reservation blocks of every room at
+  once and painting them onto a `RoomGrid`, converted to lists only at the end.
+
+Usage: python3 -m backend.script.benchmarks.room_reservation_map
+"""
+
+import random
+from datetime import date, datetime, timedelta
+
+from sqlalchemy import Engine, delete, event, insert
+from sqlalchemy.orm import Session, joinedload
+
+from ...entities import RoomEntity, UserEntity
+from ...entities.coworking import OperatingHoursEntity, ReservationEntity
+from ...entities.coworking.reservation_user_table import reservation_user_table
+from ...models import User
+from ...models.coworking import ReservationState, RoomState
+from ...services import PermissionService
+from ...services.coworking import (
+    OperatingHoursService,
+    PolicyService,
+    ReservationService,
+    SeatService,
+)
+from ...services.coworking.reservation import XL_ROOM_ID
+from ...services.permission_engine import PermissionEngine
+from .harness import benchmark_engine, median_ms, print_table
+
+__authors__ = ["Riley Chapman"]
+__copyright__ = "Copyright 2025"
+__license__ = "MIT"
+
+ROOMS = 50
+USERS = 200
+RESERVATIONS_PER_ROOM = [2, 8, 16]
+OPENS, CLOSES = 8, 22
+
+
+def _insert_rooms_and_users(session: Session, day: datetime) -> None:
+    session.execute(
+        insert(RoomEntity),
+        [
+            {
+                "id": room_id,
+                "building": "Sitterson",
+                "room": room_id,
+                "nickname": room_id,
+                "capacity": 2 + index % 8,
+                "reservable": True,
+            }
+            for index, room_id in enumerate(_room_ids())
+        ]
+        + [
+            {
+                "id": XL_ROOM_ID,
+                "building": "Sitterson",
+                "room": XL_ROOM_ID,
+                "nickname": "The XL",
+                "capacity": 40,
+                "reservable": False,
+            }
+        ],
+    )
+    session.execute(
+        insert(UserEntity),
+        [
+            {
+                "id": index + 1,
+                "pid": 700_000_000 + index,
+                "onyen": f"user{index}",
+                "email": f"user{index}@unc.edu",
+                "first_name": "First",
+                "last_name": f"Last{index}",
+            }
+            for index in range(USERS)
+        ],
+    )
+    session.add(
+        OperatingHoursEntity(
+            start=day + timedelta(hours=OPENS), end=day + timedelta(hours=CLOSES)
+        )
+    )
+    session.commit()
+
+
+def _room_ids() -> list[str]:
+    return [f"R{index:02}" for index in range(ROOMS)]
+
+
+def _insert_reservations(session: Session, day: datetime, per_room: int) -> None:
+    """Replaces the reservations with `per_room` reservations of each room, and some of the XL."""
+    session.execute(delete(reservation_user_table))
+    session.execute(delete(ReservationEntity))
+    rng = random.Random(per_room)
+    reservations, parties = [], []
+    for room_id in _room_ids() + [None] * 4:
+        for _ in range(per_room):
+            start = day + timedelta(
+                hours=OPENS, minutes=rng.randrange(0, (CLOSES - OPENS - 2) * 60, 30)
+            )
+            reservations.append(
+                {
+                    "id": len(reservations) + 1,
+                    "start": start,
+                    "end": start + timedelta(minutes=rng.choice([30, 60, 120])),
+                    "state": rng.choice(
+                        [ReservationState.CONFIRMED, ReservationState.CANCELLED]
+                    ),
+                    "walkin": False,
+                    "room_id": room_id,
+                    "created_at": start,
+                    "updated_at": start,
+                }
+            )
+            parties.append(
+                {
+                    "reservation_id": len(reservations),
+                    "user_id": rng.randrange(1, USERS + 1),
+                }
+            )
+    session.execute(insert(ReservationEntity), reservations)
+    session.execute(insert(reservation_user_table), parties)
+    session.commit()
+
+
+def _per_room(
+    session: Session, reservation_svc: ReservationService, day: datetime, subject: User
+) -> dict[str, list[int]]:
+    """The slots of the map as `get_map_reserved_times_by_date` computed them before the grid.
+
+    None of the benchmark rooms have office hours, so that step is left out.
+    """
+    rooms = [
+        room.to_details_model()
+        for room in session.query(RoomEntity).order_by(RoomEntity.id).all()
+    ]
+    opens = day + timedelta(hours=OPENS)
+    slots = 2 * (CLOSES - OPENS)
+    date_map = {}
+    for room in rooms:
+        query = session.query(ReservationEntity).filter(
+            ReservationEntity.start < day + timedelta(hours=24),
+            ReservationEntity.end > day,
+            ReservationEntity.state.not_in(
+                [ReservationState.CANCELLED, ReservationState.CHECKED_OUT]
+            ),
+        )
+        if room.id == XL_ROOM_ID:
+            query = query.join(ReservationEntity.users).filter(
+                ReservationEntity.room == None, UserEntity.id == subject.id
+            )
+        else:
+            query = (
+                query.join(ReservationEntity.room)
+                .filter(RoomEntity.id == room.id)
+                .options(
+                    joinedload(ReservationEntity.users),
+                    joinedload(ReservationEntity.seats),
+                )
+            )
+        reservations = [
+            reservation.to_model()
+            for reservation in query.order_by(ReservationEntity.start).all()
+        ]
+
+        time_slots_for_room = [RoomState.AVAILABLE.value] * slots
+        for reservation in reservations:
+            start_idx = reservation_svc._idx_calculation(reservation.start, opens)
+            end_idx = reservation_svc._idx_calculation(reservation.end, opens)
+            for idx in range(start_idx, end_idx):
+                if reservation.users[0].id == subject.id:
+                    time_slots_for_room[idx] = RoomState.SUBJECT_RESERVED.value
+                elif time_slots_for_room[idx] != RoomState.SUBJECT_RESERVED.value:
+                    time_slots_for_room[idx] = RoomState.RESERVED.value
+        date_map[room.id] = time_slots_for_room
+
+    columns = {
+        idx
+        for values in date_map.values()
+        for idx, value in enumerate(values)
+        if value == RoomState.SUBJECT_RESERVED.value
+    }
+    for values in date_map.values():
+        for idx in columns:
+            if values[idx] == RoomState.AVAILABLE.value:
+                values[idx] = RoomState.UNAVAILABLE.value
+    del date_map[XL_ROOM_ID]
+    return date_map
+
+
+def _count_statements(engine: Engine, operation) -> int:
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, many):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        operation()
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+    return len(statements)
+
+
+def main() -> None:
+    engine = benchmark_engine()
+    # A day without an ongoing half hour, so that no slot is grayed out for being past
+    day = datetime.combine(date.today() + timedelta(days=1), datetime.min.time())
+    rows = []
+    with Session(engine) as session:
+        _insert_rooms_and_users(session, day)
+        permission_svc = PermissionService(session, PermissionEngine())
+        reservation_svc = ReservationService(
+            session,
+            permission_svc,
+            PolicyService(),
+            OperatingHoursService(session, permission_svc),
+            SeatService(session),
+        )
+
+        for per_room in RESERVATIONS_PER_ROOM:
+            _insert_reservations(session, day, per_room)
+            subject = User(id=1, pid=700_000_000, onyen="user0")
+
+            def per_room_map():
+                session.expunge_all()
+                return _per_room(session, reservation_svc, day, subject)
+
+            def slot_grid_map():
+                session.expunge_all()
+                return reservation_svc.get_map_reserved_times_by_date(
+                    day, subject
+                ).reserved_date_map
+
+            # Both must agree before their speed is compared
+            assert per_room_map() == slot_grid_map()
+            rows.append(
+                [
+                    per_room,
+                    median_ms(per_room_map),
+                    _count_statements(engine, per_room_map),
+                    median_ms(slot_grid_map),
+                    _count_statements(engine, slot_grid_map),
+                ]
+            )
+
+    print(f"{ROOMS} rooms and the XL, {2 * (CLOSES - OPENS)} slots\n")
+    print_table(
+        [
+            "reservations per room",
+            "per room ms",
+            "per room queries",
+            "slot grid ms",
+            "slot grid queries",
+        ],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
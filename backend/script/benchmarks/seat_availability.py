@@ -0,0 +1,229 @@
+"""
+Compares computing seat availability with `AvailabilityList` and with integer `Availability`.
+
+`ReservationService.seat_availability` starts every seat with the open hours of the bounds, then
+subtracts each reservation from the availability of its seats, drops ranges too short to reserve,
+and returns the seats left as `SeatAvailability` models. For XL floor plans of increasing size and
+a week of reservations, the script reports the median time of that computation:
+
+* availability list: the `AvailabilityList` models the service used before, which validate a new
+  list of `TimeRange` models on every subtraction, and
+* integer boundaries: `seat_availability` over `Availability`, converting only the seats returned,
+  of which models: the part of that time spent converting the result to `SeatAvailability`.
+
+The database is not involved, as both compute from the same reservation models.
+
+Usage: python3 -m backend.script.benchmarks.seat_availability
+"""
+
+import random
+from datetime import datetime, timedelta
+
+from ...models.coworking import (
+    AvailabilityList,
+    Seat,
+    SeatAvailability,
+    TimeRange,
+)
+from ...models.coworking.seat import SeatIdentity
+from ...services.coworking.availability import (
+    Availability,
+    seat_availability,
+    to_duration,
+    to_instant,
+)
+from .harness import median_ms, print_table
+
+__authors__ = ["Riley Chapman"]
+__copyright__ = "Copyright 2025"
+__license__ = "MIT"
+
+SEAT_COUNTS = [48, 96, 192]
+RESERVATIONS_PER_SEAT_PER_DAY = [1, 3, 6]
+DAYS = 7
+OPEN_MINUTES = 10 * 60
+MINIMUM = timedelta(minutes=9)
+
+
+class BenchmarkReservation(TimeRange):
+    """The fields of `Reservation` that seat availability reads."""
+
+    seats: list[SeatIdentity]
+
+
+def _seats(count: int) -> list[Seat]:
+    return [
+        Seat(
+            id=index + 1,
+            title=f"Seat {index}",
+            shorthand=f"S{index}",
+            reservable=index % 4 == 0,
+            has_monitor=index % 2 == 0,
+            sit_stand=index % 8 == 0,
+            x=index % 16,
+            y=index // 16,
+        )
+        for index in range(count)
+    ]
+
+
+def _open_hours(today: datetime) -> list[TimeRange]:
+    return [
+        TimeRange(
+            start=today + timedelta(days=day, hours=10),
+            end=today + timedelta(days=day, hours=10, minutes=OPEN_MINUTES),
+        )
+        for day in range(DAYS)
+    ]
+
+
+def _reservations(
+    seats: list[Seat], today: datetime, per_seat: int
+) -> list[BenchmarkReservation]:
+    """Books each seat `per_seat` times a day, without overlaps, as the service ensures."""
+    rng = random.Random(len(seats) * per_seat)
+    slot = OPEN_MINUTES // per_seat
+    reservations = []
+    for day in range(DAYS):
+        opens = today + timedelta(days=day, hours=10)
+        for seat in seats:
+            for index in range(per_seat):
+                length = rng.choice(
+                    [length for length in (30, 60, 90) if length <= slot]
+                )
+                start = opens + timedelta(
+                    minutes=index * slot + rng.randrange(0, slot - length + 1, 10)
+                )
+                reservations.append(
+                    BenchmarkReservation(
+                        start=start,
+                        end=start + timedelta(minutes=length),
+                        seats=[SeatIdentity(id=seat.id)],
+                    )
+                )
+    return reservations
+
+
+def _availability_list(
+    seats: list[Seat],
+    open_hours: list[TimeRange],
+    bounds: TimeRange,
+    reservations: list[BenchmarkReservation],
+) -> list[SeatAvailability]:
+    """Seat availability as `ReservationService` computed it with `AvailabilityList`."""
+    open_availability = AvailabilityList(
+        availability=[
+            TimeRange(start=open_hour.start, end=open_hour.end)
+            for open_hour in open_hours
+        ]
+    )
+    open_availability.constrain(bounds)
+    by_seat = {
+        seat.id: SeatAvailability(
+            availability=open_availability.model_copy(deep=True).availability,
+            **seat.model_dump(),
+        )
+        for seat in seats
+    }
+    for reservation in reservations:
+        for seat in reservation.seats:
+            if seat.id in by_seat:
+                by_seat[seat.id].subtract(reservation)
+    available = []
+    for seat in by_seat.values():
+        seat.filter_time_ranges_below(MINIMUM)
+        if len(seat.availability) > 0:
+            available.append(seat)
+    return available
+
+
+def _integer_boundaries(
+    seats: list[Seat],
+    open_hours: list[TimeRange],
+    bounds: TimeRange,
+    reservations: list[BenchmarkReservation],
+) -> list[SeatAvailability]:
+    """Seat availability as `ReservationService` computes it with `Availability`."""
+    return _to_models(seats, _compute(seats, open_hours, bounds, reservations))
+
+
+def _compute(
+    seats: list[Seat],
+    open_hours: list[TimeRange],
+    bounds: TimeRange,
+    reservations: list[BenchmarkReservation],
+) -> dict[int, Availability]:
+    open_availability = Availability.from_ranges(open_hours)
+    open_availability.constrain(to_instant(bounds.start), to_instant(bounds.end))
+    return seat_availability(
+        (seat.id for seat in seats),
+        open_availability,
+        reservations,
+        to_duration(MINIMUM),
+    )
+
+
+def _to_models(
+    seats: list[Seat], availability: dict[int, Availability]
+) -> list[SeatAvailability]:
+    seats_by_id = {seat.id: seat for seat in seats}
+    return [
+        SeatAvailability(
+            availability=ranges.to_time_ranges(), **seats_by_id[seat_id].model_dump()
+        )
+        for seat_id, ranges in availability.items()
+    ]
+
+
+def main() -> None:
+    today = datetime.combine(datetime.today(), datetime.min.time())
+    open_hours = _open_hours(today)
+    bounds = TimeRange(
+        start=today + timedelta(hours=12), end=today + timedelta(days=DAYS)
+    )
+    rows = []
+    for seat_count in SEAT_COUNTS:
+        seats = _seats(seat_count)
+        for per_seat in RESERVATIONS_PER_SEAT_PER_DAY:
+            reservations = _reservations(seats, today, per_seat)
+            expected = _availability_list(seats, open_hours, bounds, reservations)
+            actual = _integer_boundaries(seats, open_hours, bounds, reservations)
+            assert [seat.availability for seat in actual] == [
+                seat.availability for seat in expected
+            ]
+
+            list_ms = median_ms(
+                lambda: _availability_list(seats, open_hours, bounds, reservations)
+            )
+            boundaries_ms = median_ms(
+                lambda: _integer_boundaries(seats, open_hours, bounds, reservations)
+            )
+            computed = _compute(seats, open_hours, bounds, reservations)
+            models_ms = median_ms(lambda: _to_models(seats, computed))
+            rows.append(
+                [
+                    seat_count,
+                    len(reservations),
+                    list_ms,
+                    boundaries_ms,
+                    models_ms,
+                    f"{list_ms / boundaries_ms:.1f}x",
+                ]
+            )
+
+    print(f"{DAYS} days of open hours, reservations of 30 to 90 minutes\n")
+    print_table(
+        [
+            "seats",
+            "reservations",
+            "availability list ms",
+            "integer boundaries ms",
+            "of which models ms",
+            "speedup",
+        ],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,212 @@
+"""
+Benchmarks similar ticket candidate selection as closed ticket history grows.
+
+Closed tickets are spread over many course sites with a fixed number of tickets per site,
+the way history accumulates term after term. For each history size the script compares:
+
+* all closed tickets: the original approach of loading every closed ticket and
+  building one prompt from all of them, and
+* candidates: the course-scoped BM25 + embedding candidate stage followed by a prompt
+  built from at most `SIMILAR_TICKETS_CANDIDATES` tickets.
+
+Prompt size and latency of the candidate path should stay flat as history grows.
+No request is sent to the AI service.
+
+Usage: python3 -m backend.script.benchmarks.similar_tickets
+"""
+
+import random
+from datetime import datetime, timedelta
+
+from sqlalchemy import insert, select
+from sqlalchemy.orm import Session
+
+from ...entities import RoomEntity
+from ...entities.academics import TermEntity
+from ...entities.office_hours import (
+    CourseSiteEntity,
+    OfficeHoursEntity,
+    OfficeHoursTicketEntity,
+)
+from ...models.office_hours.event_type import (
+    OfficeHoursEventModeType,
+    OfficeHoursEventType,
+)
+from ...models.office_hours.ticket_state import TicketState
+from ...models.office_hours.ticket_type import TicketType
+from ...services.office_hours.similar_tickets_candidates import (
+    SimilarTicketCandidateService,
+)
+from ...services.office_hours.similar_tickets_index import (
+    SIMILAR_TICKETS_CANDIDATES,
+    SimilarTicketIndexService,
+    hashing_embedding,
+)
+from ...services.office_hours.similar_tickets_prompt import SimilarTicketPromptBuilder
+from .harness import benchmark_engine, median_ms, print_table
+
+__authors__ = ["Riley Chapman"]
+__copyright__ = "Copyright 2025"
+__license__ = "MIT"
+
+HISTORY_SIZES = [1_000, 10_000, 50_000]
+TICKETS_PER_SITE = 500
+
+TOPICS = [
+    "iterating over a list with a for loop",
+    "recursion base case and stack overflow",
+    "dictionary keys and values lookup",
+    "red black tree rotations after insertion",
+    "linked list node pointers and traversal",
+    "binary search off by one index error",
+    "class constructors and instance attributes",
+    "reading a csv file and parsing rows",
+    "unit tests failing with assertion errors",
+    "git merge conflicts on the assignment branch",
+    "big o runtime of nested loops",
+    "string slicing and negative indices",
+]
+
+
+def _ticket_row(rng: random.Random, office_hours_id: int) -> dict:
+    """Generates the column values of one synthetic closed assignment ticket."""
+    topic, other = rng.sample(TOPICS, 2)
+    return {
+        "type": TicketType.ASSIGNMENT_HELP,
+        "state": TicketState.CLOSED,
+        "created_at": datetime.now() - timedelta(days=rng.randint(1, 1000)),
+        "assignment_section_description": f"Stuck on {topic} in the exercise.",
+        "code_to_english_description": f"My code should handle {topic} but it crashes.",
+        "concepts_needed_description": f"{topic} and {other}",
+        "tactics_tried": "Read the slides, added print statements, asked a peer.",
+        "meeting_summary": f"Walked through {topic} step by step on the whiteboard.",
+        "solutions_used": f"Traced an example of {topic} and fixed the bug together.",
+        "concepts_for_review": other,
+        "have_concerns": False,
+        "caller_notes": "",
+        "office_hours_id": office_hours_id,
+    }
+
+
+def _seed_sites(session: Session, first_site: int, last_site: int) -> None:
+    """Adds course sites, each with one office hours event full of closed tickets."""
+    rng = random.Random(first_site)
+    for site_id in range(first_site, last_site):
+        session.execute(
+            insert(CourseSiteEntity).values(
+                id=site_id, title=f"COMP {site_id}", term_id="F25"
+            )
+        )
+        session.execute(
+            insert(OfficeHoursEntity).values(
+                id=site_id,
+                type=OfficeHoursEventType.OFFICE_HOURS,
+                mode=OfficeHoursEventModeType.IN_PERSON,
+                description="",
+                location_description="",
+                start_time=datetime.now() - timedelta(hours=1),
+                end_time=datetime.now() + timedelta(hours=1),
+                course_site_id=site_id,
+                room_id="SN156",
+            )
+        )
+        session.execute(
+            insert(OfficeHoursTicketEntity),
+            [_ticket_row(rng, site_id) for _ in range(TICKETS_PER_SITE)],
+        )
+    session.commit()
+
+
+def main() -> None:
+    engine = benchmark_engine()
+    rows = []
+
+    with Session(engine) as session:
+        session.add(
+            TermEntity(
+                id="F25",
+                name="Fall 2025",
+                start=datetime(2025, 8, 18),
+                end=datetime(2025, 12, 10),
+            )
+        )
+        session.add(
+            RoomEntity(
+                id="SN156",
+                building="Sitterson",
+                room="156",
+                nickname="The XL",
+                capacity=40,
+                reservable=False,
+            )
+        )
+        session.commit()
+
+        index = SimilarTicketIndexService(session, hashing_embedding)
+        candidate_svc = SimilarTicketCandidateService(session, index)
+        # No token budget, so prompt sizes reflect how many tickets each approach sends
+        prompt_builder = SimilarTicketPromptBuilder(
+            token_budget=None, field_token_limit=None
+        )
+
+        seeded_sites = 0
+        for history_size in HISTORY_SIZES:
+            sites = history_size // TICKETS_PER_SITE
+            _seed_sites(session, seeded_sites + 1, sites + 1)
+            seeded_sites = sites
+            index.rebuild()
+
+            probe = session.get(OfficeHoursTicketEntity, 1)
+            prompt_input = {
+                "assignment_section_description": "Stuck on red black tree rotations after insertion.",
+                "concepts_needed_description": "rotations and recoloring",
+            }
+
+            def all_closed_prompt() -> str:
+                closed = session.scalars(
+                    select(OfficeHoursTicketEntity).where(
+                        OfficeHoursTicketEntity.state == TicketState.CLOSED
+                    )
+                ).all()
+                past_tickets = [ticket.to_overview_model() for ticket in closed]
+                return prompt_builder.build(prompt_input, past_tickets)
+
+            def candidate_prompt() -> str:
+                candidate_ids = candidate_svc.select_candidates(probe, prompt_input)
+                candidates = session.scalars(
+                    select(OfficeHoursTicketEntity).where(
+                        OfficeHoursTicketEntity.id.in_(candidate_ids)
+                    )
+                ).all()
+                past_tickets = [ticket.to_overview_model() for ticket in candidates]
+                return prompt_builder.build(prompt_input, past_tickets)
+
+            rows.append(
+                [
+                    history_size,
+                    len(all_closed_prompt()),
+                    median_ms(all_closed_prompt, repeat=3),
+                    len(candidate_prompt()),
+                    median_ms(candidate_prompt),
+                ]
+            )
+            session.expunge_all()
+
+    print(
+        f"Candidate budget: {SIMILAR_TICKETS_CANDIDATES}, tickets per course site: {TICKETS_PER_SITE}\n"
+    )
+    print_table(
+        [
+            "closed tickets",
+            "all: prompt chars",
+            "all: ms",
+            "candidates: prompt chars",
+            "candidates: ms",
+        ],
+        rows,
+    )
+    engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+"""
+Micro-benchmarks the similar tickets prompt builders at 1k, 10k and 50k past tickets.
+
+Compares three ways of building the prompt from the same synthetic tickets:
+
+* legacy: the original `_build_prompt`, which grows one string with `+=` and prints the
+  prompt (stdout is redirected to memory here, so real terminal output would be slower),
+* builder, no budget: `SimilarTicketPromptBuilder` with the token budget and field limit off,
+  to compare only the cost of assembling the same tickets, and
+* builder, budget: `SimilarTicketPromptBuilder` with the configured budget, as used in production.
+
+Usage: python3 -m backend.script.benchmarks.similar_tickets_prompt
+"""
+
+import contextlib
+import io
+import random
+from datetime import datetime
+
+from ...models.academics.my_courses import OfficeHourTicketOverview
+from ...services.office_hours.similar_tickets_prompt import (
+    SIMILAR_TICKETS_PROMPT_TOKEN_BUDGET,
+    SimilarTicketPromptBuilder,
+)
+from .harness import median_ms, print_table
+
+__authors__ = ["Riley Chapman"]
+__copyright__ = "Copyright 2025"
+__license__ = "MIT"
+
+TICKET_COUNTS = [1_000, 10_000, 50_000]
+
+WORDS = "list loop recursion tree node pointer index error class test merge runtime string slice".split()
+
+
+def _text(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(words))
+
+
+def _tickets(count: int) -> list[OfficeHourTicketOverview]:
+    """Generates closed assignment tickets with a few long fields mixed in."""
+    rng = random.Random(count)
+    return [
+        OfficeHourTicketOverview(
+            id=ticket_id,
+            created_at=datetime(2025, 1, 1),
+            called_at=None,
+            state="Closed",
+            type="Assignment Help",
+            concept_help_description=None,
+            assignment_section_description=_text(rng, 15),
+            code_to_english_description=_text(rng, 25),
+            concepts_needed_description=_text(rng, 8),
+            tactics_tried=_text(rng, 12),
+            meeting_summary=_text(rng, 400 if ticket_id % 50 == 0 else 30),
+            solutions_used=_text(rng, 20),
+            concepts_for_review=_text(rng, 5),
+            caller=None,
+            caller_id=None,
+            office_hours_id=1,
+        )
+        for ticket_id in range(count)
+    ]
+
+
+def legacy_build_prompt(
+    current_ticket: dict[str, str | None],
+    past_tickets: list[OfficeHourTicketOverview],
+) -> str:
+    """The prompt builder `SimilarTicketAIService` used before the token budget."""
+    prompt = "Current Ticket:\n"
+    for k, v in current_ticket.items():
+        if v:
+            prompt += f"{k}: {v}\n"
+
+    prompt += "\nPast Tickets:\n"
+    for t in past_tickets:
+        prompt += (
+            f"ID: {t.id}\n"
+            f"Assignment Help Description: {t.assignment_section_description}\n"
+            f"Code to English: {t.code_to_english_description}\n"
+            f"Concepts Needed: {t.concepts_needed_description}\n"
+            f"Tactics Tried: {t.tactics_tried}\n"
+            f"Meeting Summary: {t.meeting_summary}\n"
+            f"Solutions and Tools Used: {t.solutions_used}\n"
+            f"Concepts for Review: {t.concepts_for_review}\n"
+            "---\n"
+        )
+
+    prompt += '\nReturn a JSON object like: { "similar_ticket_ids": [3, 12, 17] }'
+    print(prompt)
+    return prompt
+
+
+def main() -> None:
+    current_ticket = {
+        "assignment_section_description": "Stuck on recursion over a tree",
+        "tactics_tried": "Added print statements",
+    }
+    unbudgeted = SimilarTicketPromptBuilder(token_budget=None, field_token_limit=None)
+    budgeted = SimilarTicketPromptBuilder()
+
+    rows = []
+    for count in TICKET_COUNTS:
+        tickets = _tickets(count)
+
+        def legacy() -> str:
+            with contextlib.redirect_stdout(io.StringIO()):
+                return legacy_build_prompt(current_ticket, tickets)
+
+        rows.append(
+            [
+                count,
+                median_ms(legacy),
+                median_ms(lambda: unbudgeted.build(current_ticket, tickets)),
+                median_ms(lambda: budgeted.build(current_ticket, tickets)),
+                len(legacy()),
+                len(budgeted.build(current_ticket, tickets)),
+            ]
+        )
+
+    print(f"Token budget: {SIMILAR_TICKETS_PROMPT_TOKEN_BUDGET}\n")
+    print_table(
+        [
+            "tickets",
+            "legacy: ms",
+            "builder, no budget: ms",
+            "builder, budget: ms",
+            "legacy: chars",
+            "budget: chars",
+        ],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
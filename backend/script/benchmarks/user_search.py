@@ -0,0 +1,134 @@
+"""
+Compares the two-pass `ILIKE` user search with the single ranked query of `trigram_search`.
+
+With `USERS` users, the script reports the median time of searching for each of `SEARCHES`:
+
+* two-pass: the statements `UserService.search` issued before, matching prefixes of names, onyens
+  and PIDs first, and anywhere in them and in emails only when no prefix matched,
+* trigram: `trigram_search`, finding every match through `search_text` in one ranked statement,
+  with the trigram index where the server offers `pg_trgm`, and
+* in memory: `in_memory_search`, loading and ranking every user in Python.
+
+Usage: python3 -m backend.script.benchmarks.user_search
+"""
+
+import random
+
+from sqlalchemy import Engine, String, cast, func, insert, or_, select, text
+from sqlalchemy.orm import Session
+
+from ...entities import UserEntity
+from ...services.user_search import in_memory_search, trigram_search
+from .harness import benchmark_engine, median_ms, print_table
+
+__authors__ = ["Riley Chapman"]
+__copyright__ = "Copyright 2025"
+__license__ = "MIT"
+
+USERS = 50_000
+BATCH = 10_000
+SEARCHES = ["kr", "jordan", "kris jor", "ordan", "@ad.unc", "73012", "730125577"]
+
+FIRST_NAMES = (
+    "Kris Jordan Ajay Matt Riley Sam Alex Taylor Morgan Casey Jamie Drew".split()
+)
+LAST_NAMES = (
+    "Jordan Gandecha Vu Chapman Smith Nguyen Patel Garcia Kim Lee Brown".split()
+)
+
+
+def _insert_users(engine: Engine) -> None:
+    rng = random.Random(0)
+    pids = rng.sample(range(700_000_000, 800_000_000), USERS)
+    pids[0] = 730_125_577
+    with Session(engine) as session:
+        for offset in range(0, USERS, BATCH):
+            rows = []
+            for index in range(offset, offset + BATCH):
+                first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+                onyen = f"{first[0]}{last}{index}".lower()
+                rows.append(
+                    {
+                        "id": index + 1,
+                        "pid": pids[index],
+                        "onyen": onyen,
+                        "email": f"{onyen}@{rng.choice(['unc.edu', 'ad.unc.edu'])}",
+                        "first_name": first,
+                        "last_name": last,
+                    }
+                )
+            session.execute(insert(UserEntity), rows)
+        session.commit()
+
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+        connection.execute(text("VACUUM ANALYZE"))
+
+
+def _two_pass_search(session: Session, query: str) -> list[UserEntity]:
+    """Searches users the way `UserService.search` did before the ranked query."""
+    prefix = or_(
+        func.concat(UserEntity.first_name, " ", UserEntity.last_name).ilike(
+            f"{query}%"
+        ),
+        UserEntity.last_name.ilike(f"{query}%"),
+        UserEntity.onyen.ilike(f"{query}%"),
+        cast(UserEntity.pid, String).ilike(f"{query}%"),
+    )
+    statement = select(UserEntity).order_by(UserEntity.first_name, UserEntity.last_name)
+    entities = session.scalars(statement.where(prefix).limit(50)).all()
+    if len(entities) == 0:
+        anywhere = or_(
+            func.concat(UserEntity.first_name, " ", UserEntity.last_name).ilike(
+                f"%{query}%"
+            ),
+            UserEntity.last_name.ilike(f"%{query}%"),
+            UserEntity.onyen.ilike(f"%{query}%"),
+            UserEntity.email.ilike(f"%{query}%"),
+            cast(UserEntity.pid, String).ilike(f"%{query}%"),
+        )
+        entities = session.scalars(statement.where(anywhere).limit(50)).all()
+    return entities
+
+
+def main() -> None:
+    engine = benchmark_engine()
+    _insert_users(engine)
+
+    with Session(engine) as session:
+        indexed = session.scalar(
+            text("SELECT 1 FROM pg_indexes WHERE indexname = 'user_search_trgm_idx'")
+        )
+
+        rows = []
+        for query in SEARCHES:
+
+            def two_pass():
+                session.expunge_all()
+                _two_pass_search(session, query)
+
+            def trigram():
+                session.expunge_all()
+                trigram_search(session, query)
+
+            def in_memory():
+                session.expunge_all()
+                in_memory_search(session, query)
+
+            rows.append(
+                [
+                    query,
+                    len(trigram_search(session, query)),
+                    median_ms(two_pass),
+                    median_ms(trigram),
+                    median_ms(in_memory, repeat=3),
+                ]
+            )
+
+    print(f"{USERS:,} users, trigram index {'present' if indexed else 'unavailable'}\n")
+    print_table(
+        ["search", "matches", "two-pass ms", "trigram ms", "in memory ms"], rows
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,24 @@
+"""
+This script rebuilds the similar ticket embedding index from every closed
+office hours ticket in the database.
+
+Run it after applying the migration that adds the index, or after switching
+the embedding function used by `SimilarTicketIndexService`.
+
+Usage: python3 -m backend.script.index_similar_tickets
+"""
+
+from sqlalchemy.orm import Session
+from ..database import engine
+from ..services.office_hours.similar_tickets_index import (
+    SimilarTicketIndexService,
+    embedding_function,
+)
+
+__authors__ = ["Riley Chapman"]
+__copyright__ = "Copyright 2025"
+__license__ = "MIT"
+
+with Session(engine) as session:
+    indexed = SimilarTicketIndexService(session, embedding_function()).rebuild()
+    print(f"Indexed {indexed} closed tickets.")
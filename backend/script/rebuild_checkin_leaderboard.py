@@ -0,0 +1,36 @@
+"""
+This script recounts the monthly check-in counts of the signage leaderboard
+from the checked out reservations in the database.
+
+The migration that adds the counts backfills the current month. Run it to
+count earlier months, and periodically, such as nightly, to correct counts
+that drifted from the reservations.
+Without arguments it recounts the current month. A month can be given as
+YYYY-MM.
+
+Usage: python3 -m backend.script.rebuild_checkin_leaderboard [YYYY-MM]
+"""
+
+import sys
+from datetime import date, datetime
+from sqlalchemy.orm import Session
+from ..database import engine
+from ..services.coworking.checkin_leaderboard import (
+    CheckinLeaderboardService,
+    month_of,
+)
+
+__authors__ = ["Riley Chapman"]
+__copyright__ = "Copyright 2025"
+__license__ = "MIT"
+
+month = (
+    month_of(datetime.strptime(sys.argv[1], "%Y-%m"))
+    if len(sys.argv) > 1
+    else month_of(date.today())
+)
+
+with Session(engine) as session:
+    counted = CheckinLeaderboardService(session).rebuild(month)
+    session.commit()
+    print(f"Counted the check-ins of {counted} users in {month:%B %Y}.")
@@ -0,0 +1,22 @@
+"""
+This script recounts the attendees and organizers of every event from its
+registrations in the database.
+
+`EventService` keeps the counts up to date as registrations change. Run it
+after changing registrations by other means, such as directly in the database.
+
+Usage: python3 -m backend.script.recount_event_registrations
+"""
+
+from sqlalchemy.orm import Session
+from ..database import engine
+from ..services.event import recount_registrations
+
+__authors__ = ["Riley Chapman"]
+__copyright__ = "Copyright 2025"
+__license__ = "MIT"
+
+with Session(engine) as session:
+    counted = recount_registrations(session)
+    session.commit()
+    print(f"Counted the registrations of {counted} events.")
@@ -20,6 +20,9 @@ from sqlalchemy import select, join
 from sqlalchemy.orm import joinedload, aliased
 from backend.database import db_session
 from backend.services import PermissionService, UserService
+from backend.services.identity import identity_cache
+from backend.services.permission_engine import permission_engine
+from backend.services.user_search import user_search
 
 print("=== CSXL Development Repl ===\n")
 
@@ -42,10 +45,10 @@ print(" - all models in backend/models/coworking/__init__.py")
 session = next(db_session())
 print(" - session: a SQLAlchemy ORM Session")
 
-permission_svc = PermissionService(session)
+permission_svc = PermissionService(session, permission_engine())
 print(" - permission_svc: a PermissionService")
 
-user_svc = UserService(session, permission_svc)
+user_svc = UserService(session, permission_svc, identity_cache(), user_search())
 print(" - user_svc: a UserService")
 
 print("\n=============================\n")
@@ -4,10 +4,11 @@ APIs for working with course sites.
 
 from datetime import datetime
 from itertools import groupby
+from typing import Iterator
 from fastapi import Depends
-from sqlalchemy import select, or_, func
+from sqlalchemy import Select, select, or_, func
 from sqlalchemy.orm import Session, joinedload
-from ...database import db_session
+from ...database import db_session, db_read_session
 from ...models.user import User
 from ...models.pagination import PaginationParams, Paginated
 from ...models.academics.section_member import RosterRole
@@ -31,6 +32,7 @@ from ...entities.academics.section_entity import SectionEntity
 from ...entities.office_hours import OfficeHoursEntity, CourseSiteEntity
 from ...entities.user_entity import UserEntity
 from ...entities.academics.section_member_entity import SectionMemberEntity
+from ..csv_export import stream_rows
 from ..exceptions import CoursePermissionException, ResourceNotFoundException
 
 __authors__ = ["Ajay Gandecha", "Kris Jordan"]
@@ -43,11 +45,16 @@ class CourseSiteService:
     Service that performs all of the actions on the `Section` table
     """
 
-    def __init__(self, session: Session = Depends(db_session)):
+    def __init__(
+        self,
+        session: Session = Depends(db_session),
+        read_session: Session = Depends(db_read_session),
+    ):
         """
-        Initializes the database session.
+        Initializes the database sessions.
         """
         self._session = session
+        self._read_session = read_session
 
     def get_user_course_sites(self, user: User) -> list[TermOverview]:
         """
@@ -173,15 +180,7 @@ class CourseSiteService:
             Paginated[CourseMemberOverview]
         """
 
-        # Start building the query
-        member_query = (
-            select(SectionMemberEntity)
-            .join(SectionEntity)
-            .join(UserEntity)
-            .where(SectionEntity.course_site_id == site_id)
-            .options(joinedload(SectionMemberEntity.section))
-            .options(joinedload(SectionMemberEntity.user))
-        )
+        member_query, is_student = self._roster_query(user, site_id)
 
         # Add order by sort from pagination parameters
         if pagination_params.order_by != "":
@@ -189,27 +188,6 @@ class CourseSiteService:
                 getattr(UserEntity, pagination_params.order_by)
             )
 
-        # Create query off of the member query for just the members matching
-        # with the current user (used to determine permissions)
-        user_member_query = member_query.where(SectionMemberEntity.user_id == user.id)
-        user_members = self._session.scalars(user_member_query).all()
-
-        # If the user is not a member of the looked up course, throw an error
-        if len(user_members) == 0:
-            raise CoursePermissionException(
-                "Not allowed to access the roster of a course you are not a member of."
-            )
-
-        # Determines if a user is a student
-        # NOTE: This can be used to limit roster data a user can see compared to
-        # an instructor in the future.
-        is_student = user_members[0].member_role == RosterRole.STUDENT
-
-        # In the cases where sections are taught by different instructors, ensure that
-        # the roster data only includes sections that the user has permissions for.
-        section_ids = [member.section_id for member in user_members]
-        member_query = member_query.where(SectionEntity.id.in_(section_ids))
-
         # Add filtering by inputted pagination parameters
         if pagination_params.filter != "":
             query = pagination_params.filter
@@ -222,7 +200,7 @@ class CourseSiteService:
 
         # Count the number of rows before applying pagination and filter.
         count_query = select(func.count()).select_from(member_query.subquery())
-        length = self._session.scalar(count_query)
+        length = self._read_session.scalar(count_query)
 
         # Calculate offset and limit for pagination
         offset = pagination_params.page * pagination_params.page_size
@@ -236,7 +214,7 @@ class CourseSiteService:
         )
 
         # Load the final query
-        section_member_entities = self._session.scalars(member_query).all()
+        section_member_entities = self._read_session.scalars(member_query).all()
 
         # Create paginated representation of data and return
         return Paginated(
@@ -248,6 +226,74 @@ class CourseSiteService:
             params=pagination_params,
         )
 
+    def get_course_site_roster_csv(
+        self, user: User, site_id: int
+    ) -> Iterator[CourseMemberOverview]:
+        """
+        Get the members of a course for a CSV export.
+
+        The rows are streamed from the database as they are iterated. See `stream_rows`.
+
+        Returns:
+            Iterator[CourseMemberOverview]
+        """
+        member_query, is_student = self._roster_query(user, site_id)
+        member_query = member_query.order_by(
+            SectionEntity.id,
+            UserEntity.last_name,
+            UserEntity.first_name,
+            SectionMemberEntity.id,
+        )
+        return stream_rows(
+            self._read_session.get_bind(),
+            member_query,
+            lambda member: self._to_course_member_overview(member, is_student),
+        )
+
+    def _roster_query(
+        self, user: User, site_id: int
+    ) -> tuple[Select[tuple[SectionMemberEntity]], bool]:
+        """
+        Builds the query of the members of a course that a user may see.
+
+        Returns:
+            tuple[Select, bool]: The query, and whether the user is a student of the course.
+
+        Raises:
+            CoursePermissionException: If the user is not a member of the course.
+        """
+        # Start building the query
+        member_query = (
+            select(SectionMemberEntity)
+            .join(SectionEntity)
+            .join(UserEntity)
+            .where(SectionEntity.course_site_id == site_id)
+            .options(joinedload(SectionMemberEntity.section))
+            .options(joinedload(SectionMemberEntity.user))
+        )
+
+        # Create query off of the member query for just the members matching
+        # with the current user (used to determine permissions)
+        user_member_query = member_query.where(SectionMemberEntity.user_id == user.id)
+        user_members = self._read_session.scalars(user_member_query).all()
+
+        # If the user is not a member of the looked up course, throw an error
+        if len(user_members) == 0:
+            raise CoursePermissionException(
+                "Not allowed to access the roster of a course you are not a member of."
+            )
+
+        # Determines if a user is a student
+        # NOTE: This can be used to limit roster data a user can see compared to
+        # an instructor in the future.
+        is_student = user_members[0].member_role == RosterRole.STUDENT
+
+        # In the cases where sections are taught by different instructors, ensure that
+        # the roster data only includes sections that the user has permissions for.
+        section_ids = [member.section_id for member in user_members]
+        member_query = member_query.where(SectionEntity.id.in_(section_ids))
+        return member_query, is_student
+
     def _to_course_member_overview(
         self, section_member: SectionMemberEntity, is_student: bool
     ) -> CourseMemberOverview:
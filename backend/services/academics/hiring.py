@@ -3,10 +3,17 @@ Service for hiring.
 """
 
 from itertools import groupby
-from operator import attrgetter
+from typing import Iterator
+from operator import attrgetter, itemgetter
 from fastapi import Depends
-from sqlalchemy import String, func, or_, select, update
-from sqlalchemy.orm import Session, joinedload, with_polymorphic, selectinload
+from sqlalchemy import ColumnElement, String, case, func, or_, select, update
+from sqlalchemy.orm import (
+    Session,
+    contains_eager,
+    joinedload,
+    with_polymorphic,
+    selectinload,
+)
 
 from backend.models.pagination import Paginated, PaginationParams
 from ...database import db_session
@@ -27,6 +34,7 @@ from ...entities.section_application_table import section_application_table
 from ...entities.academics.hiring.hiring_level_entity import HiringLevelEntity
 from ...entities.academics.hiring.hiring_assignment_entity import HiringAssignmentEntity
 
+from ..csv_export import stream_rows
 from ..exceptions import CoursePermissionException, ResourceNotFoundException
 from ...services import PermissionService
 from ...models.academics.hiring.application_review import (
@@ -563,87 +571,158 @@ class HiringService:
 
     # Hiring Admin Features
 
-    def _calculate_coverage(
-        self, enrollment: int, assignments: list[HiringAssignmentEntity]
-    ) -> float:
-        coverage: float = 0.0
-        for assignment in assignments:
-            if assignment.hiring_level.classification in {
-                HiringLevelClassification.MS,
-                HiringLevelClassification.PHD,
-            }:
-                coverage += assignment.hiring_level.load
-            elif assignment.hiring_level.classification == HiringLevelClassification.UG:
-                coverage += assignment.hiring_level.load * 0.25
-            else:
-                # IOR
-                coverage += 0
-
-        return (float(enrollment) / 60.0) - coverage
+    def _coverage_load(self) -> ColumnElement[float]:
+        """Returns the load an assignment covers of its course site's enrollment, per 60
+        students: its level's load for graduate students, a quarter of it for undergraduates,
+        and none for instructors of record."""
+        return case(
+            (
+                HiringLevelEntity.classification.in_(
+                    [HiringLevelClassification.MS, HiringLevelClassification.PHD]
+                ),
+                HiringLevelEntity.load,
+            ),
+            (
+                HiringLevelEntity.classification == HiringLevelClassification.UG,
+                HiringLevelEntity.load * 0.25,
+            ),
+            else_=0.0,
+        )
 
     def get_hiring_admin_overview(
         self, subject: User, term_id: str
     ) -> HiringAdminOverview:
-        """Get the overview for hiring during a given term for the site admin."""
+        """Get the overview for hiring during a given term for the site admin.
+
+        The overview is built from four queries however many course sites the term has: the
+        enrollment, cost and coverage totals of every site, their sections, their instructors,
+        and their assignments.
+        """
         # 1. Check for hiring permissions.
         self._permission.enforce(subject, "hiring.admin", "*")
-        # 2. Find the hiring information based on course sites for a given term
-        course_site_query = (
-            select(CourseSiteEntity)
-            .join(CourseSiteEntity.term)
-            .where(TermEntity.id == term_id)
-            .options(
-                joinedload(CourseSiteEntity.sections),
+        term_site_ids = select(CourseSiteEntity.id).where(
+            CourseSiteEntity.term_id == term_id
+        )
+
+        # 2. Total the enrollment of each course site's sections, and the cost and coverage
+        # of its assignments
+        enrollment_query = (
+            select(
+                SectionEntity.course_site_id,
+                func.sum(SectionEntity.enrolled).label("enrollment"),
             )
+            .where(SectionEntity.course_site_id.in_(term_site_ids))
+            .group_by(SectionEntity.course_site_id)
+            .subquery()
         )
-        course_site_entities = self._session.scalars(course_site_query).unique().all()
-
-        # 3. Assemble the overview models
-        hiring_course_site_overviews: list[HiringCourseSiteOverview] = []
-        for course_site_entity in course_site_entities:
-            # Find all of the data for a course site overview
-            section_entites = course_site_entity.sections
-            sections = [
-                section.to_catalog_identity_model() for section in section_entites
-            ]
-            instructors: list[PublicUser] = []
-            total_enrollment = 0
-            for section_entity in section_entites:
-                instructors += [
-                    staff.user.to_public_model()
-                    for staff in section_entity.staff
-                    if staff.member_role == RosterRole.INSTRUCTOR
-                ]
-                total_enrollment += section_entity.enrolled
-
-            assignments = sorted(
-                [
-                    assignment.to_overview_model()
-                    for assignment in course_site_entity.hiring_assignments
-                ],
-                key=lambda x: x.user.last_name,
+        cost_query = (
+            select(
+                HiringAssignmentEntity.course_site_id,
+                func.sum(HiringLevelEntity.salary).label("cost"),
+                func.sum(self._coverage_load()).label("coverage"),
+            )
+            .join(HiringAssignmentEntity.hiring_level)
+            .where(HiringAssignmentEntity.course_site_id.in_(term_site_ids))
+            .group_by(HiringAssignmentEntity.course_site_id)
+            .subquery()
+        )
+        totals_query = (
+            select(
+                CourseSiteEntity.id,
+                func.coalesce(enrollment_query.c.enrollment, 0),
+                func.coalesce(cost_query.c.cost, 0.0),
+                func.coalesce(cost_query.c.coverage, 0.0),
+            )
+            .outerjoin(
+                enrollment_query,
+                enrollment_query.c.course_site_id == CourseSiteEntity.id,
             )
-            total_cost = sum([assignment.level.salary for assignment in assignments])
-            coverage = self._calculate_coverage(
-                total_enrollment, course_site_entity.hiring_assignments
+            .outerjoin(cost_query, cost_query.c.course_site_id == CourseSiteEntity.id)
+            .where(CourseSiteEntity.term_id == term_id)
+            .order_by(CourseSiteEntity.id)
+        )
+        totals = self._session.execute(totals_query).all()
+
+        # 3. Load the sections, instructors and assignments of every course site at once
+        section_query = (
+            select(SectionEntity)
+            .where(SectionEntity.course_site_id.in_(term_site_ids))
+            .order_by(SectionEntity.course_site_id, SectionEntity.id)
+            .options(joinedload(SectionEntity.course))
+        )
+        sections = {
+            course_site_id: [
+                section.to_catalog_identity_model() for section in section_entities
+            ]
+            for course_site_id, section_entities in groupby(
+                self._session.scalars(section_query).all(),
+                key=attrgetter("course_site_id"),
             )
+        }
 
-            # Create overview with found data
-            course_site_overview = HiringCourseSiteOverview(
-                course_site_id=course_site_entity.id,
-                sections=sections,
-                instructors=list(set(instructors)),
-                total_enrollment=total_enrollment,
-                total_cost=total_cost,
-                coverage=coverage,
-                assignments=assignments,
+        instructor_query = (
+            select(SectionEntity.course_site_id, UserEntity)
+            .join(SectionMemberEntity, SectionMemberEntity.user_id == UserEntity.id)
+            .join(SectionEntity, SectionEntity.id == SectionMemberEntity.section_id)
+            .where(
+                SectionEntity.course_site_id.in_(term_site_ids),
+                SectionMemberEntity.member_role == RosterRole.INSTRUCTOR,
             )
+            .distinct()
+            .order_by(
+                SectionEntity.course_site_id,
+                UserEntity.last_name,
+                UserEntity.first_name,
+                UserEntity.id,
+            )
+        )
+        instructors = {
+            course_site_id: [user.to_public_model() for _, user in rows]
+            for course_site_id, rows in groupby(
+                self._session.execute(instructor_query).all(), key=itemgetter(0)
+            )
+        }
 
-            # Add overview to the list
-            hiring_course_site_overviews.append(course_site_overview)
+        assignment_query = (
+            select(HiringAssignmentEntity)
+            .join(HiringAssignmentEntity.user)
+            .where(HiringAssignmentEntity.course_site_id.in_(term_site_ids))
+            .order_by(
+                HiringAssignmentEntity.course_site_id,
+                UserEntity.last_name,
+                UserEntity.first_name,
+                HiringAssignmentEntity.id,
+            )
+            .options(
+                contains_eager(HiringAssignmentEntity.user),
+                joinedload(HiringAssignmentEntity.hiring_level),
+            )
+        )
+        assignments = {
+            course_site_id: [
+                assignment.to_overview_model() for assignment in assignment_entities
+            ]
+            for course_site_id, assignment_entities in groupby(
+                self._session.scalars(assignment_query).all(),
+                key=attrgetter("course_site_id"),
+            )
+        }
 
-        # 4. Return hiring adming overview object
-        return HiringAdminOverview(sites=hiring_course_site_overviews)
+        # 4. Assemble the overview models
+        return HiringAdminOverview(
+            sites=[
+                HiringCourseSiteOverview(
+                    course_site_id=course_site_id,
+                    sections=sections.get(course_site_id, []),
+                    instructors=instructors.get(course_site_id, []),
+                    total_enrollment=enrollment,
+                    total_cost=cost,
+                    coverage=(float(enrollment) / 60.0) - coverage,
+                    assignments=assignments.get(course_site_id, []),
+                )
+                for course_site_id, enrollment, cost, coverage in totals
+            ]
+        )
 
     def get_hiring_admin_course_overview(
         self, subject: User, course_site_id: str
@@ -880,8 +959,11 @@ class HiringService:
 
     def get_hiring_summary_for_csv(
         self, subject: User, term_id: str
-    ) -> list[HiringAssignmentCsvRow]:
-        """Returns the hires to show on a summary page for a given term."""
+    ) -> Iterator[HiringAssignmentCsvRow]:
+        """Returns the hires to show on a summary page for a given term.
+
+        The rows are streamed from the database as they are iterated. See `stream_rows`.
+        """
         # 1. Check for hiring permissions.
         self._permission.enforce(subject, "hiring.summary", "*")
         # 2. Build query
@@ -894,18 +976,32 @@ class HiringService:
                     [HiringAssignmentStatus.COMMIT, HiringAssignmentStatus.FINAL]
                 )
             )
-            .order_by(UserEntity.last_name, UserEntity.first_name)
+            .order_by(
+                UserEntity.last_name, UserEntity.first_name, HiringAssignmentEntity.id
+            )
+            .options(
+                contains_eager(HiringAssignmentEntity.user),
+                joinedload(HiringAssignmentEntity.hiring_level),
+                selectinload(HiringAssignmentEntity.course_site)
+                .selectinload(CourseSiteEntity.sections)
+                .selectinload(SectionEntity.staff)
+                .joinedload(SectionMemberEntity.user),
+            )
+        )
+        # 3. Stream items
+        return stream_rows(
+            self._session.get_bind(),
+            assignment_query,
+            HiringAssignmentEntity.to_csv_row,
         )
-        # 3. Return items
-        assignment_entities = self._session.scalars(assignment_query).all()
-        return [
-            assignment_entity.to_csv_row() for assignment_entity in assignment_entities
-        ]
 
     def get_course_site_hiring_status_csv(
         self, subject: User, course_site_id: int
-    ) -> list[ApplicationReviewCsvRow]:
-        """Retrieves the applications to a course for a CSV export."""
+    ) -> Iterator[ApplicationReviewCsvRow]:
+        """Retrieves the applications to a course for a CSV export.
+
+        The rows are streamed from the database as they are iterated. See `stream_rows`.
+        """
         # Step 0: Load a Course Site
         site_entity = self._load_course_site(course_site_id)
 
@@ -915,10 +1011,23 @@ class HiringService:
                 subject, "hiring.get_status", f"course_site/{course_site_id}"
             )
 
-        # Step 2: Convert all applicants to rows and return
-        return [
-            application.to_csv_row() for application in site_entity.application_reviews
-        ]
+        # Step 2: Stream all applicants as rows
+        review_query = (
+            select(ApplicationReviewEntity)
+            .where(ApplicationReviewEntity.course_site_id == course_site_id)
+            .order_by(ApplicationReviewEntity.id)
+            .options(
+                joinedload(ApplicationReviewEntity.application).joinedload(
+                    ApplicationEntity.user
+                ),
+                joinedload(ApplicationReviewEntity.application)
+                .selectinload(ApplicationEntity.preferred_sections)
+                .joinedload(SectionEntity.course),
+            )
+        )
+        return stream_rows(
+            self._session.get_bind(), review_query, ApplicationReviewEntity.to_csv_row
+        )
 
     def get_hiring_assignments_for_course_site(
         self, subject: User, course_site_id: int, pagination_params: PaginationParams
@@ -979,8 +1088,11 @@ class HiringService:
 
     def get_assignment_summary_for_instructors_csv(
         self, subject: User, course_site_id: int
-    ) -> list[HiringAssignmentSummaryCsvRow]:
-        """Returns the hires to show for a course site as a CSV."""
+    ) -> Iterator[HiringAssignmentSummaryCsvRow]:
+        """Returns the hires to show for a course site as a CSV.
+
+        The rows are streamed from the database as they are iterated. See `stream_rows`.
+        """
         # 1. Check for hiring permissions.
         course_site = self._load_course_site(course_site_id)
         if not self._is_instructor(subject, course_site):
@@ -997,14 +1109,19 @@ class HiringService:
                     [HiringAssignmentStatus.COMMIT, HiringAssignmentStatus.FINAL]
                 )
             )
+            .order_by(HiringAssignmentEntity.id)
+            .options(
+                joinedload(HiringAssignmentEntity.user),
+                joinedload(HiringAssignmentEntity.hiring_level),
+            )
         )
 
-        # 3. Return items
-        assignment_entities = self._session.scalars(assignments_query).all()
-        return [
-            assignment_entity.to_summary_csv_row()
-            for assignment_entity in assignment_entities
-        ]
+        # 3. Stream items
+        return stream_rows(
+            self._session.get_bind(),
+            assignments_query,
+            HiringAssignmentEntity.to_summary_csv_row,
+        )
 
     def conflict_check(
         self, subject: User, application_id: int
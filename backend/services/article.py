@@ -4,15 +4,20 @@ The Article Service allows the API to manipulate article data in the database.
 
 from fastapi import Depends
 from sqlalchemy import select, func, delete
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload, selectinload
 from datetime import datetime
 
-from ..database import db_session
+from ..database import db_session, db_read_session, run_sync
 from .exceptions import ResourceNotFoundException
 
 from ..services.event import EventService
 from ..services.permission import PermissionService
 from ..services.coworking import PolicyService, OperatingHoursService
+from .welcome_overview_cache import (
+    SharedWelcomeOverview,
+    WelcomeOverviewCache,
+    welcome_overview_cache,
+)
 
 from ..entities import (
     ArticleEntity,
@@ -21,7 +26,11 @@ from ..entities import (
     EventRegistrationEntity,
     article_author_table,
 )
-from ..entities.coworking import ReservationEntity, reservation_user_table
+from ..entities.coworking import (
+    ReservationEntity,
+    SeatEntity,
+    reservation_user_table,
+)
 
 from ..models import User
 from ..models.articles import (
@@ -30,13 +39,23 @@ from ..models.articles import (
     ArticleOverview,
     ArticleDraft,
 )
-from ..models.coworking import TimeRange
+from ..models.coworking import ReservationOverview, TimeRange
+from ..models.event import EventOverview
 from ..models.pagination import Paginated, PaginationParams
 
 __authors__ = ["Ajay Gandecha"]
 __copyright__ = "Copyright 2024"
 __license__ = "MIT"
 
+MAX_WELCOME_NEWS = 10
+"""Number of latest news articles on the welcome page."""
+
+MAX_WELCOME_RESERVATIONS = 3
+"""Number of upcoming reservations of the user on the welcome page."""
+
+MAX_WELCOME_EVENTS = 5
+"""Number of upcoming registered events of the user on the welcome page."""
+
 
 class ArticleService:
     """Service that performs all of the actions on the `article` table"""
@@ -47,96 +66,145 @@ class ArticleService:
         permission_svc: PermissionService = Depends(),
         policies_svc: PolicyService = Depends(),
         operating_hours_svc: OperatingHoursService = Depends(),
+        read_session: Session = Depends(db_read_session),
+        welcome_cache: WelcomeOverviewCache = Depends(welcome_overview_cache),
     ):
         """Initializes the session"""
         self._session = session
+        self._welcome_cache = welcome_cache
+        self._read_session = read_session
         self._permission_svc = permission_svc
         self._policies_svc = policies_svc
         self._operating_hours_svc = operating_hours_svc
 
     def get_welcome_overview(self, subject: User | None) -> WelcomeOverview:
-        """Retrieves the welcome overview."""
+        """Retrieves the welcome overview.
+
+        The announcement, news and operating hours are the same for every user and come from the
+        welcome overview cache. Only the subject's upcoming reservations and events are queried,
+        with a bounded number of statements however many the subject has."""
+        shared = self._welcome_cache.get(None, self._load_shared_welcome_overview)
+
+        future_reservations = []
+        registered_events = []
+        if subject:
+            future_reservations = self._upcoming_reservations(subject)
+            registered_events = self._registered_events(subject)
+
+        # Construct the welcome overview and return
+        return WelcomeOverview(
+            announcement=shared.announcement,
+            latest_news=shared.latest_news,
+            operating_hours=shared.operating_hours,
+            upcoming_reservations=future_reservations,
+            registered_events=registered_events,
+        )
+
+    def _load_shared_welcome_overview(self) -> SharedWelcomeOverview:
+        """Loads the part of the welcome overview shown to every user."""
         # First, retrieve the latest announcement.
         announcement_query = (
             select(ArticleEntity)
             .where(ArticleEntity.is_announcement)
             .where(ArticleEntity.state == ArticleState.PUBLISHED)
             .order_by(ArticleEntity.published.desc())
+            .limit(1)
+            .options(*self._article_overview_options())
         )
-        announcement_entity = self._session.scalars(announcement_query).all()
+        announcement_entity = self._read_session.scalars(
+            announcement_query
+        ).one_or_none()
         announcement = (
-            announcement_entity[0].to_overview_model()
-            if len(announcement_entity) > 0
-            else None
+            announcement_entity.to_overview_model() if announcement_entity else None
         )
 
         # Next, retrieve the latest news.
-        # For now, this will load a maximum of 10 articles.
         news_query = (
             select(ArticleEntity)
             .where(ArticleEntity.state == ArticleState.PUBLISHED)
             .where(ArticleEntity.is_announcement == False)
             .order_by(ArticleEntity.published.desc())
-            .limit(10)
+            .limit(MAX_WELCOME_NEWS)
+            .options(*self._article_overview_options())
         )
-        news_entities = self._session.scalars(news_query).all()
+        news_entities = self._read_session.scalars(news_query).all()
         news = [article.to_overview_model() for article in news_entities]
 
-        # Load operating hours
+        # Load operating hours, which span the reservation window of every user
         now = datetime.now()
         operating_hours = self._operating_hours_svc.schedule(
-            TimeRange(
-                start=now, end=now + self._policies_svc.reservation_window(subject)
-            )
+            TimeRange(start=now, end=now + self._policies_svc.reservation_window(None))
         )
 
-        # Load future reservations for a given user.
-        # For now, this will load a maximum of 3 future reservations.
-        future_reservations = []
-        if subject:
-            future_reservations_query = (
-                select(ReservationEntity)
-                .join(ReservationEntity.users)
-                .where(UserEntity.id == subject.id)
-                .where(ReservationEntity.start > datetime.now())
-            )
-            future_reservations_entities = self._session.scalars(
-                future_reservations_query
-            ).all()
-            future_reservations = [
-                reservation.to_overview_model()
-                for reservation in future_reservations_entities
-            ]
-
-        # Finally, load future event registrations.
-        registered_events = []
-        if subject:
-            registered_events_query = (
-                select(EventRegistrationEntity)
-                .where(EventRegistrationEntity.user_id == subject.id)
-                .join(EventEntity)
-                .where(EventEntity.start >= now)
-                .order_by(EventEntity.start)
-            )
-
-            registered_events_entities = self._session.scalars(
-                registered_events_query
-            ).all()
-
-            registered_events = [
-                registration.event.to_overview_model(subject)
-                for registration in registered_events_entities
-            ]
-
-        # Construct the welcome overview and return
-        return WelcomeOverview(
+        return SharedWelcomeOverview(
             announcement=announcement,
             latest_news=news,
             operating_hours=operating_hours,
-            upcoming_reservations=future_reservations,
-            registered_events=registered_events,
         )
 
+    @staticmethod
+    def _article_overview_options():
+        """Eagerly loads the relationships of `ArticleEntity.to_overview_model`."""
+        return (
+            joinedload(ArticleEntity.organization),
+            selectinload(ArticleEntity.authors),
+        )
+
+    def _upcoming_reservations(self, subject: User) -> list[ReservationOverview]:
+        """Loads the next reservations of a user, with their seats and room."""
+        future_reservations_query = (
+            select(ReservationEntity)
+            .join(ReservationEntity.users)
+            .where(UserEntity.id == subject.id)
+            .where(ReservationEntity.start > datetime.now())
+            .order_by(ReservationEntity.start)
+            .limit(MAX_WELCOME_RESERVATIONS)
+            .options(
+                joinedload(ReservationEntity.room),
+                selectinload(ReservationEntity.seats).joinedload(SeatEntity.room),
+            )
+        )
+        future_reservations_entities = self._read_session.scalars(
+            future_reservations_query
+        ).all()
+        return [
+            reservation.to_overview_model()
+            for reservation in future_reservations_entities
+        ]
+
+    def _registered_events(self, subject: User) -> list[EventOverview]:
+        """Loads the next events a user registered for, with their organizers."""
+        registered_events_query = (
+            select(EventRegistrationEntity)
+            .where(EventRegistrationEntity.user_id == subject.id)
+            .join(EventEntity)
+            .where(EventEntity.start >= datetime.now())
+            .order_by(EventEntity.start)
+            .limit(MAX_WELCOME_EVENTS)
+            .options(
+                joinedload(EventRegistrationEntity.event).joinedload(
+                    EventEntity.organization
+                ),
+                joinedload(EventRegistrationEntity.event)
+                .selectinload(EventEntity.organizer_registrations)
+                .joinedload(EventRegistrationEntity.user),
+            )
+        )
+        registered_events_entities = self._read_session.scalars(
+            registered_events_query
+        ).all()
+        return [
+            registration.event.to_overview_model(registration.registration_type)
+            for registration in registered_events_entities
+        ]
+
+    async def get_welcome_overview_async(self, subject: User | None) -> WelcomeOverview:
+        """Retrieves the welcome overview without holding a thread while querying.
+
+        The service must be built on the `sync_session` of an `AsyncSession`, such as by
+        `bridged_article_svc`."""
+        return await run_sync(self.get_welcome_overview, subject)
+
     def get_article(self, slug: str) -> ArticleOverview:
         """Access a single article by slug"""
         article_query = select(ArticleEntity).where(ArticleEntity.slug == slug)
@@ -194,6 +262,7 @@ class ArticleService:
                 )
             )
         self._session.commit()
+        self._welcome_cache.clear()
 
         # 5. Return
         return article_entity.to_overview_model()
@@ -240,6 +309,7 @@ class ArticleService:
                 )
             )
         self._session.commit()
+        self._welcome_cache.clear()
 
         # 5. Return
         return article_entity.to_overview_model()
@@ -259,3 +329,4 @@ class ArticleService:
         # 3. Delete the article
         self._session.delete(article_entity)
         self._session.commit()
+        self._welcome_cache.clear()
@@ -0,0 +1,153 @@
+"""
+Defines a small in-process runner for work that should not hold up an API request.
+
+Jobs run on a bounded thread pool, so at most `BACKGROUND_JOBS_MAX_WORKERS` of them run at once
+and the rest wait in the pool's queue. A job that raises one of its retryable exceptions is retried
+with exponential backoff up to `BACKGROUND_JOBS_MAX_ATTEMPTS` times. Jobs do not survive a restart
+of the worker process, so they must only compute results that can also be computed on demand.
+"""
+
+import functools
+import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Callable
+
+from ..env import getenv
+from ..models.background_jobs import BackgroundJobStats
+
+__authors__ = ["Riley Chapman"]
+__copyright__ = "Copyright 2025"
+__license__ = "MIT"
+
+BACKGROUND_JOBS_MAX_WORKERS = int(getenv("BACKGROUND_JOBS_MAX_WORKERS", default="4"))
+"""Maximum number of background jobs running at the same time."""
+
+BACKGROUND_JOBS_MAX_ATTEMPTS = int(getenv("BACKGROUND_JOBS_MAX_ATTEMPTS", default="3"))
+"""Maximum number of times a job is attempted before it is counted as failed."""
+
+BACKGROUND_JOBS_BACKOFF = float(getenv("BACKGROUND_JOBS_BACKOFF", default="1.0"))
+"""Seconds to wait before the first retry. Each further retry waits twice as long."""
+
+logger = logging.getLogger(__name__)
+
+
+class BackgroundJobRunner:
+    """Runs jobs on a bounded thread pool with retries and exposes its queue depth."""
+
+    def __init__(
+        self,
+        max_workers: int = BACKGROUND_JOBS_MAX_WORKERS,
+        max_attempts: int = BACKGROUND_JOBS_MAX_ATTEMPTS,
+        backoff: float = BACKGROUND_JOBS_BACKOFF,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="background-job"
+        )
+        self._max_attempts = max_attempts
+        self._backoff = backoff
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._futures: set[Future] = set()
+        self._queued = 0
+        self._running = 0
+        self._succeeded = 0
+        self._failed = 0
+        self._retried = 0
+
+    def submit(
+        self,
+        name: str,
+        job: Callable[[], None],
+        retry_on: tuple[type[Exception], ...] = (Exception,),
+    ) -> Future:
+        """
+        Queues a job to run in the background.
+
+        Args:
+            name (str): Name of the job, used when logging failures.
+            job (Callable[[], None]): The work to run.
+            retry_on (tuple[type[Exception], ...]): Exceptions that cause the job to be retried.
+                Any other exception fails the job immediately.
+
+        Returns:
+            Future: Completes once the job has succeeded or failed for good.
+        """
+        with self._lock:
+            self._queued += 1
+            future = self._executor.submit(self._run, name, job, retry_on)
+            self._futures.add(future)
+        future.add_done_callback(self._forget)
+        return future
+
+    def stats(self) -> BackgroundJobStats:
+        """Returns the queue depth and job counters."""
+        with self._lock:
+            return BackgroundJobStats(
+                queued=self._queued,
+                running=self._running,
+                succeeded=self._succeeded,
+                failed=self._failed,
+                retried=self._retried,
+            )
+
+    def join(self, timeout: float | None = None) -> None:
+        """Waits until every job submitted so far has finished."""
+        with self._lock:
+            futures = list(self._futures)
+        wait(futures, timeout=timeout)
+
+    def shutdown(self) -> None:
+        """Waits for queued jobs to finish and stops the worker threads."""
+        self._executor.shutdown(wait=True)
+
+    def _run(
+        self,
+        name: str,
+        job: Callable[[], None],
+        retry_on: tuple[type[Exception], ...],
+    ) -> None:
+        with self._lock:
+            self._queued -= 1
+            self._running += 1
+        try:
+            for attempt in range(1, self._max_attempts + 1):
+                try:
+                    job()
+                except retry_on as exception:
+                    if attempt == self._max_attempts:
+                        raise
+                    delay = self._backoff * 2 ** (attempt - 1)
+                    logger.warning(
+                        "Background job %s failed (attempt %d), retrying in %.1fs: %s",
+                        name,
+                        attempt,
+                        delay,
+                        exception,
+                    )
+                    with self._lock:
+                        self._retried += 1
+                    self._sleep(delay)
+                else:
+                    with self._lock:
+                        self._succeeded += 1
+                    return
+        except Exception:
+            logger.exception("Background job %s failed", name)
+            with self._lock:
+                self._failed += 1
+        finally:
+            with self._lock:
+                self._running -= 1
+
+    def _forget(self, future: Future) -> None:
+        with self._lock:
+            self._futures.discard(future)
+
+
+@functools.cache
+def background_job_runner() -> BackgroundJobRunner:
+    """Dependency offering the application-wide background job runner."""
+    return BackgroundJobRunner()
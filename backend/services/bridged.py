@@ -0,0 +1,142 @@
+"""
+Dependencies building services on the `sync_session` of an `AsyncSession`.
+
+Async route handlers depend on these instead of the services themselves. The services are the
+same classes that sync routes use, and their `_async` methods run them through `run_sync`, so that
+their queries are sent by asyncpg while the event loop serves other requests. The services of one
+request share a single session, as `db_session` does for sync routes, and reads that tolerate
+replication lag use `bridged_read_session`, as sync services use `db_read_session`.
+"""
+
+from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from ..database import async_db_read_session, async_db_session
+from .article import ArticleService
+from .coworking import (
+    OperatingHoursService,
+    PolicyService,
+    ReservationService,
+    SeatService,
+    StatusService,
+)
+from .identity import IdentityCache, identity_cache
+from .office_hours.live_queue import LiveQueueRegistry, live_queue_registry
+from .office_hours.office_hours import OfficeHoursService
+from .office_hours.similar_tickets import OfficeHourSimilarTicketService
+from .office_hours.similar_tickets_ai import SimilarTicketAIService
+from .office_hours.similar_tickets_cache import (
+    SimilarTicketCache,
+    similar_ticket_cache,
+)
+from .office_hours.similar_tickets_candidates import SimilarTicketCandidateService
+from .office_hours.similar_tickets_index import (
+    EmbeddingFunction,
+    SimilarTicketIndexService,
+    embedding_function,
+)
+from .permission import PermissionService
+from .permission_engine import PermissionEngine, permission_engine
+from .user import UserService
+from .user_search import UserSearch, user_search
+from .welcome_overview_cache import WelcomeOverviewCache, welcome_overview_cache
+
+__authors__ = ["Riley Chapman"]
+__copyright__ = "Copyright 2025"
+__license__ = "MIT"
+
+
+async def bridged_session(
+    session: AsyncSession = Depends(async_db_session),
+) -> Session:
+    """Dependency offering the `sync_session` of the request's `AsyncSession`."""
+    return session.sync_session
+
+
+async def bridged_read_session(
+    session: AsyncSession = Depends(async_db_read_session),
+) -> Session:
+    """Dependency offering the `sync_session` of the request's read-only `AsyncSession`."""
+    return session.sync_session
+
+
+async def bridged_permission_svc(
+    session: Session = Depends(bridged_session),
+    engine: PermissionEngine = Depends(permission_engine),
+) -> PermissionService:
+    return PermissionService(session, engine)
+
+
+async def bridged_user_svc(
+    session: Session = Depends(bridged_session),
+    permission_svc: PermissionService = Depends(bridged_permission_svc),
+    identity: IdentityCache = Depends(identity_cache),
+    search: UserSearch = Depends(user_search),
+) -> UserService:
+    return UserService(session, permission_svc, identity, search)
+
+
+async def bridged_reservation_svc(
+    session: Session = Depends(bridged_session),
+    permission_svc: PermissionService = Depends(bridged_permission_svc),
+) -> ReservationService:
+    return ReservationService(
+        session,
+        permission_svc,
+        PolicyService(),
+        OperatingHoursService(session, permission_svc),
+        SeatService(session),
+    )
+
+
+async def bridged_status_svc(
+    session: Session = Depends(bridged_session),
+    permission_svc: PermissionService = Depends(bridged_permission_svc),
+    reservation_svc: ReservationService = Depends(bridged_reservation_svc),
+) -> StatusService:
+    return StatusService(
+        PolicyService(),
+        OperatingHoursService(session, permission_svc),
+        SeatService(session),
+        reservation_svc,
+    )
+
+
+async def bridged_office_hours_svc(
+    session: Session = Depends(bridged_session),
+    live_queue: LiveQueueRegistry = Depends(live_queue_registry),
+) -> OfficeHoursService:
+    return OfficeHoursService(session, live_queue)
+
+
+async def bridged_similar_ticket_svc(
+    session: Session = Depends(bridged_session),
+    ai_service: SimilarTicketAIService = Depends(),
+    embed: EmbeddingFunction = Depends(embedding_function),
+    cache: SimilarTicketCache = Depends(similar_ticket_cache),
+) -> OfficeHourSimilarTicketService:
+    return OfficeHourSimilarTicketService(
+        session,
+        ai_service,
+        SimilarTicketCandidateService(
+            session, SimilarTicketIndexService(session, embed)
+        ),
+        cache,
+    )
+
+
+async def bridged_article_svc(
+    session: Session = Depends(bridged_session),
+    read_session: Session = Depends(bridged_read_session),
+    permission_svc: PermissionService = Depends(bridged_permission_svc),
+    welcome_cache: WelcomeOverviewCache = Depends(welcome_overview_cache),
+) -> ArticleService:
+    return ArticleService(
+        session,
+        permission_svc,
+        PolicyService(),
+        OperatingHoursService(session, permission_svc),
+        read_session,
+        welcome_cache,
+    )
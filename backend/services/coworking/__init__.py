@@ -3,3 +3,5 @@ from .status import StatusService
 from .operating_hours import OperatingHoursService
 from .seat import SeatService
 from .reservation import ReservationService
+from .checkin_leaderboard import CheckinLeaderboardService
+from .reservation_sweeper import ReservationSweepService
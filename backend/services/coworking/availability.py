@@ -0,0 +1,164 @@
+"""
+Availability over time, as sorted integer boundaries.
+
+`ReservationService.seat_availability` starts every seat with the operating hours of the bounds
+and subtracts each reservation of the seat from it. Doing so with `AvailabilityList` validated a
+new list of `TimeRange` models on every subtraction. `Availability` instead keeps the open ranges
+of a seat as a flat, sorted list of integer boundaries, where a subtraction is two binary searches
+and a splice. Only the seats that are returned are converted to models, by `to_time_ranges`.
+
+Boundaries are microseconds since `EPOCH`, so that converting to and from naive datetimes is exact.
+"""
+
+from bisect import bisect_left, bisect_right
+from datetime import datetime, timedelta
+from typing import Iterable, Self
+
+from ...models.coworking import Reservation, TimeRange
+
+__authors__ = ["Riley Chapman"]
+__copyright__ = "Copyright 2025"
+__license__ = "MIT"
+
+EPOCH = datetime(2000, 1, 1)
+MICROSECOND = timedelta(microseconds=1)
+
+
+def to_instant(moment: datetime) -> int:
+    """Converts a naive datetime to microseconds since `EPOCH`."""
+    return (moment - EPOCH) // MICROSECOND
+
+
+def to_datetime(instant: int) -> datetime:
+    """Converts microseconds since `EPOCH` back to a naive datetime."""
+    return EPOCH + instant * MICROSECOND
+
+
+def to_duration(duration: timedelta) -> int:
+    """Converts a timedelta to microseconds."""
+    return duration // MICROSECOND
+
+
+class Availability:
+    """Disjoint, half-open ranges of available time.
+
+    `boundaries` alternates the start and end of each range, in increasing order, so that an
+    instant is available when an odd number of boundaries are at or before it.
+    """
+
+    __slots__ = ("boundaries",)
+
+    def __init__(self, boundaries: list[int] | None = None):
+        self.boundaries: list[int] = boundaries if boundaries is not None else []
+
+    @classmethod
+    def from_ranges(cls, ranges: Iterable[TimeRange]) -> Self:
+        """Builds availability from time ranges sorted by start that do not overlap."""
+        boundaries = []
+        for time_range in ranges:
+            boundaries += (to_instant(time_range.start), to_instant(time_range.end))
+        return cls(boundaries)
+
+    def copy(self) -> Self:
+        """Returns availability with the same ranges, which can be changed independently."""
+        return type(self)(self.boundaries.copy())
+
+    def __bool__(self) -> bool:
+        return len(self.boundaries) > 0
+
+    def __len__(self) -> int:
+        return len(self.boundaries) // 2
+
+    def start(self) -> int:
+        """Start of the first range. The availability must not be empty."""
+        return self.boundaries[0]
+
+    def end(self) -> int:
+        """End of the last range. The availability must not be empty."""
+        return self.boundaries[-1]
+
+    def first_duration(self) -> int:
+        """Duration of the first range. The availability must not be empty."""
+        return self.boundaries[1] - self.boundaries[0]
+
+    def constrain(self, start: int, end: int) -> None:
+        """Removes availability outside of [start, end)."""
+        if self and start > self.start():
+            self.subtract(self.start(), start)
+        if self and end < self.end():
+            self.subtract(end, self.end())
+
+    def subtract(self, start: int, end: int) -> None:
+        """Removes the availability that overlaps [start, end)."""
+        if start >= end:
+            return
+        boundaries = self.boundaries
+        # Boundaries before `start`, then boundaries at or before `end`: an odd count means the
+        # instant falls within a range, which is cut at that instant.
+        low = bisect_left(boundaries, start)
+        high = bisect_right(boundaries, end)
+        splice = []
+        if low % 2 == 1:
+            splice.append(start)
+        if high % 2 == 1:
+            splice.append(end)
+        boundaries[low:high] = splice
+
+    def filter_below(self, minimum: int) -> None:
+        """Removes ranges shorter than `minimum`."""
+        boundaries = self.boundaries
+        self.boundaries = [
+            instant
+            for index in range(0, len(boundaries), 2)
+            if boundaries[index + 1] - boundaries[index] >= minimum
+            for instant in boundaries[index : index + 2]
+        ]
+
+    def total(self) -> int:
+        """Sum of the durations of all ranges."""
+        boundaries = self.boundaries
+        return sum(boundaries[1::2]) - sum(boundaries[0::2])
+
+    def to_time_ranges(self) -> list[TimeRange]:
+        """Converts the ranges to `TimeRange` models."""
+        boundaries = self.boundaries
+        return [
+            TimeRange(
+                start=to_datetime(boundaries[index]),
+                end=to_datetime(boundaries[index + 1]),
+            )
+            for index in range(0, len(boundaries), 2)
+        ]
+
+
+def seat_availability(
+    seat_ids: Iterable[int],
+    open_availability: Availability,
+    reservations: Iterable[Reservation],
+    minimum: int,
+) -> dict[int, Availability]:
+    """Computes the availability of seats from the open hours and their reservations.
+
+    Args:
+        seat_ids (Iterable[int]): IDs of the seats of interest.
+        open_availability (Availability): Open hours within the bounds of interest.
+        reservations (Iterable[Reservation]): Reservations of the seats during the open hours.
+        minimum (int): Shortest duration, in microseconds, of a range worth keeping.
+
+    Returns:
+        dict[int, Availability]: Availability of the seats with any left, by seat ID.
+    """
+    availability = {seat_id: open_availability.copy() for seat_id in seat_ids}
+    for reservation in reservations:
+        start, end = to_instant(reservation.start), to_instant(reservation.end)
+        for seat in reservation.seats:
+            if seat.id in availability:
+                availability[seat.id].subtract(start, end)
+
+    for seat_availability in availability.values():
+        seat_availability.filter_below(minimum)
+    return {
+        seat_id: seat_availability
+        for seat_id, seat_availability in availability.items()
+        if seat_availability
+    }
@@ -0,0 +1,143 @@
+"""
+Service that maintains the monthly check-in counts of the signage leaderboard.
+
+Rather than grouping every reservation of the month each time the leaderboard is read,
+`ReservationService` adds each reservation it checks out to the counts of its users, in the same
+transaction as the change of state. The leaderboard then reads the first entries of the counts'
+index for the month, which costs the same however many reservations the month has.
+
+Counts are kept per month of a reservation's end. Should they drift from the reservations, such
+as when two workers check out the same reservation at once, `rebuild` recounts a month from the
+reservations themselves. `python3 -m backend.script.rebuild_checkin_leaderboard` runs it.
+"""
+
+from collections import Counter
+from datetime import date, datetime
+from typing import Iterable, Sequence
+
+from fastapi import Depends
+from sqlalchemy import delete, func, insert, literal, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from ...database import db_session
+from ...entities import UserEntity
+from ...entities.coworking import CheckinCountEntity, ReservationEntity
+from ...entities.coworking.reservation_user_table import reservation_user_table
+from ...models.coworking import ReservationState
+
+__authors__ = ["Riley Chapman"]
+__copyright__ = "Copyright 2025"
+__license__ = "MIT"
+
+
+def month_of(moment: date) -> date:
+    """Returns the first day of the month of a date or datetime."""
+    return date(moment.year, moment.month, 1)
+
+
+def next_month(month: date) -> date:
+    """Returns the first day of the month after a month."""
+    return date(month.year + month.month // 12, month.month % 12 + 1, 1)
+
+
+class CheckinLeaderboardService:
+    """CheckinLeaderboardService is the access layer to the monthly check-in counts of users."""
+
+    def __init__(self, session: Session = Depends(db_session)):
+        """Initializes a new CheckinLeaderboardService.
+
+        Args:
+            session (Session): The database session to use, typically injected by FastAPI.
+        """
+        self._session = session
+
+    def record_checkouts(self, reservations: Iterable[ReservationEntity]) -> None:
+        """Adds reservations that were just checked out to the counts of their users.
+
+        The counts are updated in the session's transaction, so they are committed along with
+        the reservations' change of state.
+
+        Args:
+            reservations (Iterable[ReservationEntity]): Reservations now in the CHECKED_OUT state.
+        """
+        increments: Counter[tuple[date, int]] = Counter()
+        for reservation in reservations:
+            for user in reservation.users:
+                increments[(month_of(reservation.end), user.id)] += 1
+        if not increments:
+            return
+
+        statement = pg_insert(CheckinCountEntity).values(
+            [
+                {"month": month, "user_id": user_id, "count": count}
+                for (month, user_id), count in increments.items()
+            ]
+        )
+        self._session.execute(
+            statement.on_conflict_do_update(
+                index_elements=[CheckinCountEntity.month, CheckinCountEntity.user_id],
+                set_={"count": CheckinCountEntity.count + statement.excluded.count},
+            )
+        )
+
+    def top_users(self, month: date, limit: int) -> Sequence[UserEntity]:
+        """Returns the users with the most check-ins in a month, most check-ins first.
+
+        Args:
+            month (date): First day of the month.
+            limit (int): Maximum number of users to return.
+
+        Returns:
+            Sequence[UserEntity]: Users ordered by descending check-ins, then by ID.
+        """
+        query = (
+            select(UserEntity)
+            .join(CheckinCountEntity, CheckinCountEntity.user_id == UserEntity.id)
+            .where(CheckinCountEntity.month == month)
+            .order_by(CheckinCountEntity.count.desc(), CheckinCountEntity.user_id)
+            .limit(limit)
+        )
+        return self._session.scalars(query).all()
+
+    def rebuild(self, month: date) -> int:
+        """Recounts the check-ins of a month from its checked out reservations.
+
+        The counts are replaced in the session's transaction, which the caller commits.
+
+        Args:
+            month (date): First day of the month.
+
+        Returns:
+            int: The number of users with check-ins in the month.
+        """
+        counts = (
+            select(
+                literal(month).label("month"),
+                reservation_user_table.c.user_id,
+                func.count(ReservationEntity.id).label("count"),
+            )
+            .select_from(ReservationEntity)
+            .join(
+                reservation_user_table,
+                reservation_user_table.c.reservation_id == ReservationEntity.id,
+            )
+            .where(ReservationEntity.state == ReservationState.CHECKED_OUT)
+            .where(
+                ReservationEntity.end >= datetime.combine(month, datetime.min.time())
+            )
+            .where(
+                ReservationEntity.end
+                < datetime.combine(next_month(month), datetime.min.time())
+            )
+            .group_by(reservation_user_table.c.user_id)
+        )
+        self._session.execute(
+            delete(CheckinCountEntity).where(CheckinCountEntity.month == month)
+        )
+        result = self._session.execute(
+            insert(CheckinCountEntity).from_select(
+                ["month", "user_id", "count"], counts
+            )
+        )
+        return result.rowcount
@@ -4,8 +4,8 @@ from fastapi import Depends
 from datetime import datetime, timedelta
 from random import random
 from typing import Sequence
-from sqlalchemy import or_, and_
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import and_, func, or_, select
+from sqlalchemy.orm import Session, joinedload, selectinload
 from backend.entities.room_entity import RoomEntity
 
 from backend.models.room_details import RoomDetails
@@ -22,20 +22,32 @@ from ...models.coworking import (
     SeatAvailability,
     ReservationState,
     RoomState,
-    AvailabilityList,
-    OperatingHours,
 )
 from ...entities import UserEntity
 from ...entities.coworking import ReservationEntity, SeatEntity
+from ...entities.coworking.reservation_user_table import reservation_user_table
 from .seat import SeatService
 from .policy import PolicyService
 from .operating_hours import OperatingHoursService
+from .checkin_leaderboard import CheckinLeaderboardService
+from .reservation_sweeper import transition_due
+from .room_grid import RoomGrid
+from .availability import (
+    Availability,
+    seat_availability,
+    to_datetime,
+    to_duration,
+    to_instant,
+)
 from ..permission import PermissionService
 
 __authors__ = ["Kris Jordan", "Matt Vu", "Yuvraj Jain"]
 __copyright__ = "Copyright 2023-24"
 __license__ = "MIT"
 
+XL_ROOM_ID = "SN156"
+"""ID of the XL, whose row of the room reservation map holds the subject's seat reservations."""
+
 
 class ReservationException(Exception):
     def __init__(self, message: str):
@@ -146,6 +158,7 @@ class ReservationService:
                 ReservationEntity.state.not_in(
                     [ReservationState.CANCELLED, ReservationState.CHECKED_OUT]
                 ),
+                ~transition_due(self._policy_svc, datetime.now()),
                 UserEntity.id == focus.id,
             )
             .options(
@@ -155,10 +168,6 @@ class ReservationService:
             .all()
         )
 
-        reservations = self._state_transition_reservation_entities_by_time(
-            datetime.now(), reservations
-        )
-
         return [reservation.to_model() for reservation in reservations]
 
     def _get_active_reservations_for_user_by_state(
@@ -174,6 +183,7 @@ class ReservationService:
                 ReservationEntity.start < time_range.end,
                 ReservationEntity.end > time_range.start,
                 ReservationEntity.state == state,
+                ~transition_due(self._policy_svc, datetime.now()),
                 UserEntity.id == focus.id,
             )
             .options(
@@ -183,10 +193,6 @@ class ReservationService:
             .all()
         )
 
-        reservations = self._state_transition_reservation_entities_by_time(
-            datetime.now(), reservations
-        )
-
         return [reservation.to_model() for reservation in reservations]
 
     def _check_user_reservation_duration(
@@ -325,44 +331,16 @@ class ReservationService:
         current_time = datetime.now()
         current_time_idx = self._idx_calculation(current_time, operating_hours_start)
 
+        grid = RoomGrid(
+            (room.id for room in rooms if room.id), operating_hours_duration
+        )
         for room in rooms:
-            time_slots_for_room = [0] * operating_hours_duration
-
             # # Making slots up till current time gray
             # This code no longer required, but may be required in the future.
             # Please keep this here for now.
             # if date.date() == current_time.date():
-            #     for i in range(0, current_time_idx):
-            #         time_slots_for_room[i] = RoomState.UNAVAILABLE.value
+            #     grid.fill(room.id, 0, current_time_idx, RoomState.UNAVAILABLE)
 
-            if room.id == "SN156":
-                reservations = self._query_xl_reservations_by_date_for_user(
-                    date, subject
-                )
-            else:
-                reservations = self._query_confirmed_reservations_by_date_and_room(
-                    date, room.id
-                )
-            for reservation in reservations:
-                start_idx = self._idx_calculation(
-                    reservation.start, operating_hours_start
-                )
-                end_idx = self._idx_calculation(reservation.end, operating_hours_start)
-
-                if date.date() == current_time.date():
-                    if end_idx < current_time_idx:
-                        continue
-                    start_idx = max(current_time_idx, start_idx)
-
-                for idx in range(start_idx, end_idx):
-                    # Currently only assuming single user.
-                    # TODO: If making group reservations, need to change this.
-                    if reservation.users[0].id == subject.id:
-                        time_slots_for_room[idx] = RoomState.SUBJECT_RESERVED.value
-                    else:
-                        if time_slots_for_room[idx] != RoomState.SUBJECT_RESERVED.value:
-                            time_slots_for_room[idx] = RoomState.RESERVED.value
-            reserved_date_map[room.id] = time_slots_for_room
             capacity_map[room.id] = room.capacity
             room_type_map[room.id] = (
                 "Pairing Room"
@@ -370,12 +348,27 @@ class ReservationService:
                 else "Small Group" if room.capacity < 6 else "Large Group"
             )
 
-        self._transform_date_map_for_unavailable(reserved_date_map)
-        if "SN156" in reserved_date_map:
-            del reserved_date_map["SN156"]
-        self._transform_date_map_for_officehours(
-            date, reserved_date_map, operating_hours_start, operating_hours_duration
-        )
+        # Reservations of others are painted first, so that the subject's own take precedence.
+        blocks = self._query_reservation_blocks_by_date(date, subject, grid.room_ids)
+        for room_id, start, end, is_subject in blocks:
+            start_idx = self._idx_calculation(start, operating_hours_start)
+            end_idx = self._idx_calculation(end, operating_hours_start)
+
+            if date.date() == current_time.date():
+                if end_idx < current_time_idx:
+                    continue
+                start_idx = max(current_time_idx, start_idx)
+
+            grid.fill(
+                room_id,
+                start_idx,
+                end_idx,
+                RoomState.SUBJECT_RESERVED if is_subject else RoomState.RESERVED,
+            )
+
+        grid.block_subject_reserved_columns()
+        self._fill_office_hours(grid, date, operating_hours_start, exclude=XL_ROOM_ID)
+        reserved_date_map = grid.to_date_map(exclude=[XL_ROOM_ID])
 
         return ReservationMapDetails(
             reserved_date_map=reserved_date_map,
@@ -438,118 +431,78 @@ class ReservationService:
             (time.minute - operating_hours_start.minute) // 30
         )
 
-    def _transform_date_map_for_unavailable(
-        self, reserved_date_map: dict[str, list[int]]
-    ) -> None:
-        """
-        Modifies the reserved date map to mark certain slots as unavailable.
-
-        This function updates the reserved date map so that if a slot is reserved by the subject
-        (indicated by a 4), then any available slots (indicated by 0) in the same column across
-        all rooms are marked as unavailable (changed to 3).
-
-        Args:
-            reserved_date_map (dict[str, list[int]]): The map of room reservations to be transformed.
-
-        Returns:
-            None: This function modifies the reserved_date_map in place.
-        """
-        # Identify the columns where 4 appears
-        columns_with_4 = set()
-        for key, values in reserved_date_map.items():
-            for i, value in enumerate(values):
-                if value == RoomState.SUBJECT_RESERVED.value:
-                    columns_with_4.add(i)
-
-        # Transform the dictionary as per the rules
-        for key, values in reserved_date_map.items():
-            for i in columns_with_4:
-                if values[i] == RoomState.AVAILABLE.value:
-                    values[i] = RoomState.UNAVAILABLE.value
-
-    def _transform_date_map_for_officehours(
+    def _fill_office_hours(
         self,
+        grid: RoomGrid,
         date: datetime,
-        reserved_date_map: dict[str, list[int]],
         operating_hours_start: datetime,
-        operating_hours_duration: int,
+        exclude: str | None = None,
     ) -> None:
-        """
-        Transforms date map in place.
-        """
+        """Grays out the slots of rooms during office hours on a date, except in room `exclude`."""
         office_hours = self._policy_svc.office_hours(date=date)
         for room_id, hours in office_hours.items():
-            if room_id not in reserved_date_map:
+            if room_id not in grid or room_id == exclude:
                 continue
             for start, end in hours:
-                start_idx = max(self._idx_calculation(start, operating_hours_start), 0)
-                end_idx = min(
+                grid.fill(
+                    room_id,
+                    self._idx_calculation(start, operating_hours_start),
                     self._idx_calculation(end, operating_hours_start),
-                    operating_hours_duration,
+                    RoomState.UNAVAILABLE,
                 )
-                if start_idx < end_idx:
-                    for idx in range(start_idx, end_idx):
-                        reserved_date_map[room_id][idx] = RoomState.UNAVAILABLE.value
 
-    def _query_confirmed_reservations_by_date_and_room(
-        self, date: datetime, room_id: str
-    ) -> Sequence[Reservation]:
+    def _query_reservation_blocks_by_date(
+        self, date: datetime, subject: User, room_ids: Sequence[str]
+    ) -> Sequence[tuple[str, datetime, datetime, bool]]:
         """
-        Queries and returns confirmed and checked-in reservations for a given date and room.
+        Queries the active reservations of rooms on a date, in a single query.
 
-        This function fetches all confirmed and checked-in reservations from the database for a specified date and room.
-        It includes reservations that have any overlap with the 24-hour period starting from the
-        beginning of the given date, and are associated with a specific room ID.
+        Room reservations are included for every room in `room_ids`. When the XL is among them,
+        the subject's own XL seat reservations, which have no room, are included under its ID.
 
         Args:
-            date (datetime): The date for which to query confirmed reservations.
-            room_id (str): The ID of the room for which to query confirmed reservations.
+            date (datetime): The date for which to query reservations.
+            subject (User): The user whose reservations are marked as their own.
+            room_ids (Sequence[str]): IDs of the rooms of the map.
 
         Returns:
-            Sequence[Reservation]: A sequence of Reservation model objects representing the confirmed reservations for the specified date and room.
+            Sequence[tuple[str, datetime, datetime, bool]]: The room ID, start, end and whether the
+                subject is a party of each reservation, the subject's reservations last.
         """
         start = date.replace(hour=0, minute=0, second=0, microsecond=0)
-        reservations = (
-            self._session.query(ReservationEntity)
-            .join(ReservationEntity.room)
-            .filter(
-                ReservationEntity.start < start + timedelta(hours=24),
-                ReservationEntity.end > start,
-                ReservationEntity.state.not_in(
-                    [ReservationState.CANCELLED, ReservationState.CHECKED_OUT]
-                ),
-                RoomEntity.id == room_id,
-            )
-            .options(
-                joinedload(ReservationEntity.users), joinedload(ReservationEntity.seats)
-            )
-            .order_by(ReservationEntity.start)
-            .all()
+        is_subject = (
+            select(reservation_user_table.c.user_id)
+            .where(reservation_user_table.c.reservation_id == ReservationEntity.id)
+            .where(reservation_user_table.c.user_id == subject.id)
+            .exists()
         )
+        in_rooms = ReservationEntity.room_id.in_(
+            [room_id for room_id in room_ids if room_id != XL_ROOM_ID]
+        )
+        if XL_ROOM_ID in room_ids:
+            in_rooms = or_(
+                in_rooms, and_(ReservationEntity.room_id == None, is_subject)
+            )
 
-        return [reservation.to_model() for reservation in reservations]
-
-    def _query_xl_reservations_by_date_for_user(
-        self, date: datetime, subject: User
-    ) -> Sequence[Reservation]:
-        start = date.replace(hour=0, minute=0, second=0, microsecond=0)
-        reservations = (
-            self._session.query(ReservationEntity)
-            .join(ReservationEntity.users)
-            .filter(
+        query = (
+            select(
+                func.coalesce(ReservationEntity.room_id, XL_ROOM_ID),
+                ReservationEntity.start,
+                ReservationEntity.end,
+                is_subject,
+            )
+            .where(
                 ReservationEntity.start < start + timedelta(hours=24),
                 ReservationEntity.end > start,
                 ReservationEntity.state.not_in(
                     [ReservationState.CANCELLED, ReservationState.CHECKED_OUT]
                 ),
-                ReservationEntity.room == None,
-                UserEntity.id == subject.id,
+                ~transition_due(self._policy_svc, datetime.now()),
+                in_rooms,
             )
-            .order_by(ReservationEntity.start)
-            .all()
+            .order_by(is_subject, ReservationEntity.start)
         )
-
-        return [reservation.to_model() for reservation in reservations]
+        return [tuple(row) for row in self._session.execute(query)]
 
     def _get_reservable_rooms(self) -> Sequence[RoomDetails]:
         """
@@ -565,7 +518,8 @@ class ReservationService:
         """
         rooms = (
             self._session.query(RoomEntity)
-            .where(or_(RoomEntity.reservable == True, RoomEntity.id == "SN156"))
+            .where(or_(RoomEntity.reservable == True, RoomEntity.id == XL_ROOM_ID))
+            .options(selectinload(RoomEntity.seats))
             .order_by(RoomEntity.id)
             .all()
         )
@@ -593,6 +547,7 @@ class ReservationService:
                 ReservationEntity.state.not_in(
                     [ReservationState.CANCELLED, ReservationState.CHECKED_OUT]
                 ),
+                ~transition_due(self._policy_svc, datetime.now()),
                 SeatEntity.id.in_([seat.id for seat in seats]),
             )
             .options(
@@ -601,64 +556,8 @@ class ReservationService:
             .all()
         )
 
-        reservations = self._state_transition_reservation_entities_by_time(
-            datetime.now(), reservations
-        )
-
         return [reservation.to_model() for reservation in reservations]
 
-    def _state_transition_reservation_entities_by_time(
-        self, cutoff: datetime, reservations: Sequence[ReservationEntity]
-    ) -> Sequence[ReservationEntity]:
-        """Private, internal helper method for transitioning reservation entities
-        based on time. Three transitions are time-based:
-
-        1. Draft -> Cancelled following PolicyService#reservation_draft_timeout() after
-           the reservation's created at.
-        2. Confirmed -> Cancelled following PolicyService#reservation_checkin_timeout() after
-            the reservation's start.
-        3. Checked In -> Checked Out following the reservation's end.
-
-        Args:
-            moment (datetime): The time in which checks of expiration are made against. In
-                production, this is the current time.
-            reservations (Sequence[ReservationEntity]): The list of entities to state transition.
-
-        Returns:
-            Sequence[ReservationEntity] - All ReservationEntities that were not state transitioned.
-        """
-        valid: list[ReservationEntity] = []
-        dirty = False
-        for reservation in reservations:
-            if (
-                reservation.state == ReservationState.DRAFT
-                and reservation.created_at
-                + self._policy_svc.reservation_draft_timeout()
-                < cutoff
-            ):
-                reservation.state = ReservationState.CANCELLED
-                dirty = True
-            elif (
-                reservation.state == ReservationState.CONFIRMED
-                and reservation.start + self._policy_svc.reservation_checkin_timeout()
-                < cutoff
-            ):
-                reservation.state = ReservationState.CANCELLED
-                dirty = True
-            elif (
-                reservation.state == ReservationState.CHECKED_IN
-                and reservation.end <= cutoff
-            ):
-                reservation.state = ReservationState.CHECKED_OUT
-                dirty = True
-            else:
-                valid.append(reservation)
-
-        if dirty:
-            self._session.commit()
-
-        return valid
-
     def seat_availability(
         self, seats: Sequence[Seat], bounds: TimeRange
     ) -> Sequence[SeatAvailability]:
@@ -694,56 +593,54 @@ class ReservationService:
         if len(open_hours) == 0:
             return []
 
-        # Convert the operating hours during the bounds into an availability list
-        # and constrain the availability list within the bounds.
-        open_availability_list = self._operating_hours_to_bounded_availability_list(
-            open_hours, bounds
-        )
-        if len(open_availability_list.availability) == 0:
+        # Convert the operating hours during the bounds into availability
+        # and constrain the availability within the bounds.
+        open_availability = Availability.from_ranges(open_hours)
+        open_availability.constrain(to_instant(bounds.start), to_instant(bounds.end))
+        if not open_availability:
             return []
 
-        # Start from a position where all seats begin with same availability as
-        # open_availability_list. From there, reservations will subtract availability
-        # from the given seat.
-        seat_availability_dict = self._initialize_seat_availability_dict(
-            seats, open_availability_list
-        )
-
         # Get all active reservations during the availability bounds for the seats.
         reservation_range = TimeRange(
-            start=open_availability_list.availability[0].start,
-            end=open_availability_list.availability[-1].end,
+            start=to_datetime(open_availability.start()),
+            end=to_datetime(open_availability.end()),
         )
         reservations = self.get_seat_reservations(seats, reservation_range)
 
-        # Subtract all seat reservations from their availability
-        self._remove_reservations_from_availability(
-            seat_availability_dict, reservations
-        )
-
-        # Remove seats with availability below threshold
-        available_seats: list[SeatAvailability] = list(
-            self._prune_seats_below_availability_threshold(
-                list(seat_availability_dict.values()),
+        # Starting from the open hours, subtract all seat reservations from their
+        # availability and remove seats with availability below threshold
+        availability = seat_availability(
+            (seat.id for seat in seats if seat.id is not None),
+            open_availability,
+            reservations,
+            to_duration(
                 self._policy_svc.minimum_reservation_duration()
-                - MINUMUM_RESERVATION_EPSILON,
-            )
+                - MINUMUM_RESERVATION_EPSILON
+            ),
         )
+        seats_by_id = {seat.id: seat for seat in seats}
+        available_seats = [
+            (seats_by_id[seat_id], ranges) for seat_id, ranges in availability.items()
+        ]
 
         # Sort by nearest available ASC, duration DESC, reservable (False before True), with entropy
         # The rationale for entropy is when XL is wide open for walkins, within the given seat search
         # we'd like to mix up the order in which seats are assigned rather than always giving away
         # the same sequence of seats (and causing more consisten wear and tear to it).
         available_seats.sort(
-            key=lambda sa: (
-                sa.availability[0].start,
-                -1 * sa.availability[0].duration(),
-                sa.reservable,
+            key=lambda pair: (
+                pair[1].start(),
+                -1 * pair[1].first_duration(),
+                pair[0].reservable,
                 random(),
             )
         )
 
-        return available_seats
+        # Only the seats returned are converted to models
+        return [
+            SeatAvailability(availability=ranges.to_time_ranges(), **seat.model_dump())
+            for seat, ranges in available_seats
+        ]
 
     def draft_reservation(
         self, subject: User, request: ReservationRequest
@@ -940,6 +837,8 @@ class ReservationService:
             dirty = dirty or self._change_state(entity, delta.state)
             if entity.state == ReservationState.CHECKED_OUT:
                 entity.end = datetime.now()
+                if dirty:
+                    CheckinLeaderboardService(self._session).record_checkouts([entity])
 
         # Handle Requested Seat Changes?
         if delta.seats is not None:
@@ -1121,51 +1020,6 @@ class ReservationService:
 
     # Private helper methods
 
-    def _operating_hours_to_bounded_availability_list(
-        self, operating_hours: Sequence[OperatingHours], bounds: TimeRange
-    ) -> AvailabilityList:
-        availability = AvailabilityList(
-            availability=[
-                TimeRange(start=operating_hour.start, end=operating_hour.end)
-                for operating_hour in operating_hours
-            ]
-        )
-        availability.constrain(bounds)
-        return availability
-
-    def _initialize_seat_availability_dict(
-        self, seats: Sequence[Seat], availability: AvailabilityList
-    ) -> dict[int, SeatAvailability]:
-        return {
-            seat.id: SeatAvailability(
-                availability=availability.model_copy(deep=True).availability,
-                **seat.model_dump(),
-            )
-            for seat in seats
-            if seat.id is not None
-        }
-
-    def _remove_reservations_from_availability(
-        self,
-        seat_availability_dict: dict[int, SeatAvailability],
-        reservations: Sequence[Reservation],
-    ):
-        for reservation in reservations:
-            if len(reservation.seats) > 0:
-                for seat in reservation.seats:
-                    if seat.id in seat_availability_dict:
-                        seat_availability_dict[seat.id].subtract(reservation)
-
-    def _prune_seats_below_availability_threshold(
-        self, seats: Sequence[SeatAvailability], threshold: timedelta
-    ) -> Sequence[SeatAvailability]:
-        available_seats: list[SeatAvailability] = []
-        for seat in seats:
-            seat.filter_time_ranges_below(threshold)
-            if len(seat.availability) > 0:
-                available_seats.append(seat)
-        return available_seats
-
     def _fetch_conflicting_room_reservations(
         self, request: ReservationRequest
     ) -> list[ReservationEntity]:
@@ -1184,6 +1038,7 @@ class ReservationService:
                         ReservationState.CHECKED_IN,
                     )
                 ),
+                ~transition_due(self._policy_svc, datetime.now()),
                 ReservationEntity.room_id == request.room.id,
             )
             .all()
@@ -0,0 +1,223 @@
+"""
+Applies the time-based state transitions of reservations in the background.
+
+Three transitions of a reservation depend only on time:
+
+1. Draft -> Cancelled once `PolicyService.reservation_draft_timeout` has passed since its creation.
+2. Confirmed -> Cancelled once `PolicyService.reservation_checkin_timeout` has passed since its
+   start, as no one checked in.
+3. Checked In -> Checked Out once it has ended.
+
+`ReservationService` used to apply them to whichever reservations a read happened to load, and
+commit, so reads paid for writes and contended for row locks. The `ReservationSweeper` of each
+process now applies them every `RESERVATION_SWEEP_INTERVAL` seconds on a background thread, with
+one `UPDATE ... WHERE` statement per transition. Reads leave out the reservations matched by
+`transition_due`, so they return the same reservations whether or not a sweep ran since.
+
+Sweeps are idempotent. Each statement only matches reservations still in the state it transitions
+from, so sweeping again changes nothing. When the sweepers of two processes race, the database
+re-checks the state of a row updated by the other, so only one of them transitions it and records
+its check-in on the leaderboard.
+"""
+
+import functools
+import logging
+import threading
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Callable
+
+from fastapi import Depends
+from sqlalchemy import ColumnElement, and_, or_, select, update
+from sqlalchemy.orm import Session, selectinload
+
+from ...database import db_session, engine
+from ...entities.coworking import ReservationEntity
+from ...env import getenv
+from ...models.coworking import ReservationState
+from .checkin_leaderboard import CheckinLeaderboardService
+from .policy import PolicyService
+
+__authors__ = ["Riley Chapman"]
+__copyright__ = "Copyright 2025"
+__license__ = "MIT"
+
+RESERVATION_SWEEP_INTERVAL = float(getenv("RESERVATION_SWEEP_INTERVAL", default="60"))
+"""Seconds between sweeps of the reservations due for a time-based transition."""
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class Transition:
+    """A time-based transition from one state to another, and when it is due."""
+
+    source: ReservationState
+    due: ColumnElement[bool]
+    target: ReservationState
+
+    def matches(self) -> ColumnElement[bool]:
+        """Matches the reservations due for the transition."""
+        return and_(ReservationEntity.state == self.source, self.due)
+
+
+def transitions(policy_svc: PolicyService, cutoff: datetime) -> list[Transition]:
+    """Returns the time-based transitions, due as of `cutoff`, in the order sweeps apply them."""
+    return [
+        Transition(
+            ReservationState.DRAFT,
+            ReservationEntity.created_at
+            < cutoff - policy_svc.reservation_draft_timeout(),
+            ReservationState.CANCELLED,
+        ),
+        Transition(
+            ReservationState.CONFIRMED,
+            ReservationEntity.start < cutoff - policy_svc.reservation_checkin_timeout(),
+            ReservationState.CANCELLED,
+        ),
+        Transition(
+            ReservationState.CHECKED_IN,
+            ReservationEntity.end <= cutoff,
+            ReservationState.CHECKED_OUT,
+        ),
+    ]
+
+
+def transition_due(policy_svc: PolicyService, cutoff: datetime) -> ColumnElement[bool]:
+    """Matches the reservations due for any time-based transition as of `cutoff`."""
+    return or_(
+        *(transition.matches() for transition in transitions(policy_svc, cutoff))
+    )
+
+
+@dataclass(frozen=True)
+class ReservationSweep:
+    """Numbers of reservations transitioned by one sweep."""
+
+    expired_drafts: int
+    no_shows: int
+    checked_out: int
+
+
+class ReservationSweepService:
+    """ReservationSweepService applies the time-based transitions of every reservation at once."""
+
+    def __init__(
+        self,
+        session: Session = Depends(db_session),
+        policy_svc: PolicyService = Depends(),
+        leaderboard_svc: CheckinLeaderboardService = Depends(),
+    ):
+        """Initializes a new ReservationSweepService.
+
+        Args:
+            session (Session): The database session to use, typically injected by FastAPI.
+        """
+        self._session = session
+        self._policy_svc = policy_svc
+        self._leaderboard_svc = leaderboard_svc
+
+    def sweep(self, cutoff: datetime) -> ReservationSweep:
+        """Applies the transitions due as of `cutoff` and commits them.
+
+        Args:
+            cutoff (datetime): The time expiration is checked against. In production, this is
+                the current time.
+
+        Returns:
+            ReservationSweep: The numbers of reservations transitioned.
+        """
+        transitioned: list[list[int]] = []
+        for transition in transitions(self._policy_svc, cutoff):
+            ids = self._session.scalars(
+                update(ReservationEntity)
+                .where(transition.matches())
+                .values(state=transition.target)
+                .returning(ReservationEntity.id)
+            ).all()
+            transitioned.append(list(ids))
+        expired_drafts, no_shows, checked_out = transitioned
+
+        if checked_out:
+            self._leaderboard_svc.record_checkouts(
+                self._session.scalars(
+                    select(ReservationEntity)
+                    .where(ReservationEntity.id.in_(checked_out))
+                    .options(selectinload(ReservationEntity.users))
+                )
+            )
+        self._session.commit()
+        return ReservationSweep(len(expired_drafts), len(no_shows), len(checked_out))
+
+
+class ReservationSweeper:
+    """Sweeps the reservations of the database on a schedule, on a daemon thread."""
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        interval: float = RESERVATION_SWEEP_INTERVAL,
+        now: Callable[[], datetime] = datetime.now,
+    ):
+        """
+        Args:
+            session_factory (Callable[[], Session]): Opens the session each sweep writes with.
+            interval (float): Seconds between sweeps.
+            now (Callable[[], datetime]): Current time sweeps check expiration against,
+                replaceable in tests.
+        """
+        self._session_factory = session_factory
+        self._interval = interval
+        self._now = now
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def sweep(self) -> ReservationSweep:
+        """Applies the transitions due now, in a session of its own."""
+        with self._session_factory() as session:
+            sweep = ReservationSweepService(
+                session, PolicyService(), CheckinLeaderboardService(session)
+            ).sweep(self._now())
+        if sweep.expired_drafts or sweep.no_shows or sweep.checked_out:
+            logger.info(
+                "Swept %d expired drafts, %d no-shows and %d checked out reservations",
+                sweep.expired_drafts,
+                sweep.no_shows,
+                sweep.checked_out,
+            )
+        return sweep
+
+    def start(self) -> None:
+        """Starts sweeping on a daemon thread, unless it is running already."""
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self._run, name="reservation-sweeper", daemon=True
+            )
+            self._thread.start()
+
+    def stop(self, timeout: float | None = None) -> None:
+        """Stops the sweeping thread, waiting for a sweep in progress to finish."""
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            self._stop.set()
+            thread.join(timeout)
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self.sweep()
+            except Exception:
+                # Reads leave out reservations due for a transition until a sweep succeeds
+                logger.exception("Could not sweep the reservations")
+            self._stop.wait(self._interval)
+
+
+@functools.cache
+def reservation_sweeper() -> ReservationSweeper:
+    """Returns the reservation sweeper of this process, which the app lifespan starts and stops."""
+    return ReservationSweeper(functools.partial(Session, engine))
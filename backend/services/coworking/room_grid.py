@@ -0,0 +1,73 @@
+"""
+Grid of the 30-minute slots of rooms on one day, used to build the room reservation map.
+
+`ReservationService.get_map_reserved_times_by_date` paints each reservation of the day onto the
+row of its room, then grays out whole columns and office hours. The grid keeps one byte per slot,
+row by row, so that painting a reservation and graying out a column are each a single slice
+operation rather than a loop over slots and rooms. It is converted to the lists of
+`ReservationMapDetails` only once complete, by `to_date_map`.
+"""
+
+from typing import Iterable
+
+from ...models.coworking import RoomState
+
+__authors__ = ["Riley Chapman"]
+__copyright__ = "Copyright 2025"
+__license__ = "MIT"
+
+
+class RoomGrid:
+    """The `RoomState` of each 30-minute slot of a day, for each of a list of rooms."""
+
+    __slots__ = ("room_ids", "slots", "_rows", "_cells")
+
+    def __init__(
+        self,
+        room_ids: Iterable[str],
+        slots: int,
+        state: RoomState = RoomState.AVAILABLE,
+    ):
+        """
+        Args:
+            room_ids (Iterable[str]): IDs of the rooms, in the order of the map.
+            slots (int): Number of slots of each room.
+            state (RoomState): State every slot starts in.
+        """
+        self.room_ids = list(room_ids)
+        self.slots = max(slots, 0)
+        self._rows = {room_id: row for row, room_id in enumerate(self.room_ids)}
+        self._cells = bytearray([state.value]) * (len(self.room_ids) * self.slots)
+
+    def __contains__(self, room_id: str) -> bool:
+        return room_id in self._rows
+
+    def fill(self, room_id: str, start: int, end: int, state: RoomState) -> None:
+        """Sets the slots [start, end) of a room to a state, ignoring slots outside the day."""
+        start, end = max(start, 0), min(end, self.slots)
+        if start >= end:
+            return
+        offset = self._rows[room_id] * self.slots
+        self._cells[offset + start : offset + end] = bytes([state.value]) * (
+            end - start
+        )
+
+    def block_subject_reserved_columns(self) -> None:
+        """Grays out the available slots of every room at times the subject has reserved."""
+        available = bytes([RoomState.AVAILABLE.value])
+        unavailable = bytes([RoomState.UNAVAILABLE.value])
+        for column in range(self.slots):
+            states = self._cells[column :: self.slots]
+            if RoomState.SUBJECT_RESERVED.value in states:
+                self._cells[column :: self.slots] = states.replace(
+                    available, unavailable
+                )
+
+    def to_date_map(self, exclude: Iterable[str] = ()) -> dict[str, list[int]]:
+        """Converts the grid to lists of slot states by room ID, leaving out `exclude`."""
+        excluded = set(exclude)
+        return {
+            room_id: list(self._cells[row * self.slots : (row + 1) * self.slots])
+            for row, room_id in enumerate(self.room_ids)
+            if room_id not in excluded
+        }
@@ -3,7 +3,7 @@
 from fastapi import Depends
 from datetime import datetime
 from sqlalchemy.orm import Session
-from ...database import db_session
+from ...database import db_session, run_sync
 from .reservation import ReservationService
 from .operating_hours import OperatingHoursService
 from .seat import SeatService
@@ -63,3 +63,10 @@ class StatusService:
             seat_availability=seat_availability,
             operating_hours=operating_hours,
         )
+
+    async def get_coworking_status_async(self, subject: User) -> Status:
+        """Gets the coworking status without holding a thread while querying.
+
+        The service must be built on the `sync_session` of an `AsyncSession`, such as by
+        `bridged_status_svc`."""
+        return await run_sync(self.get_coworking_status, subject)
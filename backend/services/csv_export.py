@@ -0,0 +1,103 @@
+"""
+Streams CSV exports of database rows.
+
+An export pulls the entities it selects from the database in batches of `CSV_EXPORT_BATCH_SIZE`
+through a server-side cursor, and encodes them into CSV a batch at a time as the response is
+sent. It holds one batch in memory however many rows it has.
+
+Services check permissions and build the statement of an export while handling a request, and
+return the rows of `stream_rows`. They are queried once the response starts, after the request's
+session has been closed, so they are read through a session of their own.
+"""
+
+import csv
+import io
+from itertools import islice
+from typing import Any, AsyncIterator, Callable, Iterable, Iterator, Mapping, TypeVar
+
+from pydantic import BaseModel
+from sqlalchemy import Connection, Engine, Select
+from sqlalchemy.orm import Session
+from starlette.concurrency import iterate_in_threadpool
+
+__authors__ = ["Riley Chapman"]
+__copyright__ = "Copyright 2025"
+__license__ = "MIT"
+
+CSV_EXPORT_BATCH_SIZE = 1000
+"""Number of rows fetched from the database and encoded at a time."""
+
+E = TypeVar("E")
+Row = TypeVar("Row")
+
+
+def stream_rows(
+    bind: Engine | Connection,
+    statement: Select[tuple[E]],
+    to_row: Callable[[E], Row],
+    batch_size: int = CSV_EXPORT_BATCH_SIZE,
+) -> Iterator[Row]:
+    """
+    Yields the rows of the entities a statement selects, fetching them in batches.
+
+    Relationships of the rows should be loaded by the statement, with `joinedload` for
+    many-to-one relationships and `selectinload` for collections, which loads them per batch.
+
+    Args:
+        bind (Engine | Connection): Database the rows are read from, with a session of their own.
+        statement (Select[tuple[E]]): Statement selecting the entities of the export, in order.
+        to_row (Callable[[E], Row]): Converts an entity into a row of the export.
+        batch_size (int): Number of entities fetched at a time.
+    """
+    with Session(bind) as session:
+        entities = session.scalars(statement.execution_options(yield_per=batch_size))
+        for entity in entities:
+            yield to_row(entity)
+
+
+def encode_csv(
+    rows: Iterable[BaseModel | Mapping[str, Any]],
+    fieldnames: list[str],
+    batch_size: int = CSV_EXPORT_BATCH_SIZE,
+) -> Iterator[str]:
+    """
+    Yields the CSV text of rows a batch at a time, starting with the header.
+
+    Args:
+        rows (Iterable[BaseModel | Mapping[str, Any]]): Models or dictionaries of the rows.
+        fieldnames (list[str]): Columns of the export, in order. Other fields are left out.
+        batch_size (int): Number of rows encoded at a time.
+    """
+    buffer = io.StringIO()
+    writer = csv.DictWriter(
+        buffer, delimiter=",", fieldnames=fieldnames, extrasaction="ignore"
+    )
+    writer.writeheader()
+    yield _drain(buffer)
+
+    rows = iter(rows)
+    while batch := list(islice(rows, batch_size)):
+        # Note: __dict__ converts a Pydantic model into a dictionary of its fields.
+        writer.writerows(
+            [row if isinstance(row, Mapping) else row.__dict__ for row in batch]
+        )
+        yield _drain(buffer)
+
+
+async def stream_csv(
+    rows: Iterable[BaseModel | Mapping[str, Any]],
+    fieldnames: list[str],
+    batch_size: int = CSV_EXPORT_BATCH_SIZE,
+) -> AsyncIterator[str]:
+    """Yields the CSV text of rows like `encode_csv`, pulling them in the threadpool so that
+    their queries do not block the event loop."""
+    async for chunk in iterate_in_threadpool(encode_csv(rows, fieldnames, batch_size)):
+        yield chunk
+
+
+def _drain(buffer: io.StringIO) -> str:
+    """Returns the text written to a buffer, and empties it."""
+    text = buffer.getvalue()
+    buffer.seek(0)
+    buffer.truncate()
+    return text
@@ -2,11 +2,15 @@
 The Event Service allows the API to manipulate event data in the database.
 """
 
+import base64
+import re
 from typing import Sequence
 
 from fastapi import Depends
-from sqlalchemy import func, select, and_, func, or_, exists, or_
-from sqlalchemy.orm import Session, aliased
+from sqlalchemy import func, select, and_, func, or_, exists, or_, delete, update
+from sqlalchemy import ColumnElement, tuple_
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, aliased, joinedload, selectinload
 from backend.entities.user_entity import UserEntity
 from backend.models.event_registration import EventRegistration, NewEventRegistration
 from ..models.public_user import PublicUser
@@ -14,8 +18,14 @@ from backend.models.organization_details import OrganizationDetails
 from backend.models.pagination import Paginated, PaginationParams
 from backend.models.registration_type import RegistrationType
 
-from ..models import User, Paginated, EventPaginationParams
-from ..database import db_session
+from ..models import (
+    User,
+    Paginated,
+    EventPaginationParams,
+    CursorPaginated,
+    EventCursorParams,
+)
+from ..database import db_session, db_read_session
 from backend.models.event import (
     EventDraft,
     EventOverview,
@@ -34,6 +44,7 @@ from .exceptions import (
     EventRegistrationException,
 )
 from . import UserService
+from .event_count_cache import EventCountCache, event_count_cache
 from datetime import datetime
 
 __authors__ = [
@@ -46,6 +57,91 @@ __authors__ = [
 __copyright__ = "Copyright 2024"
 __license__ = "MIT"
 
+OVERVIEW_OPTIONS = (
+    joinedload(EventEntity.organization),
+    selectinload(EventEntity.organizer_registrations).joinedload(
+        EventRegistrationEntity.user
+    ),
+)
+"""Loader options for the relationships `EventEntity.to_overview_model` reads."""
+
+SEARCH_CONFIGURATION = "english"
+"""Text search configuration of `EventEntity.search_vector` and of the queries matched to it."""
+
+
+def search_query(text: str) -> ColumnElement | None:
+    """
+    Builds a full-text query matching documents that contain every word of `text`.
+
+    The last word is matched as a prefix, so that results appear as the word is being typed.
+    Words are stemmed, so "workshops" matches "workshop".
+
+    Returns:
+        ColumnElement | None: The `tsquery`, or None when `text` has no words.
+    """
+    words = re.findall(r"[^\W_]+", text)
+    if len(words) == 0:
+        return None
+    terms = words[:-1] + [f"{words[-1]}:*"]
+    return func.to_tsquery(SEARCH_CONFIGURATION, " & ".join(terms))
+
+
+def encode_cursor(entity: EventEntity) -> str:
+    """Encodes the position of an event in listings as an opaque cursor."""
+    position = f"{entity.start.isoformat()}|{entity.id}"
+    return base64.urlsafe_b64encode(position.encode()).decode()
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int]:
+    """
+    Decodes a cursor made by `encode_cursor`.
+
+    Raises:
+        ValueError: If the cursor was not made by `encode_cursor`.
+    """
+    try:
+        start, id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+        return datetime.fromisoformat(start), int(id)
+    except (ValueError, UnicodeError):
+        raise ValueError(f"Invalid cursor: {cursor}")
+
+
+def _count_registrations(registration_type: RegistrationType):
+    return (
+        select(func.count())
+        .select_from(EventRegistrationEntity)
+        .where(
+            EventRegistrationEntity.event_id == EventEntity.id,
+            EventRegistrationEntity.registration_type == registration_type,
+        )
+        .scalar_subquery()
+    )
+
+
+def recount_registrations(session: Session) -> int:
+    """
+    Recounts the attendees and organizers of every event from its registrations.
+
+    Run it after inserting registrations other than through `EventService`, such as in data
+    fixtures. The counts are updated in the session's transaction, which the caller commits.
+
+    Args:
+        session: The database session to update the counts in.
+
+    Returns:
+        int: The number of events recounted.
+    """
+    result = session.execute(
+        update(EventEntity)
+        .values(
+            attendee_count=_count_registrations(RegistrationType.ATTENDEE),
+            organizer_count=_count_registrations(RegistrationType.ORGANIZER),
+        )
+        .execution_options(synchronize_session=False)
+    )
+    session.expire_all()
+    return result.rowcount
+
 
 class EventService:
     """Service that performs all of the actions on the `Event` table"""
@@ -55,11 +151,15 @@ class EventService:
         session: Session = Depends(db_session),
         permission: PermissionService = Depends(),
         user_svc: UserService = Depends(),
+        read_session: Session = Depends(db_read_session),
+        count_cache: EventCountCache = Depends(event_count_cache),
     ):
         """Initializes the `EventService` session"""
         self._session = session
+        self._read_session = read_session
         self._permission = permission
         self._user_svc = user_svc
+        self._count_cache = count_cache
 
     def get_paginated_events(
         self,
@@ -75,40 +175,24 @@ class EventService:
             Paginated[Event]: The paginated list of events.
         """
 
-        statement = select(EventEntity)
-        length_statement = select(func.count()).select_from(EventEntity)
-        if pagination_params.range_start != "":
-            range_start = pagination_params.range_start
-            range_end = pagination_params.range_end
-            criteria = and_(
-                EventEntity.start >= datetime.fromisoformat(range_start),
-                EventEntity.start <= datetime.fromisoformat(range_end),
-            )
-            statement = statement.where(criteria)
-            length_statement = length_statement.where(criteria)
-
-        if pagination_params.filter != "":
-            query = pagination_params.filter
-
-            criteria = or_(
-                EventEntity.name.ilike(f"%{query}%"),
-                EventEntity.description.ilike(f"%{query}%"),
-                exists().where(
-                    OrganizationEntity.id == EventEntity.organization_id,
-                    OrganizationEntity.name.ilike(f"%{query}%"),
-                ),
-                exists().where(
-                    OrganizationEntity.id == EventEntity.organization_id,
-                    OrganizationEntity.slug.ilike(f"%{query}%"),
-                ),
-            )
-            statement = statement.where(criteria)
-            length_statement = length_statement.where(criteria)
+        criteria = self._criteria(
+            pagination_params.filter,
+            pagination_params.range_start,
+            pagination_params.range_end,
+        )
+        statement = select(EventEntity).options(*OVERVIEW_OPTIONS).where(*criteria)
 
         offset = pagination_params.page * pagination_params.page_size
         limit = pagination_params.page_size
 
-        if pagination_params.order_by != "":
+        query = search_query(pagination_params.filter)
+        if pagination_params.order_by == "relevance":
+            if query is not None:
+                statement = statement.order_by(
+                    func.ts_rank(EventEntity.search_vector, query).desc()
+                )
+            statement = statement.order_by(EventEntity.start, EventEntity.id)
+        elif pagination_params.order_by != "":
             statement = (
                 statement.order_by(getattr(EventEntity, pagination_params.order_by))
                 if pagination_params.ascending
@@ -119,15 +203,68 @@ class EventService:
 
         statement = statement.offset(offset).limit(limit)
 
-        length = self._session.execute(length_statement).scalar()
-        entities = self._session.execute(statement).scalars()
+        length = self._count(pagination_params, criteria)
+        entities = self._read_session.execute(statement).scalars().all()
 
         return Paginated(
-            items=[entity.to_overview_model(subject) for entity in entities],
+            items=self._to_overview_models(self._read_session, entities, subject),
             length=length,
             params=pagination_params,
         )
 
+    def get_events_by_cursor(
+        self,
+        cursor_params: EventCursorParams,
+        subject: User | None = None,
+    ) -> CursorPaginated[EventOverview]:
+        """List Events in order of start time, a page at a time.
+
+        Unlike `get_paginated_events`, each page starts after the last event of the previous
+        one rather than at an offset, so that deep pages are as fast as the first.
+
+        Parameters:
+            cursor_params: The cursor and filters of the page.
+
+        Returns:
+            CursorPaginated[EventOverview]: The page of events, and the cursor of the next.
+
+        Raises:
+            ValueError: If the cursor is invalid.
+        """
+        criteria = self._criteria(
+            cursor_params.filter, cursor_params.range_start, cursor_params.range_end
+        )
+        statement = select(EventEntity).options(*OVERVIEW_OPTIONS).where(*criteria)
+
+        position = tuple_(EventEntity.start, EventEntity.id)
+        if cursor_params.after != "":
+            after = tuple_(*decode_cursor(cursor_params.after))
+            statement = statement.where(
+                position > after if cursor_params.ascending else position < after
+            )
+        if cursor_params.ascending:
+            statement = statement.order_by(EventEntity.start, EventEntity.id)
+        else:
+            statement = statement.order_by(
+                EventEntity.start.desc(), EventEntity.id.desc()
+            )
+
+        # One more event than the page holds tells whether there is a next page
+        statement = statement.limit(cursor_params.page_size + 1)
+        entities = self._read_session.execute(statement).scalars().all()
+        page = entities[: cursor_params.page_size]
+
+        return CursorPaginated(
+            items=self._to_overview_models(self._read_session, page, subject),
+            length=self._count(cursor_params, criteria),
+            next=(
+                encode_cursor(page[-1])
+                if len(entities) > cursor_params.page_size
+                else None
+            ),
+            params=cursor_params,
+        )
+
     def create(self, subject: User, event: EventDraft) -> EventOverview:
         """
         Creates a event based on the input object and adds it to the table.
@@ -165,6 +302,7 @@ class EventService:
         self._session.commit()
 
         # Add organizers that should be added.
+        event_entity.organizer_count = len(event.organizers)
         for organizer_id in [organizer.id for organizer in event.organizers]:
             new_registration = NewEventRegistration(
                 event_id=event_entity.id,
@@ -177,11 +315,12 @@ class EventService:
             self._session.add(new_registration_entity)
 
         self._session.commit()
+        self._count_cache.clear()
 
         # Return added object
         # NOTE: Must re-convert the entity to a model again so that the registration
         # for the event organizer is automatically populated
-        return event_entity.to_overview_model(subject)
+        return self._to_overview_model(event_entity, subject)
 
     def get_by_id(self, id: int, subject: User | None = None) -> EventOverview:
         """
@@ -201,7 +340,7 @@ class EventService:
             raise ResourceNotFoundException(f"No event found with matching ID: {id}")
 
         # Convert entry to a model and return
-        return entity.to_overview_model(subject)
+        return self._to_overview_model(entity, subject)
 
     def update(self, subject: User, event: EventDraft) -> EventOverview:
         """
@@ -239,8 +378,7 @@ class EventService:
         old_organizer_ids = set(
             [
                 registration.user_id
-                for registration in event_entity.registrations
-                if registration.registration_type == RegistrationType.ORGANIZER
+                for registration in event_entity.organizer_registrations
             ]
         )
 
@@ -286,6 +424,8 @@ class EventService:
         ]
 
         # Remove organizers that should be removed.
+        organizer_delta = -len(organizers_to_remove)
+        attendee_delta = 0
         for organizer_id in organizers_to_remove:
             event_registration_entity = self._session.get(
                 EventRegistrationEntity, (event_entity.id, organizer_id)
@@ -293,6 +433,7 @@ class EventService:
             self._session.delete(event_registration_entity)
 
         # Add organizers that should be added.
+        organizer_delta += len(organizers_to_add)
         for organizer_id in organizers_to_add:
             # Check if the user is already registered for the event.
             event_registration_entity = self._session.get(
@@ -300,6 +441,7 @@ class EventService:
             )
             if event_registration_entity:
                 event_registration_entity.registration_type = RegistrationType.ORGANIZER
+                attendee_delta -= 1
             else:
                 new_registration = NewEventRegistration(
                     event_id=event_entity.id,
@@ -311,10 +453,17 @@ class EventService:
                 )
                 self._session.add(new_registration_entity)
 
+        # Update the counts relative to the stored ones, which other requests may be changing
+        if organizer_delta:
+            event_entity.organizer_count = EventEntity.organizer_count + organizer_delta
+        if attendee_delta:
+            event_entity.attendee_count = EventEntity.attendee_count + attendee_delta
+
         # Save all changes
         self._session.commit()
+        self._count_cache.clear()
         # Return updated object
-        return event_entity.to_overview_model(subject)
+        return self._to_overview_model(event_entity, subject)
 
     def delete(self, subject: User, id: int) -> None:
         """
@@ -344,6 +493,7 @@ class EventService:
 
         # Save changes
         self._session.commit()
+        self._count_cache.clear()
 
     """Event Registration Service Methods"""
 
@@ -405,8 +555,7 @@ class EventService:
 
         organizer_ids = [
             registration.user_id
-            for registration in event_entity.registrations
-            if registration.registration_type == RegistrationType.ORGANIZER
+            for registration in event_entity.organizer_registrations
         ]
 
         if subject.id not in organizer_ids:
@@ -456,15 +605,6 @@ class EventService:
                 f"organization/{event_entity.organization_id}",
             )
 
-        # Get the registration status.
-        # NOTE: It is preferred to use the service function rather than the list of
-        # registrations passed in from `event` in the case that registrations are added
-        # between when `event` was fetched and this function runs.
-
-        # Raise exception if event is full.
-        if event.number_registered >= event.registration_limit:
-            raise EventRegistrationException(event.id)
-
         # Enable idemopotency in returning existing registration, if one exists.
         # Permission to manage / read registration is enforced in EventService#get_registration
         existing_registration = self.get_registration(subject, attendee, event)
@@ -474,6 +614,23 @@ class EventService:
             )
             return user_entity.to_public_model()
 
+        # Claim a spot, unless the event is full.
+        # NOTE: The count is checked and incremented by a single statement, which locks the
+        # event's row until this transaction ends, so that concurrent registrations never
+        # exceed the limit. `event.number_registered` may be stale by now.
+        claimed = self._session.execute(
+            update(EventEntity)
+            .where(
+                EventEntity.id == event.id,
+                EventEntity.attendee_count < EventEntity.registration_limit,
+            )
+            .values(attendee_count=EventEntity.attendee_count + 1)
+            .execution_options(synchronize_session=False)
+        )
+        if claimed.rowcount == 0:
+            self._session.rollback()
+            raise EventRegistrationException(event.id)
+
         # Add new object to table and commit changes
         new_event_registration = NewEventRegistration(
             user_id=attendee.id,
@@ -484,7 +641,12 @@ class EventService:
             new_event_registration
         )
         self._session.add(event_registration_entity)
-        self._session.commit()
+        try:
+            self._session.commit()
+        except IntegrityError:
+            # A concurrent request registered the attendee first, and only its spot is kept
+            self._session.rollback()
+            return self._session.get_one(UserEntity, attendee.id).to_public_model()
 
         # Return registration
         return event_registration_entity.to_flat_model()
@@ -516,13 +678,22 @@ class EventService:
         ):
             return
 
-        # Delete object and commit
-        self._session.delete(
-            self._session.get(
-                EventRegistrationEntity,
-                (event.id, attendee.id),
+        # Delete object, release its spot and commit
+        # NOTE: Only the request that deletes the registration releases its spot.
+        deleted = self._session.execute(
+            delete(EventRegistrationEntity).where(
+                EventRegistrationEntity.event_id == event.id,
+                EventRegistrationEntity.user_id == attendee.id,
+                EventRegistrationEntity.registration_type == RegistrationType.ATTENDEE,
             )
         )
+        if deleted.rowcount > 0:
+            self._session.execute(
+                update(EventEntity)
+                .where(EventEntity.id == event.id)
+                .values(attendee_count=EventEntity.attendee_count - 1)
+                .execution_options(synchronize_session=False)
+            )
         self._session.commit()
 
     def get_registrations_of_user(
@@ -582,8 +753,7 @@ class EventService:
         event_entity = self._session.get(EventEntity, event_id)
         organizer_ids = [
             registration.user_id
-            for registration in event_entity.registrations
-            if registration.registration_type == RegistrationType.ORGANIZER
+            for registration in event_entity.organizer_registrations
         ]
 
         # Ensure that the user has appropriate permissions to view event information
@@ -678,6 +848,7 @@ class EventService:
             .where(EventEntity.start >= datetime.now())
             .order_by(EventEntity.start)
             .limit(50)
+            .options(*OVERVIEW_OPTIONS)
         )
         event_entities = self._session.scalars(event_query).all()
         for event in event_entities:
@@ -685,10 +856,10 @@ class EventService:
                 event.organization_id in PREFERRED_ORGANIZATIONS
                 and featured_event == None
             ):
-                featured_event = event.to_overview_model(subject)
+                featured_event = self._to_overview_model(event, subject)
         if featured_event == None:
             featured_event = (
-                event_entities[0].to_overview_model(subject)
+                self._to_overview_model(event_entities[0], subject)
                 if len(event_entities) > 0
                 else None
             )
@@ -700,6 +871,9 @@ class EventService:
             .join(EventEntity)
             .where(EventEntity.start >= datetime.now())
             .order_by(EventEntity.start)
+            .options(
+                joinedload(EventRegistrationEntity.event).options(*OVERVIEW_OPTIONS)
+            )
         )
 
         registered_events_entities = self._session.scalars(
@@ -707,7 +881,7 @@ class EventService:
         ).all()
 
         registered_events = [
-            registration.event.to_overview_model(subject)
+            registration.event.to_overview_model(registration.registration_type)
             for registration in registered_events_entities
         ]
 
@@ -731,6 +905,7 @@ class EventService:
             .where(EventEntity.start >= datetime.now())
             .order_by(EventEntity.start)
             .limit(50)
+            .options(*OVERVIEW_OPTIONS)
         )
         event_entities = self._session.scalars(event_query).all()
         for event in event_entities:
@@ -748,3 +923,90 @@ class EventService:
 
         # 3. Return the event status.
         return EventStatusOverview(featured=featured_event, registered=[])
+
+    def _to_overview_model(
+        self, entity: EventEntity, subject: User | None
+    ) -> EventOverview:
+        """Converts an event to an overview, including how the subject is registered for it."""
+        return self._to_overview_models(self._session, [entity], subject)[0]
+
+    def _to_overview_models(
+        self, session: Session, entities: Sequence[EventEntity], subject: User | None
+    ) -> list[EventOverview]:
+        """
+        Converts events to overviews, including how the subject is registered for each.
+
+        The registrations of the subject to all of the events are looked up in one query.
+        """
+        registration_types: dict[int, RegistrationType] = {}
+        if subject is not None and len(entities) > 0:
+            registration_types_query = select(
+                EventRegistrationEntity.event_id,
+                EventRegistrationEntity.registration_type,
+            ).where(
+                EventRegistrationEntity.user_id == subject.id,
+                EventRegistrationEntity.event_id.in_(
+                    [entity.id for entity in entities]
+                ),
+            )
+            registration_types = {
+                event_id: registration_type
+                for event_id, registration_type in session.execute(
+                    registration_types_query
+                )
+            }
+        return [
+            entity.to_overview_model(registration_types.get(entity.id))
+            for entity in entities
+        ]
+
+    def _criteria(
+        self, filter: str, range_start: str, range_end: str
+    ) -> list[ColumnElement[bool]]:
+        """
+        Returns the criteria of the events in a time range that match a search.
+
+        Events match when their name or description match the words of `filter`, or when the
+        name or slug of their organization does.
+        """
+        criteria: list[ColumnElement[bool]] = []
+        if range_start != "":
+            criteria.append(
+                and_(
+                    EventEntity.start >= datetime.fromisoformat(range_start),
+                    EventEntity.start <= datetime.fromisoformat(range_end),
+                )
+            )
+
+        query = search_query(filter)
+        if query is not None:
+            # NOTE: There are few organizations, so they are matched first, letting the
+            # event indexes answer both halves of the criteria.
+            organization_ids = self._read_session.scalars(
+                select(OrganizationEntity.id).where(
+                    func.to_tsvector(
+                        SEARCH_CONFIGURATION,
+                        OrganizationEntity.name + " " + OrganizationEntity.slug,
+                    ).bool_op("@@")(query)
+                )
+            ).all()
+            matches = EventEntity.search_vector.bool_op("@@")(query)
+            if len(organization_ids) > 0:
+                matches = or_(
+                    matches, EventEntity.organization_id.in_(organization_ids)
+                )
+            criteria.append(matches)
+        return criteria
+
+    def _count(
+        self,
+        params: EventPaginationParams | EventCursorParams,
+        criteria: list[ColumnElement[bool]],
+    ) -> int:
+        """Returns the number of events matching the criteria of a listing, cached by its filters."""
+        return self._count_cache.get(
+            (params.filter, params.range_start, params.range_end),
+            lambda: self._read_session.scalar(
+                select(func.count()).select_from(EventEntity).where(*criteria)
+            ),
+        )
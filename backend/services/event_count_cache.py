@@ -0,0 +1,51 @@
+"""
+Caches the total numbers of events matching the filters of event listings.
+
+Listings return the total number of matching events along with each page. Counting them is a
+scan of every matching event, however deep the page, so each process keeps the totals of recent
+filters for `EVENT_COUNT_CACHE_TTL` seconds.
+
+`EventService` invalidates the cache of its process when it creates, edits or deletes an event.
+Events changed by the other workers of a deployment are counted once the cache expires.
+"""
+
+import functools
+import time
+from typing import Callable, Hashable
+
+from ..env import getenv
+from .ttl_cache import TTLCache
+
+__authors__ = ["Riley Chapman"]
+__copyright__ = "Copyright 2025"
+__license__ = "MIT"
+
+EVENT_COUNT_CACHE_TTL = float(getenv("EVENT_COUNT_CACHE_TTL", default="60"))
+"""Seconds the total of a listing's filters stays valid."""
+
+EVENT_COUNT_CACHE_SIZE = 1024
+"""Number of filters whose totals are kept, least recently used first out."""
+
+
+class EventCountCache(TTLCache[Hashable, int]):
+    """Cache of event listing totals by the filters of the listing."""
+
+    def __init__(
+        self,
+        ttl: float = EVENT_COUNT_CACHE_TTL,
+        size: int = EVENT_COUNT_CACHE_SIZE,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            ttl (float): Seconds after which a total is counted again.
+            size (int): Number of totals kept.
+            clock (Callable[[], float]): Monotonic clock, replaceable in tests.
+        """
+        super().__init__(ttl, max_entries=size, clock=clock)
+
+
+@functools.cache
+def event_count_cache() -> EventCountCache:
+    """Dependency offering the event count cache of this process."""
+    return EventCountCache()
@@ -14,7 +14,7 @@ from fastapi import Depends
 from sqlalchemy import text
 from ..models.openai_test_response import OpenAITestResponse
 from ..database import Session, db_session
-from ..services.openai import OpenAIService
+from ..services.openai import AsyncOpenAIService
 
 __authors__ = ["Kris Jordan"]
 __copyright__ = "Copyright 2023"
@@ -23,12 +23,12 @@ __license__ = "MIT"
 
 class HealthService:
     _session: Session
-    _openai_svc: OpenAIService
+    _openai_svc: AsyncOpenAIService
 
     def __init__(
         self,
         session: Annotated[Session, Depends(db_session)],
-        openai_svc: Annotated[OpenAIService, Depends()],
+        openai_svc: Annotated[AsyncOpenAIService, Depends()],
     ):
         self._session = session
         self._openai_svc = openai_svc
@@ -39,7 +39,7 @@ class HealthService:
         row = result.all()[0]
         return str(f"{row[0]} @ {row[1]}")
 
-    def check_openai(self) -> OpenAITestResponse:
+    async def check_openai(self) -> OpenAITestResponse:
         # Placeholder for OpenAI health check
         # system_prompt = "You are a student at UNC-Chapel Hill."
         # user_prompt = "Who is our most famous basketball player?"
@@ -48,4 +48,4 @@ class HealthService:
         system_prompt = "Your job is to take the item given by the user and search through the list to find out which items are most similar to the one the user gave. Here is a list of items: Apple, Banana, Grapes, Car, Bicycle, Train, Airplane, T-shirt, Sweater, Jacket, Laptop, Tablet, Smartphone, Hammer"
         user_prompt = "Orange"
         response_model = OpenAITestResponse
-        return self._openai_svc.prompt(system_prompt, user_prompt, response_model)
+        return await self._openai_svc.prompt(system_prompt, user_prompt, response_model)
@@ -0,0 +1,98 @@
+"""
+Caches the users that bearer tokens were issued to.
+
+`registered_user` resolves the subject of a request once. FastAPI caches dependencies for the
+duration of a request, and the request's `PermissionService` keeps the compiled grants it has read.
+Across requests, the `IdentityCache` of each process keeps users for `IDENTITY_CACHE_TTL` seconds,
+keyed by the PID and issue time of their token, so that most authenticated requests issue no query
+to find their subject. A newly issued token always reads the user again.
+
+`UserService` invalidates a user's entries when it updates them, and the `PermissionEngine` keeps
+permissions current when grants or roles change. Changes made by the other workers of a
+deployment are picked up once entries expire.
+"""
+
+import functools
+import time
+from typing import Callable
+
+from ..env import getenv
+from ..models import User
+from ..models.identity import IdentityCacheStats
+from .permission_engine import PermissionEngine
+from .ttl_cache import TTLCache
+
+__authors__ = ["Riley Chapman"]
+__copyright__ = "Copyright 2025"
+__license__ = "MIT"
+
+IDENTITY_CACHE_TTL = float(getenv("IDENTITY_CACHE_TTL", default="10"))
+"""Seconds a resolved user stays valid."""
+
+IDENTITY_CACHE_SIZE = int(getenv("IDENTITY_CACHE_SIZE", default="4096"))
+"""Maximum number of tokens whose users are kept before evicting the least recently used."""
+
+
+class IdentityCache:
+    """Thread-safe cache of users by token, with TTL expiry and LRU eviction."""
+
+    def __init__(
+        self,
+        ttl: float = IDENTITY_CACHE_TTL,
+        max_entries: int = IDENTITY_CACHE_SIZE,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            ttl (float): Seconds after which a user is read from the database again.
+            max_entries (int): Maximum number of tokens whose users are kept.
+            clock (Callable[[], float]): Monotonic clock, replaceable in tests.
+        """
+        self._users: TTLCache[tuple[int, int | None], User] = TTLCache(
+            ttl, max_entries, clock
+        )
+
+    def resolve(
+        self, pid: int, issued_at: int | None, load: Callable[[], User | None]
+    ) -> User | None:
+        """
+        Returns the user a token was issued to, loading them if missing or expired.
+
+        Args:
+            pid (int): The PID claim of the token.
+            issued_at (int | None): The `iat` claim of the token, if it has one.
+            load (Callable[[], User | None]): Reads the user from the database.
+
+        Returns:
+            User | None: The user, or None if no user has the PID. Missing users are not cached.
+        """
+        return self._users.get((pid, issued_at), load)
+
+    def invalidate(self, pid: int) -> None:
+        """Drops the cached user of every token issued to a PID."""
+        self._users.invalidate_where(lambda key: key[0] == pid)
+
+    def stats(self, engine: PermissionEngine) -> IdentityCacheStats:
+        """Returns the counters of this cache and of the permission engine used alongside it."""
+        users = self._users.stats()
+        permissions = engine.stats()
+        requests = users.hits + users.misses
+        saved = users.hits + permissions.hits
+        return IdentityCacheStats(
+            requests=requests,
+            user_hits=users.hits,
+            user_misses=users.misses,
+            permission_hits=permissions.hits,
+            permission_misses=permissions.misses,
+            round_trips_saved=saved,
+            round_trips_saved_per_request=saved / requests if requests else 0.0,
+        )
+
+    def __len__(self) -> int:
+        return len(self._users)
+
+
+@functools.cache
+def identity_cache() -> IdentityCache:
+    """Dependency offering the application-wide identity cache."""
+    return IdentityCache()
@@ -0,0 +1,333 @@
+"""
+Defines the in-memory live queues of office hours events.
+
+A `LiveQueue` holds the open tickets of one office hours event: the QUEUED tickets ordered by
+`created_at` and the set of CALLED tickets. A student's queue position is a binary search instead
+of loading and sorting every ticket the event ever had.
+
+`OfficeHourTicketService` applies each committed ticket change to the `LiveQueueRegistry` of its
+process. Queues are rehydrated from the database when the application starts, when an event is
+first read, and once they are older than `LIVE_QUEUE_MAX_AGE` seconds. The age limit bounds how
+long a worker can miss changes committed by the other workers of a deployment. `check` compares a
+queue with the database and replaces it if they differ.
+"""
+
+import bisect
+import functools
+import logging
+import threading
+import time
+from collections import defaultdict
+from datetime import datetime
+from typing import Callable, TypeVar
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from ...entities.office_hours import OfficeHoursTicketEntity
+from ...env import getenv
+from ...models.office_hours.live_queue import LiveQueueConsistency
+from ...models.office_hours.queue_event import OfficeHoursQueueEvent
+from ...models.office_hours.ticket_state import TicketState
+
+__authors__ = ["Riley Chapman"]
+__copyright__ = "Copyright 2025"
+__license__ = "MIT"
+
+LIVE_QUEUE_MAX_AGE = float(getenv("LIVE_QUEUE_MAX_AGE", default="5"))
+"""Seconds after which a live queue is reloaded from the database."""
+
+logger = logging.getLogger(__name__)
+
+_OPEN_STATES = [TicketState.QUEUED, TicketState.CALLED]
+
+T = TypeVar("T")
+
+
+class LiveQueue:
+    """The QUEUED and CALLED tickets of one office hours event."""
+
+    def __init__(self, loaded_at: float = 0.0):
+        """
+        Args:
+            loaded_at (float): Monotonic time at which the queue was read from the database.
+        """
+        self.loaded_at = loaded_at
+        self._queued: list[tuple[datetime, int]] = []
+        self._queued_keys: dict[int, tuple[datetime, int]] = {}
+        self.called: set[int] = set()
+
+    def enqueue(self, ticket_id: int, created_at: datetime) -> None:
+        """Adds a ticket to the queue in order of creation."""
+        self.remove(ticket_id)
+        key = (created_at, ticket_id)
+        bisect.insort(self._queued, key)
+        self._queued_keys[ticket_id] = key
+
+    def call(self, ticket_id: int) -> None:
+        """Moves a ticket from the queue to the called tickets."""
+        self.remove(ticket_id)
+        self.called.add(ticket_id)
+
+    def remove(self, ticket_id: int) -> None:
+        """Removes a ticket that was closed or canceled."""
+        key = self._queued_keys.pop(ticket_id, None)
+        if key is not None:
+            del self._queued[bisect.bisect_left(self._queued, key)]
+        self.called.discard(ticket_id)
+
+    def position(self, ticket_id: int) -> int:
+        """
+        Finds the position of a ticket in the queue.
+
+        Returns:
+            int: The 1-based position of the ticket, or -1 if the ticket is not queued.
+        """
+        key = self._queued_keys.get(ticket_id)
+        if key is None:
+            return -1
+        return bisect.bisect_left(self._queued, key) + 1
+
+    def queued_ids(self) -> list[int]:
+        """Returns the IDs of the queued tickets, first in line first."""
+        return [ticket_id for _, ticket_id in self._queued]
+
+    def __len__(self) -> int:
+        return len(self._queued)
+
+
+class LiveQueueRegistry:
+    """Thread-safe live queues of the office hours events used by this process.
+
+    The lock only guards the queues in memory and is never held while reading the database, so a
+    reload of one event's queue does not block reads of the others. A queue is loaded without the
+    lock and swapped in under it, after replaying the changes applied while it was being read.
+    """
+
+    def __init__(
+        self,
+        max_age: float = LIVE_QUEUE_MAX_AGE,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            max_age (float): Seconds after which a queue is reloaded from the database.
+            clock (Callable[[], float]): Monotonic clock, replaceable in tests.
+        """
+        self._max_age = max_age
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._queues: dict[int, LiveQueue] = {}
+        self._loading: list[list[OfficeHoursQueueEvent]] = []
+
+    def queue_position(
+        self, session: Session, office_hours_id: int, ticket_id: int
+    ) -> int:
+        """
+        Finds the position of a ticket in the queue of its office hours event.
+
+        Args:
+            session (Session): Session used if the queue must be loaded.
+            office_hours_id (int): The ID of the office hours event.
+            ticket_id (int): The ID of the ticket.
+
+        Returns:
+            int: The 1-based position of the ticket, or -1 if the ticket is not queued.
+        """
+        return self._read(
+            session, office_hours_id, lambda queue: queue.position(ticket_id)
+        )
+
+    def queued_ids(self, session: Session, office_hours_id: int) -> list[int]:
+        """Returns the IDs of the queued tickets of an office hours event, first in line first."""
+        return self._read(session, office_hours_id, LiveQueue.queued_ids)
+
+    def apply(self, event: OfficeHoursQueueEvent) -> None:
+        """
+        Applies a committed ticket change to the queue of its office hours event.
+
+        Events of queues that are not loaded are ignored, since loading reads the change. Events
+        arriving while queues are being loaded are also replayed onto the loaded queues.
+        """
+        with self._lock:
+            for events in self._loading:
+                events.append(event)
+            queue = self._queues.get(event.office_hours_id)
+            if queue is not None:
+                _apply(queue, event)
+
+    def rehydrate(self, session: Session, office_hours_id: int | None = None) -> int:
+        """
+        Reloads live queues from the database.
+
+        Args:
+            session (Session): Session to read the open tickets with.
+            office_hours_id (int | None): The event to reload, or None for every event
+                with open tickets, as done when the application starts.
+
+        Returns:
+            int: The number of queues loaded.
+        """
+        queues, events = self._start_load(session, office_hours_id)
+        with self._lock:
+            self._catch_up(queues, events)
+            if office_hours_id is None:
+                self._queues = queues
+            else:
+                self._queues[office_hours_id] = queues[office_hours_id]
+            return len(queues)
+
+    def check(
+        self, session: Session, office_hours_id: int, repair: bool = True
+    ) -> LiveQueueConsistency:
+        """
+        Compares the live queue of an office hours event with the database.
+
+        Args:
+            session (Session): Session to read the open tickets with.
+            office_hours_id (int): The ID of the office hours event.
+            repair (bool): Whether to replace an inconsistent queue with the database state.
+
+        Returns:
+            LiveQueueConsistency: The tickets the live queue is missing or has in excess.
+        """
+        queues, events = self._start_load(session, office_hours_id)
+        with self._lock:
+            expected = self._catch_up(queues, events)[office_hours_id]
+            actual = self._queues.get(office_hours_id)
+            if actual is None:
+                # A queue that was never loaded cannot be stale, so load it
+                actual = self._queues[office_hours_id] = expected
+
+            expected_queued = expected.queued_ids()
+            actual_queued = actual.queued_ids()
+            missing_queued = sorted(set(expected_queued) - set(actual_queued))
+            unexpected_queued = sorted(set(actual_queued) - set(expected_queued))
+            missing_called = sorted(expected.called - actual.called)
+            unexpected_called = sorted(actual.called - expected.called)
+            same_tickets = not (missing_queued or unexpected_queued)
+            out_of_order = same_tickets and expected_queued != actual_queued
+
+            consistency = LiveQueueConsistency(
+                office_hours_id=office_hours_id,
+                consistent=(
+                    same_tickets
+                    and not (missing_called or unexpected_called or out_of_order)
+                ),
+                missing_queued=missing_queued,
+                unexpected_queued=unexpected_queued,
+                missing_called=missing_called,
+                unexpected_called=unexpected_called,
+                out_of_order=out_of_order,
+            )
+            if not consistency.consistent:
+                logger.warning(
+                    "Live queue of office hours %d differs from the database: %s",
+                    office_hours_id,
+                    consistency,
+                )
+                if repair:
+                    self._queues[office_hours_id] = expected
+            return consistency
+
+    def check_all(
+        self, session: Session, repair: bool = True
+    ) -> list[LiveQueueConsistency]:
+        """Compares every loaded live queue with the database."""
+        with self._lock:
+            office_hours_ids = sorted(self._queues)
+        return [
+            self.check(session, office_hours_id, repair)
+            for office_hours_id in office_hours_ids
+        ]
+
+    def _read(
+        self, session: Session, office_hours_id: int, read: Callable[[LiveQueue], T]
+    ) -> T:
+        """Reads the queue of an event, loading it first if it is missing or too old."""
+        with self._lock:
+            queue = self._queues.get(office_hours_id)
+            if queue is not None and self._clock() - queue.loaded_at <= self._max_age:
+                return read(queue)
+
+        queues, events = self._start_load(session, office_hours_id)
+        with self._lock:
+            loaded = self._catch_up(queues, events)[office_hours_id]
+            current = self._queues.get(office_hours_id)
+            # A concurrent load that started later is as complete and stays fresh for longer
+            if current is None or current.loaded_at <= loaded.loaded_at:
+                current = self._queues[office_hours_id] = loaded
+            return read(current)
+
+    def _start_load(
+        self, session: Session, office_hours_id: int | None
+    ) -> tuple[dict[int, LiveQueue], list[OfficeHoursQueueEvent]]:
+        """
+        Loads queues without holding the lock, recording the changes applied meanwhile.
+
+        The caller must pass the result to `_catch_up` under the lock before using the queues.
+        """
+        events: list[OfficeHoursQueueEvent] = []
+        with self._lock:
+            self._loading.append(events)
+        try:
+            return self._load(session, office_hours_id), events
+        except BaseException:
+            with self._lock:
+                self._loading.remove(events)
+            raise
+
+    def _catch_up(
+        self, queues: dict[int, LiveQueue], events: list[OfficeHoursQueueEvent]
+    ) -> dict[int, LiveQueue]:
+        """Replays onto loaded queues the changes applied while loading. Requires the lock."""
+        self._loading.remove(events)
+        for event in events:
+            queue = queues.get(event.office_hours_id)
+            if queue is not None:
+                _apply(queue, event)
+        return queues
+
+    def _load(
+        self, session: Session, office_hours_id: int | None
+    ) -> dict[int, LiveQueue]:
+        """Reads the open tickets of one or every office hours event into new queues."""
+        query = select(
+            OfficeHoursTicketEntity.office_hours_id,
+            OfficeHoursTicketEntity.id,
+            OfficeHoursTicketEntity.created_at,
+            OfficeHoursTicketEntity.state,
+        ).where(OfficeHoursTicketEntity.state.in_(_OPEN_STATES))
+        if office_hours_id is not None:
+            query = query.where(
+                OfficeHoursTicketEntity.office_hours_id == office_hours_id
+            )
+
+        loaded_at = self._clock()
+        queues: dict[int, LiveQueue] = defaultdict(lambda: LiveQueue(loaded_at))
+        if office_hours_id is not None:
+            queues[office_hours_id] = LiveQueue(loaded_at)
+        for event_id, ticket_id, created_at, state in session.execute(query):
+            if state == TicketState.QUEUED:
+                queues[event_id].enqueue(ticket_id, created_at)
+            else:
+                queues[event_id].call(ticket_id)
+        return dict(queues)
+
+
+def _apply(queue: LiveQueue, event: OfficeHoursQueueEvent) -> None:
+    """Applies a committed ticket change to a queue."""
+    ticket = event.ticket
+    state = TicketState.from_string(ticket.state)
+    if state == TicketState.QUEUED:
+        queue.enqueue(ticket.id, ticket.created_at)
+    elif state == TicketState.CALLED:
+        queue.call(ticket.id)
+    else:
+        queue.remove(ticket.id)
+
+
+@functools.cache
+def live_queue_registry() -> LiveQueueRegistry:
+    """Dependency offering the application-wide live office hours queues."""
+    return LiveQueueRegistry()
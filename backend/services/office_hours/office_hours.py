@@ -6,10 +6,10 @@ import math
 from typing import Type, TypeVar
 from fastapi import Depends
 from sqlalchemy import select, exists, and_, func
-from sqlalchemy.orm import Session, joinedload, selectinload
+from sqlalchemy.orm import Session, joinedload
 
 from ...models.office_hours.office_hours_details import PrimaryOfficeHoursDetails
-from ...database import db_session
+from ...database import db_session, run_sync
 from ...models.user import User
 from ...models.academics.section_member import RosterRole
 from ...models.academics.my_courses import (
@@ -27,11 +27,10 @@ from ...entities.office_hours import (
     OfficeHoursEntity,
     OfficeHoursTicketEntity,
 )
-from ...entities.office_hours.user_created_tickets_table import (
-    user_created_tickets_table,
-)
 from ...entities.academics.section_member_entity import SectionMemberEntity
 from ..exceptions import CoursePermissionException, ResourceNotFoundException
+from .live_queue import LiveQueueRegistry, live_queue_registry
+from .ticket_overview import ticket_overview_query, ticket_overviews
 
 __authors__ = ["Ajay Gandecha", "Jade Keegan", "Kris Jordan"]
 __copyright__ = "Copyright 2024"
@@ -45,11 +44,16 @@ class OfficeHoursService:
     Service that performs all actions for office hour events.
     """
 
-    def __init__(self, session: Session = Depends(db_session)):
+    def __init__(
+        self,
+        session: Session = Depends(db_session),
+        live_queue: LiveQueueRegistry = Depends(live_queue_registry),
+    ):
         """
-        Initializes the database session.
+        Initializes the database session and the live office hours queues.
         """
         self._session = session
+        self._live_queue = live_queue
 
     def get_office_hour_queue(
         self, user: User, office_hours_id: int
@@ -81,6 +85,17 @@ class OfficeHoursService:
 
         return self._to_oh_queue_overview(user, office_hours_entity)
 
+    async def get_office_hour_queue_async(
+        self, user: User, office_hours_id: int
+    ) -> OfficeHourQueueOverview:
+        """
+        Loads all of the data relevant to an office hour queue without holding a thread while querying.
+
+        The service must be built on the `sync_session` of an `AsyncSession`, such as by
+        `bridged_office_hours_svc`.
+        """
+        return await run_sync(self.get_office_hour_queue, user, office_hours_id)
+
     def _get_entity_or_raise(self, entity_type: Type[T], id: int) -> T:
         """
         Gets an entity from the database or raises a ResourceNotFoundException.
@@ -158,34 +173,31 @@ class OfficeHoursService:
         self._check_site_student_permissions(user, queue_entity.course_site_id)
 
         # Get ticket for user, if any
-        active_tickets_query = (
-            select(OfficeHoursTicketEntity)
-            .join(user_created_tickets_table)
+        active_tickets = ticket_overviews(
+            self._session,
+            ticket_overview_query()
             .where(OfficeHoursTicketEntity.office_hours_id == office_hours_id)
-            # .where(user_created_tickets_table.member_id == )
+            .where(
+                OfficeHoursTicketEntity.state.in_(
+                    [TicketState.QUEUED, TicketState.CALLED]
+                )
+            )
+            .where(
+                OfficeHoursTicketEntity.creators.any(
+                    SectionMemberEntity.user_id == user.id
+                )
+            )
+            .order_by(OfficeHoursTicketEntity.id)
+            .limit(1),
         )
-        active_tickets = [
-            ticket
-            for ticket in queue_entity.tickets
-            if user.id in [creator.user_id for creator in ticket.creators]
-            and ticket.state in [TicketState.QUEUED, TicketState.CALLED]
-        ]
-
         active_ticket = active_tickets[0] if len(active_tickets) > 0 else None
 
-        # Find queue position
-        queue_tickets: list[OfficeHoursTicketEntity] = sorted(
-            [
-                ticket
-                for ticket in queue_entity.tickets
-                if ticket.state == TicketState.QUEUED
-            ],
-            key=lambda ticket: ticket.created_at,
-        )
-
+        # Find queue position without loading every ticket of the event
         queue_position = (
-            queue_tickets.index(active_ticket) + 1
-            if active_ticket and active_ticket.state == TicketState.QUEUED
+            self._live_queue.queue_position(
+                self._session, office_hours_id, active_ticket.id
+            )
+            if active_ticket and active_ticket.state == TicketState.QUEUED.to_string()
             else -1
         )
 
@@ -197,9 +209,7 @@ class OfficeHoursService:
             event_end_time=queue_entity.end_time,
             event_location=queue_entity.room.nickname,
             event_location_description=queue_entity.location_description,
-            ticket=(
-                self._to_oh_ticket_overview(active_ticket) if active_ticket else None
-            ),
+            ticket=active_ticket,
             queue_position=queue_position,
         )
 
@@ -207,34 +217,29 @@ class OfficeHoursService:
         self, user: User, oh_event: OfficeHoursEntity
     ) -> OfficeHourQueueOverview:
 
-        ticket_entities = self._session.scalars(
-            select(OfficeHoursTicketEntity)
+        tickets = ticket_overviews(
+            self._session,
+            ticket_overview_query()
             .where(OfficeHoursTicketEntity.office_hours_id == oh_event.id)
             .where(
                 OfficeHoursTicketEntity.state.in_(
                     [TicketState.CALLED, TicketState.QUEUED]
                 )
             )
-            .order_by(OfficeHoursTicketEntity.id)
-            .options(
-                selectinload(OfficeHoursTicketEntity.creators).selectinload(
-                    SectionMemberEntity.user
-                )
-            )
-        ).all()
+            .order_by(OfficeHoursTicketEntity.id),
+        )
 
         active_tickets: list[OfficeHourTicketOverview] = []
         called_tickets: list[OfficeHourTicketOverview] = []
         queued_tickets: list[OfficeHourTicketOverview] = []
-        for ticket in ticket_entities:
-            overview = self._to_oh_ticket_overview(ticket)
-            if ticket.state == TicketState.CALLED:
-                if ticket.caller.user_id == user.id:
-                    active_tickets.append(overview)
+        for ticket in tickets:
+            if ticket.state == TicketState.CALLED.to_string():
+                if ticket.caller is not None and ticket.caller.id == user.id:
+                    active_tickets.append(ticket)
                 else:
-                    called_tickets.append(overview)
-            elif ticket.state == TicketState.QUEUED:
-                queued_tickets.append(overview)
+                    called_tickets.append(ticket)
+            elif ticket.state == TicketState.QUEUED.to_string():
+                queued_tickets.append(ticket)
 
         completed_tickets = []
         personal_completed_tickets = []
@@ -298,29 +303,6 @@ class OfficeHoursService:
 
         return OfficeHourEventRoleOverview(role=user_members[0].member_role.value)
 
-    def _to_oh_ticket_overview(
-        self, ticket: OfficeHoursTicketEntity
-    ) -> OfficeHourTicketOverview:
-        return OfficeHourTicketOverview(
-            id=ticket.id,
-            created_at=ticket.created_at,
-            called_at=ticket.called_at,
-            state=ticket.state.to_string(),
-            type=ticket.type.to_string(),
-            concept_help_description=ticket.concept_help_description,
-            assignment_section_description=ticket.assignment_section_description,
-            code_to_english_description=ticket.code_to_english_description,
-            concepts_needed_description=ticket.concepts_needed_description,
-            tactics_tried=ticket.tactics_tried,
-            meeting_summary=ticket.meeting_summary,
-            solutions_used=ticket.solutions_used,
-            concepts_for_review=ticket.concepts_for_review,
-            creators=[creator.user.to_public_model() for creator in ticket.creators],
-            caller=(ticket.caller.user.to_public_model() if ticket.caller else None),
-            caller_id=ticket.caller_id,
-            office_hours_id=ticket.office_hours_id,
-        )
-
     def create(self, user: User, site_id: int, event: NewOfficeHours) -> OfficeHours:
         """
         Creates a new office hours event.
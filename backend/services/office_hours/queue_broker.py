@@ -0,0 +1,205 @@
+"""
+Defines the in-process publish/subscribe broker behind the office hours queue WebSockets.
+
+`OfficeHourTicketService` publishes an `OfficeHoursQueueEvent` after every committed change to a
+ticket, and each open WebSocket subscribes to the events of one office hours event. Clients load
+one snapshot when they connect and then follow the events, so database load grows with the number
+of ticket changes instead of with the number of polling clients.
+
+Events are published from the threads that run synchronous routes and are delivered on the event
+loop of each subscriber. A subscriber that falls more than `OFFICE_HOURS_QUEUE_MAX_PENDING` events
+behind has its pending events dropped and receives `None`, meaning it must reload its snapshot.
+
+The broker only reaches WebSockets served by the same process. Deployments with several workers
+need a shared broker, such as Redis pub/sub, behind the same `publish` and `subscribe` methods.
+"""
+
+import asyncio
+import contextlib
+import functools
+import logging
+import threading
+from collections import defaultdict
+from typing import Iterator
+
+from ...env import getenv
+from ...models.academics.my_courses import OfficeHourGetHelpOverview
+from ...models.office_hours.queue_event import OfficeHoursQueueEvent
+from ...models.office_hours.ticket_state import TicketState
+from ...models.user import User
+
+__authors__ = ["Riley Chapman"]
+__copyright__ = "Copyright 2025"
+__license__ = "MIT"
+
+OFFICE_HOURS_QUEUE_MAX_PENDING = int(
+    getenv("OFFICE_HOURS_QUEUE_MAX_PENDING", default="256")
+)
+"""Maximum number of undelivered events kept for one subscriber."""
+
+logger = logging.getLogger(__name__)
+
+
+class OfficeHoursQueueSubscription:
+    """The events of one office hours event, delivered to one subscriber's event loop."""
+
+    def __init__(
+        self,
+        office_hours_id: int,
+        loop: asyncio.AbstractEventLoop,
+        max_pending: int = OFFICE_HOURS_QUEUE_MAX_PENDING,
+    ):
+        self.office_hours_id = office_hours_id
+        self._loop = loop
+        self._events: asyncio.Queue[OfficeHoursQueueEvent | None] = asyncio.Queue(
+            max_pending
+        )
+
+    async def get(self) -> OfficeHoursQueueEvent | None:
+        """
+        Waits for the next event.
+
+        Returns:
+            OfficeHoursQueueEvent | None: The next event, or None if events were dropped
+                because the subscriber fell behind and its snapshot must be reloaded.
+        """
+        return await self._events.get()
+
+    def _post(self, event: OfficeHoursQueueEvent) -> None:
+        """Hands an event to the subscriber from any thread."""
+        try:
+            self._loop.call_soon_threadsafe(self._deliver, event)
+        except RuntimeError:
+            # The subscriber's event loop has already closed
+            ...
+
+    def _deliver(self, event: OfficeHoursQueueEvent) -> None:
+        """Queues an event on the subscriber's event loop."""
+        try:
+            self._events.put_nowait(event)
+        except asyncio.QueueFull:
+            logger.warning(
+                "Office hours %d queue subscriber fell behind; requesting a snapshot",
+                self.office_hours_id,
+            )
+            while not self._events.empty():
+                self._events.get_nowait()
+            self._events.put_nowait(None)
+
+
+class OfficeHoursQueueBroker:
+    """Thread-safe in-process broker of office hours queue events."""
+
+    def __init__(self, max_pending: int = OFFICE_HOURS_QUEUE_MAX_PENDING):
+        """
+        Args:
+            max_pending (int): Maximum number of undelivered events kept per subscriber.
+        """
+        self._max_pending = max_pending
+        self._lock = threading.Lock()
+        self._subscriptions: dict[int, set[OfficeHoursQueueSubscription]] = defaultdict(
+            set
+        )
+
+    def subscribe(self, office_hours_id: int) -> OfficeHoursQueueSubscription:
+        """
+        Subscribes the running event loop to the events of an office hours event.
+
+        Args:
+            office_hours_id (int): The ID of the office hours event.
+
+        Returns:
+            OfficeHoursQueueSubscription: Receives every event published from now on.
+        """
+        subscription = OfficeHoursQueueSubscription(
+            office_hours_id, asyncio.get_running_loop(), self._max_pending
+        )
+        with self._lock:
+            self._subscriptions[office_hours_id].add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: OfficeHoursQueueSubscription) -> None:
+        """Stops delivering events to a subscription."""
+        with self._lock:
+            subscriptions = self._subscriptions.get(subscription.office_hours_id)
+            if subscriptions is not None:
+                subscriptions.discard(subscription)
+                if not subscriptions:
+                    del self._subscriptions[subscription.office_hours_id]
+
+    @contextlib.contextmanager
+    def subscription(
+        self, office_hours_id: int
+    ) -> Iterator[OfficeHoursQueueSubscription]:
+        """Subscribes to an office hours event for the duration of a `with` block."""
+        subscription = self.subscribe(office_hours_id)
+        try:
+            yield subscription
+        finally:
+            self.unsubscribe(subscription)
+
+    def publish(self, event: OfficeHoursQueueEvent) -> None:
+        """
+        Delivers an event to every subscriber of its office hours event.
+
+        Args:
+            event (OfficeHoursQueueEvent): The committed change to a ticket.
+        """
+        with self._lock:
+            subscriptions = list(self._subscriptions.get(event.office_hours_id, ()))
+        for subscription in subscriptions:
+            subscription._post(event)
+
+    def subscriber_count(self, office_hours_id: int) -> int:
+        """Returns the number of subscribers of an office hours event."""
+        with self._lock:
+            return len(self._subscriptions.get(office_hours_id, ()))
+
+
+@functools.cache
+def office_hours_queue_broker() -> OfficeHoursQueueBroker:
+    """Dependency offering the application-wide office hours queue broker."""
+    return OfficeHoursQueueBroker()
+
+
+class GetHelpQueueTracker:
+    """Keeps a student's get help overview current from queue events without querying.
+
+    Tickets ahead of the student's ticket leaving the queue move it up one position. Events
+    about the student's own ticket change more than the position, so they ask for a reload.
+    """
+
+    def __init__(self, user: User, overview: OfficeHourGetHelpOverview):
+        """
+        Args:
+            user (User): The student following the queue.
+            overview (OfficeHourGetHelpOverview): The student's latest snapshot.
+        """
+        self._user = user
+        self.overview = overview
+
+    def needs_reload(self, event: OfficeHoursQueueEvent) -> bool:
+        """Returns whether an event is about one of the student's own tickets."""
+        return self._user.id in event.creator_ids
+
+    def apply(self, event: OfficeHoursQueueEvent) -> bool:
+        """
+        Applies an event about another student's ticket to the overview.
+
+        Returns:
+            bool: Whether the overview changed.
+        """
+        ticket = self.overview.ticket
+        if (
+            ticket is None
+            or ticket.state != TicketState.QUEUED.to_string()
+            or event.previous_state != TicketState.QUEUED.to_string()
+            or event.type not in ("ticket_called", "ticket_canceled")
+            or event.ticket.created_at > ticket.created_at
+        ):
+            return False
+
+        self.overview = self.overview.model_copy(
+            update={"queue_position": max(self.overview.queue_position - 1, 1)}
+        )
+        return True
@@ -4,13 +4,24 @@ Defines service layer for similar tickets API.
 
 from datetime import datetime
 from fastapi import Depends
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy import select
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload
 
-from backend.models.office_hours.similar_tickets_ai import SimilarTicketsResponse
+from backend.models.office_hours.similar_tickets_ai import (
+    SimilarTicketsAIResponse,
+    SimilarTicketsResponse,
+)
 from backend.models.office_hours.ticket_type import TicketType
 from backend.services.office_hours.similar_tickets_ai import SimilarTicketAIService
-from ...database import db_session
+from backend.services.office_hours.similar_tickets_cache import (
+    SimilarTicketCache,
+    similar_ticket_cache,
+)
+from backend.services.office_hours.similar_tickets_candidates import (
+    SimilarTicketCandidateService,
+)
+from ...database import db_session, run_sync
 from ...models.user import User
 from ...models.academics.section_member import RosterRole
 from ...models.academics.my_courses import (
@@ -46,19 +57,29 @@ class OfficeHourSimilarTicketService:
         self,
         session: Session = Depends(db_session),
         ai_service: SimilarTicketAIService = Depends(),
+        candidates: SimilarTicketCandidateService = Depends(),
+        cache: SimilarTicketCache = Depends(similar_ticket_cache),
     ):
         """
         Initializes the database session.
         """
         self._session = session
         self._ai_service = ai_service
+        self._candidates = candidates
+        self._cache = cache
 
-    def find_similar_tickets(self, subject: User, id: int) -> SimilarTicketsResponse:
+    async def find_similar_tickets(
+        self, subject: User, id: int
+    ) -> SimilarTicketsResponse:
         """
-        Builds the AI prompt and compiles all past tickets in the database to be sifted through by AI.
-        Makes a call to the AI service layer andvuses the AI response
+        Selects a bounded set of candidate tickets from the current ticket's course site
+        and makes a call to the AI service layer to rerank them. Uses the AI response
         to compile a list of actual tickets to return to the API.
 
+        Queries run through `run_sync`, so with a service built on the `sync_session` of an
+        `AsyncSession`, such as by `bridged_similar_ticket_svc`, neither they nor the AI call
+        hold a thread.
+
         Args:
             subject (User): The user requesting the tickets.
             id (int): The ID of the ticket that is currently open.
@@ -66,68 +87,207 @@ class OfficeHourSimilarTicketService:
         Returns:
             SimilarTicketsResponse: List of similar tickets.
         """
+        ticket_entity, prompt_input, cache_keys = await run_sync(
+            self._load_ticket, subject, id
+        )
+        cache_key, precomputed_key = cache_keys
+
+        # Reuse the previous answer for identical ticket content and an unchanged corpus, or else
+        # the answer precomputed when the ticket was created. The cache may be on Redis, whose
+        # client blocks, so it is called from the threadpool
+        ai_response = await run_in_threadpool(
+            self._cache.get, cache_key, precomputed_key
+        )
+        if ai_response is None:
+            ai_response = await self._rerank_candidates(ticket_entity, prompt_input)
+            await run_in_threadpool(self._cache.set, cache_key, ai_response)
+
+        similar_ids = ai_response.similar_ticket_ids
+        if not similar_ids:
+            return SimilarTicketsResponse(similar_tickets=[])
+
+        similar_tickets = await run_sync(self._ticket_overviews, similar_ids)
+        return SimilarTicketsResponse(similar_tickets=similar_tickets)
+
+    async def precompute_similar_tickets(self, id: int) -> None:
+        """
+        Computes the similar tickets of a ticket ahead of time and stores them in the cache
+        under the ticket's own key, so that `find_similar_tickets` can answer without waiting
+        on the AI even after other tickets of the course have been closed.
+
+        Runs in the background after a ticket is created, so no permission check is made.
+
+        Args:
+            id (int): The ID of the newly created ticket.
+
+        Raises:
+            ResourceNotFoundException: If the ticket does not exist.
+        """
+        ticket_entity, prompt_input, cache_keys = await run_sync(
+            self._load_ticket, None, id
+        )
+        _, precomputed_key = cache_keys
+        ai_response = await self._rerank_candidates(ticket_entity, prompt_input)
+        await run_in_threadpool(self._cache.set, precomputed_key, ai_response)
+
+    def _load_ticket(
+        self, subject: User | None, id: int
+    ) -> tuple[OfficeHoursTicketEntity, dict[str, str | None], tuple[str, str]]:
+        """
+        Loads a ticket, checking that the subject is a TA or instructor of its course site.
+
+        Args:
+            subject (User | None): The user requesting the tickets, or None to skip the check.
+            id (int): The ID of the ticket.
+
+        Returns:
+            tuple: The ticket, its prompt fields, and its course-wide and precomputed cache keys.
+
+        Raises:
+            ResourceNotFoundException: If the ticket does not exist.
+            CoursePermissionException: If the subject is not a TA or instructor of the course.
+        """
         ticket_entity = self._session.get(OfficeHoursTicketEntity, id)
         if not ticket_entity:
             raise ResourceNotFoundException(f"Ticket not found with ID: {id}")
 
-        # Testing adding course permissions here
-        user_member_query = (
-            select(SectionMemberEntity)
-            .where(SectionMemberEntity.user_id == subject.id)
-            .join(SectionEntity)
-            .join(CourseSiteEntity)
-            .join(OfficeHoursEntity)
-            .where(OfficeHoursEntity.id == ticket_entity.office_hours_id)
-        )
-        user_members = self._session.scalars(user_member_query).unique().all()
-        user_member = user_members[0] if len(user_members) > 0 else None
-
-        # Ensure that the user is a TA or Instructor for the office hours session
-        if not user_member or user_member.member_role not in [
-            RosterRole.UTA,
-            RosterRole.INSTRUCTOR,
-            RosterRole.GTA,
-        ]:
-            raise CoursePermissionException(
-                "Not allowed to view similar tickets unless you are a TA or Instructor for the course."
+        if subject is not None:
+            # Testing adding course permissions here
+            user_member_query = (
+                select(SectionMemberEntity)
+                .where(SectionMemberEntity.user_id == subject.id)
+                .join(SectionEntity)
+                .join(CourseSiteEntity)
+                .join(OfficeHoursEntity)
+                .where(OfficeHoursEntity.id == ticket_entity.office_hours_id)
             )
+            user_members = self._session.scalars(user_member_query).unique().all()
+            user_member = user_members[0] if len(user_members) > 0 else None
+
+            # Ensure that the user is a TA or Instructor for the office hours session
+            if not user_member or user_member.member_role not in [
+                RosterRole.UTA,
+                RosterRole.INSTRUCTOR,
+                RosterRole.GTA,
+            ]:
+                raise CoursePermissionException(
+                    "Not allowed to view similar tickets unless you are a TA or Instructor for the course."
+                )
 
         # prepping input for AI call
-        prompt_input = {}
+        prompt_input = self._prompt_input(ticket_entity)
+        cache_keys = (
+            self._cache.key(
+                ticket_entity.office_hours.course_site_id,
+                ticket_entity.type,
+                prompt_input,
+            ),
+            self._cache.precomputed_key(
+                ticket_entity.id, ticket_entity.type, prompt_input
+            ),
+        )
+        return ticket_entity, prompt_input, cache_keys
+
+    def _ticket_overviews(self, ids: list[int]) -> list[OfficeHourTicketOverview]:
+        """
+        Loads the overviews of tickets, in the order of their IDs.
+
+        Args:
+            ids (list[int]): IDs of the tickets. IDs of missing tickets are skipped.
+
+        Returns:
+            list[OfficeHourTicketOverview]: The overviews of the tickets that exist.
+        """
+        # get tickets with ids given by AI from the database - also based on sqlalchemy reading part 4
+        query = (
+            select(OfficeHoursTicketEntity)
+            .where(OfficeHoursTicketEntity.id.in_(ids))
+            .options(
+                joinedload(OfficeHoursTicketEntity.caller).joinedload(
+                    SectionMemberEntity.user
+                )
+            )
+        )
+        overviews = {
+            entity.id: entity.to_overview_model()
+            for entity in self._session.scalars(query).all()
+        }
+        return [overviews[id] for id in ids if id in overviews]
+
+    def _prompt_input(
+        self, ticket_entity: OfficeHoursTicketEntity
+    ) -> dict[str, str | None]:
+        """
+        Selects the fields of the current ticket that are sent to the AI.
+
+        Args:
+            ticket_entity (OfficeHoursTicketEntity): The current open ticket.
+
+        Returns:
+            dict[str, str | None]: Ticket fields keyed by name.
+        """
         if ticket_entity.type == TicketType.CONCEPTUAL_HELP:
-            prompt_input = {
+            return {
                 "concept_help_description": ticket_entity.concept_help_description,
             }
-        else:
-            prompt_input = {
-                "assignment_section_description": ticket_entity.assignment_section_description,
-                "code_to_english_description": ticket_entity.code_to_english_description,
-                "concepts_needed_description": ticket_entity.concepts_needed_description,
-                "tactics_tried": ticket_entity.tactics_tried,
-            }
+        return {
+            "assignment_section_description": ticket_entity.assignment_section_description,
+            "code_to_english_description": ticket_entity.code_to_english_description,
+            "concepts_needed_description": ticket_entity.concepts_needed_description,
+            "tactics_tried": ticket_entity.tactics_tried,
+        }
 
-        # Based on sqlalchemy reading part 4 (read section)
-        query = select(OfficeHoursTicketEntity).where(
-            OfficeHoursTicketEntity.state == TicketState.CLOSED
-        )
-        all_entities = self._session.scalars(query).all()
-        past_tickets = [entity.to_overview_model() for entity in all_entities]
+    async def _rerank_candidates(
+        self,
+        ticket_entity: OfficeHoursTicketEntity,
+        prompt_input: dict[str, str | None],
+    ) -> SimilarTicketsAIResponse:
+        """
+        Selects candidate tickets and asks the AI which of them are similar to the current ticket.
 
-        # call AI and get similar ticket ids from AI using the similarticketAiresponse model
-        ai_response = self._ai_service.ai_for_similar_tickets(
+        Args:
+            ticket_entity (OfficeHoursTicketEntity): The current open ticket.
+            prompt_input (dict[str, str | None]): Fields of the current open ticket.
+
+        Returns:
+            SimilarTicketsAIResponse: IDs of the similar tickets, limited to the candidates.
+        """
+        # Only a bounded set of candidates from the same course site is sent to the AI
+        past_tickets = await run_sync(self._candidates_for, ticket_entity, prompt_input)
+        if not past_tickets:
+            return SimilarTicketsAIResponse(similar_ticket_ids=[])
+
+        # call AI to rerank the candidates using the similarticketAiresponse model
+        ai_response = await self._ai_service.ai_for_similar_tickets(
             prompt_input, past_tickets
         )
-        similar_ids = ai_response.similar_ticket_ids
 
-        if not similar_ids:
-            return SimilarTicketsResponse(similar_tickets=[])
-
-        # get tickets with ids given by AI from the database - also based on sqlalchemy reading part 4
-        filtered_query = select(OfficeHoursTicketEntity).where(
-            OfficeHoursTicketEntity.id.in_(similar_ids)
+        # Ignore any IDs the AI returns that were not among the candidates
+        candidate_ids = {ticket.id for ticket in past_tickets}
+        return SimilarTicketsAIResponse(
+            similar_ticket_ids=[
+                similar_id
+                for similar_id in ai_response.similar_ticket_ids
+                if similar_id in candidate_ids
+            ]
         )
-        filtered_entities = self._session.scalars(filtered_query).all()
-        filtered_ticket_overviews = [
-            entity.to_overview_model() for entity in filtered_entities
-        ]
-        return SimilarTicketsResponse(similar_tickets=filtered_ticket_overviews)
+
+    def _candidates_for(
+        self,
+        ticket_entity: OfficeHoursTicketEntity,
+        prompt_input: dict[str, str | None],
+    ) -> list[OfficeHourTicketOverview]:
+        """
+        Selects the candidate tickets sent to the AI for the current ticket.
+
+        Args:
+            ticket_entity (OfficeHoursTicketEntity): The current open ticket.
+            prompt_input (dict[str, str | None]): Fields of the current open ticket.
+
+        Returns:
+            list[OfficeHourTicketOverview]: Overviews of the candidates, best candidates first.
+        """
+        candidate_ids = self._candidates.select_candidates(ticket_entity, prompt_input)
+        if not candidate_ids:
+            return []
+        return self._ticket_overviews(candidate_ids)
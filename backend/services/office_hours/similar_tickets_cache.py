@@ -0,0 +1,256 @@
+"""
+Defines the result cache for similar ticket lookups.
+
+Reopening the similar tickets panel, or two TAs looking at the same queued ticket, would otherwise
+pay for a full AI round trip each time. Results are cached by a hash of the current ticket's prompt
+fields and the version of its course site's candidate corpus. Closing a ticket bumps that version,
+so cached results never outlive the corpus they were computed from.
+
+Results precomputed in the background when a ticket is created are stored under the ticket's own
+key instead, made of its ID and the hash of its prompt fields. Tickets are closed all the time
+during busy office hours, so a precomputed result keyed by the corpus version would usually be
+gone by the time a TA calls the ticket. Editing the ticket invalidates its precomputed result, but
+closing other tickets does not: it may miss the tickets closed since the ticket was created.
+
+Entries live in a `SimilarTicketCacheBackend`. `InMemoryCacheBackend` is used by default and keeps
+entries per process with TTL and LRU eviction. Setting `SIMILAR_TICKETS_CACHE_URL` switches to
+`RedisCacheBackend`, which shares entries between worker processes through a Redis-compatible server
+and needs the `redis` package.
+"""
+
+import functools
+import hashlib
+import json
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Any, Callable
+
+from ...env import getenv
+from ...models.office_hours.similar_tickets_ai import (
+    SimilarTicketCacheStats,
+    SimilarTicketsAIResponse,
+)
+from ...models.office_hours.ticket_type import TicketType
+from ..ttl_cache import TTLCache
+
+__authors__ = ["Riley Chapman"]
+__copyright__ = "Copyright 2025"
+__license__ = "MIT"
+
+SIMILAR_TICKETS_CACHE_TTL = int(getenv("SIMILAR_TICKETS_CACHE_TTL", default="3600"))
+"""Seconds a cached similar ticket result stays valid."""
+
+SIMILAR_TICKETS_CACHE_SIZE = int(getenv("SIMILAR_TICKETS_CACHE_SIZE", default="1024"))
+"""Maximum number of results kept by the in-process cache before evicting the least recently used."""
+
+
+class SimilarTicketCacheBackend(ABC):
+    """Key-value storage used by `SimilarTicketCache`."""
+
+    @abstractmethod
+    def get(self, key: str) -> str | None:
+        """Returns the value stored under `key`, or None if it is missing or expired."""
+
+    @abstractmethod
+    def set(self, key: str, value: str, ttl: int) -> None:
+        """Stores `value` under `key` for `ttl` seconds."""
+
+    @abstractmethod
+    def counter(self, key: str) -> int:
+        """Returns the counter stored under `key`, or 0 if it was never incremented."""
+
+    @abstractmethod
+    def incr(self, key: str) -> int:
+        """Atomically increments the counter stored under `key` and returns its new value.
+
+        Counters are never expired nor evicted, unlike the entries stored with `set`.
+        """
+
+
+class InMemoryCacheBackend(SimilarTicketCacheBackend):
+    """Process-local backend with TTL expiry and least-recently-used eviction.
+
+    Counters written with `incr` are kept apart from cached entries so that they are never evicted.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = SIMILAR_TICKETS_CACHE_SIZE,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._entries: TTLCache[str, str] = TTLCache(
+            SIMILAR_TICKETS_CACHE_TTL, max_entries, clock
+        )
+        self._counters: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> str | None:
+        return self._entries.lookup(key)
+
+    def set(self, key: str, value: str, ttl: int) -> None:
+        self._entries.put(key, value, ttl)
+
+    def counter(self, key: str) -> int:
+        with self._lock:
+            return self._counters.get(key, 0)
+
+    def incr(self, key: str) -> int:
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + 1
+            return self._counters[key]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class RedisCacheBackend(SimilarTicketCacheBackend):
+    """Shared backend for any client exposing the `get`, `set(ex=...)`, `hget` and `hincrby`
+    commands of redis-py.
+
+    Entries are stored with a TTL, and eviction of least recently used entries is left to the
+    server. Counters are fields of one hash, `counters_key`, stored without a TTL. The server must
+    run with a `volatile-*` `maxmemory-policy`, such as `volatile-lru`, which only evicts keys with
+    a TTL: under an `allkeys-*` policy the hash could be evicted, and cached entries of a counter's
+    earlier values would be served again.
+
+    Any object with the same four methods can stand in for the client, which keeps this backend
+    testable locally.
+    """
+
+    def __init__(self, client: Any, counters_key: str = "similar_tickets:counters"):
+        self._client = client
+        self._counters_key = counters_key
+
+    def get(self, key: str) -> str | None:
+        value = self._client.get(key)
+        return value.decode() if isinstance(value, bytes) else value
+
+    def set(self, key: str, value: str, ttl: int) -> None:
+        self._client.set(key, value, ex=ttl)
+
+    def counter(self, key: str) -> int:
+        value = self._client.hget(self._counters_key, key)
+        return 0 if value is None else int(value)
+
+    def incr(self, key: str) -> int:
+        return int(self._client.hincrby(self._counters_key, key, 1))
+
+
+class SimilarTicketCache:
+    """Caches `SimilarTicketsAIResponse` objects and counts cache hits and misses."""
+
+    _PREFIX = "similar_tickets"
+
+    def __init__(
+        self,
+        backend: SimilarTicketCacheBackend,
+        ttl: int = SIMILAR_TICKETS_CACHE_TTL,
+    ):
+        self._backend = backend
+        self._ttl = ttl
+        self._hits = 0
+        self._misses = 0
+        self._lock = threading.Lock()
+
+    def key(
+        self,
+        course_site_id: int,
+        ticket_type: TicketType,
+        prompt_input: dict[str, str | None],
+    ) -> str:
+        """
+        Builds the cache key for a ticket.
+
+        Args:
+            course_site_id (int): Course site whose closed tickets are the candidate corpus.
+            ticket_type (TicketType): Type of the current ticket.
+            prompt_input (dict[str, str | None]): Fields of the current ticket sent to the AI.
+
+        Returns:
+            str: A key that changes whenever the prompt fields or the corpus version change.
+        """
+        version = self._backend.counter(self._version_key(course_site_id))
+        digest = self._digest(ticket_type, prompt_input)
+        return f"{self._PREFIX}:{course_site_id}:{version}:{digest}"
+
+    def precomputed_key(
+        self,
+        ticket_id: int,
+        ticket_type: TicketType,
+        prompt_input: dict[str, str | None],
+    ) -> str:
+        """
+        Builds the key of the result precomputed for a ticket.
+
+        Args:
+            ticket_id (int): ID of the ticket the result was precomputed for.
+            ticket_type (TicketType): Type of the ticket.
+            prompt_input (dict[str, str | None]): Fields of the ticket sent to the AI.
+
+        Returns:
+            str: A key that changes whenever the prompt fields of the ticket change, but not
+                when the corpus version of its course site does.
+        """
+        digest = self._digest(ticket_type, prompt_input)
+        return f"{self._PREFIX}:ticket:{ticket_id}:{digest}"
+
+    def get(self, *keys: str) -> SimilarTicketsAIResponse | None:
+        """Returns the cached response under the first of `keys` that has one, recording one
+        hit or miss for the lookup."""
+        value = None
+        for key in keys:
+            value = self._backend.get(key)
+            if value is not None:
+                break
+        with self._lock:
+            if value is None:
+                self._misses += 1
+                return None
+            self._hits += 1
+        return SimilarTicketsAIResponse.model_validate_json(value)
+
+    def set(self, key: str, response: SimilarTicketsAIResponse) -> None:
+        """Caches `response` under `key`."""
+        self._backend.set(key, response.model_dump_json(), self._ttl)
+
+    def bump_corpus_version(self, course_site_id: int) -> None:
+        """Invalidates every cached result for a course site by moving to a new corpus version."""
+        self._backend.incr(self._version_key(course_site_id))
+
+    def stats(self) -> SimilarTicketCacheStats:
+        """Returns the hit and miss counters of this process."""
+        with self._lock:
+            return SimilarTicketCacheStats(hits=self._hits, misses=self._misses)
+
+    def _digest(
+        self, ticket_type: TicketType, prompt_input: dict[str, str | None]
+    ) -> str:
+        content = json.dumps(
+            {"type": ticket_type.name, "prompt_input": prompt_input}, sort_keys=True
+        )
+        return hashlib.sha256(content.encode()).hexdigest()
+
+    def _version_key(self, course_site_id: int) -> str:
+        return f"{self._PREFIX}:corpus_version:{course_site_id}"
+
+
+@functools.cache
+def similar_ticket_cache() -> SimilarTicketCache:
+    """Dependency offering the application-wide similar ticket cache.
+
+    Uses a shared Redis-compatible backend when `SIMILAR_TICKETS_CACHE_URL` is set, and an
+    in-process backend otherwise. Built when the API starts, so that a missing `redis` package
+    fails fast rather than on the first request.
+    """
+    url = getenv("SIMILAR_TICKETS_CACHE_URL", default="")
+    if url:
+        try:
+            import redis
+        except ImportError as error:
+            raise RuntimeError(
+                "Error: SIMILAR_TICKETS_CACHE_URL is set but the redis package is not installed"
+            ) from error
+
+        return SimilarTicketCache(RedisCacheBackend(redis.Redis.from_url(url)))
+    return SimilarTicketCache(InMemoryCacheBackend())
@@ -0,0 +1,157 @@
+"""
+Defines the candidate-selection stage that runs in front of the similar tickets AI call.
+
+Candidates are scoped to closed tickets of the same type from the current ticket's course site
+(and therefore its term). Within that scope, tickets are ranked both lexically, with BM25 over
+their description fields, and semantically, with the embedding index. The two rankings are
+merged with reciprocal rank fusion and cut to a fixed budget, so the AI prompt stays bounded
+no matter how much ticket history has accumulated.
+"""
+
+import math
+from collections import Counter
+
+from fastapi import Depends
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from ...database import db_session
+from ...entities.office_hours import OfficeHoursEntity, OfficeHoursTicketEntity
+from ...models.office_hours.ticket_state import TicketState
+from .similar_tickets_index import (
+    SIMILAR_TICKETS_CANDIDATES,
+    SimilarTicketIndexService,
+    ticket_document_text,
+    ticket_query_text,
+    tokenize,
+)
+
+__authors__ = ["Riley Chapman"]
+__copyright__ = "Copyright 2025"
+__license__ = "MIT"
+
+BM25_K1 = 1.2
+"""BM25 term frequency saturation parameter."""
+
+BM25_B = 0.75
+"""BM25 document length normalization parameter."""
+
+RRF_K = 60
+"""Reciprocal rank fusion smoothing constant."""
+
+
+def bm25_rank(
+    query: str, documents: dict[int, str], k: int = SIMILAR_TICKETS_CANDIDATES
+) -> list[int]:
+    """Ranks documents against a query with Okapi BM25.
+
+    Args:
+        query (str): The query text.
+        documents (dict[int, str]): Document text keyed by ticket ID.
+        k (int): Maximum number of ticket IDs to return.
+
+    Returns:
+        list[int]: IDs of at most `k` documents that share a term with the query, best first.
+    """
+    query_terms = set(tokenize(query))
+    if not query_terms or not documents or k <= 0:
+        return []
+
+    term_counts = {
+        ticket_id: Counter(tokenize(text)) for ticket_id, text in documents.items()
+    }
+    lengths = {
+        ticket_id: sum(counts.values()) for ticket_id, counts in term_counts.items()
+    }
+    average_length = sum(lengths.values()) / len(documents) or 1
+
+    document_frequency = Counter(
+        term
+        for counts in term_counts.values()
+        for term in query_terms.intersection(counts)
+    )
+    idf = {
+        term: math.log(1 + (len(documents) - frequency + 0.5) / (frequency + 0.5))
+        for term, frequency in document_frequency.items()
+    }
+
+    scores: dict[int, float] = {}
+    for ticket_id, counts in term_counts.items():
+        norm = BM25_K1 * (1 - BM25_B + BM25_B * lengths[ticket_id] / average_length)
+        score = sum(
+            idf[term] * counts[term] * (BM25_K1 + 1) / (counts[term] + norm)
+            for term in idf
+            if term in counts
+        )
+        if score > 0:
+            scores[ticket_id] = score
+
+    return sorted(scores, key=lambda ticket_id: (-scores[ticket_id], ticket_id))[:k]
+
+
+def reciprocal_rank_fusion(rankings: list[list[int]]) -> list[int]:
+    """Merges several rankings of ticket IDs into one, favouring IDs ranked highly by any of them."""
+    scores: dict[int, float] = {}
+    for ranking in rankings:
+        for rank, ticket_id in enumerate(ranking):
+            scores[ticket_id] = scores.get(ticket_id, 0) + 1 / (RRF_K + rank + 1)
+    return sorted(scores, key=lambda ticket_id: (-scores[ticket_id], ticket_id))
+
+
+class SimilarTicketCandidateService:
+    """
+    Service that selects the bounded set of past tickets the AI is asked to rerank.
+    """
+
+    def __init__(
+        self,
+        session: Session = Depends(db_session),
+        index: SimilarTicketIndexService = Depends(),
+    ):
+        """
+        Initializes the database session and the similar ticket index.
+        """
+        self._session = session
+        self._index = index
+
+    def select_candidates(
+        self,
+        ticket: OfficeHoursTicketEntity,
+        prompt_input: dict[str, str | None],
+        budget: int = SIMILAR_TICKETS_CANDIDATES,
+    ) -> list[int]:
+        """
+        Selects candidate tickets similar to the current ticket.
+
+        Args:
+            ticket (OfficeHoursTicketEntity): The current open ticket.
+            prompt_input (dict[str, str | None]): Fields of the current open ticket.
+            budget (int): Maximum number of candidates to return.
+
+        Returns:
+            list[int]: IDs of at most `budget` closed tickets, most promising first.
+        """
+        course_site_id = ticket.office_hours.course_site_id
+
+        scoped_query = (
+            select(OfficeHoursTicketEntity)
+            .join(OfficeHoursEntity)
+            .where(OfficeHoursEntity.course_site_id == course_site_id)
+            .where(OfficeHoursTicketEntity.type == ticket.type)
+            .where(OfficeHoursTicketEntity.state == TicketState.CLOSED)
+            .where(OfficeHoursTicketEntity.id != ticket.id)
+        )
+        documents = {
+            entity.id: ticket_document_text(entity)
+            for entity in self._session.scalars(scoped_query).all()
+        }
+
+        lexical = bm25_rank(ticket_query_text(prompt_input), documents, budget)
+        semantic = self._index.nearest(
+            prompt_input,
+            k=budget,
+            exclude=[ticket.id],
+            course_site_id=course_site_id,
+            ticket_type=ticket.type,
+        )
+        return reciprocal_rank_fusion([lexical, semantic])[:budget]
@@ -0,0 +1,245 @@
+"""
+Defines the embedding index used to pre-select candidate tickets for the similar tickets feature.
+
+Rather than sending every closed ticket to the AI service, closed tickets are embedded once
+(when they are closed) and stored in the `office_hours__ticket_embedding` table. Similar ticket
+lookups embed the current ticket and only forward the top-k nearest neighbours to the AI.
+
+The database scores and ranks the candidates: the cosine similarity of each embedding in scope is
+a dot product over the dimensions the current ticket uses, and only the top-k rows are returned.
+That is still a scan of the course site's closed tickets inside PostgreSQL, whose cost grows with
+the ticket history; an approximate nearest-neighbour index (such as pgvector's) would need an
+extension the development database image does not ship.
+
+The embedding function is pluggable through the `embedding_function` dependency. The default,
+`hashing_embedding`, runs entirely offline so the index can be built and tested without Azure.
+"""
+
+import functools
+import hashlib
+import math
+import operator
+import re
+from typing import Callable, Iterable
+
+from fastapi import Depends
+from sqlalchemy import delete, insert, select
+from sqlalchemy.orm import Session
+
+from ...database import db_session
+from ...entities.office_hours import (
+    OfficeHoursEntity,
+    OfficeHoursTicketEmbeddingEntity,
+    OfficeHoursTicketEntity,
+)
+from ...env import getenv
+from ...models.office_hours.ticket_state import TicketState
+from ...models.office_hours.ticket_type import TicketType
+
+__authors__ = ["Riley Chapman"]
+__copyright__ = "Copyright 2025"
+__license__ = "MIT"
+
+EmbeddingFunction = Callable[[str], list[float]]
+"""Maps a piece of ticket text to an embedding vector."""
+
+EMBEDDING_DIMENSIONS = 512
+"""Number of dimensions produced by the default `hashing_embedding` function."""
+
+SIMILAR_TICKETS_CANDIDATES = int(getenv("SIMILAR_TICKETS_CANDIDATES", default="10"))
+"""Maximum number of nearest-neighbour candidates forwarded to the AI for reranking."""
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+
+def tokenize(text: str) -> list[str]:
+    """Splits text into the lowercase alphanumeric terms used for embedding and ranking."""
+    return _TOKEN_PATTERN.findall(text.lower())
+
+
+def hashing_embedding(text: str) -> list[float]:
+    """Embeds text locally by hashing its unigrams and bigrams into a fixed-size vector.
+
+    This is a dependency-free stand-in for a learned embedding model. Tickets that share
+    vocabulary end up close together, which is enough to pre-select candidates for the AI.
+
+    Args:
+        text (str): The text to embed.
+
+    Returns:
+        list[float]: A unit-length vector of `EMBEDDING_DIMENSIONS` floats (all zeros for empty text).
+    """
+    tokens = tokenize(text)
+    features = tokens + [f"{a} {b}" for a, b in zip(tokens, tokens[1:])]
+
+    vector = [0.0] * EMBEDDING_DIMENSIONS
+    for feature in features:
+        digest = int.from_bytes(
+            hashlib.blake2b(feature.encode(), digest_size=8).digest(), "little"
+        )
+        sign = 1.0 if digest >> 63 else -1.0
+        vector[digest % EMBEDDING_DIMENSIONS] += sign
+
+    return _normalize(vector)
+
+
+def embedding_function() -> EmbeddingFunction:
+    """Dependency offering the embedding function used by the similar ticket index.
+
+    Override this dependency (e.g. with `app.dependency_overrides`) to plug in a hosted model.
+    The index must be rebuilt with `SimilarTicketIndexService.rebuild` after switching functions.
+    """
+    return hashing_embedding
+
+
+def ticket_query_text(prompt_input: dict[str, str | None]) -> str:
+    """Builds the text embedded for the current ticket from its prompt fields."""
+    return "\n".join(value for value in prompt_input.values() if value)
+
+
+def ticket_document_text(ticket: OfficeHoursTicketEntity) -> str:
+    """Builds the text embedded for a closed ticket.
+
+    Uses the same fields that `SimilarTicketPromptBuilder` sends to the AI.
+    """
+    if ticket.type == TicketType.CONCEPTUAL_HELP:
+        fields = [ticket.concept_help_description]
+    else:
+        fields = [
+            ticket.assignment_section_description,
+            ticket.code_to_english_description,
+            ticket.concepts_needed_description,
+        ]
+    fields += [
+        ticket.tactics_tried,
+        ticket.meeting_summary,
+        ticket.solutions_used,
+        ticket.concepts_for_review,
+    ]
+    return "\n".join(field for field in fields if field)
+
+
+def _normalize(vector: list[float]) -> list[float]:
+    """Scales a vector to unit length so that a dot product is its cosine similarity."""
+    norm = math.sqrt(sum(value * value for value in vector))
+    return [value / norm for value in vector] if norm else vector
+
+
+class SimilarTicketIndexService:
+    """
+    Service that maintains and queries the embedding index over closed office hours tickets.
+    """
+
+    def __init__(
+        self,
+        session: Session = Depends(db_session),
+        embed: EmbeddingFunction = Depends(embedding_function),
+    ):
+        """
+        Initializes the database session and embedding function.
+        """
+        self._session = session
+        self._embed = embed
+
+    def index_ticket(self, ticket: OfficeHoursTicketEntity) -> None:
+        """
+        Adds or refreshes the embedding of a closed ticket.
+
+        The change is staged on the session and persisted with the caller's next commit,
+        so closing a ticket and indexing it happen in the same transaction.
+
+        Args:
+            ticket (OfficeHoursTicketEntity): The closed ticket to index.
+        """
+        self._session.merge(
+            OfficeHoursTicketEmbeddingEntity(
+                ticket_id=ticket.id,
+                embedding=_normalize(self._embed(ticket_document_text(ticket))),
+            )
+        )
+
+    def rebuild(self) -> int:
+        """
+        Rebuilds the entire index from the closed tickets in the database.
+
+        Returns:
+            int: The number of tickets indexed.
+        """
+        self._session.execute(delete(OfficeHoursTicketEmbeddingEntity))
+        closed_tickets = self._session.scalars(
+            select(OfficeHoursTicketEntity).where(
+                OfficeHoursTicketEntity.state == TicketState.CLOSED
+            )
+        ).all()
+        if closed_tickets:
+            self._session.execute(
+                insert(OfficeHoursTicketEmbeddingEntity),
+                [
+                    {
+                        "ticket_id": ticket.id,
+                        "embedding": _normalize(
+                            self._embed(ticket_document_text(ticket))
+                        ),
+                    }
+                    for ticket in closed_tickets
+                ],
+            )
+        self._session.commit()
+        return len(closed_tickets)
+
+    def nearest(
+        self,
+        prompt_input: dict[str, str | None],
+        k: int = SIMILAR_TICKETS_CANDIDATES,
+        exclude: Iterable[int] = (),
+        course_site_id: int | None = None,
+        ticket_type: TicketType | None = None,
+    ) -> list[int]:
+        """
+        Finds the closed tickets nearest to the current ticket by cosine similarity.
+
+        Args:
+            prompt_input (dict[str, str | None]): Fields of the current open ticket.
+            k (int): Maximum number of ticket IDs to return.
+            exclude (Iterable[int]): Ticket IDs that should never be returned.
+            course_site_id (int | None): If given, only search tickets from this course site.
+            ticket_type (TicketType | None): If given, only search tickets of this type.
+
+        Returns:
+            list[int]: IDs of at most `k` tickets, most similar first. Tickets sharing
+                nothing with the current ticket are never returned.
+        """
+        query = _normalize(self._embed(ticket_query_text(prompt_input)))
+        if k <= 0 or not any(query):
+            return []
+
+        # Dimensions where the current ticket is zero add nothing to the dot product
+        score = functools.reduce(
+            operator.add,
+            (
+                OfficeHoursTicketEmbeddingEntity.embedding[index + 1] * value
+                for index, value in enumerate(query)
+                if value
+            ),
+        ).label("score")
+        query_statement = (
+            select(OfficeHoursTicketEmbeddingEntity.ticket_id)
+            .join(OfficeHoursTicketEntity)
+            .where(OfficeHoursTicketEntity.state == TicketState.CLOSED, score > 0)
+            .order_by(score.desc(), OfficeHoursTicketEmbeddingEntity.ticket_id.desc())
+            .limit(k)
+        )
+        excluded = set(exclude)
+        if excluded:
+            query_statement = query_statement.where(
+                OfficeHoursTicketEmbeddingEntity.ticket_id.not_in(excluded)
+            )
+        if course_site_id is not None:
+            query_statement = query_statement.join(OfficeHoursEntity).where(
+                OfficeHoursEntity.course_site_id == course_site_id
+            )
+        if ticket_type is not None:
+            query_statement = query_statement.where(
+                OfficeHoursTicketEntity.type == ticket_type
+            )
+        return list(self._session.scalars(query_statement))
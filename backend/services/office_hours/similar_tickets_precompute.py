@@ -0,0 +1,125 @@
+"""
+Defines the background precomputation of similar tickets.
+
+When a student creates a ticket, a job is queued on the `BackgroundJobRunner` that computes the
+ticket's similar tickets and stores them in the `SimilarTicketCache` under the ticket's own key,
+which closing other tickets of the course does not invalidate. By the time a TA calls the ticket,
+`OfficeHourSimilarTicketService.find_similar_tickets` usually reads the stored answer instead of
+waiting on the AI. If the job has not finished, failed, or the ticket was edited since, the lookup
+falls back to computing the answer on demand.
+
+The runner's threads only wait for the jobs, which run on the event loop serving the API. There
+they share the API's asynchronous OpenAI client and concurrency limiter, so that requests and jobs
+together keep at most `UNC_OPENAI_MAX_CONCURRENCY` completions in flight, and send their queries
+through asyncpg as `bridged` services do.
+"""
+
+import asyncio
+import contextlib
+from typing import AsyncContextManager, AsyncIterator, Callable
+
+from fastapi import Depends, Request
+from openai import AsyncAzureOpenAI, OpenAIError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ...database import async_engine
+from ..background_jobs import BackgroundJobRunner, background_job_runner
+from ..openai import AsyncOpenAIService
+from .similar_tickets import OfficeHourSimilarTicketService
+from .similar_tickets_ai import SimilarTicketAIService
+from .similar_tickets_cache import similar_ticket_cache
+from .similar_tickets_candidates import SimilarTicketCandidateService
+from .similar_tickets_index import SimilarTicketIndexService, embedding_function
+from .similar_tickets_prompt import similar_ticket_prompt_builder
+
+__authors__ = ["Riley Chapman"]
+__copyright__ = "Copyright 2025"
+__license__ = "MIT"
+
+SimilarTicketServiceFactory = Callable[
+    [], AsyncContextManager[OfficeHourSimilarTicketService]
+]
+"""Opens a similar ticket service with its own database session, on the API's event loop."""
+
+RETRYABLE_EXCEPTIONS = (OpenAIError, ValueError, TimeoutError)
+"""Failures of `AsyncOpenAIService` that are worth retrying."""
+
+
+@contextlib.asynccontextmanager
+async def _background_similar_ticket_service(
+    client: AsyncAzureOpenAI, limiter: asyncio.Semaphore
+) -> AsyncIterator[OfficeHourSimilarTicketService]:
+    """Builds a similar ticket service that outlives the request which queued the job.
+
+    The request's session is closed as soon as the response is sent, so the job opens its own
+    `AsyncSession` and uses its `sync_session`. Dependency overrides of the API do not apply here.
+    """
+    async with AsyncSession(async_engine) as async_session:
+        session = async_session.sync_session
+        yield OfficeHourSimilarTicketService(
+            session,
+            SimilarTicketAIService(
+                AsyncOpenAIService(client, limiter), similar_ticket_prompt_builder()
+            ),
+            SimilarTicketCandidateService(
+                session, SimilarTicketIndexService(session, embedding_function())
+            ),
+            similar_ticket_cache(),
+        )
+
+
+def similar_ticket_service_factory(request: Request) -> SimilarTicketServiceFactory:
+    """Dependency offering the factory used by background jobs to open a similar ticket service.
+
+    The client and limiter are read from `app.state` when a job opens the service, since the
+    application's lifespan creates them."""
+    state = request.app.state
+    return lambda: _background_similar_ticket_service(
+        state.async_openai_client, state.openai_concurrency_limiter
+    )
+
+
+async def event_loop() -> asyncio.AbstractEventLoop:
+    """Dependency offering the event loop serving the API, which background jobs run on."""
+    return asyncio.get_running_loop()
+
+
+class SimilarTicketPrecomputeService:
+    """
+    Service that queues the computation of similar tickets for newly created tickets.
+    """
+
+    def __init__(
+        self,
+        runner: BackgroundJobRunner = Depends(background_job_runner),
+        service_factory: SimilarTicketServiceFactory = Depends(
+            similar_ticket_service_factory
+        ),
+        loop: asyncio.AbstractEventLoop = Depends(event_loop),
+    ):
+        """
+        Initializes the background job runner, the similar ticket service factory, and the event
+        loop the jobs run on.
+        """
+        self._runner = runner
+        self._service_factory = service_factory
+        self._loop = loop
+
+    def enqueue(self, ticket_id: int) -> None:
+        """
+        Queues a background job that precomputes the similar tickets of a ticket.
+
+        Args:
+            ticket_id (int): The ID of the newly created ticket.
+        """
+        self._runner.submit(
+            f"precompute similar tickets for ticket {ticket_id}",
+            lambda: asyncio.run_coroutine_threadsafe(
+                self._precompute(ticket_id), self._loop
+            ).result(),
+            retry_on=RETRYABLE_EXCEPTIONS,
+        )
+
+    async def _precompute(self, ticket_id: int) -> None:
+        async with self._service_factory() as similar_ticket_svc:
+            await similar_ticket_svc.precompute_similar_tickets(ticket_id)
@@ -0,0 +1,240 @@
+"""
+Defines the token-budgeted prompt builder for the similar tickets AI call.
+
+The prompt lists the current ticket followed by past tickets in the order they were ranked by
+candidate selection. Every field is cut to `SIMILAR_TICKETS_PROMPT_FIELD_TOKENS` tokens, and past
+tickets that would push the prompt past `SIMILAR_TICKETS_PROMPT_TOKEN_BUDGET` tokens are left out,
+so the least promising tickets are dropped first. Chunks are collected in a list and joined once.
+
+Tokens are counted by a pluggable `TokenCounter`. The default, `approximate_token_count`, needs no
+extra packages. Setting `SIMILAR_TICKETS_TOKENIZER=tiktoken` counts tokens exactly with the
+optional `tiktoken` package. Prompt sizes are recorded in `SimilarTicketPromptMetrics`.
+"""
+
+import functools
+import logging
+import threading
+from typing import Callable
+
+from ...env import getenv
+from ...models.academics.my_courses import OfficeHourTicketOverview
+from ...models.office_hours.similar_tickets_ai import SimilarTicketPromptStats
+
+__authors__ = ["Riley Chapman"]
+__copyright__ = "Copyright 2025"
+__license__ = "MIT"
+
+TokenCounter = Callable[[str], int]
+"""Returns the number of model tokens in a piece of text."""
+
+SIMILAR_TICKETS_PROMPT_TOKEN_BUDGET = int(
+    getenv("SIMILAR_TICKETS_PROMPT_TOKEN_BUDGET", default="6000")
+)
+"""Maximum number of tokens in a similar tickets prompt."""
+
+SIMILAR_TICKETS_PROMPT_FIELD_TOKENS = int(
+    getenv("SIMILAR_TICKETS_PROMPT_FIELD_TOKENS", default="250")
+)
+"""Maximum number of tokens of a single ticket field in the prompt."""
+
+TRUNCATION_MARKER = " [truncated]"
+
+RESPONSE_INSTRUCTIONS = (
+    '\nReturn a JSON object like: { "similar_ticket_ids": [3, 12, 17] }'
+)
+
+logger = logging.getLogger(__name__)
+
+
+def approximate_token_count(text: str) -> int:
+    """Estimates the token count of English text at roughly four characters per token."""
+    return (len(text) + 3) // 4
+
+
+def token_counter() -> TokenCounter:
+    """Dependency offering the token counter selected by `SIMILAR_TICKETS_TOKENIZER`."""
+    if getenv("SIMILAR_TICKETS_TOKENIZER", default="approximate") == "tiktoken":
+        import tiktoken
+
+        encoding = tiktoken.get_encoding("o200k_base")
+        return lambda text: len(encoding.encode(text))
+    return approximate_token_count
+
+
+class SimilarTicketPromptMetrics:
+    """Thread-safe counters describing the prompts built in this process."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stats = SimilarTicketPromptStats(
+            prompts=0,
+            total_chars=0,
+            total_tokens=0,
+            last_chars=0,
+            last_tokens=0,
+            tickets_included=0,
+            tickets_dropped=0,
+            fields_truncated=0,
+        )
+
+    def record(
+        self,
+        chars: int,
+        tokens: int,
+        tickets_included: int,
+        tickets_dropped: int,
+        fields_truncated: int,
+    ) -> None:
+        """Adds one built prompt to the counters."""
+        with self._lock:
+            stats = self._stats
+            stats.prompts += 1
+            stats.total_chars += chars
+            stats.total_tokens += tokens
+            stats.last_chars = chars
+            stats.last_tokens = tokens
+            stats.tickets_included += tickets_included
+            stats.tickets_dropped += tickets_dropped
+            stats.fields_truncated += fields_truncated
+
+    def stats(self) -> SimilarTicketPromptStats:
+        """Returns a snapshot of the counters."""
+        with self._lock:
+            return self._stats.model_copy()
+
+
+@functools.cache
+def similar_ticket_prompt_metrics() -> SimilarTicketPromptMetrics:
+    """Dependency offering the application-wide similar ticket prompt metrics."""
+    return SimilarTicketPromptMetrics()
+
+
+class SimilarTicketPromptBuilder:
+    """Builds similar tickets prompts that fit within a token budget.
+
+    A builder keeps per-prompt state while building, so each request gets its own instance.
+    """
+
+    def __init__(
+        self,
+        count_tokens: TokenCounter = approximate_token_count,
+        token_budget: int | None = SIMILAR_TICKETS_PROMPT_TOKEN_BUDGET,
+        field_token_limit: int | None = SIMILAR_TICKETS_PROMPT_FIELD_TOKENS,
+        metrics: SimilarTicketPromptMetrics | None = None,
+    ):
+        """
+        Args:
+            count_tokens (TokenCounter): Counts the tokens of a piece of text.
+            token_budget (int | None): Maximum tokens in a prompt, or None for no limit.
+            field_token_limit (int | None): Maximum tokens per field, or None for no limit.
+            metrics (SimilarTicketPromptMetrics | None): Where to record prompt sizes.
+        """
+        self._count_tokens = count_tokens
+        self._token_budget = token_budget
+        self._field_token_limit = field_token_limit
+        self._metrics = metrics
+        self._fields_truncated = 0
+
+    def build(
+        self,
+        current_ticket: dict[str, str | None],
+        past_tickets: list[OfficeHourTicketOverview],
+    ) -> str:
+        """
+        Builds the user prompt for the similar tickets AI call.
+
+        Args:
+            current_ticket (dict[str, str | None]): Fields of the current open ticket.
+            past_tickets (list[OfficeHourTicketOverview]): Candidate tickets, most promising first.
+
+        Returns:
+            str: The current ticket, as many past tickets as fit the budget, and the
+                response instructions.
+        """
+        self._fields_truncated = 0
+
+        chunks = ["Current Ticket:\n"]
+        for key, value in current_ticket.items():
+            if value:
+                chunks.append(f"{key}: {self._field(value)}\n")
+        chunks.append("\nPast Tickets:\n")
+        tokens = self._count_tokens("".join(chunks)) + self._count_tokens(
+            RESPONSE_INSTRUCTIONS
+        )
+
+        included = 0
+        for ticket in past_tickets:
+            block = self._ticket_block(ticket)
+            block_tokens = self._count_tokens(block)
+            if (
+                self._token_budget is not None
+                and tokens + block_tokens > self._token_budget
+            ):
+                break
+            chunks.append(block)
+            tokens += block_tokens
+            included += 1
+
+        chunks.append(RESPONSE_INSTRUCTIONS)
+        prompt = "".join(chunks)
+
+        dropped = len(past_tickets) - included
+        if self._metrics is not None:
+            self._metrics.record(
+                len(prompt), tokens, included, dropped, self._fields_truncated
+            )
+        logger.debug(
+            "Built similar tickets prompt: %d chars, ~%d tokens, %d tickets, %d dropped",
+            len(prompt),
+            tokens,
+            included,
+            dropped,
+        )
+        return prompt
+
+    def _ticket_block(self, ticket: OfficeHourTicketOverview) -> str:
+        """Formats one past ticket for the prompt."""
+        if ticket.type == "Conceptual Help":
+            description = (
+                f"Concept Help Description: {self._field(ticket.concept_help_description)}\n"
+                f"Tactics Tried: {self._field(ticket.tactics_tried)}\n"
+            )
+        else:
+            description = (
+                f"Assignment Help Description: {self._field(ticket.assignment_section_description)}\n"
+                f"Code to English: {self._field(ticket.code_to_english_description)}\n"
+                f"Concepts Needed: {self._field(ticket.concepts_needed_description)}\n"
+                f"Tactics Tried: {self._field(ticket.tactics_tried)}\n"
+            )
+        return (
+            f"ID: {ticket.id}\n"
+            f"{description}"
+            f"Meeting Summary: {self._field(ticket.meeting_summary)}\n"
+            f"Solutions and Tools Used: {self._field(ticket.solutions_used)}\n"
+            f"Concepts for Review: {self._field(ticket.concepts_for_review)}\n"
+            "---\n"
+        )
+
+    def _field(self, value: str | None) -> str | None:
+        """Cuts a field down to the per-field token limit."""
+        if value is None or self._field_token_limit is None:
+            return value
+        tokens = self._count_tokens(value)
+        if tokens <= self._field_token_limit:
+            return value
+
+        self._fields_truncated += 1
+        # Shrink proportionally until the tokenizer agrees the field fits
+        length = len(value) * self._field_token_limit // tokens
+        while (
+            length > 0 and self._count_tokens(value[:length]) > self._field_token_limit
+        ):
+            length = length * 9 // 10
+        return value[:length].rstrip() + TRUNCATION_MARKER
+
+
+def similar_ticket_prompt_builder() -> SimilarTicketPromptBuilder:
+    """Dependency offering the configured similar ticket prompt builder."""
+    return SimilarTicketPromptBuilder(
+        count_tokens=token_counter(), metrics=similar_ticket_prompt_metrics()
+    )
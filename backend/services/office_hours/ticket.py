@@ -28,6 +28,16 @@ from ...entities.office_hours import (
 from ...entities.academics.section_member_entity import SectionMemberEntity
 from ..exceptions import CoursePermissionException, ResourceNotFoundException
 from ...entities.office_hours import user_created_tickets_table
+from ...models.office_hours.queue_event import (
+    OfficeHoursQueueEvent,
+    OfficeHoursQueueEventType,
+)
+from .live_queue import LiveQueueRegistry, live_queue_registry
+from .queue_broker import OfficeHoursQueueBroker, office_hours_queue_broker
+from .similar_tickets_cache import SimilarTicketCache, similar_ticket_cache
+from .similar_tickets_index import SimilarTicketIndexService
+from .similar_tickets_precompute import SimilarTicketPrecomputeService
+from .ticket_overview import ticket_overview
 
 __authors__ = ["Ajay Gandecha"]
 __copyright__ = "Copyright 2024"
@@ -39,41 +49,48 @@ class OfficeHourTicketService:
     Service that performs all of the actions for office hour tickets.
     """
 
-    def __init__(self, session: Session = Depends(db_session)):
+    def __init__(
+        self,
+        session: Session = Depends(db_session),
+        similar_ticket_index: SimilarTicketIndexService = Depends(),
+        similar_ticket_cache: SimilarTicketCache = Depends(similar_ticket_cache),
+        similar_ticket_precompute: SimilarTicketPrecomputeService = Depends(),
+        queue_broker: OfficeHoursQueueBroker = Depends(office_hours_queue_broker),
+        live_queue: LiveQueueRegistry = Depends(live_queue_registry),
+    ):
         """
-        Initializes the database session.
+        Initializes the database session, the similar ticket services, and the live queues.
         """
         self._session = session
+        self._similar_ticket_index = similar_ticket_index
+        self._similar_ticket_cache = similar_ticket_cache
+        self._similar_ticket_precompute = similar_ticket_precompute
+        self._queue_broker = queue_broker
+        self._live_queue = live_queue
 
-    def _to_oh_ticket_overview(
-        self, ticket: OfficeHoursTicketEntity
+    def _publish(
+        self,
+        event_type: OfficeHoursQueueEventType,
+        ticket_entity: OfficeHoursTicketEntity,
+        previous_state: TicketState | None,
     ) -> OfficeHourTicketOverview:
         """
-        Converts an OH Ticket Entity to an OfficeHourTicketOverview.
+        Applies a committed ticket change to the live queue and pushes it to its subscribers.
 
         Returns:
-            OfficeHourTicketOverview
+            OfficeHourTicketOverview: The changed ticket.
         """
-        return OfficeHourTicketOverview(
-            id=ticket.id,
-            created_at=ticket.created_at,
-            called_at=ticket.called_at,
-            state=ticket.state.to_string(),
-            type=ticket.type.to_string(),
-            # description=ticket.description,
-            concept_help_description=ticket.concept_help_description,
-            assignment_section_description=ticket.assignment_section_description,
-            code_to_english_description=ticket.code_to_english_description,
-            concepts_needed_description=ticket.concepts_needed_description,
-            tactics_tried=ticket.tactics_tried,
-            meeting_summary=ticket.meeting_summary,
-            solutions_used=ticket.solutions_used,
-            concepts_for_review=ticket.concepts_for_review,
-            creators=[creator.user.to_public_model() for creator in ticket.creators],
-            caller=(ticket.caller.user.to_public_model() if ticket.caller else None),
-            caller_id=ticket.caller_id,
+        ticket = ticket_overview(self._session, ticket_entity.id)
+        event = OfficeHoursQueueEvent(
+            type=event_type,
             office_hours_id=ticket.office_hours_id,
+            ticket=ticket,
+            creator_ids=[creator.id for creator in ticket.creators],
+            previous_state=previous_state.to_string() if previous_state else None,
         )
+        self._live_queue.apply(event)
+        self._queue_broker.publish(event)
+        return ticket
 
     def call_ticket(self, user: User, ticket_id: int) -> OfficeHourTicketOverview:
         """
@@ -118,6 +135,7 @@ class OfficeHourTicketService:
             )
 
         # Call the ticket
+        previous_state = ticket_entity.state
         ticket_entity.caller_id = user_members[0].id
         ticket_entity.called_at = datetime.now()
         ticket_entity.state = TicketState.CALLED
@@ -125,8 +143,8 @@ class OfficeHourTicketService:
         # Save changes
         self._session.commit()
 
-        # Return the changed ticket
-        return self._to_oh_ticket_overview(ticket_entity)
+        # Notify the queue's subscribers and return the changed ticket
+        return self._publish("ticket_called", ticket_entity, previous_state)
 
     def cancel_ticket(self, user: User, ticket_id: int) -> OfficeHourTicketOverview:
         """
@@ -165,13 +183,14 @@ class OfficeHourTicketService:
             )
 
         # Cancel the ticket
+        previous_state = ticket_entity.state
         ticket_entity.state = TicketState.CANCELED
 
         # Save changes
         self._session.commit()
 
-        # Return the changed ticket
-        return self._to_oh_ticket_overview(ticket_entity)
+        # Notify the queue's subscribers and return the changed ticket
+        return self._publish("ticket_canceled", ticket_entity, previous_state)
 
     def close_ticket(
         self,
@@ -225,6 +244,7 @@ class OfficeHourTicketService:
         # Close the ticket
 
         # added TA responses to database
+        previous_state = ticket_entity.state
         ticket_entity.closed_at = datetime.now()
         ticket_entity.state = TicketState.CLOSED
         ticket_entity.meeting_summary = ticket_data.meeting_summary
@@ -232,11 +252,19 @@ class OfficeHourTicketService:
         ticket_entity.solutions_used = ticket_data.solutions_used
         ticket_entity.concepts_for_review = ticket_data.concepts_for_review
 
+        # Make the closed ticket available to similar ticket lookups
+        self._similar_ticket_index.index_ticket(ticket_entity)
+
         # Save changes
         self._session.commit()
 
-        # Return the changed ticket
-        return self._to_oh_ticket_overview(ticket_entity)
+        # Cached similar ticket results for this course no longer cover every candidate
+        self._similar_ticket_cache.bump_corpus_version(
+            ticket_entity.office_hours.course_site_id
+        )
+
+        # Notify the queue's subscribers and return the changed ticket
+        return self._publish("ticket_closed", ticket_entity, previous_state)
 
     def create_ticket(
         self, user: User, ticket: NewOfficeHoursTicket
@@ -327,5 +355,8 @@ class OfficeHourTicketService:
 
         self._session.commit()
 
-        # Return details model
-        return self._to_oh_ticket_overview(oh_ticket_entity)
+        # Have similar tickets ready by the time a TA calls this ticket
+        self._similar_ticket_precompute.enqueue(oh_ticket_entity.id)
+
+        # Notify the queue's subscribers and return details model
+        return self._publish("ticket_created", oh_ticket_entity, None)
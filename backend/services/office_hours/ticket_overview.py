@@ -0,0 +1,169 @@
+"""
+Shared projection of office hours tickets into `OfficeHourTicketOverview` models.
+
+Tickets are read with a single statement: ticket columns, the caller's user joined through their
+section membership, and the creators aggregated into a JSON array by a correlated subquery. The
+number of statements therefore stays the same no matter how many tickets or creators are loaded,
+instead of lazily loading `creators[*].user` and `caller.user` for every ticket.
+"""
+
+from sqlalchemy import ColumnElement, Select, func, select
+from sqlalchemy.dialects.postgresql import aggregate_order_by
+from sqlalchemy.orm import Session, aliased
+
+from ...entities.academics.section_member_entity import SectionMemberEntity
+from ...entities.office_hours import OfficeHoursTicketEntity
+from ...entities.office_hours.user_created_tickets_table import (
+    user_created_tickets_table,
+)
+from ...entities.user_entity import UserEntity
+from ...models.academics.my_courses import OfficeHourTicketOverview
+from ...models.public_user import PublicUser
+
+__authors__ = ["Riley Chapman"]
+__copyright__ = "Copyright 2025"
+__license__ = "MIT"
+
+_PUBLIC_USER_COLUMNS = [
+    "id",
+    "onyen",
+    "first_name",
+    "last_name",
+    "pronouns",
+    "email",
+    "github_avatar",
+    "github",
+    "bio",
+    "linkedin",
+    "website",
+]
+
+_creator_member = aliased(SectionMemberEntity)
+_creator_user = aliased(UserEntity)
+_caller_member = aliased(SectionMemberEntity)
+_caller_user = aliased(UserEntity)
+
+
+def _json_public_user(user) -> ColumnElement:
+    """Builds a JSON object with the `PublicUser` fields of a user row."""
+    return func.json_build_object(
+        *[
+            part
+            for column in _PUBLIC_USER_COLUMNS
+            for part in (column, getattr(user, column))
+        ]
+    )
+
+
+_creators = (
+    select(
+        func.coalesce(
+            func.json_agg(
+                aggregate_order_by(_json_public_user(_creator_user), _creator_member.id)
+            ),
+            func.json_build_array(),
+        )
+    )
+    .select_from(user_created_tickets_table)
+    .join(_creator_member, _creator_member.id == user_created_tickets_table.c.member_id)
+    .join(_creator_user, _creator_user.id == _creator_member.user_id)
+    .where(user_created_tickets_table.c.ticket_id == OfficeHoursTicketEntity.id)
+    .correlate(OfficeHoursTicketEntity)
+    .scalar_subquery()
+)
+
+
+def ticket_overview_query() -> Select:
+    """
+    Builds the statement that selects the columns of `OfficeHourTicketOverview`.
+
+    Callers add their own `where` and `order_by` clauses.
+    """
+    return (
+        select(
+            OfficeHoursTicketEntity.id,
+            OfficeHoursTicketEntity.created_at,
+            OfficeHoursTicketEntity.called_at,
+            OfficeHoursTicketEntity.state,
+            OfficeHoursTicketEntity.type,
+            OfficeHoursTicketEntity.concept_help_description,
+            OfficeHoursTicketEntity.assignment_section_description,
+            OfficeHoursTicketEntity.code_to_english_description,
+            OfficeHoursTicketEntity.concepts_needed_description,
+            OfficeHoursTicketEntity.tactics_tried,
+            OfficeHoursTicketEntity.meeting_summary,
+            OfficeHoursTicketEntity.solutions_used,
+            OfficeHoursTicketEntity.concepts_for_review,
+            OfficeHoursTicketEntity.caller_id,
+            OfficeHoursTicketEntity.office_hours_id,
+            _creators.label("creators"),
+            *[
+                getattr(_caller_user, column).label(f"caller_user_{column}")
+                for column in _PUBLIC_USER_COLUMNS
+            ],
+        )
+        .outerjoin(
+            _caller_member, _caller_member.id == OfficeHoursTicketEntity.caller_id
+        )
+        .outerjoin(_caller_user, _caller_user.id == _caller_member.user_id)
+    )
+
+
+def ticket_overviews(
+    session: Session, query: Select | None = None
+) -> list[OfficeHourTicketOverview]:
+    """
+    Loads ticket overviews with a single statement.
+
+    Args:
+        session (Session): The database session.
+        query (Select | None): A statement built from `ticket_overview_query()` with its
+            filters and ordering. Defaults to every ticket.
+
+    Returns:
+        list[OfficeHourTicketOverview]: One overview per selected ticket, in query order.
+    """
+    rows = session.execute(query if query is not None else ticket_overview_query())
+    return [_to_overview(row._mapping) for row in rows]
+
+
+def ticket_overview(
+    session: Session, ticket_id: int
+) -> OfficeHourTicketOverview | None:
+    """Loads the overview of one ticket, or None if it does not exist."""
+    overviews = ticket_overviews(
+        session, ticket_overview_query().where(OfficeHoursTicketEntity.id == ticket_id)
+    )
+    return overviews[0] if overviews else None
+
+
+def _to_overview(row) -> OfficeHourTicketOverview:
+    """Converts a row of `ticket_overview_query()` into an overview model."""
+    return OfficeHourTicketOverview(
+        id=row["id"],
+        created_at=row["created_at"],
+        called_at=row["called_at"],
+        state=row["state"].to_string(),
+        type=row["type"].to_string(),
+        concept_help_description=row["concept_help_description"],
+        assignment_section_description=row["assignment_section_description"],
+        code_to_english_description=row["code_to_english_description"],
+        concepts_needed_description=row["concepts_needed_description"],
+        tactics_tried=row["tactics_tried"],
+        meeting_summary=row["meeting_summary"],
+        solutions_used=row["solutions_used"],
+        concepts_for_review=row["concepts_for_review"],
+        creators=[PublicUser.model_validate(creator) for creator in row["creators"]],
+        caller=(
+            PublicUser(
+                **{
+                    column: row[f"caller_user_{column}"]
+                    for column in _PUBLIC_USER_COLUMNS
+                }
+            )
+            if row["caller_user_id"] is not None
+            else None
+        ),
+        caller_id=row["caller_id"],
+        office_hours_id=row["office_hours_id"],
+    )
@@ -3,13 +3,28 @@ This service provides methods to interact with the OpenAI API.
 
 This module encapsulates Azure OpenAI API calls and provides a clean interface
 for making AI completion requests using Pydantic models for response parsing.
+
+Both the synchronous `OpenAIService` and the `AsyncOpenAIService` share one application-scoped
+client each, so HTTP connections to Azure are pooled and reused across requests instead of
+being opened for every request. Every call is bounded by `UNC_OPENAI_TIMEOUT`.
+
+The asynchronous client and the semaphore bounding concurrent completions belong to the event loop
+that uses them, so they are created in the application's lifespan and kept on `app.state`, rather
+than cached for the whole process. Background jobs run on that event loop and share them. Code
+running on another event loop, such as a script using `asyncio.run`, creates its own with
+`create_async_openai_client` and `create_openai_concurrency_limiter`.
 """
 
+import asyncio
+import functools
+
+import httpx
 from ..env import getenv
 from typing import Type, TypeVar, Annotated
-from fastapi import Depends
+from fastapi import Depends, Request
 from pydantic import BaseModel
-from openai import AzureOpenAI
+from openai import AsyncAzureOpenAI, AzureOpenAI
+from .openai_fake import FAKE_TRANSPORT_ENABLED, FakeOpenAITransport
 
 __authors__ = ["Kris Jordan"]
 __copyright__ = "Copyright 2025"
@@ -23,16 +38,82 @@ API_VERSION = getenv("UNC_OPENAI_API_VERSION", default="2024-10-21")
 API_ENDPOINT = getenv(
     "UNC_OPENAI_API_ENDPOINT", default="https://azureaiapi.cloud.unc.edu"
 )
+TIMEOUT = float(getenv("UNC_OPENAI_TIMEOUT", default="30"))
+"""Seconds an OpenAI call may take before it is abandoned."""
+
+MAX_CONNECTIONS = int(getenv("UNC_OPENAI_MAX_CONNECTIONS", default="20"))
+"""Size of the HTTP connection pool shared by all calls of one client."""
 
+MAX_CONCURRENCY = int(getenv("UNC_OPENAI_MAX_CONCURRENCY", default="8"))
+"""Maximum number of completions `AsyncOpenAIService` has in flight at once."""
 
-def openai_client():
-    """Generator function offering dependency injection of SQLAlchemy Sessions."""
-    with AzureOpenAI(
+
+def _limits() -> httpx.Limits:
+    return httpx.Limits(
+        max_connections=MAX_CONNECTIONS, max_keepalive_connections=MAX_CONNECTIONS
+    )
+
+
+@functools.cache
+def openai_client() -> AzureOpenAI:
+    """Dependency offering the application-wide synchronous Azure OpenAI client."""
+    return AzureOpenAI(
         api_version=API_VERSION,
         azure_endpoint=API_ENDPOINT,
         api_key=API_KEY,
-    ) as client:
-        yield client
+        timeout=TIMEOUT,
+        http_client=httpx.Client(
+            limits=_limits(),
+            timeout=TIMEOUT,
+            transport=FakeOpenAITransport() if FAKE_TRANSPORT_ENABLED else None,
+        ),
+    )
+
+
+def create_async_openai_client() -> AsyncAzureOpenAI:
+    """Creates an asynchronous Azure OpenAI client for the current event loop.
+
+    The caller owns the client, and closes it with `close` when its event loop is done with it.
+    """
+    return AsyncAzureOpenAI(
+        api_version=API_VERSION,
+        azure_endpoint=API_ENDPOINT,
+        api_key=API_KEY,
+        timeout=TIMEOUT,
+        http_client=httpx.AsyncClient(
+            limits=_limits(),
+            timeout=TIMEOUT,
+            transport=FakeOpenAITransport() if FAKE_TRANSPORT_ENABLED else None,
+        ),
+    )
+
+
+def create_openai_concurrency_limiter() -> asyncio.Semaphore:
+    """Creates a semaphore allowing `MAX_CONCURRENCY` asynchronous completions at once."""
+    return asyncio.Semaphore(MAX_CONCURRENCY)
+
+
+def async_openai_client(request: Request) -> AsyncAzureOpenAI:
+    """Dependency offering the application's asynchronous Azure OpenAI client, created by its lifespan."""
+    return request.app.state.async_openai_client
+
+
+def openai_concurrency_limiter(request: Request) -> asyncio.Semaphore:
+    """Dependency offering the application's semaphore bounding concurrent asynchronous
+    completions, created by its lifespan."""
+    return request.app.state.openai_concurrency_limiter
+
+
+def _parse_completion(completion, response_model: Type[T]) -> T:
+    """Parses the content of a chat completion into `response_model`."""
+    if (
+        not completion.choices
+        or not completion.choices[0].message
+        or not completion.choices[0].message.content
+    ):
+        raise ValueError("Invalid response from the OpenAI API")
+    else:
+        return response_model.model_validate_json(completion.choices[0].message.content)
 
 
 class OpenAIService:
@@ -50,10 +131,10 @@ class OpenAIService:
     _model: str = getenv("UNC_OPENAI_MODEL", default="gpt-4o-mini")
 
     def __init__(self, client: Annotated[AzureOpenAI, Depends(openai_client)]):
-        """Initialize the OpenAI service with configuration from environment variables.
+        """Initialize the OpenAI service with the shared Azure OpenAI client.
 
-        Reads API key, version, and endpoint from environment variables and
-        configures the Azure OpenAI client.
+        The client is configured from the API key, version, endpoint and timeout
+        environment variables by `openai_client`.
         """
         self._client = client
 
@@ -89,13 +170,104 @@ class OpenAIService:
             ],
         )
 
-        if (
-            not completion.choices
-            or not completion.choices[0].message
-            or not completion.choices[0].message.content
-        ):
-            raise ValueError("Invalid response from the OpenAI API")
-        else:
-            return response_model.model_validate_json(
-                completion.choices[0].message.content
+        return _parse_completion(completion, response_model)
+
+
+class AsyncOpenAIService:
+    """Asynchronous service for interacting with Azure OpenAI API.
+
+    Awaiting a completion does not hold a worker thread, and `prompt_many` sends several
+    prompts concurrently. The application's semaphore keeps at most `MAX_CONCURRENCY`
+    completions in flight, so bursts queue here rather than at Azure's rate limiter.
+
+    Attributes:
+        _client (AsyncAzureOpenAI): The shared asynchronous Azure OpenAI client.
+        _limiter (asyncio.Semaphore): Bounds the number of concurrent completions.
+        _model (str): The model name to use for completions.
+    """
+
+    _client: AsyncAzureOpenAI
+    _limiter: asyncio.Semaphore
+    _model: str = getenv("UNC_OPENAI_MODEL", default="gpt-4o-mini")
+
+    def __init__(
+        self,
+        client: Annotated[AsyncAzureOpenAI, Depends(async_openai_client)],
+        limiter: Annotated[asyncio.Semaphore, Depends(openai_concurrency_limiter)],
+    ):
+        """Initialize the service with the shared client and concurrency limiter."""
+        self._client = client
+        self._limiter = limiter
+
+    async def prompt(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        response_model: Type[T],
+        timeout: float | None = None,
+    ) -> T:
+        """Send a prompt to the AI and parse the response into the specified model.
+
+        Args:
+            system_prompt (str): Instructions for the AI's behavior.
+            user_prompt (str): The user's query or input to the AI.
+            response_model (Type[T]): A Pydantic model class that defines the
+                expected structure of the response.
+            timeout (float | None): Seconds this call may take once it has a concurrency
+                slot, overriding `UNC_OPENAI_TIMEOUT`.
+
+        Returns:
+            T: An instance of the response_model populated with the AI's response.
+
+        Raises:
+            ValueError: If the API response doesn't contain valid content.
+            TimeoutError: If the call takes longer than the timeout.
+        """
+        timeout = timeout if timeout is not None else TIMEOUT
+        async with self._limiter:
+            # httpx timeouts apply per read, so also bound the call as a whole
+            async with asyncio.timeout(timeout):
+                completion = await self._client.beta.chat.completions.parse(
+                    model=self._model,
+                    response_format=response_model,
+                    messages=[
+                        {
+                            "role": "system",
+                            "content": system_prompt,
+                        },
+                        {
+                            "role": "user",
+                            "content": user_prompt,
+                        },
+                    ],
+                    timeout=timeout,
+                )
+        return _parse_completion(completion, response_model)
+
+    async def prompt_many(
+        self,
+        system_prompt: str,
+        user_prompts: list[str],
+        response_model: Type[T],
+        timeout: float | None = None,
+    ) -> list[T]:
+        """Send several prompts concurrently, sharing one system prompt and response model.
+
+        Args:
+            system_prompt (str): Instructions for the AI's behavior.
+            user_prompts (list[str]): The user prompts to send.
+            response_model (Type[T]): A Pydantic model class that defines the
+                expected structure of each response.
+            timeout (float | None): Seconds each call may take, overriding `UNC_OPENAI_TIMEOUT`.
+
+        Returns:
+            list[T]: One parsed response per user prompt, in the same order.
+        """
+        return list(
+            await asyncio.gather(
+                *(
+                    self.prompt(system_prompt, user_prompt, response_model, timeout)
+                    for user_prompt in user_prompts
+                )
             )
+        )
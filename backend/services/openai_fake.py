@@ -0,0 +1,122 @@
+"""
+Local stand-in for the Azure OpenAI API used to test and load-test AI features without network access.
+
+`FakeOpenAITransport` is an httpx transport that answers chat completion requests itself. It builds
+a response that satisfies the JSON schema the caller asked for, so structured prompts parse into
+their Pydantic response models. Integer arrays are filled with the IDs listed as `ID: <n>` in the
+user prompt, which makes the similar tickets feature return some of the tickets it was shown.
+
+Set `UNC_OPENAI_FAKE_TRANSPORT=true` to route every OpenAI client of the application through it,
+optionally with `UNC_OPENAI_FAKE_LATENCY` seconds of simulated model latency per request.
+"""
+
+import asyncio
+import json
+import re
+import time
+from typing import Any
+
+import httpx
+
+from ..env import getenv
+
+__authors__ = ["Riley Chapman"]
+__copyright__ = "Copyright 2025"
+__license__ = "MIT"
+
+FAKE_TRANSPORT_ENABLED = (
+    getenv("UNC_OPENAI_FAKE_TRANSPORT", default="false").lower() == "true"
+)
+"""Whether the application's OpenAI clients use `FakeOpenAITransport`."""
+
+FAKE_TRANSPORT_LATENCY = float(getenv("UNC_OPENAI_FAKE_LATENCY", default="0"))
+"""Seconds each fake completion takes to answer."""
+
+FAKE_IDS_RETURNED = 3
+"""Maximum number of prompt IDs placed in an integer array of a fake response."""
+
+_ID_PATTERN = re.compile(r"^ID: (\d+)$", re.MULTILINE)
+
+
+def fake_content(schema: dict[str, Any], user_prompt: str) -> Any:
+    """Builds a value matching a JSON schema produced from a Pydantic response model.
+
+    Args:
+        schema (dict[str, Any]): The JSON schema of the requested response format.
+        user_prompt (str): The user prompt, searched for `ID: <n>` lines.
+
+    Returns:
+        Any: A JSON-serializable value that validates against `schema`.
+    """
+    schema_type = schema.get("type")
+    if schema_type == "object":
+        return {
+            name: fake_content(property_schema, user_prompt)
+            for name, property_schema in schema.get("properties", {}).items()
+        }
+    if schema_type == "array":
+        if schema.get("items", {}).get("type") == "integer":
+            ids = [int(match) for match in _ID_PATTERN.findall(user_prompt)]
+            return ids[:FAKE_IDS_RETURNED]
+        return [fake_content(schema.get("items", {}), user_prompt)]
+    if schema_type == "integer":
+        return 0
+    if schema_type == "number":
+        return 0.0
+    if schema_type == "boolean":
+        return False
+    return "fake"
+
+
+def fake_completion(request: httpx.Request) -> httpx.Response:
+    """Answers a chat completion request with a completion that satisfies its response format."""
+    body = json.loads(request.content)
+    user_prompt = "\n".join(
+        message["content"]
+        for message in body.get("messages", [])
+        if message.get("role") == "user"
+    )
+    schema = body.get("response_format", {}).get("json_schema", {}).get("schema", {})
+    content = json.dumps(fake_content(schema, user_prompt))
+    return httpx.Response(
+        200,
+        json={
+            "id": "chatcmpl-fake",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": body.get("model", "fake"),
+            "choices": [
+                {
+                    "index": 0,
+                    "finish_reason": "stop",
+                    "message": {"role": "assistant", "content": content},
+                }
+            ],
+            "usage": {
+                "prompt_tokens": len(user_prompt.split()),
+                "completion_tokens": len(content.split()),
+                "total_tokens": len(user_prompt.split()) + len(content.split()),
+            },
+        },
+        request=request,
+    )
+
+
+class FakeOpenAITransport(httpx.BaseTransport, httpx.AsyncBaseTransport):
+    """httpx transport that answers chat completions locally for sync and async clients."""
+
+    def __init__(self, latency: float = FAKE_TRANSPORT_LATENCY):
+        self._latency = latency
+        self.requests = 0
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        self.requests += 1
+        if self._latency:
+            time.sleep(self._latency)
+        return fake_completion(request)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        self.requests += 1
+        if self._latency:
+            await asyncio.sleep(self._latency)
+        return fake_completion(request)
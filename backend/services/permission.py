@@ -3,6 +3,10 @@ Permission Service grants, revokes, tests, and enforces permissions for users an
 
 This Service is more of an internal service that other services take dependency on. It is not directly
 exposed via the API.
+
+Checks are answered from the compiled grants cached by the `PermissionEngine`, see `permission_engine.py`.
+A PermissionService lives for one request, and it keeps the compiled grants it reads so that every check
+of the request sees the same grants without consulting the engine again.
 """
 
 import re
@@ -14,6 +18,7 @@ from ..database import db_session
 from ..models import User, Permission, Role, RoleDetails
 from ..entities import UserEntity, PermissionEntity, RoleEntity
 from ..services.exceptions import UserPermissionException
+from .permission_engine import CompiledPermissions, PermissionEngine, permission_engine
 
 __authors__ = ["Kris Jordan"]
 __copyright__ = "Copyright 2023"
@@ -24,13 +29,22 @@ class PermissionService:
     """PermissionService grants, revokes, tests, and enforces permissions for users and roles in the system."""
 
     _session: Session
-
-    def __init__(self, session: Session = Depends(db_session)):
+    _engine: PermissionEngine
+    _compiled: dict[int, CompiledPermissions]
+
+    def __init__(
+        self,
+        session: Session = Depends(db_session),
+        engine: PermissionEngine = Depends(permission_engine),
+    ):
         """Initialize a new PermissionService instance.
 
         Args:
-            session (Session): The SQLAlchemy session to use for database operations."""
+            session (Session): The SQLAlchemy session to use for database operations.
+            engine (PermissionEngine): The cache of compiled user grants."""
         self._session = session
+        self._engine = engine
+        self._compiled = {}
 
     def get_permissions(self, subject: User) -> list[Permission]:
         """Get the permissions for a user.
@@ -40,10 +54,7 @@ class PermissionService:
 
         Returns:
             list[Permission]: The permissions for the user."""
-        user_permissions = self._get_user_permissions(subject)
-        roles_permissions = self._get_user_roles_permissions(subject)
-        permissions = user_permissions + roles_permissions
-        return [permission.to_model() for permission in permissions]
+        return list(self._permissions(subject).permissions)
 
     def grant(
         self, grantor: User, grantee: User | Role | RoleDetails, permission: Permission
@@ -83,6 +94,7 @@ class PermissionService:
 
         self._session.add(permission_entity)
         self._session.commit()
+        self._invalidate(permission_entity.user_id)
         return True
 
     def revoke(self, revoker: User, permission: Permission) -> bool:
@@ -108,10 +120,20 @@ class PermissionService:
         self.enforce(revoker, "permission.revoke", f"permission/{permission_entity.id}")
         self.enforce(revoker, permission_entity.action, permission_entity.resource)
 
+        user_id = permission_entity.user_id
         self._session.delete(permission_entity)
         self._session.commit()
+        self._invalidate(user_id)
         return True
 
+    def invalidate(self, subject: User) -> None:
+        """Discard the cached permissions of a user whose roles changed.
+
+        Args:
+            subject (User): The user whose permissions are no longer current."""
+        self._compiled.pop(subject.id, None)
+        self._engine.invalidate_user(subject.id)
+
     def enforce(self, subject: User, action: str, resource: str) -> None:
         """Enforce a permission for a user.
 
@@ -138,14 +160,35 @@ class PermissionService:
         Returns:
             bool: True if the user has permission to carry out the action on the resource, False otherwise.
         """
-        # Check user permissions
-        user_perms = self._get_user_permissions(subject)
-        if self._has_permission(user_perms, action, resource):
-            return True
-
-        # Check role permissions
-        role_permissions = self._get_user_roles_permissions(subject)
-        return self._has_permission(role_permissions, action, resource)
+        return self._permissions(subject).allows(action, resource)
+
+    def _permissions(self, subject: User) -> CompiledPermissions:
+        """Get the compiled permissions of a user, reading them once per request.
+
+        Args:
+            subject (User): The user to get permissions for.
+
+        Returns:
+            CompiledPermissions: The user's direct and role permissions."""
+        compiled = self._compiled.get(subject.id)
+        if compiled is None:
+            compiled = self._compiled[subject.id] = self._engine.permissions(
+                self._session, subject.id
+            )
+        return compiled
+
+    def _invalidate(self, user_id: int | None) -> None:
+        """Discard the cached permissions affected by a granted or revoked permission.
+
+        Args:
+            user_id (int | None): The user the permission belongs to, or None if it belongs to a role.
+        """
+        if user_id is not None:
+            self._compiled.pop(user_id, None)
+            self._engine.invalidate_user(user_id)
+        else:
+            self._compiled.clear()
+            self._engine.invalidate_all()
 
     def _get_user_permissions(self, subject: User) -> list[PermissionEntity]:
         """Get the permissions for a user.
@@ -0,0 +1,176 @@
+"""
+Compiles and caches the permission grants of users for `PermissionService`.
+
+A user's direct and role grants are read with one query and compiled into `CompiledPermissions`.
+The first check of an action combines the resource patterns of every grant whose action pattern
+matches it into a single regular expression, so later checks of that action are one dictionary
+lookup and one match, no matter how many grants the user has.
+
+Compiled grants are cached per user by the `PermissionEngine` of each process. `PermissionService`
+invalidates them when it grants or revokes a permission and `RoleService` when it changes the
+members of a role. Changes made by the other workers of a deployment are picked up once entries
+are older than `PERMISSION_CACHE_TTL` seconds.
+"""
+
+import functools
+import re
+import time
+from typing import Callable, Iterable
+
+from sqlalchemy import or_, select
+from sqlalchemy.orm import Session
+
+from ..entities import PermissionEntity
+from ..entities.user_role_table import user_role_table
+from ..env import getenv
+from ..models import Permission
+from ..models.cache import CacheStats
+from .ttl_cache import TTLCache
+
+__authors__ = ["Riley Chapman"]
+__copyright__ = "Copyright 2025"
+__license__ = "MIT"
+
+PERMISSION_CACHE_TTL = float(getenv("PERMISSION_CACHE_TTL", default="10"))
+"""Seconds the compiled grants of a user stay valid."""
+
+PERMISSION_CACHE_SIZE = int(getenv("PERMISSION_CACHE_SIZE", default="4096"))
+"""Maximum number of users whose grants are kept before evicting the least recently used."""
+
+_MAX_COMPILED_ACTIONS = 1024
+"""Maximum number of distinct actions compiled for one user before starting over."""
+
+
+def expand_pattern(pattern: str) -> str:
+    """Expands the `*` wildcards of a permission pattern into a regular expression."""
+    return pattern.replace("*", ".*")
+
+
+@functools.lru_cache(maxsize=PERMISSION_CACHE_SIZE)
+def _compile_pattern(pattern: str) -> re.Pattern:
+    """Compiles a permission pattern, memoized since most patterns are shared by many users."""
+    return re.compile(expand_pattern(pattern))
+
+
+class CompiledPermissions:
+    """The grants of one user, compiled for matching actions and resources."""
+
+    def __init__(self, permissions: Iterable[Permission]):
+        """
+        Args:
+            permissions (Iterable[Permission]): The user's direct grants followed by their role grants.
+        """
+        self.permissions = list(permissions)
+
+        resources_by_action: dict[str, list[str]] = {}
+        for permission in self.permissions:
+            resources_by_action.setdefault(permission.action, []).append(
+                permission.resource
+            )
+        self._action_patterns = [
+            (_compile_pattern(action), resources)
+            for action, resources in resources_by_action.items()
+        ]
+        self._resources_by_action: dict[str, re.Pattern | None] = {}
+
+    def allows(self, action: str, resource: str) -> bool:
+        """Returns whether any grant allows carrying out `action` on `resource`."""
+        try:
+            resource_pattern = self._resources_by_action[action]
+        except KeyError:
+            resource_pattern = self._compile_action(action)
+        return (
+            resource_pattern is not None
+            and resource_pattern.fullmatch(resource) is not None
+        )
+
+    def _compile_action(self, action: str) -> re.Pattern | None:
+        """Combines the resource patterns of the grants matching an action into one expression."""
+        resources = [
+            expand_pattern(resource)
+            for action_pattern, action_resources in self._action_patterns
+            if action_pattern.fullmatch(action) is not None
+            for resource in action_resources
+        ]
+        pattern = (
+            re.compile("|".join(f"(?:{resource})" for resource in resources))
+            if resources
+            else None
+        )
+        if len(self._resources_by_action) >= _MAX_COMPILED_ACTIONS:
+            self._resources_by_action = {}
+        self._resources_by_action[action] = pattern
+        return pattern
+
+
+class PermissionEngine:
+    """Thread-safe cache of the compiled grants of users, with TTL expiry and LRU eviction."""
+
+    def __init__(
+        self,
+        ttl: float = PERMISSION_CACHE_TTL,
+        max_subjects: int = PERMISSION_CACHE_SIZE,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            ttl (float): Seconds after which a user's grants are read from the database again.
+            max_subjects (int): Maximum number of users whose grants are kept.
+            clock (Callable[[], float]): Monotonic clock, replaceable in tests.
+        """
+        self._subjects: TTLCache[int, CompiledPermissions] = TTLCache(
+            ttl, max_subjects, clock
+        )
+
+    def permissions(self, session: Session, user_id: int) -> CompiledPermissions:
+        """
+        Returns the compiled grants of a user, reading them if missing or expired.
+
+        Args:
+            session (Session): Session used if the grants must be read.
+            user_id (int): The ID of the user.
+
+        Returns:
+            CompiledPermissions: The user's direct and role grants.
+        """
+        return self._subjects.get(
+            user_id, lambda: CompiledPermissions(self._load(session, user_id))
+        )
+
+    def invalidate_user(self, user_id: int) -> None:
+        """Drops the compiled grants of a user whose grants or roles changed."""
+        self._subjects.invalidate(user_id)
+
+    def invalidate_all(self) -> None:
+        """Drops the compiled grants of every user, as needed when a role's grants change."""
+        self._subjects.clear()
+
+    def stats(self) -> CacheStats:
+        """Returns the hit and miss counters of the compiled grants."""
+        return self._subjects.stats()
+
+    def __len__(self) -> int:
+        return len(self._subjects)
+
+    def _load(self, session: Session, user_id: int) -> list[Permission]:
+        """Reads the direct grants of a user followed by the grants of their roles."""
+        role_ids = select(user_role_table.c.role_id).where(
+            user_role_table.c.user_id == user_id
+        )
+        query = (
+            select(PermissionEntity)
+            .where(
+                or_(
+                    PermissionEntity.user_id == user_id,
+                    PermissionEntity.role_id.in_(role_ids),
+                )
+            )
+            .order_by(PermissionEntity.user_id.is_(None), PermissionEntity.id)
+        )
+        return [entity.to_model() for entity in session.scalars(query)]
+
+
+@functools.cache
+def permission_engine() -> PermissionEngine:
+    """Dependency offering the application-wide permission engine."""
+    return PermissionEngine()
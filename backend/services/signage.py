@@ -3,13 +3,13 @@ Service to collect and organize the information for CSXL Signage
 """
 
 from fastapi import Depends
-from sqlalchemy import select, func, not_, exists
+from sqlalchemy import select, not_, exists
 from sqlalchemy.orm import Session
 
 from backend.models.coworking.reservation import ReservationState
 from backend.models.office_hours.ticket_state import TicketState
 
-from ..database import db_session
+from ..database import db_read_session
 
 from datetime import datetime, timedelta
 from ..models.coworking import TimeRange
@@ -21,8 +21,14 @@ from ..models.signage import (
     SignageAnnouncement,
     SignageProfile,
 )
-from ..services.coworking import ReservationService, SeatService
+from ..services.coworking import (
+    CheckinLeaderboardService,
+    ReservationService,
+    SeatService,
+)
+from ..services.coworking.checkin_leaderboard import month_of
 from ..services import RoomService
+from ..services.event import OVERVIEW_OPTIONS
 
 from ..entities import ArticleEntity, RoomEntity, UserEntity, EventEntity
 from ..entities.coworking import ReservationEntity
@@ -46,15 +52,17 @@ class SignageService:
 
     def __init__(
         self,
-        session: Session = Depends(db_session),
+        session: Session = Depends(db_read_session),
         reservation_svc: ReservationService = Depends(),
         seat_svc: SeatService = Depends(),
         room_svc: RoomService = Depends(),
+        checkin_leaderboard_svc: CheckinLeaderboardService = Depends(),
     ):
         self._reservation_svc = reservation_svc
         self._session = session
         self._seat_svc = seat_svc
         self.room_svc = room_svc
+        self._checkin_leaderboard_svc = checkin_leaderboard_svc
 
     def to_signage_office_hours_model(
         self, entity: OfficeHoursEntity
@@ -174,22 +182,9 @@ class SignageService:
         newest_news = [news.to_overview_model() for news in news_entities]
 
         # Checkin Leaderboard
-        start_of_month = datetime.today().replace(
-            day=1, hour=0, minute=0, second=0, microsecond=0
-        )
-        top_users_query = (
-            select(
-                UserEntity, func.count(ReservationEntity.id).label("reservation_count")
-            )
-            .join(ReservationEntity.users)
-            .where(ReservationEntity.end >= start_of_month)
-            .where(ReservationEntity.state == ReservationState.CHECKED_OUT)
-            .group_by(UserEntity.id)
-            .order_by(func.count(ReservationEntity.id).desc())
-            .limit(MAX_LEADERBOARD_SLOTS)
+        user_entities = self._checkin_leaderboard_svc.top_users(
+            month_of(datetime.today()), MAX_LEADERBOARD_SLOTS
         )
-
-        user_entities: list[UserEntity] = self._session.scalars(top_users_query).all()
         top_users = [self.to_signage_profile_model(user) for user in user_entities]
 
         # Newest Events
@@ -198,6 +193,7 @@ class SignageService:
             .where(EventEntity.end >= datetime.now())
             .order_by(EventEntity.start.desc())
             .limit(MAX_EVENTS)
+            .options(*OVERVIEW_OPTIONS)
         )
         event_entities = self._session.scalars(events_query).all()
         events = [event.to_overview_model() for event in event_entities]
@@ -0,0 +1,202 @@
+"""
+Serves the signage data of every screen from snapshots refreshed in the background.
+
+Every screen polls `/api/signage/fast` and `/api/signage/slow`. Rather than computing the signage
+data for each poll, the `SignageSnapshotService` of each process recomputes it every
+`SIGNAGE_FAST_REFRESH` and `SIGNAGE_SLOW_REFRESH` seconds on a background thread and keeps the
+serialized JSON. Polls are answered from memory, so any number of screens costs one computation
+per refresh interval and worker process.
+
+Snapshots are tagged with a hash of their body. Since every worker serializes the same data to the
+same bytes, a screen whose `If-None-Match` header names the current tag receives an empty
+`304 Not Modified` response no matter which worker serves it.
+"""
+
+import functools
+import hashlib
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Literal
+
+from fastapi import Response
+from pydantic import BaseModel
+from sqlalchemy.orm import Session
+
+from ..database import replica_engine
+from ..env import getenv
+from .coworking import (
+    CheckinLeaderboardService,
+    OperatingHoursService,
+    PolicyService,
+    ReservationService,
+    SeatService,
+)
+from .permission import PermissionService
+from .permission_engine import permission_engine
+from .room import RoomService
+from .signage import SignageService
+
+__authors__ = ["Riley Chapman"]
+__copyright__ = "Copyright 2025"
+__license__ = "MIT"
+
+SIGNAGE_FAST_REFRESH = float(getenv("SIGNAGE_FAST_REFRESH", default="5"))
+"""Seconds between recomputations of the office hours, room and seat availability of signage."""
+
+SIGNAGE_SLOW_REFRESH = float(getenv("SIGNAGE_SLOW_REFRESH", default="60"))
+"""Seconds between recomputations of the news, leaderboard, events and announcements of signage."""
+
+SignageKind = Literal["fast", "slow"]
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class SignageSnapshot:
+    """Serialized signage data and the entity tag identifying it."""
+
+    body: bytes
+    etag: str
+
+    def matches(self, if_none_match: str | None) -> bool:
+        """Returns whether an `If-None-Match` header names this snapshot."""
+        if if_none_match is None:
+            return False
+        tags = [tag.strip() for tag in if_none_match.split(",")]
+        return "*" in tags or any(tag.removeprefix("W/") == self.etag for tag in tags)
+
+    def response(self, if_none_match: str | None = None) -> Response:
+        """Responds with the snapshot, or with `304 Not Modified` if the client has it already."""
+        # Screens must revalidate every poll, which costs them no more than a 304
+        headers = {"ETag": self.etag, "Cache-Control": "no-cache"}
+        if self.matches(if_none_match):
+            return Response(status_code=304, headers=headers)
+        return Response(
+            content=self.body, media_type="application/json", headers=headers
+        )
+
+
+def signage_service(session: Session) -> SignageService:
+    """Builds a `SignageService` and its dependencies on a session, outside of a request."""
+    permission_svc = PermissionService(session, permission_engine())
+    return SignageService(
+        session,
+        ReservationService(
+            session,
+            permission_svc,
+            PolicyService(),
+            OperatingHoursService(session, permission_svc),
+            SeatService(session),
+        ),
+        SeatService(session),
+        RoomService(session, permission_svc),
+        CheckinLeaderboardService(session),
+    )
+
+
+class SignageSnapshotService:
+    """Keeps the latest signage snapshots of this process and refreshes them on a schedule."""
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        fast_refresh: float = SIGNAGE_FAST_REFRESH,
+        slow_refresh: float = SIGNAGE_SLOW_REFRESH,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            session_factory (Callable[[], Session]): Opens the session each refresh reads with.
+            fast_refresh (float): Seconds between refreshes of the fast data.
+            slow_refresh (float): Seconds between refreshes of the slow data.
+            clock (Callable[[], float]): Monotonic clock, replaceable in tests.
+        """
+        self._session_factory = session_factory
+        self._intervals: dict[SignageKind, float] = {
+            "fast": fast_refresh,
+            "slow": slow_refresh,
+        }
+        self._clock = clock
+        self._snapshots: dict[SignageKind, SignageSnapshot] = {}
+        # Refreshes of one kind are serialized, so that concurrent cold requests compute once
+        self._refresh_locks = {kind: threading.Lock() for kind in self._intervals}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def current(self, kind: SignageKind) -> SignageSnapshot | None:
+        """Returns the latest snapshot of a kind, or None if none was computed yet."""
+        return self._snapshots.get(kind)
+
+    def get(self, kind: SignageKind) -> SignageSnapshot:
+        """Returns the latest snapshot of a kind, computing it first if there is none."""
+        snapshot = self._snapshots.get(kind)
+        if snapshot is not None:
+            return snapshot
+        with self._refresh_locks[kind]:
+            snapshot = self._snapshots.get(kind)
+            if snapshot is None:
+                snapshot = self._compute(kind)
+            return snapshot
+
+    def refresh(self, kind: SignageKind) -> SignageSnapshot:
+        """Recomputes the snapshot of a kind and replaces the one served."""
+        with self._refresh_locks[kind]:
+            return self._compute(kind)
+
+    def start(self) -> None:
+        """Starts refreshing the snapshots on a daemon thread, unless it is running already."""
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self._run, name="signage-snapshots", daemon=True
+            )
+            self._thread.start()
+
+    def stop(self, timeout: float | None = None) -> None:
+        """Stops the refresh thread, waiting for a refresh in progress to finish."""
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            self._stop.set()
+            thread.join(timeout)
+
+    def _compute(self, kind: SignageKind) -> SignageSnapshot:
+        with self._session_factory() as session:
+            signage_svc = signage_service(session)
+            data: BaseModel = (
+                signage_svc.get_fast_data()
+                if kind == "fast"
+                else signage_svc.get_slow_data()
+            )
+        body = data.model_dump_json().encode()
+        snapshot = SignageSnapshot(
+            body=body,
+            etag=f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"',
+        )
+        self._snapshots[kind] = snapshot
+        return snapshot
+
+    def _run(self) -> None:
+        due = {kind: 0.0 for kind in self._intervals}
+        while not self._stop.is_set():
+            for kind, interval in self._intervals.items():
+                if self._clock() < due[kind]:
+                    continue
+                try:
+                    self.refresh(kind)
+                except Exception:
+                    # Screens keep the last snapshot until a refresh succeeds
+                    logger.exception("Could not refresh the %s signage data", kind)
+                due[kind] = self._clock() + interval
+            self._stop.wait(max(0.0, min(due.values()) - self._clock()))
+
+
+@functools.cache
+def signage_snapshot_svc() -> SignageSnapshotService:
+    """Dependency offering the signage snapshots of this process, read from the replica if any."""
+    return SignageSnapshotService(functools.partial(Session, replica_engine))
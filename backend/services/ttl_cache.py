@@ -0,0 +1,132 @@
+"""
+Process-local cache with TTL expiry and least-recently-used eviction.
+
+Services keep values that are costly to read and tolerate being a few seconds stale, such as
+compiled permissions, resolved identities and listing totals, in a `TTLCache` offered by a
+`functools.cache` dependency, so that each worker process has one. Changes made by the other
+workers of a deployment are picked up once entries expire.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Generic, Hashable, TypeVar
+
+from ..models.cache import CacheStats
+
+__authors__ = ["Riley Chapman"]
+__copyright__ = "Copyright 2025"
+__license__ = "MIT"
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class TTLCache(Generic[K, V]):
+    """Thread-safe cache of values by key, with TTL expiry, LRU eviction and hit and miss counters."""
+
+    def __init__(
+        self,
+        ttl: float,
+        max_entries: int,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            ttl (float): Seconds after which an entry expires, unless given when it is put.
+            max_entries (int): Maximum number of entries kept.
+            clock (Callable[[], float]): Monotonic clock, replaceable in tests.
+        """
+        self._ttl = ttl
+        self._max_entries = max_entries
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[K, tuple[float, V]] = OrderedDict()
+        self._generation = 0
+        self._hits = 0
+        self._misses = 0
+
+    def lookup(self, key: K) -> V | None:
+        """Returns the value of a key, or None if it is missing or expired."""
+        with self._lock:
+            return self._lookup(key)
+
+    def get(self, key: K, load: Callable[[], V | None]) -> V | None:
+        """
+        Returns the value of a key, loading it if missing or expired.
+
+        The lock is not held while loading, since async routes load on the event loop's thread
+        through `run_sync`. Requests that miss at the same time each load the value. A value loaded
+        while the cache was invalidated is returned but not kept, since it may predate the change.
+
+        Args:
+            key (K): The key of the value.
+            load (Callable[[], V | None]): Reads the value. None is returned without being cached.
+        """
+        with self._lock:
+            value = self._lookup(key)
+            if value is not None:
+                return value
+            generation = self._generation
+
+        loaded_at = self._clock()
+        value = load()
+        if value is not None:
+            with self._lock:
+                if generation == self._generation:
+                    self._put(key, value, loaded_at + self._ttl)
+        return value
+
+    def put(self, key: K, value: V, ttl: float | None = None) -> None:
+        """Stores the value of a key for `ttl` seconds, or the TTL of the cache."""
+        with self._lock:
+            self._put(key, value, self._clock() + (self._ttl if ttl is None else ttl))
+
+    def invalidate(self, key: K) -> None:
+        """Drops the value of a key."""
+        with self._lock:
+            self._generation += 1
+            self._entries.pop(key, None)
+
+    def invalidate_where(self, predicate: Callable[[K], bool]) -> None:
+        """Drops the values of the keys matching a predicate."""
+        with self._lock:
+            self._generation += 1
+            for key in [key for key in self._entries if predicate(key)]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        """Drops every value."""
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+
+    def stats(self) -> CacheStats:
+        """Returns the hit and miss counters and the number of entries."""
+        with self._lock:
+            return CacheStats(
+                hits=self._hits, misses=self._misses, entries=len(self._entries)
+            )
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def _lookup(self, key: K) -> V | None:
+        """Returns the value of a key and counts the hit or miss. Requires the lock."""
+        entry = self._entries.get(key)
+        if entry is not None and self._clock() < entry[0]:
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry[1]
+        if entry is not None:
+            del self._entries[key]
+        self._misses += 1
+        return None
+
+    def _put(self, key: K, value: V, expires_at: float) -> None:
+        """Stores a value, evicting the least recently used entries. Requires the lock."""
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
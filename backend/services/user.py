@@ -4,13 +4,15 @@ The User Service provides access to the User model and its associated database o
 """
 
 from fastapi import Depends
-from sqlalchemy import select, or_, func, cast, String
+from sqlalchemy import select, or_, func
 from sqlalchemy.orm import Session
 from ..database import db_session
 from ..models import User, UserDetails, Paginated, PaginationParams, PublicUser
 from ..entities import UserEntity
 from .exceptions import ResourceNotFoundException
+from .identity import IdentityCache, identity_cache
 from .permission import PermissionService
+from .user_search import USER_SEARCH_LIMIT, UserSearch, user_search
 
 __authors__ = ["Kris Jordan"]
 __copyright__ = "Copyright 2023"
@@ -20,15 +22,21 @@ __license__ = "MIT"
 class UserService:
     _session: Session
     _permission: PermissionService
+    _identity: IdentityCache
+    _search: UserSearch
 
     def __init__(
         self,
         session: Session = Depends(db_session),
         permission: PermissionService = Depends(),
+        identity: IdentityCache = Depends(identity_cache),
+        search: UserSearch = Depends(user_search),
     ):
         """Initialize the User Service."""
         self._session = session
         self._permission = permission
+        self._identity = identity
+        self._search = search
 
     def get(self, pid: int) -> UserDetails | None:
         """Get a User by PID.
@@ -44,11 +52,33 @@ class UserService:
         if user_entity is None:
             return None
         else:
-            user = user_entity.to_model()
-            user_fields = user.model_dump()
-            user_fields["permissions"] = self._permission.get_permissions(user)
-            user_details = UserDetails(**user_fields)
-            return user_details
+            return self.details(user_entity.to_model())
+
+    def get_by_token(self, pid: int, issued_at: int | None) -> UserDetails | None:
+        """Get the User a bearer token was issued to, reusing recently resolved Users.
+
+        Args:
+            pid: The PID claim of the token.
+            issued_at: The `iat` claim of the token, if it has one.
+
+        Returns:
+            UserDetails | None: The user or None if not found.
+        """
+        user = self._identity.resolve(pid, issued_at, lambda: self.get(pid))
+        return None if user is None else self.details(user)
+
+    def details(self, user: User) -> UserDetails:
+        """Add the current permissions of a User to their model.
+
+        Args:
+            user: The user.
+
+        Returns:
+            UserDetails: The user and their permissions.
+        """
+        user_fields = user.model_dump()
+        user_fields["permissions"] = self._permission.get_permissions(user)
+        return UserDetails(**user_fields)
 
     def get_by_id(self, id: int) -> User:
         """Get a User by their id.
@@ -88,7 +118,10 @@ class UserService:
         return user_entity.to_public_model()
 
     def search(self, _subject: User, query: str) -> list[User]:
-        """Search for users by their name, onyen, email.
+        """Search for users by their name, onyen, email or PID.
+
+        Users whose PID is the query come first, then those whose name, onyen or PID starts
+        with it, then those matching it anywhere else, each by name.
 
         Args:
             subject: The user performing the action.
@@ -97,44 +130,7 @@ class UserService:
         Returns:
             list[User]: The list of users matching the query.
         """
-        # First attempt: Query for users by name, onyen, or PID from start of string
-        statement = (
-            select(UserEntity)
-            .where(
-                or_(
-                    func.concat(UserEntity.first_name, " ", UserEntity.last_name).ilike(
-                        f"{query}%"
-                    ),
-                    UserEntity.last_name.ilike(f"{query}%"),
-                    UserEntity.onyen.ilike(f"{query}%"),
-                    cast(UserEntity.pid, String).ilike(f"{query}%"),
-                )
-            )
-            .order_by(UserEntity.first_name, UserEntity.last_name)
-            .limit(50)
-        )
-        entities = self._session.execute(statement).scalars().all()
-
-        # Second attempt: match in the middle of strings and also search email
-        if len(entities) == 0:
-            statement = (
-                select(UserEntity)
-                .where(
-                    or_(
-                        func.concat(
-                            UserEntity.first_name, " ", UserEntity.last_name
-                        ).ilike(f"%{query}%"),
-                        UserEntity.last_name.ilike(f"%{query}%"),
-                        UserEntity.onyen.ilike(f"%{query}%"),
-                        UserEntity.email.ilike(f"%{query}%"),
-                        cast(UserEntity.pid, String).ilike(f"%{query}%"),
-                    )
-                )
-                .order_by(UserEntity.first_name, UserEntity.last_name)
-                .limit(50)
-            )
-            entities = self._session.execute(statement).scalars().all()
-
+        entities = self._search(self._session, query, USER_SEARCH_LIMIT)
         return [entity.to_model() for entity in entities]
 
     def list(
@@ -227,6 +223,8 @@ class UserService:
         if subject != user:
             self._permission.enforce(subject, "user.update", f"user/{user.id}")
         entity = self._session.get(UserEntity, user.id)
+        pid = entity.pid
         entity.update(user)
         self._session.commit()
+        self._identity.invalidate(pid)
         return entity.to_model()
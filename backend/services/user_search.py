@@ -0,0 +1,147 @@
+"""
+Searches users by name, onyen, email and PID for the typeaheads of rosters and hiring tools.
+
+A user matches a query when their `UserEntity.search_text`, the lowercase name, onyen, email and
+PID, contains it. Matches are ranked in three tiers, and by name within each:
+
+1. `PID_MATCH`: the query is the user's PID.
+2. `PREFIX_MATCH`: the full name, last name, onyen or PID starts with the query.
+3. `SUBSTRING_MATCH`: the query appears anywhere else, such as in the email.
+
+`trigram_search` finds and ranks matches with one query. The trigram index of `search_text`
+answers the `LIKE '%query%'` criteria, and the PID index the exact PID. `in_memory_search` ranks
+every user in Python instead, for databases without the `pg_trgm` extension and as the
+reference the SQL ranking is tested against.
+
+The search function is pluggable through the `user_search` dependency.
+"""
+
+from typing import Callable, Sequence
+
+from sqlalchemy import ColumnElement, String, case, cast, func, or_, select
+from sqlalchemy.orm import Session
+
+from ..entities import UserEntity
+
+__authors__ = ["Riley Chapman"]
+__copyright__ = "Copyright 2025"
+__license__ = "MIT"
+
+UserSearch = Callable[[Session, str, int], Sequence[UserEntity]]
+"""Finds up to a number of users matching a query, best matches first."""
+
+USER_SEARCH_LIMIT = 50
+"""Maximum number of users a search returns."""
+
+PID_MATCH = 0
+PREFIX_MATCH = 1
+SUBSTRING_MATCH = 2
+
+
+def normalize(query: str) -> str:
+    """Lowercases a query and collapses its whitespace, as `search_text` is."""
+    return " ".join(query.split()).lower()
+
+
+def search_text(entity: UserEntity) -> str:
+    """Computes `UserEntity.search_text` in Python, as the database generates it."""
+    return " ".join(
+        [
+            entity.first_name,
+            entity.last_name,
+            entity.onyen or "",
+            entity.email,
+            "" if entity.pid is None else str(entity.pid),
+        ]
+    ).lower()
+
+
+def rank(entity: UserEntity, query: str) -> int | None:
+    """Returns the tier of a user matching a normalized query, or None if it does not match."""
+    if query.isdigit() and entity.pid == int(query):
+        return PID_MATCH
+    prefixed = [
+        f"{entity.first_name} {entity.last_name}".lower(),
+        entity.last_name.lower(),
+        (entity.onyen or "").lower(),
+        "" if entity.pid is None else str(entity.pid),
+    ]
+    if any(field.startswith(query) for field in prefixed):
+        return PREFIX_MATCH
+    if query in search_text(entity):
+        return SUBSTRING_MATCH
+    return None
+
+
+def trigram_search(
+    session: Session, query: str, limit: int = USER_SEARCH_LIMIT
+) -> Sequence[UserEntity]:
+    """Finds and ranks the users matching a query with one SQL statement."""
+    query = normalize(query)
+    pattern = _escape_like(query)
+
+    matches: ColumnElement[bool] = UserEntity.search_text.like(f"%{pattern}%")
+    tiers = [
+        (
+            or_(
+                func.lower(
+                    func.concat(UserEntity.first_name, " ", UserEntity.last_name)
+                ).like(f"{pattern}%"),
+                func.lower(UserEntity.last_name).like(f"{pattern}%"),
+                func.lower(UserEntity.onyen).like(f"{pattern}%"),
+                cast(UserEntity.pid, String).like(f"{pattern}%"),
+            ),
+            PREFIX_MATCH,
+        )
+    ]
+    if query.isdigit():
+        matches = or_(UserEntity.pid == int(query), matches)
+        tiers.insert(0, (UserEntity.pid == int(query), PID_MATCH))
+
+    statement = (
+        select(UserEntity)
+        .where(matches)
+        .order_by(
+            case(*tiers, else_=SUBSTRING_MATCH),
+            UserEntity.first_name,
+            UserEntity.last_name,
+            UserEntity.id,
+        )
+        .limit(limit)
+    )
+    return session.scalars(statement).all()
+
+
+def in_memory_search(
+    session: Session, query: str, limit: int = USER_SEARCH_LIMIT
+) -> Sequence[UserEntity]:
+    """Finds and ranks the users matching a query in Python, after loading every user."""
+    query = normalize(query)
+    ranked = [
+        (tier, entity)
+        for entity in session.scalars(select(UserEntity))
+        if (tier := rank(entity, query)) is not None
+    ]
+    ranked.sort(
+        key=lambda match: (
+            match[0],
+            match[1].first_name,
+            match[1].last_name,
+            match[1].id,
+        )
+    )
+    return [entity for _, entity in ranked[:limit]]
+
+
+def user_search() -> UserSearch:
+    """Dependency offering the search function used by `UserService.search`.
+
+    Override this dependency (e.g. with `app.dependency_overrides`) with `in_memory_search` to
+    search without the trigram index.
+    """
+    return trigram_search
+
+
+def _escape_like(query: str) -> str:
+    """Escapes the wildcards of `LIKE` in a query, with PostgreSQL's default escape character."""
+    return query.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
@@ -0,0 +1,59 @@
+"""
+Caches the part of the welcome overview that is the same for every user.
+
+The welcome page is the landing page of the site. Its announcement, latest news and operating
+hours do not depend on who is signed in, so each process keeps them for `WELCOME_CACHE_TTL`
+seconds and requests only query the parts of the overview that belong to their user.
+
+`ArticleService` invalidates the cache of its process when it creates, edits or deletes an
+article. Changes to operating hours, and articles changed by the other workers of a deployment,
+are picked up once the cache expires.
+"""
+
+import functools
+import time
+from dataclasses import dataclass
+from typing import Callable
+
+from ..env import getenv
+from ..models.articles import ArticleOverview
+from ..models.coworking import OperatingHours
+from .ttl_cache import TTLCache
+
+__authors__ = ["Riley Chapman"]
+__copyright__ = "Copyright 2025"
+__license__ = "MIT"
+
+WELCOME_CACHE_TTL = float(getenv("WELCOME_CACHE_TTL", default="30"))
+"""Seconds the shared part of the welcome overview stays valid."""
+
+
+@dataclass(frozen=True)
+class SharedWelcomeOverview:
+    """The part of the welcome overview shown to every user."""
+
+    announcement: ArticleOverview | None
+    latest_news: list[ArticleOverview]
+    operating_hours: list[OperatingHours]
+
+
+class WelcomeOverviewCache(TTLCache[None, SharedWelcomeOverview]):
+    """Cache of the shared part of the welcome overview, kept under the key None."""
+
+    def __init__(
+        self,
+        ttl: float = WELCOME_CACHE_TTL,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            ttl (float): Seconds after which the shared overview is loaded again.
+            clock (Callable[[], float]): Monotonic clock, replaceable in tests.
+        """
+        super().__init__(ttl, max_entries=1, clock=clock)
+
+
+@functools.cache
+def welcome_overview_cache() -> WelcomeOverviewCache:
+    """Dependency offering the welcome overview cache of this process."""
+    return WelcomeOverviewCache()
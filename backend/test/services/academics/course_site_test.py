@@ -94,6 +94,33 @@ def test_get_course_site_roster_not_member(course_site_svc: CourseSiteService):
         pytest.fail()
 
 
+def test_get_course_site_roster_csv(course_site_svc: CourseSiteService):
+    """Ensures that the roster export streams every member of the roster."""
+    rows = list(
+        course_site_svc.get_course_site_roster_csv(
+            user_data.instructor, office_hours_data.comp_110_site.id
+        )
+    )
+    roster = course_site_svc.get_course_site_roster(
+        user_data.instructor,
+        office_hours_data.comp_110_site.id,
+        PaginationParams(page_size=100),
+    )
+    assert isinstance(rows[0], CourseMemberOverview)
+    assert sorted(rows, key=lambda row: (row.pid, row.section_number)) == sorted(
+        roster.items, key=lambda row: (row.pid, row.section_number)
+    )
+
+
+def test_get_course_site_roster_csv_not_member(course_site_svc: CourseSiteService):
+    """Ensures that non-members are refused before the roster is exported."""
+    with pytest.raises(CoursePermissionException):
+        course_site_svc.get_course_site_roster_csv(
+            user_data.ambassador, office_hours_data.comp_110_site.id
+        )
+        pytest.fail()
+
+
 def test_get_current_office_hour_events(course_site_svc: CourseSiteService):
     """Ensures that members are able to access current office hour events."""
     office_hours = course_site_svc.get_current_office_hour_events(
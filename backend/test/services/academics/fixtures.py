@@ -6,6 +6,7 @@ from sqlalchemy.orm import Session
 
 from ....services.academics.section_member import SectionMemberService
 from ....services import PermissionService
+from ....services.permission_engine import PermissionEngine
 from ....services.academics import TermService, CourseService, SectionService
 from ....services.academics.course_site import CourseSiteService
 
@@ -17,7 +18,7 @@ __license__ = "MIT"
 @pytest.fixture()
 def permission_svc(session: Session):
     """PermissionService fixture."""
-    return PermissionService(session)
+    return PermissionService(session, PermissionEngine())
 
 
 @pytest.fixture()
@@ -47,4 +48,4 @@ def section_member_svc(session: Session, permission_svc: PermissionService):
 @pytest.fixture()
 def course_site_svc(session: Session):
     """CourseSiteService fixture."""
-    return CourseSiteService(session)
+    return CourseSiteService(session, session)
@@ -0,0 +1,196 @@
+"""Tests for the aggregates of the hiring admin overview."""
+
+from datetime import datetime
+
+import pytest
+from sqlalchemy import insert, select
+from sqlalchemy.orm import Session
+
+from .....entities.academics import SectionEntity
+from .....entities.academics.section_member_entity import SectionMemberEntity
+from .....entities.academics.hiring.hiring_assignment_entity import (
+    HiringAssignmentEntity,
+)
+from .....entities.office_hours import CourseSiteEntity
+from .....models.academics.hiring.hiring_assignment import (
+    HiringAdminOverview,
+    HiringAssignmentStatus,
+)
+from .....models.academics.hiring.hiring_level import HiringLevelClassification
+from .....models.academics.section_member import RosterRole
+from .....services.academics import HiringService
+from ...query_counter import count_queries
+
+# Injected Service Fixtures
+from .fixtures import hiring_svc
+
+# Import the setup_teardown fixture explicitly to load entities in database
+from ...core_data import setup_insert_data_fixture as insert_order_0
+from ...academics.term_data import fake_data_fixture as insert_order_1
+from ...academics.course_data import fake_data_fixture as insert_order_2
+from ...academics.section_data import fake_data_fixture as insert_order_3
+from ...room_data import fake_data_fixture as insert_order_4
+from ...office_hours.office_hours_data import fake_data_fixture as insert_order_5
+from .hiring_data import fake_data_fixture as insert_order_6
+
+# Test data
+from ... import user_data
+from ...academics import course_data, term_data
+from . import hiring_data
+
+__authors__ = ["Riley Chapman"]
+__copyright__ = "Copyright 2025"
+__license__ = "MIT"
+
+
+def insert_course_sites(session: Session, count: int) -> None:
+    """Inserts course sites in the current term, each with two sections, an instructor and
+    two assignments."""
+    now = datetime.now()
+    site_ids = range(100, 100 + count)
+    session.execute(
+        insert(CourseSiteEntity),
+        [
+            {"id": id, "title": f"COMP {id}", "term_id": term_data.current_term.id}
+            for id in site_ids
+        ],
+    )
+    session.execute(
+        insert(SectionEntity),
+        [
+            {
+                "id": 1000 + 2 * id + index,
+                "course_id": course_data.comp_110.id,
+                "number": f"{2 * id + index}",
+                "term_id": term_data.current_term.id,
+                "course_site_id": id,
+                "enrolled": 40 + index * 35,
+            }
+            for id in site_ids
+            for index in range(2)
+        ],
+    )
+    session.execute(
+        insert(SectionMemberEntity),
+        [
+            {
+                "user_id": user_data.instructor.id,
+                "section_id": 1000 + 2 * id + index,
+                "member_role": RosterRole.INSTRUCTOR,
+            }
+            for id in site_ids
+            for index in range(2)
+        ],
+    )
+    session.execute(
+        insert(HiringAssignmentEntity),
+        [
+            {
+                "term_id": term_data.current_term.id,
+                "course_site_id": id,
+                "user_id": user.id,
+                "hiring_level_id": hiring_data.uta_level.id,
+                "status": HiringAssignmentStatus.COMMIT,
+                "position_number": "",
+                "epar": "",
+                "i9": False,
+                "notes": "",
+                "created": now,
+                "modified": now,
+            }
+            for id in site_ids
+            for user in [user_data.student, user_data.user]
+        ],
+    )
+    session.commit()
+
+
+def walk_overview(session: Session) -> dict[int, dict]:
+    """Totals each course site of the current term by walking its relationships."""
+    sites = {}
+    for site in session.scalars(
+        select(CourseSiteEntity).where(
+            CourseSiteEntity.term_id == term_data.current_term.id
+        )
+    ):
+        enrollment = sum(section.enrolled for section in site.sections)
+        coverage = 0.0
+        for assignment in site.hiring_assignments:
+            level = assignment.hiring_level
+            if level.classification == HiringLevelClassification.UG:
+                coverage += level.load * 0.25
+            elif level.classification != HiringLevelClassification.IOR:
+                coverage += level.load
+        sites[site.id] = {
+            "sections": {section.id for section in site.sections},
+            "instructors": {
+                staff.user_id
+                for section in site.sections
+                for staff in section.staff
+                if staff.member_role == RosterRole.INSTRUCTOR
+            },
+            "total_enrollment": enrollment,
+            "total_cost": sum(
+                assignment.hiring_level.salary for assignment in site.hiring_assignments
+            ),
+            "coverage": enrollment / 60.0 - coverage,
+            "assignments": {assignment.id for assignment in site.hiring_assignments},
+        }
+    return sites
+
+
+def totals(overview: HiringAdminOverview) -> dict[int, dict]:
+    return {
+        site.course_site_id: {
+            "sections": {section.id for section in site.sections},
+            "instructors": {instructor.id for instructor in site.instructors},
+            "total_enrollment": site.total_enrollment,
+            "total_cost": pytest.approx(site.total_cost),
+            "coverage": pytest.approx(site.coverage),
+            "assignments": {assignment.id for assignment in site.assignments},
+        }
+        for site in overview.sites
+    }
+
+
+def test_overview_matches_relationships(session: Session, hiring_svc: HiringService):
+    insert_course_sites(session, 3)
+    overview = hiring_svc.get_hiring_admin_overview(
+        user_data.root, term_data.current_term.id
+    )
+    assert totals(overview) == walk_overview(session)
+
+
+def test_overview_orders_assignments_by_last_name(
+    session: Session, hiring_svc: HiringService
+):
+    """Sally Student is listed before Stewie Student, whose assignment was made first."""
+    insert_course_sites(session, 1)
+    overview = hiring_svc.get_hiring_admin_overview(
+        user_data.root, term_data.current_term.id
+    )
+    site = next(site for site in overview.sites if site.course_site_id == 100)
+    assert [assignment.user.id for assignment in site.assignments] == [
+        user_data.user.id,
+        user_data.student.id,
+    ]
+    assert [instructor.id for instructor in site.instructors] == [
+        user_data.instructor.id
+    ]
+
+
+def test_overview_queries_are_bounded(session: Session, hiring_svc: HiringService):
+    """The overview costs the same statements however many course sites the term has."""
+    # Loads the permissions of the subject, which later checks take from the cache
+    hiring_svc.get_hiring_admin_overview(user_data.root, term_data.current_term.id)
+    with count_queries(session) as queries:
+        hiring_svc.get_hiring_admin_overview(user_data.root, term_data.current_term.id)
+    before = len(queries)
+
+    insert_course_sites(session, 25)
+    with count_queries(session) as queries:
+        overview = hiring_svc.get_hiring_admin_overview(
+            user_data.root, term_data.current_term.id
+        )
+    assert len(overview.sites) == 27
+    assert len(queries) == before
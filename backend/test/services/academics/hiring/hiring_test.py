@@ -3,6 +3,7 @@
 # PyTest
 import pytest
 from unittest.mock import create_autospec
+from sqlalchemy.orm import Session
 
 from backend.services.exceptions import (
     UserPermissionException,
@@ -19,6 +20,7 @@ from .....models.academics.hiring.application_review import (
 from .....services.academics import HiringService
 from .....services.application import ApplicationService
 from .....services.academics.course_site import CourseSiteService
+from .....entities.office_hours import CourseSiteEntity
 
 # Injected Service Fixtures
 from .fixtures import hiring_svc
@@ -303,3 +305,44 @@ def test_get_phd_applicants(hiring_svc: HiringService):
     assert len(applicants) > 0
     for applicant in applicants:
         assert applicant.program_pursued in {"PhD", "PhD (ABD)"}
+
+
+def test_get_hiring_summary_for_csv(hiring_svc: HiringService):
+    """Ensures that the committed hires of the term are exported with their instructors."""
+    rows = list(
+        hiring_svc.get_hiring_summary_for_csv(user_data.root, term_data.current_term.id)
+    )
+    assert [row.onyen for row in rows] == [user_data.student.onyen]
+    assert rows[0].instructors == "Ina Instructor"
+    assert rows[0].level_title == hiring_data.uta_level.title
+
+
+def test_get_hiring_summary_for_csv_checks_permission(hiring_svc: HiringService):
+    """Ensures that nobody else is able to export the hires, even before reading them."""
+    with pytest.raises(UserPermissionException):
+        hiring_svc.get_hiring_summary_for_csv(
+            user_data.ambassador, term_data.current_term.id
+        )
+        pytest.fail()
+
+
+def test_get_course_site_hiring_status_csv(session: Session, hiring_svc: HiringService):
+    """Ensures that the streamed rows are those of the site's application reviews."""
+    rows = list(
+        hiring_svc.get_course_site_hiring_status_csv(
+            user_data.instructor, office_hours_data.comp_110_site.id
+        )
+    )
+    site = session.get_one(CourseSiteEntity, office_hours_data.comp_110_site.id)
+    reviews = sorted(site.application_reviews, key=lambda review: review.id)
+    assert rows == [review.to_csv_row() for review in reviews]
+    assert len(rows) == len(hiring_data.reviews)
+
+
+def test_get_assignment_summary_for_instructors_csv(hiring_svc: HiringService):
+    rows = list(
+        hiring_svc.get_assignment_summary_for_instructors_csv(
+            user_data.instructor, office_hours_data.comp_110_site.id
+        )
+    )
+    assert [row.onyen for row in rows] == [user_data.student.onyen]
@@ -0,0 +1,156 @@
+"""Tests for the welcome overview and its cache of the part shared by every user."""
+
+from datetime import datetime
+
+from sqlalchemy.orm import Session
+
+from ....entities import EventRegistrationEntity
+from ....models.registration_type import RegistrationType
+from ....services import ArticleService
+from ....services.welcome_overview_cache import (
+    SharedWelcomeOverview,
+    WelcomeOverviewCache,
+)
+from ..clock import FakeClock
+from ..query_counter import count_queries
+
+# Imported fixtures provide dependencies injected for the tests as parameters.
+from ..fixtures import article_svc
+from ..coworking.time import *
+
+# Data Setup and Injected Service Fixtures
+from ..core_data import setup_insert_data_fixture as insert_order_0
+from ..coworking.operating_hours_data import fake_data_fixture as insert_order_1
+from ..room_data import fake_data_fixture as insert_order_2
+from ..coworking.seat_data import fake_data_fixture as insert_order_3
+from ..coworking.reservation.reservation_data import (
+    fake_data_fixture as insert_order_4,
+)
+from .article_data import fake_data_fixture as insert_order_5
+
+# Data Models for Fake Data Inserted in Setup
+from .. import user_data
+from ..event import event_test_data
+from . import article_data
+
+__authors__ = ["Riley Chapman"]
+__copyright__ = "Copyright 2025"
+__license__ = "MIT"
+
+SHARED_QUERIES = 5
+"""Announcement and news, each with their authors, and operating hours."""
+
+PER_USER_QUERIES = 4
+"""Reservations with their seats, and registrations with their events' registrations."""
+
+
+def test_shared_overview_is_cached(session: Session, article_svc: ArticleService):
+    with count_queries(session) as queries:
+        first = article_svc.get_welcome_overview(None)
+    assert len(queries) == SHARED_QUERIES
+
+    with count_queries(session) as queries:
+        second = article_svc.get_welcome_overview(None)
+    assert queries == []
+    assert second == first
+
+
+def test_per_user_queries_are_bounded(
+    session: Session, article_svc: ArticleService, time: dict[str, datetime]
+):
+    """The overview of a user costs the same statements however much they registered for."""
+    article_svc.get_welcome_overview(None)
+
+    with count_queries(session) as queries:
+        overview = article_svc.get_welcome_overview(user_data.user)
+    assert len(queries) == PER_USER_QUERIES
+    assert [event.id for event in overview.registered_events] == [
+        event_test_data.event_one.id
+    ]
+    assert len(overview.upcoming_reservations) == 2
+
+    for event in event_test_data.events[1:]:
+        session.add(
+            EventRegistrationEntity(
+                event_id=event.id,
+                user_id=user_data.user.id,
+                registration_type=RegistrationType.ATTENDEE,
+            )
+        )
+    session.commit()
+
+    with count_queries(session) as queries:
+        overview = article_svc.get_welcome_overview(user_data.user)
+    assert len(queries) == PER_USER_QUERIES
+    assert len(overview.registered_events) == len(event_test_data.events)
+    assert [event.start for event in overview.registered_events] == sorted(
+        event.start for event in overview.registered_events
+    )
+    organizers = {
+        event.id: [organizer.id for organizer in event.organizers]
+        for event in overview.registered_events
+    }
+    assert organizers[event_test_data.event_one.id] == [user_data.user.id]
+
+
+def test_upcoming_reservations_are_next_first(
+    article_svc: ArticleService, time: dict[str, datetime]
+):
+    reservations = article_svc.get_welcome_overview(
+        user_data.user
+    ).upcoming_reservations
+    assert [reservation.start for reservation in reservations] == sorted(
+        reservation.start for reservation in reservations
+    )
+
+
+def test_article_changes_invalidate_cache(article_svc: ArticleService):
+    article_svc.get_welcome_overview(None)
+    article_svc.create_article(user_data.root, article_data.new_article)
+    news = article_svc.get_welcome_overview(None).latest_news
+    assert article_data.new_article.slug in [article.slug for article in news]
+
+    article = next(
+        article for article in news if article.slug == article_data.new_article.slug
+    )
+    article_svc.delete_article(user_data.root, article.id)
+    news = article_svc.get_welcome_overview(None).latest_news
+    assert article.id not in [article.id for article in news]
+
+
+def test_cache_expires():
+    clock = FakeClock(100.0)
+    cache = WelcomeOverviewCache(ttl=30, clock=clock)
+    loads = []
+
+    def load() -> SharedWelcomeOverview:
+        loads.append(clock.now)
+        return SharedWelcomeOverview(None, [], [])
+
+    cache.get(None, load)
+    clock.now += 29
+    cache.get(None, load)
+    assert len(loads) == 1
+    clock.now += 1
+    cache.get(None, load)
+    assert loads == [100.0, 130.0]
+
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.entries) == (1, 2, 1)
+
+
+def test_load_racing_invalidation_is_not_cached():
+    """An overview loaded while an article changed is served once, then loaded again."""
+    cache = WelcomeOverviewCache()
+    loads = []
+
+    def load() -> SharedWelcomeOverview:
+        loads.append(None)
+        if len(loads) == 1:
+            cache.clear()
+        return SharedWelcomeOverview(None, [], [])
+
+    cache.get(None, load)
+    cache.get(None, load)
+    assert len(loads) == 2
+    assert len(cache) == 1
@@ -0,0 +1,107 @@
+"""Tests for the BackgroundJobRunner."""
+
+import threading
+
+import pytest
+
+from ...services.background_jobs import BackgroundJobRunner
+
+__authors__ = ["Riley Chapman"]
+__copyright__ = "Copyright 2025"
+__license__ = "MIT"
+
+
+class FlakyJob:
+    """Job that raises `exception` for its first `failures` calls."""
+
+    def __init__(self, failures: int, exception: Exception = ConnectionError()):
+        self.failures = failures
+        self.exception = exception
+        self.calls = 0
+
+    def __call__(self) -> None:
+        self.calls += 1
+        if self.calls <= self.failures:
+            raise self.exception
+
+
+@pytest.fixture()
+def runner():
+    """BackgroundJobRunner fixture that records backoff delays instead of sleeping."""
+    delays: list[float] = []
+    runner = BackgroundJobRunner(
+        max_workers=2, max_attempts=3, backoff=0.5, sleep=delays.append
+    )
+    runner.delays = delays
+    yield runner
+    runner.shutdown()
+
+
+def test_runs_job(runner: BackgroundJobRunner):
+    """Ensures a submitted job runs and is counted as succeeded."""
+    job = FlakyJob(failures=0)
+    runner.submit("job", job).result()
+
+    stats = runner.stats()
+    assert job.calls == 1
+    assert stats.succeeded == 1
+    assert stats.failed == 0
+    assert stats.queued == 0
+    assert stats.running == 0
+
+
+def test_retries_with_exponential_backoff(runner: BackgroundJobRunner):
+    """Ensures failing jobs are retried with doubling delays until they succeed."""
+    job = FlakyJob(failures=2)
+    runner.submit("job", job).result()
+
+    assert job.calls == 3
+    assert runner.delays == [0.5, 1.0]
+    assert runner.stats().retried == 2
+    assert runner.stats().succeeded == 1
+
+
+def test_gives_up_after_max_attempts(runner: BackgroundJobRunner):
+    """Ensures a job that keeps failing is attempted max_attempts times, then counted as failed."""
+    job = FlakyJob(failures=5)
+    runner.submit("job", job).result()
+
+    assert job.calls == 3
+    assert runner.stats().failed == 1
+    assert runner.stats().succeeded == 0
+
+
+def test_does_not_retry_other_exceptions(runner: BackgroundJobRunner):
+    """Ensures only the given exception types are retried."""
+    job = FlakyJob(failures=1, exception=KeyError("missing"))
+    runner.submit("job", job, retry_on=(ConnectionError,)).result()
+
+    assert job.calls == 1
+    assert runner.delays == []
+    assert runner.stats().failed == 1
+
+
+def test_bounded_concurrency_and_queue_depth(runner: BackgroundJobRunner):
+    """Ensures no more than max_workers jobs run at once and the rest are reported as queued."""
+    release = threading.Event()
+    started = threading.Semaphore(0)
+
+    def blocking_job():
+        started.release()
+        release.wait(timeout=5)
+
+    for _ in range(5):
+        runner.submit("blocking", blocking_job)
+    started.acquire(timeout=5)
+    started.acquire(timeout=5)
+
+    stats = runner.stats()
+    assert stats.running == 2
+    assert stats.queued == 3
+
+    release.set()
+    runner.join(timeout=5)
+    stats = runner.stats()
+    assert stats.running == 0
+    assert stats.queued == 0
+    assert stats.succeeded == 5
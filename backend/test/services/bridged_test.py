@@ -0,0 +1,260 @@
+"""Tests for the async variants of read paths, run on sessions bridged from AsyncSessions."""
+
+import asyncio
+from typing import Awaitable, Callable
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy import Engine
+from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import HTTPException
+from fastapi.security.http import HTTPAuthorizationCredentials
+from sqlalchemy.orm import Session
+
+from ...api.authentication import _generate_token, bridged_registered_user
+from ...database import create_pooled_async_engine, pool_stats
+from ...models.coworking import Status
+from ...models.office_hours.similar_tickets_ai import SimilarTicketsAIResponse
+from ...services.article import ArticleService
+from ...services.bridged import (
+    bridged_article_svc,
+    bridged_office_hours_svc,
+    bridged_permission_svc,
+    bridged_reservation_svc,
+    bridged_similar_ticket_svc,
+    bridged_status_svc,
+    bridged_user_svc,
+)
+from ...services.coworking import ReservationService, StatusService
+from ...services.exceptions import CoursePermissionException
+from ...services.identity import IdentityCache
+from ...services.welcome_overview_cache import WelcomeOverviewCache
+from ...services.office_hours import OfficeHoursService
+from ...services.office_hours.live_queue import LiveQueueRegistry
+from ...services.office_hours.similar_tickets_ai import SimilarTicketAIService
+from ...services.office_hours.similar_tickets_cache import (
+    InMemoryCacheBackend,
+    SimilarTicketCache,
+)
+from ...services.office_hours.similar_tickets_index import hashing_embedding
+from ...services.permission_engine import PermissionEngine
+from ...services.user_search import trigram_search
+
+# Imported fixtures provide dependencies injected for the tests as parameters.
+from .fixtures import article_svc
+from .coworking.time import time
+from .coworking.fixtures import *
+
+# Data Setup and Injected Service Fixtures
+from .core_data import setup_insert_data_fixture as insert_order_0
+from .academics.term_data import fake_data_fixture as insert_order_1
+from .academics.course_data import fake_data_fixture as insert_order_2
+from .academics.section_data import fake_data_fixture as insert_order_3
+from .room_data import fake_data_fixture as insert_order_4
+from .coworking.seat_data import fake_data_fixture as insert_order_5
+from .coworking.operating_hours_data import fake_data_fixture as insert_order_6
+from .coworking.reservation.reservation_data import (
+    fake_data_fixture as insert_order_7,
+)
+from .office_hours.office_hours_data import fake_data_fixture as insert_order_8
+from .signage_data import fake_data_fixture as insert_order_9
+from .articles.article_data import fake_data_fixture as insert_order_10
+
+# Data Models for Fake Data Inserted in Setup
+from .user_data import ambassador, instructor, student
+from .office_hours import office_hours_data
+
+__authors__ = ["Riley Chapman"]
+__copyright__ = "Copyright 2025"
+__license__ = "MIT"
+
+
+def run_bridged(
+    test_engine: Engine,
+    call: Callable[[Session], Awaitable],
+    concurrency: int = 1,
+) -> list:
+    """Awaits `call` with the `sync_session` of fresh AsyncSessions on the test database.
+
+    The asyncpg engine is created and disposed within the event loop of the test."""
+
+    async def run() -> list:
+        async_engine = create_pooled_async_engine(test_engine.url, "async")
+        try:
+
+            async def one():
+                async with AsyncSession(async_engine) as session:
+                    return await call(session.sync_session)
+
+            return await asyncio.gather(*(one() for _ in range(concurrency)))
+        finally:
+            await async_engine.dispose()
+
+    return asyncio.run(run())
+
+
+def seat_ids(status: Status) -> list[int]:
+    """Seats with equal availability are ordered randomly, so compare them as sorted IDs."""
+    return sorted(seat.id for seat in status.seat_availability)
+
+
+def test_get_coworking_status_async(
+    test_engine: Engine,
+    reservation_svc: ReservationService,
+    policy_svc,
+    operating_hours_svc,
+    seat_svc,
+):
+    async def call(session: Session):
+        permission_svc = await bridged_permission_svc(session, PermissionEngine())
+        status_svc = await bridged_status_svc(
+            session,
+            permission_svc,
+            await bridged_reservation_svc(session, permission_svc),
+        )
+        return await status_svc.get_coworking_status_async(ambassador)
+
+    [status] = run_bridged(test_engine, call)
+    expected = StatusService(
+        policy_svc, operating_hours_svc, seat_svc, reservation_svc
+    ).get_coworking_status(ambassador)
+    assert status.my_reservations == expected.my_reservations
+    assert status.operating_hours == expected.operating_hours
+    assert seat_ids(status) == seat_ids(expected)
+
+
+def test_get_office_hour_queue_async(test_engine: Engine, session: Session):
+    async def call(session: Session):
+        oh_svc = await bridged_office_hours_svc(session, LiveQueueRegistry())
+        return await oh_svc.get_office_hour_queue_async(
+            instructor, office_hours_data.comp_110_current_office_hours.id
+        )
+
+    [queue] = run_bridged(test_engine, call)
+    assert queue == OfficeHoursService(
+        session, LiveQueueRegistry()
+    ).get_office_hour_queue(
+        instructor, office_hours_data.comp_110_current_office_hours.id
+    )
+
+
+def test_get_office_hour_queue_async_not_staff(test_engine: Engine):
+    """Exceptions of the sync implementation reach the async caller."""
+
+    async def call(session: Session):
+        oh_svc = await bridged_office_hours_svc(session, LiveQueueRegistry())
+        return await oh_svc.get_office_hour_queue_async(
+            student, office_hours_data.comp_110_current_office_hours.id
+        )
+
+    with pytest.raises(CoursePermissionException):
+        run_bridged(test_engine, call)
+
+
+def test_find_similar_tickets_async(test_engine: Engine):
+    """Similar tickets are found without holding a thread for the queries or the AI call."""
+    ai_svc = MagicMock(spec=SimilarTicketAIService)
+    ai_svc.ai_for_similar_tickets.return_value = SimilarTicketsAIResponse(
+        similar_ticket_ids=[office_hours_data.comp_110_closed_ticket_RB1.id]
+    )
+
+    async def call(session: Session):
+        similar_ticket_svc = await bridged_similar_ticket_svc(
+            session,
+            ai_svc,
+            hashing_embedding,
+            SimilarTicketCache(InMemoryCacheBackend()),
+        )
+        return await similar_ticket_svc.find_similar_tickets(
+            instructor, office_hours_data.red_black_called_ticket.id
+        )
+
+    [response] = run_bridged(test_engine, call)
+    assert [ticket.id for ticket in response.similar_tickets] == [
+        office_hours_data.comp_110_closed_ticket_RB1.id
+    ]
+    ai_svc.ai_for_similar_tickets.assert_awaited_once()
+
+
+def test_get_welcome_overview_async(test_engine: Engine, article_svc: ArticleService):
+    async def call(session: Session):
+        permission_svc = await bridged_permission_svc(session, PermissionEngine())
+        article_svc = await bridged_article_svc(
+            session, session, permission_svc, WelcomeOverviewCache()
+        )
+        return await article_svc.get_welcome_overview_async(ambassador)
+
+    [overview] = run_bridged(test_engine, call)
+    assert overview == article_svc.get_welcome_overview(ambassador)
+
+
+def test_bridged_registered_user(test_engine: Engine):
+    """Async routes authenticate on the bridged session, rejecting invalid tokens."""
+
+    async def call(session: Session):
+        user_svc = await bridged_user_svc(
+            session,
+            await bridged_permission_svc(session, PermissionEngine()),
+            IdentityCache(),
+            trigram_search,
+        )
+        token = _generate_token(ambassador.onyen, ambassador.pid)
+        user = await bridged_registered_user(
+            user_svc, HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+        )
+        with pytest.raises(HTTPException):
+            await bridged_registered_user(
+                user_svc,
+                HTTPAuthorizationCredentials(scheme="Bearer", credentials="invalid"),
+            )
+        return user
+
+    [user] = run_bridged(test_engine, call)
+    assert user.id == ambassador.id
+
+
+def test_welcome_overview_reads_read_session(
+    test_engine: Engine, article_svc: ArticleService
+):
+    """The welcome overview is read from the read session, which may be on the replica."""
+
+    async def call(session: Session):
+        async_engine = create_pooled_async_engine(test_engine.url, "async-replica")
+        try:
+            async with AsyncSession(async_engine) as read_session:
+                permission_svc = await bridged_permission_svc(
+                    session, PermissionEngine()
+                )
+                article_svc = await bridged_article_svc(
+                    session,
+                    read_session.sync_session,
+                    permission_svc,
+                    WelcomeOverviewCache(),
+                )
+                overview = await article_svc.get_welcome_overview_async(None)
+                return overview, pool_stats(read_session.sync_session.get_bind())
+        finally:
+            await async_engine.dispose()
+
+    [(overview, stats)] = run_bridged(test_engine, call)
+    assert overview == article_svc.get_welcome_overview(None)
+    assert stats.name == "async-replica"
+    assert stats.checkouts >= 1
+
+
+def test_async_engine_pool_metrics(test_engine: Engine):
+    """Concurrent async requests check out connections of the instrumented async pool."""
+
+    async def call(session: Session):
+        permission_svc = await bridged_permission_svc(session, PermissionEngine())
+        status_svc = await bridged_status_svc(
+            session,
+            permission_svc,
+            await bridged_reservation_svc(session, permission_svc),
+        )
+        await status_svc.get_coworking_status_async(ambassador)
+        return pool_stats(session.get_bind())
+
+    stats = run_bridged(test_engine, call, concurrency=8)
+    assert max(stat.checkouts for stat in stats) >= 8
+    assert all(stat.name == "async" for stat in stats)
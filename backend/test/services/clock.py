@@ -0,0 +1,15 @@
+"""Helper for tests of services that expire or refresh state on a monotonic clock."""
+
+__authors__ = ["Riley Chapman"]
+__copyright__ = "Copyright 2025"
+__license__ = "MIT"
+
+
+class FakeClock:
+    """Clock that only moves when told to, by setting or advancing `now`."""
+
+    def __init__(self, now: float = 0.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
@@ -0,0 +1,168 @@
+"""Tests for the integer availability used to compute seat availability."""
+
+from datetime import datetime, timedelta
+
+from ....models.coworking import Reservation, ReservationState, TimeRange
+from ....services.coworking.availability import (
+    Availability,
+    seat_availability,
+    to_datetime,
+    to_duration,
+    to_instant,
+)
+
+# Data Models for Fake Data
+from . import seat_data
+
+__authors__ = ["Riley Chapman"]
+__copyright__ = "Copyright 2025"
+__license__ = "MIT"
+
+MINUTE = to_duration(timedelta(minutes=1))
+
+
+def ranges(availability: Availability) -> list[tuple[int, int]]:
+    boundaries = availability.boundaries
+    return list(zip(boundaries[0::2], boundaries[1::2]))
+
+
+def test_instants_round_trip():
+    moment = datetime(2025, 3, 14, 15, 9, 26, 535897)
+    assert to_datetime(to_instant(moment)) == moment
+    assert to_instant(moment + timedelta(minutes=1)) - to_instant(moment) == MINUTE
+
+
+def test_from_ranges_and_back():
+    start = datetime(2025, 3, 14, 10)
+    time_ranges = [
+        TimeRange(start=start, end=start + timedelta(hours=2)),
+        TimeRange(start=start + timedelta(hours=3), end=start + timedelta(hours=4)),
+    ]
+    availability = Availability.from_ranges(time_ranges)
+    assert len(availability) == 2
+    assert availability.to_time_ranges() == time_ranges
+    assert availability.total() == 3 * 60 * MINUTE
+
+
+def test_subtract_middle():
+    availability = Availability([0, 60])
+    availability.subtract(10, 20)
+    assert ranges(availability) == [(0, 10), (20, 60)]
+
+
+def test_subtract_front_and_back():
+    availability = Availability([0, 60])
+    availability.subtract(-10, 10)
+    availability.subtract(50, 70)
+    assert ranges(availability) == [(10, 50)]
+
+
+def test_subtract_exact_range():
+    availability = Availability([0, 10, 20, 30])
+    availability.subtract(0, 10)
+    assert ranges(availability) == [(20, 30)]
+
+
+def test_subtract_spanning_ranges():
+    availability = Availability([0, 10, 20, 30, 40, 50])
+    availability.subtract(5, 45)
+    assert ranges(availability) == [(0, 5), (45, 50)]
+
+
+def test_subtract_gap_and_outside():
+    availability = Availability([0, 10, 20, 30])
+    availability.subtract(10, 20)
+    availability.subtract(30, 40)
+    availability.subtract(-10, 0)
+    assert ranges(availability) == [(0, 10), (20, 30)]
+
+
+def test_subtract_at_adjacent_boundary():
+    """Adjacent ranges, such as operating hours split at midnight, stay separate."""
+    availability = Availability([0, 10, 10, 20])
+    availability.subtract(5, 10)
+    assert ranges(availability) == [(0, 5), (10, 20)]
+    availability.subtract(10, 15)
+    assert ranges(availability) == [(0, 5), (15, 20)]
+
+
+def test_subtract_everything():
+    availability = Availability([0, 10, 20, 30])
+    availability.subtract(-5, 35)
+    assert not availability
+    availability.subtract(0, 10)
+    assert not availability
+
+
+def test_constrain():
+    availability = Availability([0, 10, 20, 30, 40, 50])
+    availability.constrain(25, 45)
+    assert ranges(availability) == [(25, 30), (40, 45)]
+
+
+def test_constrain_outside_bounds():
+    availability = Availability([0, 10])
+    availability.constrain(20, 30)
+    assert not availability
+
+
+def test_copy_is_independent():
+    availability = Availability([0, 10])
+    copy = availability.copy()
+    copy.subtract(0, 5)
+    assert ranges(availability) == [(0, 10)]
+    assert ranges(copy) == [(5, 10)]
+
+
+def test_filter_below():
+    availability = Availability([0, 5, 10, 20, 30, 34])
+    availability.filter_below(5)
+    assert ranges(availability) == [(0, 5), (10, 20)]
+    assert availability.first_duration() == 5
+
+
+def test_seat_availability():
+    start = datetime(2025, 3, 14, 10)
+    open_availability = Availability.from_ranges(
+        [TimeRange(start=start, end=start + timedelta(hours=2))]
+    )
+    reservations = [
+        Reservation(
+            id=1,
+            start=start,
+            end=start + timedelta(minutes=55),
+            state=ReservationState.CONFIRMED,
+            users=[],
+            seats=[seat_data.monitor_seat_00, seat_data.monitor_seat_01],
+            walkin=False,
+            room=None,
+            created_at=start,
+            updated_at=start,
+        ),
+        Reservation(
+            id=2,
+            start=start + timedelta(minutes=60),
+            end=start + timedelta(hours=2),
+            state=ReservationState.CONFIRMED,
+            users=[],
+            seats=[seat_data.monitor_seat_01, seat_data.monitor_seat_10],
+            walkin=False,
+            room=None,
+            created_at=start,
+            updated_at=start,
+        ),
+    ]
+    availability = seat_availability(
+        [seat_data.monitor_seat_00.id, seat_data.monitor_seat_01.id],
+        open_availability,
+        reservations,
+        10 * MINUTE,
+    )
+    # The gap left between the reservations of the second seat is too short to reserve
+    assert list(availability) == [seat_data.monitor_seat_00.id]
+    assert availability[seat_data.monitor_seat_00.id].to_time_ranges() == [
+        TimeRange(start=start + timedelta(minutes=55), end=start + timedelta(hours=2))
+    ]
+    assert ranges(open_availability) == [
+        (to_instant(start), to_instant(start + timedelta(hours=2)))
+    ]
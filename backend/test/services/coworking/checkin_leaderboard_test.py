@@ -0,0 +1,160 @@
+"""Tests for the monthly check-in counts of the signage leaderboard."""
+
+from datetime import date, datetime, timedelta
+
+from sqlalchemy import select, update
+from sqlalchemy.orm import Session
+
+from ....entities.coworking import CheckinCountEntity, ReservationEntity
+from ....models.coworking import ReservationPartial, ReservationState
+from ....services.coworking import (
+    CheckinLeaderboardService,
+    ReservationService,
+    ReservationSweepService,
+)
+from ....services.coworking.checkin_leaderboard import month_of, next_month
+from ..query_counter import count_queries
+
+# Imported fixtures provide dependencies injected for the tests as parameters.
+from .fixtures import (
+    reservation_svc,
+    reservation_sweep_svc,
+    permission_svc,
+    seat_svc,
+    policy_svc,
+    operating_hours_svc,
+)
+from .time import *
+
+# Data Setup and Injected Service Fixtures
+from ..core_data import setup_insert_data_fixture as insert_order_0
+from .operating_hours_data import fake_data_fixture as insert_order_1
+from ..room_data import fake_data_fixture as insert_order_2
+from .seat_data import fake_data_fixture as insert_order_3
+from .reservation.reservation_data import fake_data_fixture as insert_order_4
+
+# Data Models for Fake Data Inserted in Setup
+from ..core_data import user_data
+from .reservation import reservation_data
+
+__authors__ = ["Riley Chapman"]
+__copyright__ = "Copyright 2025"
+__license__ = "MIT"
+
+
+def counts(session: Session, month: date) -> dict[int, int]:
+    session.expire_all()
+    return {
+        entity.user_id: entity.count
+        for entity in session.scalars(
+            select(CheckinCountEntity).where(CheckinCountEntity.month == month)
+        )
+    }
+
+
+def test_month_of():
+    assert month_of(datetime(2025, 3, 31, 23, 59)) == date(2025, 3, 1)
+    assert next_month(date(2025, 3, 1)) == date(2025, 4, 1)
+    assert next_month(date(2025, 12, 1)) == date(2026, 1, 1)
+
+
+def test_rebuild_counts_checked_out_reservations(
+    session: Session, time: dict[str, datetime]
+):
+    """Only the checked out reservation of the fake data is counted."""
+    assert counts(session, month_of(time[NOW])) == {user_data.ambassador.id: 1}
+
+
+def test_rebuild_corrects_drift(session: Session, time: dict[str, datetime]):
+    month = month_of(time[NOW])
+    session.execute(update(CheckinCountEntity).values(count=99))
+    session.add(CheckinCountEntity(month=month, user_id=user_data.root.id, count=5))
+    session.commit()
+
+    assert CheckinLeaderboardService(session).rebuild(month) == 1
+    session.commit()
+    assert counts(session, month) == {user_data.ambassador.id: 1}
+
+
+def test_rebuild_month_without_checkins(session: Session, time: dict[str, datetime]):
+    past = month_of(month_of(time[NOW]) - timedelta(days=1))
+    assert CheckinLeaderboardService(session).rebuild(past) == 0
+    assert counts(session, past) == {}
+
+
+def test_change_reservation_checkout_counts(
+    session: Session, reservation_svc: ReservationService, time: dict[str, datetime]
+):
+    reservation_svc.change_reservation(
+        user_data.user,
+        ReservationPartial(
+            id=reservation_data.reservation_1.id, state=ReservationState.CHECKED_OUT
+        ),
+    )
+    assert counts(session, month_of(datetime.now())) == {
+        user_data.ambassador.id: 1,
+        user_data.user.id: 1,
+    }
+
+
+def test_change_reservation_invalid_transition_not_counted(
+    session: Session, reservation_svc: ReservationService, time: dict[str, datetime]
+):
+    """A reservation already checked out is not counted again."""
+    reservation_svc.change_reservation(
+        user_data.ambassador,
+        ReservationPartial(
+            id=reservation_data.reservation_2.id, state=ReservationState.CHECKED_IN
+        ),
+    )
+    session.commit()
+    assert counts(session, month_of(time[NOW])) == {user_data.ambassador.id: 1}
+
+
+def test_sweep_checkout_counts(
+    session: Session,
+    reservation_sweep_svc: ReservationSweepService,
+    time: dict[str, datetime],
+):
+    end = reservation_data.active_reservations[0].end
+    reservation_sweep_svc.sweep(end)
+    assert counts(session, month_of(end)).get(user_data.user.id) == 1
+
+
+def test_record_checkouts_accumulates(session: Session, time: dict[str, datetime]):
+    """Each check-out adds to the existing count, per user of the reservation's party."""
+    reservation = session.get(ReservationEntity, reservation_data.reservation_2.id)
+    leaderboard_svc = CheckinLeaderboardService(session)
+    leaderboard_svc.record_checkouts([reservation, reservation])
+    leaderboard_svc.record_checkouts([])
+    session.commit()
+    assert counts(session, month_of(reservation.end)) == {user_data.ambassador.id: 3}
+
+
+def test_top_users(session: Session, time: dict[str, datetime]):
+    month = month_of(time[NOW])
+    session.add_all(
+        [
+            CheckinCountEntity(month=month, user_id=user_data.root.id, count=4),
+            CheckinCountEntity(month=month, user_id=user_data.user.id, count=1),
+            CheckinCountEntity(
+                month=next_month(month), user_id=user_data.instructor.id, count=9
+            ),
+        ]
+    )
+    session.commit()
+    session.expunge_all()
+
+    leaderboard_svc = CheckinLeaderboardService(session)
+    with count_queries(session) as queries:
+        top = leaderboard_svc.top_users(month, 10)
+    assert len(queries) == 1
+    # Ties are ordered by ID
+    assert [user.id for user in top] == [
+        user_data.root.id,
+        min(user_data.ambassador.id, user_data.user.id),
+        max(user_data.ambassador.id, user_data.user.id),
+    ]
+    assert [user.id for user in leaderboard_svc.top_users(month, 1)] == [
+        user_data.root.id
+    ]
@@ -7,12 +7,15 @@ from ....services import (
     PermissionService,
     RoomService,
 )
+from ....services.permission_engine import PermissionEngine
 from ....services.coworking import (
     OperatingHoursService,
     SeatService,
     ReservationService,
     PolicyService,
     StatusService,
+    CheckinLeaderboardService,
+    ReservationSweepService,
 )
 
 __authors__ = [
@@ -29,7 +32,7 @@ __license__ = "MIT"
 @pytest.fixture()
 def permission_svc(session: Session):
     """PermissionService fixture."""
-    return PermissionService(session)
+    return PermissionService(session, PermissionEngine())
 
 
 @pytest.fixture()
@@ -70,6 +73,14 @@ def reservation_svc(
     )
 
 
+@pytest.fixture()
+def reservation_sweep_svc(session: Session, policy_svc: PolicyService):
+    """ReservationSweepService fixture."""
+    return ReservationSweepService(
+        session, policy_svc, CheckinLeaderboardService(session)
+    )
+
+
 @pytest.fixture()
 def status_svc():
     policies_mock = create_autospec(PolicyService)
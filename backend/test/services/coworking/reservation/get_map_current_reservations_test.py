@@ -4,7 +4,12 @@ from backend.models.coworking.availability import RoomState
 from backend.models.coworking.reservation import ReservationState
 from datetime import date
 
-from .....services.coworking import ReservationService
+import pytest
+from sqlalchemy.orm import Session
+
+from .....services.coworking import PolicyService, ReservationService
+from .....services.coworking.room_grid import RoomGrid
+from ...query_counter import count_queries
 
 # Imported fixtures provide dependencies injected for the tests as parameters.
 # Dependent fixtures (seat_svc) are required to be imported in the testing module.
@@ -40,10 +45,10 @@ __copyright__ = "Copyright 2023-24"
 __license__ = "MIT"
 
 
-def test_transform_date_map_for_unavailable_simple(reservation_svc: ReservationService):
+def test_block_subject_reserved_columns_simple():
     """
-    Validates the transformation of the date map to indicate unavailable time slots.
-    
+    Validates graying out the time slots of other rooms once the subject has a reservation.
+
     This test ensures that time slots are appropriately grayed out for all other rooms
     once a user has made a reservation. For example, if Sally Student reserves room SN135
     from 1 pm to 3 pm on February 29, she should be prevented from booking any other room
@@ -51,58 +56,48 @@ def test_transform_date_map_for_unavailable_simple(reservation_svc: ReservationS
     accurately reflects these unavailable slots, enhancing the user experience by
     preventing double bookings.
     """
-    
-    sample_date_map_1 = {
-        'SN135': [0, 0, 0, 0],
-        'SN137': [0, 0, 4, 4],
-        'SN139': [0, 0, 0, 0]
-    }
 
-    expected_transformed_date_map_1 = {
-        'SN135': [0, 0, 3, 3],
-        'SN137': [0, 0, 4, 4],
-        'SN139': [0, 0, 3, 3]
-    }
+    grid = RoomGrid(["SN135", "SN137", "SN139"], 4)
+    grid.fill("SN137", 2, 4, RoomState.SUBJECT_RESERVED)
 
-    reservation_svc._transform_date_map_for_unavailable(sample_date_map_1)
-    assert sample_date_map_1 == expected_transformed_date_map_1
+    grid.block_subject_reserved_columns()
+    assert grid.to_date_map() == {
+        "SN135": [0, 0, 3, 3],
+        "SN137": [0, 0, 4, 4],
+        "SN139": [0, 0, 3, 3],
+    }
 
 
-def test_transform_date_map_for_unavailable_complex(reservation_svc: ReservationService):    
-    sample_date_map_2 = {
-        'SN135': [0, 0, 0, 0, 0, 0, 1, 1, 1, 1],
-        'SN137': [0, 0, 1, 1, 4, 4, 4, 4, 0, 0],
-        'SN139': [0, 4, 4, 1, 1, 0, 0, 0, 0, 0]
-    }
+def test_block_subject_reserved_columns_complex():
+    grid = RoomGrid(["SN135", "SN137", "SN139"], 10)
+    grid.fill("SN135", 6, 10, RoomState.RESERVED)
+    grid.fill("SN137", 2, 4, RoomState.RESERVED)
+    grid.fill("SN137", 4, 8, RoomState.SUBJECT_RESERVED)
+    grid.fill("SN139", 1, 3, RoomState.SUBJECT_RESERVED)
+    grid.fill("SN139", 3, 5, RoomState.RESERVED)
 
-    expected_transformed_date_map_2 = {
-        'SN135': [0, 3, 3, 0, 3, 3, 1, 1, 1, 1],
-        'SN137': [0, 3, 1, 1, 4, 4, 4, 4, 0, 0],
-        'SN139': [0, 4, 4, 1, 1, 3, 3, 3, 0, 0]
+    grid.block_subject_reserved_columns()
+    assert grid.to_date_map() == {
+        "SN135": [0, 3, 3, 0, 3, 3, 1, 1, 1, 1],
+        "SN137": [0, 3, 1, 1, 4, 4, 4, 4, 0, 0],
+        "SN139": [0, 4, 4, 1, 1, 3, 3, 3, 0, 0],
     }
 
-    reservation_svc._transform_date_map_for_unavailable(sample_date_map_2)
-    assert expected_transformed_date_map_2 == sample_date_map_2
-
 
-def test_transform_date_map_for_office_hours(reservation_svc: ReservationService):
+def test_fill_office_hours(reservation_svc: ReservationService):
+    """Office hours on Wednesday, May 1st, 2024 gray out the slots of their rooms from 10am."""
     date = datetime(year=2024, month=5, day=1)
     start = datetime(year=2024, month=5, day=1, hour=10, minute=0)
-    reserved_date_map = {
-        'SN135': [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
-        'SN137': [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
-        'SN141': [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0]
+    grid = RoomGrid(["SN135", "SN137", "SN139", "SN141"], 16)
+
+    reservation_svc._fill_office_hours(grid, date, start, exclude="SN135")
+    assert grid.to_date_map() == {
+        "SN135": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+        "SN137": [0, 0, 0, 0, 0, 0, 3, 3, 0, 0, 0, 0, 0, 0, 0, 0],
+        "SN139": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+        "SN141": [3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 0, 0],
     }
 
-    expected_transformed_date_map = {
-        'SN135': [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
-        'SN137': [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3, 3, 0, 0, 0, 0],
-        'SN141': [3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 0, 0, 0, 0]
-    }
-
-    reservation_svc._transform_date_map_for_officehours(date, reserved_date_map, start, 16)
-    assert reserved_date_map == expected_transformed_date_map
-
 
 def test_idx_calculation(reservation_svc: ReservationService):
     time_1 = datetime.now().replace(hour=10, minute=12)
@@ -141,14 +136,20 @@ def test_round_idx_calculation_2(reservation_svc: ReservationService):
     assert rounded_down.hour == 10 and rounded_down.minute == 30
 
 
-def test_query_confirmed_reservations_by_date_and_room(
+def test_query_reservation_blocks_by_date_for_room(
     reservation_svc: ReservationService, time: dict[str, datetime]
 ):
-    """Test getting all reservations for a particular date."""
-    reservations = reservation_svc._query_confirmed_reservations_by_date_and_room(time[NOW] + timedelta(days=2), 'SN135')
-    assert len(reservations) == 1
-    assert reservations[0].id == 6
-    assert reservations[0].room.id == 'SN135'
+    """Test getting all reservations of a room for a particular date."""
+    reservation = reservation_data.reservation_6
+    blocks = reservation_svc._query_reservation_blocks_by_date(
+        time[NOW] + timedelta(days=2), user_data.user, ["SN135"]
+    )
+    assert blocks == [("SN135", reservation.start, reservation.end, True)]
+
+    blocks = reservation_svc._query_reservation_blocks_by_date(
+        time[NOW] + timedelta(days=2), user_data.root, ["SN135", "SN137"]
+    )
+    assert blocks == [("SN135", reservation.start, reservation.end, False)]
 
 def test_get_reservable_rooms(reservation_svc: ReservationService):
     rooms = reservation_svc._get_reservable_rooms()
@@ -158,14 +159,38 @@ def test_get_reservable_rooms(reservation_svc: ReservationService):
     assert rooms[3].id == 'SN141' and rooms[3].reservable is True
 
 
-def test_query_xl_reservations_by_date_for_user(reservation_svc: ReservationService, time: dict[str, datetime]):
-    reservations = reservation_svc._query_xl_reservations_by_date_for_user(time[NOW], user_data.user)
-    assert reservations[0].room is None
-    assert reservations[0].users[0].first_name == 'Sally'
+def test_query_reservation_blocks_by_date_for_xl(
+    reservation_svc: ReservationService, time: dict[str, datetime]
+):
+    """XL seat reservations are included under the XL, for the subject only."""
+    blocks = reservation_svc._query_reservation_blocks_by_date(
+        time[NOW], user_data.user, ["SN156"]
+    )
+    assert len(blocks) > 0
+    assert all(room_id == "SN156" and is_subject for room_id, *_, is_subject in blocks)
+
+    blocks = reservation_svc._query_reservation_blocks_by_date(
+        time[NOW], user_data.user, ["SN135"]
+    )
+    assert all(room_id == "SN135" for room_id, *_ in blocks)
+
+
+def test_get_map_reserved_times_by_date_query_count(
+    session: Session, reservation_svc: ReservationService, time: dict[str, datetime]
+):
+    """Rooms with their seats, operating hours and the reservations of every room."""
+    with count_queries(session) as queries:
+        reservation_svc.get_map_reserved_times_by_date(
+            time[NOW] + timedelta(days=2), user_data.user
+        )
+    assert len(queries) == 4
 
 
 def test_get_map_reserved_times_by_date(
-    reservation_svc: ReservationService, time: dict[str, datetime]
+    reservation_svc: ReservationService,
+    policy_svc: PolicyService,
+    time: dict[str, datetime],
+    monkeypatch: pytest.MonkeyPatch,
 ):
     """Test for getting a dictionary where keys are room ids and time slots array are values.
     
@@ -174,12 +199,13 @@ def test_get_map_reserved_times_by_date(
     multiple edge cases that arise out of it. I recommend setting a breakpoint and looking at
     the reserved_date_map in the debugger.
     """
+    # Office hours depend on the weekday the test runs on, and are tested by test_fill_office_hours.
+    monkeypatch.setattr(policy_svc, "office_hours", lambda date: {})
     test_time = time[NOW] + timedelta(days=2)
     reservation_details = reservation_svc.get_map_reserved_times_by_date(
         test_time, user_data.user
     )
 
-    # This may change based on what time the test is ran due to office hours.
     expected_date_map = {
         'SN135' : [0, 3, 3, 3, 0],
         'SN137' : [0, 4, 4, 4, 0],
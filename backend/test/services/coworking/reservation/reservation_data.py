@@ -7,6 +7,10 @@ from .....entities.coworking import ReservationEntity
 from .....models.coworking import Reservation, ReservationState, ReservationRequest
 from .....models.user import UserIdentity
 from .....models.coworking.seat import SeatIdentity
+from .....services.coworking.checkin_leaderboard import (
+    CheckinLeaderboardService,
+    month_of,
+)
 from ..time import *
 
 from ...core_data import user_data
@@ -191,6 +195,9 @@ def insert_fake_data(session: Session, time: dict[str, datetime]):
         session, ReservationEntity, ReservationEntity.id, len(reservations) + 1
     )
 
+    # Count the check-ins of reservations inserted as checked out
+    CheckinLeaderboardService(session).rebuild(month_of(time[NOW]))
+
 
 def delete_future_data(session: Session, time: dict[str, datetime]):
     reservations = session.scalars(
@@ -0,0 +1,207 @@
+"""Tests for the sweeper applying the time-based state transitions of reservations."""
+
+import functools
+import time as clock
+from datetime import date, datetime, timedelta
+
+from sqlalchemy import Engine, select
+from sqlalchemy.orm import Session
+
+from ....entities.coworking import CheckinCountEntity, ReservationEntity
+from ....models.coworking import ReservationRequest, ReservationState
+from ....models.room import RoomPartial
+from ....services.coworking import (
+    PolicyService,
+    ReservationService,
+    ReservationSweepService,
+)
+from ....services.coworking.checkin_leaderboard import month_of
+from ....services.coworking.reservation_sweeper import (
+    ReservationSweep,
+    ReservationSweeper,
+)
+from ..query_counter import count_queries
+
+# Imported fixtures provide dependencies injected for the tests as parameters.
+from .fixtures import (
+    reservation_svc,
+    reservation_sweep_svc,
+    permission_svc,
+    seat_svc,
+    policy_svc,
+    operating_hours_svc,
+)
+from .time import *
+
+# Data Setup and Injected Service Fixtures
+from ..core_data import setup_insert_data_fixture as insert_order_0
+from .operating_hours_data import fake_data_fixture as insert_order_1
+from ..room_data import fake_data_fixture as insert_order_2
+from .seat_data import fake_data_fixture as insert_order_3
+from .reservation.reservation_data import fake_data_fixture as insert_order_4
+
+# Data Models for Fake Data Inserted in Setup
+from ..core_data import user_data
+from .reservation import reservation_data
+
+__authors__ = ["Riley Chapman"]
+__copyright__ = "Copyright 2025"
+__license__ = "MIT"
+
+NOTHING = ReservationSweep(expired_drafts=0, no_shows=0, checked_out=0)
+
+
+def state(session: Session, id: int) -> ReservationState:
+    return session.get(ReservationEntity, id, populate_existing=True).state
+
+
+def checkins(session: Session, month: date) -> dict[int, int]:
+    session.expire_all()
+    return {
+        entity.user_id: entity.count
+        for entity in session.scalars(
+            select(CheckinCountEntity).where(CheckinCountEntity.month == month)
+        )
+    }
+
+
+def test_sweep_noop(
+    reservation_sweep_svc: ReservationSweepService, time: dict[str, datetime]
+):
+    assert reservation_sweep_svc.sweep(time[AN_HOUR_AGO]) == NOTHING
+
+
+def test_sweep_checks_out_ended(
+    session: Session, reservation_sweep_svc: ReservationSweepService
+):
+    reservation = reservation_data.active_reservations[0]
+    before = reservation_sweep_svc.sweep(reservation.end - timedelta(seconds=1))
+    assert before.checked_out == 0
+
+    assert reservation_sweep_svc.sweep(reservation.end).checked_out == 1
+    assert state(session, reservation.id) == ReservationState.CHECKED_OUT
+    assert checkins(session, month_of(reservation.end))[user_data.user.id] == 1
+
+
+def test_sweep_draft_timeout(
+    session: Session,
+    reservation_sweep_svc: ReservationSweepService,
+    policy_svc: PolicyService,
+):
+    draft = reservation_data.draft_reservations[0]
+    cutoff = draft.created_at + policy_svc.reservation_draft_timeout()
+    assert reservation_sweep_svc.sweep(cutoff).expired_drafts == 0
+    assert state(session, draft.id) == ReservationState.DRAFT
+
+    sweep = reservation_sweep_svc.sweep(cutoff + timedelta(seconds=1))
+    assert sweep.expired_drafts == 1
+    assert state(session, draft.id) == ReservationState.CANCELLED
+
+
+def test_sweep_checkin_timeout(
+    session: Session,
+    reservation_sweep_svc: ReservationSweepService,
+    policy_svc: PolicyService,
+):
+    confirmed = reservation_data.confirmed_reservations[0]
+    cutoff = confirmed.start + policy_svc.reservation_checkin_timeout()
+    reservation_sweep_svc.sweep(cutoff)
+    assert state(session, confirmed.id) == ReservationState.CONFIRMED
+
+    reservation_sweep_svc.sweep(cutoff + timedelta(seconds=1))
+    assert state(session, confirmed.id) == ReservationState.CANCELLED
+
+
+def test_sweep_is_idempotent(
+    session: Session,
+    reservation_sweep_svc: ReservationSweepService,
+    time: dict[str, datetime],
+):
+    cutoff = time[IN_EIGHT_HOURS]
+    first = reservation_sweep_svc.sweep(cutoff)
+    assert first.checked_out == 1
+    assert first.no_shows > 0
+
+    with count_queries(session) as queries:
+        assert reservation_sweep_svc.sweep(cutoff) == NOTHING
+    # One UPDATE per transition, and no check-ins to record
+    assert len([query for query in queries if query.startswith("UPDATE")]) == 3
+    reservation = reservation_data.active_reservations[0]
+    assert checkins(session, month_of(reservation.end))[user_data.user.id] == 1
+
+
+def test_reads_leave_out_due_reservations_without_writing(
+    session: Session, reservation_svc: ReservationService
+):
+    """The room reservation that started an hour ago without a check-in is due to be cancelled."""
+    no_show = reservation_data.reservation_7
+    with count_queries(session) as queries:
+        reservations = reservation_svc.get_current_reservations_for_user(
+            user_data.root, user_data.root
+        )
+    assert no_show.id not in [reservation.id for reservation in reservations]
+    assert reservation_data.confirmed_reservations[0].id in [
+        reservation.id for reservation in reservations
+    ]
+    assert all(query.startswith("SELECT") for query in queries)
+    assert state(session, no_show.id) == ReservationState.CONFIRMED
+
+
+def test_room_reads_leave_out_due_reservations(
+    session: Session, reservation_svc: ReservationService
+):
+    """The room no-show neither blocks its room on the map nor conflicts with a new booking."""
+    no_show = reservation_data.reservation_7
+    with count_queries(session) as queries:
+        blocks = reservation_svc._query_reservation_blocks_by_date(
+            no_show.start, user_data.root, [no_show.room.id]
+        )
+        conflicts = reservation_svc._fetch_conflicting_room_reservations(
+            ReservationRequest(
+                start=no_show.start,
+                end=no_show.end,
+                users=[user_data.user],
+                room=RoomPartial(id=no_show.room.id),
+            )
+        )
+    assert (no_show.room.id, no_show.start, no_show.end, True) not in blocks
+    assert no_show.id not in [conflict.id for conflict in conflicts]
+    assert all(query.startswith("SELECT") for query in queries)
+    assert state(session, no_show.id) == ReservationState.CONFIRMED
+
+
+def test_sweeper_sweeps(test_engine: Engine, time: dict[str, datetime]):
+    sweeper = ReservationSweeper(
+        functools.partial(Session, test_engine), now=lambda: time[IN_EIGHT_HOURS]
+    )
+    sweep = sweeper.sweep()
+    assert sweep.checked_out == 1
+    assert sweep.no_shows > 0
+    assert sweeper.sweep() == NOTHING
+
+
+def test_sweeper_thread(test_engine: Engine, time: dict[str, datetime]):
+    sweeps = 0
+
+    def session_factory() -> Session:
+        nonlocal sweeps
+        sweeps += 1
+        return Session(test_engine)
+
+    sweeper = ReservationSweeper(
+        session_factory, interval=0.01, now=lambda: time[IN_EIGHT_HOURS]
+    )
+    sweeper.start()
+    try:
+        deadline = clock.monotonic() + 5
+        while sweeps < 2 and clock.monotonic() < deadline:
+            clock.sleep(0.01)
+    finally:
+        sweeper.stop()
+    assert sweeps >= 2
+    assert (
+        ReservationSweeper(
+            functools.partial(Session, test_engine), now=lambda: time[IN_EIGHT_HOURS]
+        ).sweep()
+        == NOTHING
+    )
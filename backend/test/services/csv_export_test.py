@@ -0,0 +1,85 @@
+"""Tests for streaming CSV exports."""
+
+import csv
+import io
+
+from fastapi import FastAPI
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.testclient import TestClient
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from ...api.csv_export import csv_response
+from ...entities import UserEntity
+from ...models import User
+from ...services.csv_export import encode_csv, stream_rows
+from .query_counter import count_queries
+
+# Data Setup
+from .core_data import setup_insert_data_fixture
+
+# Data Models for Fake Data Inserted in Setup
+from .user_data import users
+
+__authors__ = ["Riley Chapman"]
+__copyright__ = "Copyright 2025"
+__license__ = "MIT"
+
+FIELDNAMES = ["id", "pid", "onyen"]
+
+
+def rows(count: int) -> list[dict]:
+    return [
+        {"id": index, "pid": 700_000_000 + index, "onyen": f"user{index}"}
+        for index in range(count)
+    ]
+
+
+def parse(text: str) -> list[dict]:
+    return [
+        {key: int(value) if value.isdigit() else value for key, value in row.items()}
+        for row in csv.DictReader(io.StringIO(text))
+    ]
+
+
+def test_encode_csv_in_batches():
+    chunks = list(encode_csv(rows(25), FIELDNAMES, batch_size=10))
+    assert chunks[0] == "id,pid,onyen\r\n"
+    assert [chunk.count("\r\n") for chunk in chunks[1:]] == [10, 10, 5]
+    assert parse("".join(chunks)) == rows(25)
+
+
+def test_encode_csv_models():
+    models = [User(id=1, pid=700_000_000, onyen="user0")]
+    assert parse("".join(encode_csv(models, FIELDNAMES))) == [
+        {"id": 1, "pid": 700_000_000, "onyen": "user0"}
+    ]
+
+
+def test_encode_csv_without_rows():
+    assert list(encode_csv([], FIELDNAMES)) == ["id,pid,onyen\r\n"]
+
+
+def test_stream_rows_reads_when_iterated(session: Session):
+    statement = select(UserEntity).order_by(UserEntity.id)
+    with count_queries(session) as queries:
+        streamed = stream_rows(session.get_bind(), statement, UserEntity.to_model, 2)
+        assert queries == []
+        assert [user.id for user in streamed] == [user.id for user in users]
+    # One statement, read two rows at a time through a server-side cursor
+    assert len(queries) == 1
+
+
+def test_csv_response_streams_gzip():
+    app = FastAPI()
+    app.add_middleware(GZipMiddleware)
+
+    @app.get("/export")
+    def export():
+        return csv_response(iter(rows(5000)), FIELDNAMES, "users.csv")
+
+    response = TestClient(app).get("/export", headers={"Accept-Encoding": "gzip"})
+    assert response.headers["content-type"].startswith("text/csv")
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["content-disposition"] == "attachment; filename=users.csv"
+    assert parse(response.text) == rows(5000)
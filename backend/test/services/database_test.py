@@ -0,0 +1,131 @@
+"""Tests for the instrumented connection pools and the routing of reads to a replica."""
+
+import pytest
+from sqlalchemy import Engine, exc
+from sqlalchemy.orm import Session
+
+from ... import database
+from ...database import create_pooled_engine, db_read_session, pool_stats
+from ...models.pagination import EventPaginationParams
+from ...services import EventService, PermissionService
+from ...services.event_count_cache import EventCountCache
+from ...services.permission_engine import PermissionEngine
+
+# Data Setup and Injected Service Fixtures
+from .core_data import setup_insert_data_fixture
+
+# Data Models for Fake Data Inserted in Setup
+from .event.event_test_data import events
+
+__authors__ = ["Riley Chapman"]
+__copyright__ = "Copyright 2025"
+__license__ = "MIT"
+
+
+@pytest.fixture()
+def pooled_engines(test_engine: Engine):
+    """A primary and a replica stand-in, both connected to the test database."""
+    engines = [
+        create_pooled_engine(
+            test_engine.url, name, pool_size=2, max_overflow=1, pool_timeout=0.1
+        )
+        for name in ("primary", "replica")
+    ]
+    yield engines
+    for engine in engines:
+        engine.dispose()
+
+
+def test_pool_settings(pooled_engines: list[Engine]):
+    primary, _ = pooled_engines
+    stats = pool_stats(primary)
+    assert stats.name == "primary"
+    assert stats.size == 2
+    assert stats.max_overflow == 1
+    assert stats.checked_out == 0
+
+
+def test_checkouts_beyond_pool_size_are_overflow(pooled_engines: list[Engine]):
+    """Checkouts beyond the pool size are counted as overflow until the pool times out."""
+    primary, _ = pooled_engines
+    connections = [primary.connect() for _ in range(3)]
+    stats = pool_stats(primary)
+    assert stats.checked_out == 3
+    assert stats.overflow == 1
+    assert stats.connects == 3
+    assert stats.checkouts == 3
+    assert stats.overflow_checkouts == 1
+
+    with pytest.raises(exc.TimeoutError):
+        primary.connect()
+    stats = pool_stats(primary)
+    assert stats.timeouts == 1
+    assert stats.checkouts == 3
+
+    for connection in connections:
+        connection.close()
+    assert pool_stats(primary).checked_out == 0
+
+
+def test_checkout_wait(pooled_engines: list[Engine]):
+    """Checkouts record how long they waited for a connection."""
+    primary, _ = pooled_engines
+    with primary.connect():
+        pass
+    with primary.connect():
+        pass
+    stats = pool_stats(primary)
+    assert stats.connects == 1
+    assert stats.checkouts == 2
+    assert 0 < stats.checkout_wait_ms_avg <= stats.checkout_wait_ms_max
+
+
+def test_metrics_survive_dispose(pooled_engines: list[Engine]):
+    """Disposing an engine recreates its pool without losing the counters."""
+    primary, _ = pooled_engines
+    with primary.connect():
+        pass
+    primary.dispose()
+    with primary.connect():
+        pass
+    stats = pool_stats(primary)
+    assert stats.connects == 2
+    assert stats.checkouts == 2
+    assert stats.checkout_wait_ms_max > 0
+
+
+def test_db_read_session_uses_replica(
+    pooled_engines: list[Engine], monkeypatch: pytest.MonkeyPatch
+):
+    primary, replica = pooled_engines
+    monkeypatch.setattr(database, "engine", primary)
+    monkeypatch.setattr(database, "replica_engine", replica)
+    with Session(primary) as session:
+        assert next(db_read_session(session)).get_bind() is replica
+    assert database.database_engines()[:2] == [primary, replica]
+
+
+def test_db_read_session_defaults_to_request_session(session: Session):
+    """Without a replica, reads share the session, and connection, of the request."""
+    if database.REPLICA_URL != "":
+        pytest.skip("A replica is configured")
+    assert next(db_read_session(session)) is session
+    assert database.database_engines()[:1] == [database.engine]
+
+
+def test_event_listing_reads_from_replica(pooled_engines: list[Engine]):
+    """Listing events issues no query against the primary."""
+    primary, replica = pooled_engines
+    with Session(primary) as session, Session(replica) as read_session:
+        event_svc = EventService(
+            session,
+            PermissionService(session, PermissionEngine()),
+            read_session=read_session,
+            count_cache=EventCountCache(),
+        )
+        page = event_svc.get_paginated_events(
+            EventPaginationParams(order_by="id", page_size=100)
+        )
+    assert page.length == len(events)
+    assert pool_stats(primary).checkouts == 0
+    assert pool_stats(replica).checkouts == 1
@@ -0,0 +1,163 @@
+"""Tests for listing events by cursor, searching them, and counting them."""
+
+from datetime import timedelta
+
+import pytest
+from sqlalchemy import insert, text
+from sqlalchemy.orm import Session
+
+from ....entities import EventEntity
+from ....models import EventCursorParams, EventPaginationParams
+from ....services import EventService
+from ..query_counter import count_queries
+from ..query_plan import explain_queries
+
+# Injected Service Fixtures
+from ..fixtures import user_svc_integration, event_svc_integration
+
+# Explicitly import Data Fixture to load entities in database
+from ..core_data import setup_insert_data_fixture
+
+# Data Models for Fake Data Inserted in Setup
+from .event_test_data import event_one, event_two, event_three, to_add
+from .event_demo_data import date_maker
+from ..organization.organization_test_data import cads, cssg
+from ..user_data import root, ambassador
+
+__authors__ = ["Riley Chapman"]
+__copyright__ = "Copyright 2025"
+__license__ = "MIT"
+
+
+def page_through(event_svc: EventService, params: EventCursorParams) -> list[list[int]]:
+    """Returns the IDs of the events of every page, following the cursors to the last."""
+    pages = []
+    while True:
+        page = event_svc.get_events_by_cursor(params, ambassador)
+        pages.append([event.id for event in page.items])
+        if page.next is None:
+            return pages
+        params = params.model_copy(update={"after": page.next})
+
+
+def search(event_svc: EventService, filter: str) -> list[int]:
+    """Returns the IDs of the events matching a search, most relevant first."""
+    page = event_svc.get_paginated_events(
+        EventPaginationParams(filter=filter, order_by="relevance"), ambassador
+    )
+    return [event.id for event in page.items]
+
+
+def test_cursor_pages_in_order_of_start(event_svc_integration: EventService):
+    """Events two and three start at the same time, and are ordered by ID."""
+    pages = page_through(event_svc_integration, EventCursorParams(page_size=1))
+    assert pages == [[event_one.id], [event_two.id], [event_three.id]]
+
+
+def test_cursor_descending(event_svc_integration: EventService):
+    pages = page_through(
+        event_svc_integration, EventCursorParams(page_size=2, ascending=False)
+    )
+    assert pages == [[event_three.id, event_two.id], [event_one.id]]
+
+
+def test_cursor_length(event_svc_integration: EventService):
+    page = event_svc_integration.get_events_by_cursor(EventCursorParams(page_size=1))
+    assert page.length == 3
+    assert page.next is not None
+
+
+def test_cursor_time_range(event_svc_integration: EventService):
+    params = EventCursorParams(
+        range_start=date_maker(days_in_future=2, hour=0, minutes=0).isoformat(),
+        range_end=date_maker(days_in_future=3, hour=0, minutes=0).isoformat(),
+    )
+    assert page_through(event_svc_integration, params) == [
+        [event_two.id, event_three.id]
+    ]
+
+
+def test_invalid_cursor(event_svc_integration: EventService):
+    with pytest.raises(ValueError):
+        event_svc_integration.get_events_by_cursor(
+            EventCursorParams(after="not a cursor")
+        )
+
+
+def test_search_matches_prefixes_and_stems(event_svc_integration: EventService):
+    assert search(event_svc_integration, "Work") == [event_two.id]
+    assert search(event_svc_integration, "workshops") == [event_two.id]
+    assert search(event_svc_integration, "exclusive meeting") == [event_three.id]
+    assert search(event_svc_integration, "exclusive workshop") == []
+
+
+def test_search_without_words(event_svc_integration: EventService):
+    assert len(search(event_svc_integration, "+ -")) == 3
+
+
+def test_search_matches_organizations(event_svc_integration: EventService):
+    assert len(search(event_svc_integration, "Social Good")) == 3
+    assert len(search(event_svc_integration, cssg.slug)) == 3
+    assert search(event_svc_integration, cads.slug) == []
+
+
+def test_search_ranks_name_matches_first(event_svc_integration: EventService):
+    """The new event is named after the challenge event one only describes."""
+    created = event_svc_integration.create(root, to_add)
+    assert search(event_svc_integration, "data challenge") == [
+        created.id,
+        event_one.id,
+    ]
+
+
+def test_counts_are_cached_until_events_change(
+    session: Session, event_svc_integration: EventService
+):
+    params = EventPaginationParams(filter=cads.slug)
+    assert event_svc_integration.get_paginated_events(params).length == 0
+    with count_queries(session) as queries:
+        event_svc_integration.get_paginated_events(params)
+    assert not any("count(*)" in query for query in queries)
+
+    event_svc_integration.create(root, to_add)
+    assert event_svc_integration.get_paginated_events(params).length == 1
+    stats = event_svc_integration._count_cache.stats()
+    assert (stats.hits, stats.misses) == (1, 2)
+
+
+def test_search_and_cursor_use_indexes(
+    session: Session, event_svc_integration: EventService
+):
+    """With a few thousand events, listings read the event table through its indexes."""
+    start = date_maker(days_in_future=10, hour=9, minutes=0)
+    session.execute(
+        insert(EventEntity),
+        [
+            {
+                "name": f"Seminar {index}",
+                "start": start + timedelta(hours=index),
+                "end": start + timedelta(hours=index + 1),
+                "location": "Sitterson Hall",
+                "description": f"A talk about topic {index % 50}.",
+                "public": True,
+                "registration_limit": 50,
+                "organization_id": cads.id,
+            }
+            for index in range(3000)
+        ],
+    )
+    session.commit()
+    # Autovacuum moves new entries of the search index out of its pending list in production
+    session.execute(text("SELECT gin_clean_pending_list('event_search_idx')"))
+    session.execute(text("ANALYZE event"))
+
+    page = event_svc_integration.get_events_by_cursor(EventCursorParams(page_size=1000))
+    with explain_queries(session) as plans:
+        search(event_svc_integration, "Workshop")
+        event_svc_integration.get_events_by_cursor(
+            EventCursorParams(after=page.next, page_size=10)
+        )
+    plans = [plan for plan in plans if "FROM event" in plan.statement]
+    assert all("event" not in plan.sequential_scans for plan in plans)
+    assert "event_search_idx" in set().union(*(plan.indexes for plan in plans))
+    assert "event_start_id_idx" in set().union(*(plan.indexes for plan in plans))
@@ -13,6 +13,7 @@ from .event_demo_data import date_maker
 from ..organization.organization_test_data import cads, cssg
 from ..user_data import root, ambassador, user
 from ..reset_table_id_seq import reset_table_id_seq
+from ....services.event import recount_registrations
 
 __authors__ = ["Ajay Gandecha"]
 __copyright__ = "Copyright 2023"
@@ -272,6 +273,8 @@ def insert_fake_data(session: Session):
     for registration in registrations:
         registration_entity = EventRegistrationEntity.from_new_model(registration)
         session.add(registration_entity)
+    session.flush()
+    recount_registrations(session)
 
     # Reset table IDs to prevent ID conflicts
     reset_table_id_seq(session, EventEntity, EventEntity.id, len(events) + 1)
@@ -0,0 +1,212 @@
+"""Tests for the registration counts EventService maintains on events."""
+
+import threading
+
+import pytest
+from sqlalchemy import Engine, insert, select, func
+from sqlalchemy.orm import Session
+
+from ....entities import EventEntity, EventRegistrationEntity, UserEntity
+from ....models import EventPaginationParams, User
+from ....models.registration_type import RegistrationType
+from ....services import EventService, PermissionService, UserService
+from ....services.event import recount_registrations
+from ....services.event_count_cache import EventCountCache
+from ....services.exceptions import EventRegistrationException
+from ....services.identity import IdentityCache
+from ....services.permission_engine import PermissionEngine
+from ....services.user_search import trigram_search
+from ..query_counter import count_queries
+
+# Injected Service Fixtures
+from ..fixtures import user_svc_integration, event_svc_integration
+
+# Explicitly import Data Fixture to load entities in database
+from ..core_data import setup_insert_data_fixture
+
+# Data Models for Fake Data Inserted in Setup
+from .event_test_data import event_one, event_three, updated_event_one_organizers
+from ..user_data import root, ambassador, user
+
+__authors__ = ["Riley Chapman"]
+__copyright__ = "Copyright 2025"
+__license__ = "MIT"
+
+# Fewer than the connections the pool of the test engine allows at once
+REGISTRANTS = 12
+LIMIT = 5
+
+
+def counts(session: Session, event_id: int) -> tuple[int, int]:
+    """Returns the stored attendee and organizer counts of an event."""
+    session.expire_all()
+    event = session.get_one(EventEntity, event_id)
+    return event.attendee_count, event.organizer_count
+
+
+def registrations(session: Session, event_id: int) -> tuple[int, int]:
+    """Returns the attendee and organizer counts of an event, counted from its registrations."""
+    count = lambda registration_type: session.scalar(
+        select(func.count())
+        .select_from(EventRegistrationEntity)
+        .where(
+            EventRegistrationEntity.event_id == event_id,
+            EventRegistrationEntity.registration_type == registration_type,
+        )
+    )
+    return count(RegistrationType.ATTENDEE), count(RegistrationType.ORGANIZER)
+
+
+def insert_registrants(session: Session) -> list[User]:
+    """Inserts users with no registrations, to register for events."""
+    session.execute(
+        insert(UserEntity),
+        [
+            {
+                "id": 1000 + index,
+                "pid": 800_000_000 + index,
+                "onyen": f"registrant{index}",
+                "email": f"registrant{index}@unc.edu",
+                "first_name": "Registrant",
+                "last_name": f"{index}",
+            }
+            for index in range(REGISTRANTS)
+        ],
+    )
+    session.commit()
+    return [
+        User(id=1000 + index, pid=800_000_000 + index, onyen=f"registrant{index}")
+        for index in range(REGISTRANTS)
+    ]
+
+
+def test_fake_data_counts(session: Session):
+    assert counts(session, event_one.id) == registrations(session, event_one.id)
+    assert counts(session, event_one.id) == (1, 1)
+    assert counts(session, event_three.id) == (1, 0)
+
+
+def test_overview_number_registered(event_svc_integration: EventService):
+    assert event_svc_integration.get_by_id(event_one.id).number_registered == 1
+
+
+def test_register_and_unregister_count(
+    session: Session, event_svc_integration: EventService
+):
+    event = event_svc_integration.get_by_id(event_one.id)
+    event_svc_integration.register(root, root, event)
+    event_svc_integration.register(root, root, event)
+    assert counts(session, event_one.id) == (2, 1)
+
+    event_svc_integration.unregister(root, root, event)
+    event_svc_integration.unregister(root, root, event)
+    assert counts(session, event_one.id) == (1, 1)
+    # Organizers cannot unregister, and keep their count
+    event_svc_integration.unregister(user, user, event)
+    assert counts(session, event_one.id) == registrations(session, event_one.id)
+
+
+def test_full_event_is_not_counted(
+    session: Session, event_svc_integration: EventService
+):
+    event = event_svc_integration.get_by_id(event_three.id)
+    with pytest.raises(EventRegistrationException):
+        event_svc_integration.register(user, user, event)
+    assert counts(session, event_three.id) == (1, 0)
+
+
+def test_update_organizers_count(session: Session, event_svc_integration: EventService):
+    """The attendee promoted to organizer moves from one count to the other."""
+    event_svc_integration.update(root, updated_event_one_organizers)
+    assert counts(session, event_one.id) == registrations(session, event_one.id)
+
+
+def test_create_counts_organizers(
+    session: Session, event_svc_integration: EventService
+):
+    draft = updated_event_one_organizers.model_copy(update={"id": None})
+    created = event_svc_integration.create(root, draft)
+    assert counts(session, created.id) == (0, len(draft.organizers))
+
+
+def test_recount_registrations(session: Session):
+    session.get_one(EventEntity, event_one.id).attendee_count = 40
+    session.commit()
+
+    recount_registrations(session)
+    session.commit()
+    assert counts(session, event_one.id) == (1, 1)
+
+
+def test_paginated_queries_are_bounded(
+    session: Session, event_svc_integration: EventService
+):
+    """Listing events costs the same statements however many registered for them."""
+    params = EventPaginationParams(order_by="id")
+    # Counts the events, which later pages take from the cache
+    event_svc_integration.get_paginated_events(params, ambassador)
+    with count_queries(session) as queries:
+        event_svc_integration.get_paginated_events(params, ambassador)
+    before = len(queries)
+
+    for registrant in insert_registrants(session):
+        event = event_svc_integration.get_by_id(event_one.id)
+        event_svc_integration.register(registrant, registrant, event)
+
+    with count_queries(session) as queries:
+        page = event_svc_integration.get_paginated_events(params, ambassador)
+    assert len(queries) == before
+    assert page.items[0].number_registered == 1 + REGISTRANTS
+
+
+def test_concurrent_registrations_respect_limit(
+    session: Session, test_engine: Engine, event_svc_integration: EventService
+):
+    """Registrants racing for the last spots of an event never exceed its limit."""
+    registrants = insert_registrants(session)
+    session.get_one(EventEntity, event_one.id).registration_limit = LIMIT
+    session.commit()
+    event = event_svc_integration.get_by_id(event_one.id)
+
+    barrier = threading.Barrier(REGISTRANTS)
+    outcomes: list[str] = []
+    lock = threading.Lock()
+
+    def register(registrant: User):
+        with Session(test_engine) as thread_session:
+            permission_svc = PermissionService(thread_session, PermissionEngine())
+            event_svc = EventService(
+                thread_session,
+                permission_svc,
+                UserService(
+                    thread_session,
+                    permission_svc,
+                    IdentityCache(),
+                    trigram_search,
+                ),
+                thread_session,
+                EventCountCache(),
+            )
+            barrier.wait(timeout=30)
+            try:
+                event_svc.register(registrant, registrant, event)
+                outcome = "registered"
+            except EventRegistrationException:
+                outcome = "full"
+        with lock:
+            outcomes.append(outcome)
+
+    threads = [
+        threading.Thread(target=register, args=(registrant,))
+        for registrant in registrants
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # The ambassador was registered already
+    assert outcomes.count("registered") == LIMIT - 1
+    assert outcomes.count("full") == REGISTRANTS - LIMIT + 1
+    assert counts(session, event_one.id) == registrations(session, event_one.id)
+    assert counts(session, event_one.id) == (LIMIT, 1)
@@ -15,7 +15,13 @@ from ...services import (
 )
 from ...services.academics import HiringService
 from ...services.article import ArticleService
+from ...services.welcome_overview_cache import WelcomeOverviewCache
+from ...services.identity import IdentityCache
+from ...services.event_count_cache import EventCountCache
+from ...services.permission_engine import PermissionEngine
+from ...services.user_search import trigram_search
 from ...services.coworking import (
+    CheckinLeaderboardService,
     PolicyService,
     OperatingHoursService,
     ReservationService,
@@ -29,7 +35,7 @@ __license__ = "MIT"
 
 @pytest.fixture()
 def permission_svc(session: Session):
-    return PermissionService(session)
+    return PermissionService(session, PermissionEngine())
 
 
 @pytest.fixture()
@@ -41,13 +47,18 @@ def permission_svc_mock():
 @pytest.fixture()
 def user_svc(session: Session, permission_svc_mock: PermissionService):
     """This fixture is used to test the UserService class with a mocked PermissionService."""
-    return UserService(session, permission_svc_mock)
+    return UserService(session, permission_svc_mock, IdentityCache(), trigram_search)
 
 
 @pytest.fixture()
 def user_svc_integration(session: Session):
     """This fixture is used to test the UserService class with a real PermissionService."""
-    return UserService(session, PermissionService(session))
+    return UserService(
+        session,
+        PermissionService(session, PermissionEngine()),
+        IdentityCache(),
+        trigram_search,
+    )
 
 
 @pytest.fixture()
@@ -62,38 +73,52 @@ def signage_svc(
     seat_svc: SeatService,
     room_svc: RoomService,
 ):
-    return SignageService(session, reservation_svc, seat_svc, room_svc)
+    return SignageService(
+        session,
+        reservation_svc,
+        seat_svc,
+        room_svc,
+        CheckinLeaderboardService(session),
+    )
 
 
 @pytest.fixture()
 def organization_svc_integration(session: Session):
     """This fixture is used to test the OrganizationService class with a real PermissionService."""
-    return OrganizationService(session, PermissionService(session))
+    return OrganizationService(session, PermissionService(session, PermissionEngine()))
 
 
 @pytest.fixture()
 def event_svc_integration(session: Session, user_svc_integration: UserService):
     """This fixture is used to test the EventService class with a real PermissionService."""
-    return EventService(session, PermissionService(session))
+    return EventService(
+        session,
+        PermissionService(session, PermissionEngine()),
+        user_svc_integration,
+        session,
+        EventCountCache(),
+    )
 
 
 @pytest.fixture()
 def room_svc(session: Session):
     """RoomService fixture."""
-    return RoomService(session, PermissionService(session))
+    return RoomService(session, PermissionService(session, PermissionEngine()))
 
 
 @pytest.fixture()
 def article_svc(session: Session):
     return ArticleService(
         session,
-        PermissionService(session),
+        PermissionService(session, PermissionEngine()),
         PolicyService(),
-        OperatingHoursService(session, PermissionService(session)),
+        OperatingHoursService(session, PermissionService(session, PermissionEngine())),
+        session,
+        WelcomeOverviewCache(),
     )
 
 
 @pytest.fixture()
 def application_svc(session: Session):
     """ApplicationService fixture."""
-    return ApplicationService(session, PermissionService(session))
+    return ApplicationService(session, PermissionService(session, PermissionEngine()))
@@ -0,0 +1,175 @@
+"""Tests for resolving the subject of requests through the identity cache."""
+
+import pytest
+from sqlalchemy.orm import Session
+
+from ...models import Permission, User
+from ...services import PermissionService, UserService
+from ...services.identity import IdentityCache
+from ...services.permission_engine import PermissionEngine
+from ...services.user_search import trigram_search
+
+# Data Setup and Injected Service Fixtures
+from .core_data import setup_insert_data_fixture
+from .clock import FakeClock
+from .query_counter import count_queries
+
+# Data Models for Fake Data Inserted in Setup
+from .user_data import root, ambassador, user
+from .permission_data import (
+    ambassador_permission,
+    ambassador_permission_coworking_reservation,
+)
+
+__authors__ = ["Riley Chapman"]
+__copyright__ = "Copyright 2025"
+__license__ = "MIT"
+
+
+@pytest.fixture()
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+@pytest.fixture()
+def identity(clock: FakeClock) -> IdentityCache:
+    return IdentityCache(ttl=10, clock=clock)
+
+
+@pytest.fixture()
+def engine() -> PermissionEngine:
+    return PermissionEngine()
+
+
+def request_user_svc(
+    session: Session, engine: PermissionEngine, identity: IdentityCache
+) -> UserService:
+    """Builds the services of one request, sharing the application-wide caches."""
+    return UserService(
+        session, PermissionService(session, engine), identity, trigram_search
+    )
+
+
+def test_resolve_loads_once_per_token(identity: IdentityCache):
+    """A token's user is loaded once and a newly issued token loads it again."""
+    loads = []
+
+    def load() -> User:
+        loads.append(ambassador.pid)
+        return ambassador
+
+    assert identity.resolve(ambassador.pid, 1, load) == ambassador
+    assert identity.resolve(ambassador.pid, 1, load) == ambassador
+    assert len(loads) == 1
+    identity.resolve(ambassador.pid, 2, load)
+    assert len(loads) == 2
+
+
+def test_resolve_expires(identity: IdentityCache, clock: FakeClock):
+    """Users are loaded again once they are older than the TTL."""
+    loads = []
+    identity.resolve(ambassador.pid, 1, lambda: loads.append(1) or ambassador)
+    clock.now = 11
+    identity.resolve(ambassador.pid, 1, lambda: loads.append(1) or ambassador)
+    assert len(loads) == 2
+
+
+def test_resolve_does_not_cache_missing_users(identity: IdentityCache):
+    """Tokens of unregistered PIDs are not cached, so registering takes effect at once."""
+    assert identity.resolve(123, 1, lambda: None) is None
+    assert identity.resolve(123, 1, lambda: ambassador) == ambassador
+
+
+def test_invalidate_drops_every_token_of_a_pid(identity: IdentityCache):
+    identity.resolve(ambassador.pid, 1, lambda: ambassador)
+    identity.resolve(ambassador.pid, 2, lambda: ambassador)
+    identity.resolve(root.pid, 1, lambda: root)
+    identity.invalidate(ambassador.pid)
+    assert len(identity) == 1
+
+
+def test_least_recently_used_tokens_are_evicted():
+    identity = IdentityCache(max_entries=2)
+    identity.resolve(root.pid, 1, lambda: root)
+    identity.resolve(ambassador.pid, 1, lambda: ambassador)
+    identity.resolve(root.pid, 1, lambda: root)
+    identity.resolve(user.pid, 1, lambda: user)
+    assert len(identity) == 2
+    assert identity.resolve(root.pid, 1, lambda: None) == root
+
+
+def test_get_by_token(session: Session, engine, identity):
+    """Resolving a token returns the same details as looking the user up by PID."""
+    details = request_user_svc(session, engine, identity).get_by_token(
+        ambassador.pid, 1
+    )
+    assert details == request_user_svc(session, engine, identity).get(ambassador.pid)
+    assert details.permissions == [
+        ambassador_permission,
+        ambassador_permission_coworking_reservation,
+    ]
+
+
+def test_get_by_token_unregistered(session: Session, engine, identity):
+    assert request_user_svc(session, engine, identity).get_by_token(123, 1) is None
+
+
+def test_repeated_requests_issue_no_queries(session: Session, engine, identity):
+    """Once a token is resolved, later requests resolve and authorize without queries."""
+    request_user_svc(session, engine, identity).get_by_token(ambassador.pid, 1)
+
+    with count_queries(session) as statements:
+        user_svc = request_user_svc(session, engine, identity)
+        subject = user_svc.get_by_token(ambassador.pid, 1)
+        user_svc._permission.enforce(subject, "checkin.create", "checkin")
+        user_svc._permission.enforce(subject, "coworking.reservation.read", "user/1")
+    assert statements == []
+
+
+def test_permissions_are_read_once_per_request(session: Session, engine, identity):
+    """A request consults the permission engine once per subject."""
+    user_svc = request_user_svc(session, engine, identity)
+    subject = user_svc.get_by_token(ambassador.pid, 1)
+    for _ in range(5):
+        user_svc._permission.check(subject, "checkin.create", "checkin")
+    stats = engine.stats()
+    assert stats.hits + stats.misses == 1
+
+
+def test_permission_changes_reach_cached_identities(session: Session, engine, identity):
+    """Granting a permission takes effect for users resolved from the identity cache."""
+    request_user_svc(session, engine, identity).get_by_token(user.pid, 1)
+    PermissionService(session, engine).grant(
+        root, user, Permission(action="user.list", resource="user/")
+    )
+    details = request_user_svc(session, engine, identity).get_by_token(user.pid, 1)
+    assert [p.action for p in details.permissions] == ["user.list"]
+
+
+def test_update_invalidates(session: Session, engine, identity):
+    """Updating a user takes effect for requests resolved from the identity cache."""
+    user_svc = request_user_svc(session, engine, identity)
+    details = user_svc.get_by_token(ambassador.pid, 1)
+    details.first_name = "Andy"
+    user_svc.update(root, details)
+    resolved = request_user_svc(session, engine, identity).get_by_token(
+        ambassador.pid, 1
+    )
+    assert resolved.first_name == "Andy"
+
+
+def test_stats_count_round_trips_saved(session: Session, engine, identity):
+    """Each user hit saves the user query and each permission hit the grants query."""
+    for _ in range(4):
+        user_svc = request_user_svc(session, engine, identity)
+        subject = user_svc.get_by_token(ambassador.pid, 1)
+        user_svc._permission.check(subject, "checkin.create", "checkin")
+
+    stats = identity.stats(engine)
+    assert stats.requests == 4
+    assert stats.user_hits == 3
+    assert stats.user_misses == 1
+    assert stats.permission_hits == 3
+    assert stats.permission_misses == 1
+    assert stats.round_trips_saved == 6
+    assert stats.round_trips_saved_per_request == 1.5
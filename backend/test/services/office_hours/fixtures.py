@@ -8,7 +8,24 @@ from ....services.office_hours.office_hours_recurrence import (
     OfficeHoursRecurrenceService,
 )
 from ....services import PermissionService
+from ....services.permission_engine import PermissionEngine
 from ....services.office_hours import OfficeHourTicketService, OfficeHoursService
+from ....services.office_hours.live_queue import LiveQueueRegistry
+from ....services.office_hours.queue_broker import OfficeHoursQueueBroker
+from ....services.office_hours.similar_tickets_cache import (
+    InMemoryCacheBackend,
+    SimilarTicketCache,
+)
+from ....services.office_hours.similar_tickets_candidates import (
+    SimilarTicketCandidateService,
+)
+from ....services.office_hours.similar_tickets_precompute import (
+    SimilarTicketPrecomputeService,
+)
+from ....services.office_hours.similar_tickets_index import (
+    SimilarTicketIndexService,
+    hashing_embedding,
+)
 
 __authors__ = ["Meghan Sun", "Jade Keegan"]
 __copyright__ = "Copyright 2024"
@@ -18,13 +35,13 @@ __license__ = "MIT"
 @pytest.fixture()
 def permission_svc(session: Session):
     """PermissionService fixture."""
-    return PermissionService(session)
+    return PermissionService(session, PermissionEngine())
 
 
 @pytest.fixture()
 def oh_svc(session: Session):
     """OfficeHoursEventService fixture."""
-    return OfficeHoursService(session)
+    return OfficeHoursService(session, LiveQueueRegistry())
 
 
 @pytest.fixture()
@@ -33,13 +50,42 @@ def oh_svc_mock():
     return create_autospec(OfficeHoursService)
 
 
+@pytest.fixture()
+def similar_ticket_index_svc(session: Session):
+    """SimilarTicketIndexService fixture using the offline embedding function."""
+    return SimilarTicketIndexService(session, hashing_embedding)
+
+
+@pytest.fixture()
+def similar_ticket_cache():
+    """SimilarTicketCache fixture backed by a fresh in-process cache."""
+    return SimilarTicketCache(InMemoryCacheBackend())
+
+
+@pytest.fixture()
+def similar_ticket_candidate_svc(session: Session):
+    """SimilarTicketCandidateService fixture using the offline embedding function."""
+    return SimilarTicketCandidateService(
+        session, SimilarTicketIndexService(session, hashing_embedding)
+    )
+
+
 @pytest.fixture()
 def oh_ticket_svc(session: Session):
     """OfficeHoursEventService fixture."""
-    return OfficeHourTicketService(session)
+    return OfficeHourTicketService(
+        session,
+        SimilarTicketIndexService(session, hashing_embedding),
+        SimilarTicketCache(InMemoryCacheBackend()),
+        create_autospec(SimilarTicketPrecomputeService, instance=True),
+        create_autospec(OfficeHoursQueueBroker, instance=True),
+        LiveQueueRegistry(),
+    )
 
 
 @pytest.fixture()
 def oh_recurrence_svc(session: Session):
     """OfficeHoursRecurrenceService fixture."""
-    return OfficeHoursRecurrenceService(session, OfficeHoursService(session))
+    return OfficeHoursRecurrenceService(
+        session, OfficeHoursService(session, LiveQueueRegistry())
+    )
@@ -0,0 +1,248 @@
+"""Tests for the LiveQueue and the LiveQueueRegistry."""
+
+import threading
+import time
+from datetime import datetime, timedelta
+from unittest.mock import create_autospec
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from ....entities.office_hours import OfficeHoursTicketEntity
+from ....models.office_hours.queue_event import OfficeHoursQueueEvent
+from ....models.office_hours.ticket_state import TicketState
+from ....services.office_hours import OfficeHoursService
+from ....services.office_hours.live_queue import LiveQueue, LiveQueueRegistry
+from ....services.office_hours.queue_broker import OfficeHoursQueueBroker
+from ....services.office_hours.similar_tickets_cache import (
+    InMemoryCacheBackend,
+    SimilarTicketCache,
+)
+from ....services.office_hours.similar_tickets_index import (
+    SimilarTicketIndexService,
+    hashing_embedding,
+)
+from ....services.office_hours.similar_tickets_precompute import (
+    SimilarTicketPrecomputeService,
+)
+from ....services.office_hours.ticket import OfficeHourTicketService
+
+# Import the setup_teardown fixture explicitly to load entities in database
+from ..core_data import setup_insert_data_fixture as insert_order_0
+from ..academics.term_data import fake_data_fixture as insert_order_1
+from ..academics.course_data import fake_data_fixture as insert_order_2
+from ..academics.section_data import fake_data_fixture as insert_order_3
+from ..room_data import fake_data_fixture as insert_order_4
+from ..office_hours.office_hours_data import fake_data_fixture as insert_order_5
+
+# Import the fake model data in a namespace for test assertions
+from .. import user_data
+from ..office_hours import office_hours_data
+
+__authors__ = ["Riley Chapman"]
+__copyright__ = "Copyright 2025"
+__license__ = "MIT"
+
+
+OFFICE_HOURS_ID = office_hours_data.comp_110_current_office_hours.id
+
+
+def sorted_queue_ids(session: Session) -> list[int]:
+    """Computes the queue the way the get help overview did before the live queue."""
+    tickets = session.scalars(
+        select(OfficeHoursTicketEntity).where(
+            OfficeHoursTicketEntity.office_hours_id == OFFICE_HOURS_ID
+        )
+    ).all()
+    queued = [ticket for ticket in tickets if ticket.state == TicketState.QUEUED]
+    return [ticket.id for ticket in sorted(queued, key=lambda t: (t.created_at, t.id))]
+
+
+def test_live_queue_orders_by_creation():
+    """Ensures positions follow creation time and shift as tickets leave the queue."""
+    start = datetime(2025, 3, 3, 14, 0)
+    queue = LiveQueue()
+    queue.enqueue(3, start + timedelta(minutes=2))
+    queue.enqueue(1, start)
+    queue.enqueue(2, start + timedelta(minutes=1))
+
+    assert queue.queued_ids() == [1, 2, 3]
+    assert queue.position(3) == 3
+
+    queue.call(1)
+    queue.remove(2)
+    assert queue.position(3) == 1
+    assert queue.position(1) == -1
+    assert queue.called == {1}
+
+    queue.remove(1)
+    assert queue.called == set()
+    assert len(queue) == 1
+
+
+def test_rehydrate_matches_database(session: Session):
+    """Ensures a rehydrated queue reports the positions of a full sort of the tickets."""
+    registry = LiveQueueRegistry()
+    assert registry.rehydrate(session) >= 1
+
+    expected = sorted_queue_ids(session)
+    assert registry.queued_ids(session, OFFICE_HOURS_ID) == expected
+    for position, ticket_id in enumerate(expected, start=1):
+        assert registry.queue_position(session, OFFICE_HOURS_ID, ticket_id) == position
+    assert registry.check(session, OFFICE_HOURS_ID).consistent
+
+
+def test_ticket_changes_maintain_live_queue(session: Session):
+    """Ensures create, call, cancel and close keep the live queue equal to the database."""
+    registry = LiveQueueRegistry(max_age=float("inf"))
+    ticket_svc = OfficeHourTicketService(
+        session,
+        SimilarTicketIndexService(session, hashing_embedding),
+        SimilarTicketCache(InMemoryCacheBackend()),
+        create_autospec(SimilarTicketPrecomputeService, instance=True),
+        create_autospec(OfficeHoursQueueBroker, instance=True),
+        registry,
+    )
+    registry.rehydrate(session, OFFICE_HOURS_ID)
+
+    created = ticket_svc.create_ticket(user_data.user, office_hours_data.new_ticket)
+    queued = sorted_queue_ids(session)
+    assert registry.queue_position(session, OFFICE_HOURS_ID, created.id) == len(queued)
+
+    first, second = queued[0], queued[1]
+    ticket_svc.call_ticket(user_data.instructor, first)
+    ticket_svc.cancel_ticket(user_data.instructor, second)
+    assert (
+        registry.queue_position(session, OFFICE_HOURS_ID, created.id) == len(queued) - 2
+    )
+
+    consistency = registry.check(session, OFFICE_HOURS_ID)
+    assert consistency.consistent
+    assert registry.queued_ids(session, OFFICE_HOURS_ID) == sorted_queue_ids(session)
+
+
+def test_check_repairs_changes_missed_by_the_process(session: Session):
+    """Ensures the consistency check finds and repairs changes made by another worker."""
+    registry = LiveQueueRegistry(max_age=float("inf"))
+    registry.rehydrate(session, OFFICE_HOURS_ID)
+
+    ticket = session.get(
+        OfficeHoursTicketEntity, office_hours_data.comp_110_queued_ticket_1.id
+    )
+    ticket.state = TicketState.CALLED
+    session.commit()
+
+    consistency = registry.check(session, OFFICE_HOURS_ID)
+    assert not consistency.consistent
+    assert consistency.unexpected_queued == [ticket.id]
+    assert consistency.missing_called == [ticket.id]
+    assert registry.check(session, OFFICE_HOURS_ID).consistent
+    assert registry.queue_position(session, OFFICE_HOURS_ID, ticket.id) == -1
+
+
+def test_stale_queue_reloads(session: Session):
+    """Ensures a queue older than the maximum age is read again from the database."""
+    now = [0.0]
+    registry = LiveQueueRegistry(max_age=5, clock=lambda: now[0])
+    ticket_id = office_hours_data.comp_110_queued_ticket_1.id
+    position = registry.queue_position(session, OFFICE_HOURS_ID, ticket_id)
+    assert position >= 1
+
+    session.get(OfficeHoursTicketEntity, ticket_id).state = TicketState.CANCELED
+    session.commit()
+
+    now[0] = 4
+    assert registry.queue_position(session, OFFICE_HOURS_ID, ticket_id) == position
+    now[0] = 6
+    assert registry.queue_position(session, OFFICE_HOURS_ID, ticket_id) == -1
+
+
+def test_get_help_overview_uses_live_queue(session: Session):
+    """Ensures the get help overview reads the student's position from the live queue."""
+    registry = LiveQueueRegistry()
+    overview = OfficeHoursService(session, registry).get_office_hour_get_help_overview(
+        user_data.student, OFFICE_HOURS_ID
+    )
+
+    assert overview.ticket is not None
+    assert overview.ticket.state == TicketState.QUEUED.to_string()
+    assert overview.queue_position == (
+        sorted_queue_ids(session).index(overview.ticket.id) + 1
+    )
+    assert overview.queue_position == registry.queue_position(
+        session, OFFICE_HOURS_ID, overview.ticket.id
+    )
+
+
+class PausedSession:
+    """Session whose queries wait until released, standing in for a slow database."""
+
+    def __init__(self, session: Session):
+        self._session = session
+        self.querying = threading.Event()
+        self.release = threading.Event()
+
+    def execute(self, *args, **kwargs):
+        self.querying.set()
+        self.release.wait(timeout=10)
+        return self._session.execute(*args, **kwargs)
+
+
+def test_reload_does_not_block_other_events(session: Session):
+    """Ensures reading a fresh queue does not wait on another event's queue being reloaded."""
+    now = [0.0]
+    registry = LiveQueueRegistry(max_age=5, clock=lambda: now[0])
+    registry.rehydrate(session, OFFICE_HOURS_ID)
+    now[0] = 6
+    other_office_hours_id = OFFICE_HOURS_ID + 1000
+    assert registry.queued_ids(session, other_office_hours_id) == []
+
+    paused = PausedSession(session)
+    reload = threading.Thread(
+        target=registry.queued_ids, args=(paused, OFFICE_HOURS_ID)
+    )
+    reload.start()
+    assert paused.querying.wait(timeout=10)
+    # Releases the reload in case the read below waits on it
+    threading.Timer(2, paused.release.set).start()
+
+    start = time.monotonic()
+    assert registry.queued_ids(session, other_office_hours_id) == []
+    assert time.monotonic() - start < 1
+    paused.release.set()
+    reload.join(timeout=10)
+
+
+def test_reload_replays_changes_applied_while_loading(session: Session):
+    """Ensures a change applied while a queue is read is not lost when the queue is swapped in."""
+    registry = LiveQueueRegistry(max_age=float("inf"))
+    paused = PausedSession(session)
+    positions: list[int] = []
+    ticket = office_hours_data.comp_110_queued_ticket_1.model_copy(
+        update={
+            "id": 9999,
+            "state": TicketState.QUEUED.to_string(),
+            "created_at": datetime.now() + timedelta(hours=1),
+        }
+    )
+    load = threading.Thread(
+        target=lambda: positions.append(
+            registry.queue_position(paused, OFFICE_HOURS_ID, ticket.id)
+        )
+    )
+    load.start()
+    assert paused.querying.wait(timeout=10)
+
+    registry.apply(
+        OfficeHoursQueueEvent(
+            type="ticket_created",
+            office_hours_id=OFFICE_HOURS_ID,
+            ticket=ticket,
+            creator_ids=[],
+            previous_state=None,
+        )
+    )
+    paused.release.set()
+    load.join(timeout=10)
+
+    assert positions == [len(sorted_queue_ids(session)) + 1]
@@ -38,6 +38,10 @@ from ....models.office_hours.course_site import (
 from ....models.office_hours.ticket import OfficeHoursTicket, NewOfficeHoursTicket
 from ....models.office_hours.ticket_type import TicketType
 from ....models.office_hours.ticket_state import TicketState
+from ....services.office_hours.similar_tickets_index import (
+    SimilarTicketIndexService,
+    hashing_embedding,
+)
 
 __authors__ = [
     "Ajay Gandecha",
@@ -897,6 +901,9 @@ def insert_fake_data(session: Session):
 
     session.commit()
 
+    # Step 6: Index closed tickets for similar ticket lookups
+    SimilarTicketIndexService(session, hashing_embedding).rebuild()
+
 
 @pytest.fixture(autouse=True)
 def fake_data_fixture(session: Session):
@@ -0,0 +1,183 @@
+"""Tests for the OfficeHoursQueueBroker and the GetHelpQueueTracker."""
+
+import asyncio
+import threading
+from datetime import datetime, timedelta
+
+from ....models.academics.my_courses import (
+    OfficeHourGetHelpOverview,
+    OfficeHourTicketOverview,
+)
+from ....models.office_hours.queue_event import OfficeHoursQueueEvent
+from ....services.office_hours.queue_broker import (
+    GetHelpQueueTracker,
+    OfficeHoursQueueBroker,
+)
+
+# Import the fake model data in a namespace for test assertions
+from .. import user_data
+
+__authors__ = ["Riley Chapman"]
+__copyright__ = "Copyright 2025"
+__license__ = "MIT"
+
+
+NOW = datetime(2025, 3, 3, 14, 0)
+
+
+def ticket(
+    id: int, minutes_ago: int, state: str = "Queued"
+) -> OfficeHourTicketOverview:
+    return OfficeHourTicketOverview(
+        id=id,
+        created_at=NOW - timedelta(minutes=minutes_ago),
+        called_at=None,
+        state=state,
+        type="Conceptual Help",
+        concept_help_description="How do nested loops work?",
+        assignment_section_description=None,
+        code_to_english_description=None,
+        concepts_needed_description=None,
+        tactics_tried=None,
+        meeting_summary=None,
+        solutions_used=None,
+        concepts_for_review=None,
+        caller=None,
+        caller_id=None,
+        office_hours_id=1,
+    )
+
+
+def event(
+    type: str,
+    ticket: OfficeHourTicketOverview,
+    previous_state: str | None = "Queued",
+    creator_ids: list[int] | None = None,
+) -> OfficeHoursQueueEvent:
+    return OfficeHoursQueueEvent(
+        type=type,
+        office_hours_id=ticket.office_hours_id,
+        ticket=ticket,
+        creator_ids=creator_ids or [user_data.user.id],
+        previous_state=previous_state,
+    )
+
+
+def get_help_overview(
+    ticket: OfficeHourTicketOverview | None, queue_position: int
+) -> OfficeHourGetHelpOverview:
+    return OfficeHourGetHelpOverview(
+        event_type="Office Hours",
+        event_mode="In Person",
+        event_start_time=NOW - timedelta(hours=1),
+        event_end_time=NOW + timedelta(hours=1),
+        event_location="SN 156",
+        event_location_description="Back of the room",
+        ticket=ticket,
+        queue_position=queue_position,
+    )
+
+
+def test_publish_delivers_to_subscribers_of_the_event():
+    """Ensures events reach the subscribers of their office hours event only."""
+    broker = OfficeHoursQueueBroker()
+
+    async def scenario():
+        with broker.subscription(1) as first, broker.subscription(2) as other:
+            broker.publish(event("ticket_created", ticket(10, 0), None))
+            received = await asyncio.wait_for(first.get(), 1)
+            assert other._events.empty()
+            return received
+
+    received = asyncio.run(scenario())
+    assert received.type == "ticket_created"
+    assert received.ticket.id == 10
+
+
+def test_publish_from_another_thread():
+    """Ensures events published by a threadpool route reach the subscriber's event loop."""
+    broker = OfficeHoursQueueBroker()
+
+    async def scenario():
+        with broker.subscription(1) as subscription:
+            publisher = threading.Thread(
+                target=broker.publish, args=(event("ticket_called", ticket(10, 5)),)
+            )
+            publisher.start()
+            received = await asyncio.wait_for(subscription.get(), 1)
+            publisher.join()
+            return received
+
+    assert asyncio.run(scenario()).type == "ticket_called"
+
+
+def test_slow_subscriber_is_asked_to_reload():
+    """Ensures a subscriber that falls behind gets None instead of unbounded events."""
+    broker = OfficeHoursQueueBroker(max_pending=2)
+
+    async def scenario():
+        with broker.subscription(1) as subscription:
+            for ticket_id in range(5):
+                broker.publish(event("ticket_created", ticket(ticket_id, 0), None))
+            await asyncio.sleep(0)
+            return await asyncio.wait_for(subscription.get(), 1)
+
+    assert asyncio.run(scenario()) is None
+
+
+def test_subscription_ends_with_block():
+    """Ensures leaving the `with` block unsubscribes."""
+    broker = OfficeHoursQueueBroker()
+
+    async def scenario():
+        with broker.subscription(1):
+            assert broker.subscriber_count(1) == 1
+        assert broker.subscriber_count(1) == 0
+        broker.publish(event("ticket_created", ticket(10, 0), None))
+
+    asyncio.run(scenario())
+
+
+def test_tracker_moves_up_when_earlier_ticket_leaves_queue():
+    """Ensures calling or canceling a ticket ahead moves the student up without a reload."""
+    tracker = GetHelpQueueTracker(
+        user_data.student, get_help_overview(ticket(20, 5), 3)
+    )
+
+    called = event("ticket_called", ticket(10, 10, "Called"))
+    canceled = event("ticket_canceled", ticket(11, 8, "Cancelled"))
+    assert not tracker.needs_reload(called)
+    assert tracker.apply(called)
+    assert tracker.apply(canceled)
+    assert tracker.overview.queue_position == 1
+
+
+def test_tracker_ignores_changes_that_do_not_move_the_student():
+    """Ensures later tickets and tickets that already left the queue keep the position."""
+    tracker = GetHelpQueueTracker(
+        user_data.student, get_help_overview(ticket(20, 5), 3)
+    )
+
+    assert not tracker.apply(event("ticket_created", ticket(30, 0), None))
+    assert not tracker.apply(event("ticket_called", ticket(30, 1, "Called")))
+    assert not tracker.apply(
+        event("ticket_closed", ticket(10, 10, "Closed"), previous_state="Called")
+    )
+    assert not tracker.apply(
+        event("ticket_canceled", ticket(11, 10, "Cancelled"), previous_state="Called")
+    )
+    assert tracker.overview.queue_position == 3
+
+
+def test_tracker_reloads_for_own_ticket():
+    """Ensures events about the student's own ticket ask for a fresh snapshot."""
+    tracker = GetHelpQueueTracker(user_data.student, get_help_overview(None, -1))
+
+    assert tracker.needs_reload(
+        event(
+            "ticket_created",
+            ticket(40, 0),
+            None,
+            creator_ids=[user_data.student.id],
+        )
+    )
@@ -1,14 +1,19 @@
 """Tests for AI Integration."""
 
+import asyncio
 from os import getenv
-from openai import AzureOpenAI
+from openai import AsyncAzureOpenAI
 import pytest
 from unittest.mock import MagicMock, Mock
 
 from backend.entities.academics.section_member_entity import SectionMemberEntity
 from backend.models.roster_role import RosterRole
 from backend.services.office_hours.similar_tickets import OfficeHourSimilarTicketService
-from backend.services.openai import OpenAIService
+from backend.services.office_hours.similar_tickets_cache import SimilarTicketCache
+from backend.services.openai import (
+    AsyncOpenAIService,
+    create_openai_concurrency_limiter,
+)
 
 from ....services.exceptions import CoursePermissionException, ResourceNotFoundException
 
@@ -24,6 +29,9 @@ from backend.models.office_hours.similar_tickets_ai import (
 )
 from backend.models.academics.my_courses import OfficeHourTicketOverview
 from backend.services.office_hours.similar_tickets_ai import SimilarTicketAIService
+from backend.services.office_hours.similar_tickets_prompt import (
+    SimilarTicketPromptBuilder,
+)
 from sqlalchemy.orm import Session
 
 
@@ -34,12 +42,23 @@ __copyright__ = "Copyright 2025"
 # Similar Ticket SVC Unit Tests
 
 
+def _empty_cache() -> MagicMock:
+    """Returns a mocked similar ticket cache that never holds a result."""
+    mock_cache = MagicMock(spec=SimilarTicketCache)
+    mock_cache.get.return_value = None
+    return mock_cache
+
+
 def test_get_similar_tickets_valid():
     """Ensures similar tickets are returned when user has permission and a valid ticket ID is given."""
     mock_session = Mock(spec=Session)
-    mock_ai_svc = MagicMock()
+    mock_ai_svc = MagicMock(spec=SimilarTicketAIService)
+    mock_candidates = MagicMock()
     ticket_svc = OfficeHourSimilarTicketService(
-        session=mock_session, ai_service=mock_ai_svc
+        session=mock_session,
+        ai_service=mock_ai_svc,
+        candidates=mock_candidates,
+        cache=_empty_cache(),
     )
 
     current_ticket = office_hours_data.comp_110_called_ticket
@@ -53,13 +72,21 @@ def test_get_similar_tickets_valid():
     ]
     mock_ai_svc.ai_for_similar_tickets.return_value = mock_ai_response
 
+    # Mock the candidate stage to return the closed tickets as candidates
+    mock_candidates.select_candidates.return_value = [
+        office_hours_data.comp_110_closed_ticket_1.id,
+        office_hours_data.comp_110_closed_ticket_2.id,
+    ]
+
     # Mock the session to return closed tickets
     mock_entity_1 = Mock()
+    mock_entity_1.id = office_hours_data.comp_110_closed_ticket_1.id
     mock_entity_1.to_overview_model.return_value = (
         office_hours_data.comp_110_closed_ticket_1
     )
 
     mock_entity_2 = Mock()
+    mock_entity_2.id = office_hours_data.comp_110_closed_ticket_2.id
     mock_entity_2.to_overview_model.return_value = (
         office_hours_data.comp_110_closed_ticket_2
     )
@@ -76,8 +103,8 @@ def test_get_similar_tickets_valid():
         mock_user_member
     ]
 
-    result: SimilarTicketsResponse = ticket_svc.find_similar_tickets(
-        subject=user, id=current_ticket.id
+    result: SimilarTicketsResponse = asyncio.run(
+        ticket_svc.find_similar_tickets(subject=user, id=current_ticket.id)
     )
 
     assert len(result.similar_tickets) == 2
@@ -87,9 +114,13 @@ def test_get_similar_tickets_valid():
 def test_get_similar_tickets_no_similar():
     """Ensures no similar tickets are returned when the AI service returns no matches."""
     mock_session = Mock(spec=Session)
-    mock_ai_svc = MagicMock()
+    mock_ai_svc = MagicMock(spec=SimilarTicketAIService)
+    mock_candidates = MagicMock()
     ticket_svc = OfficeHourSimilarTicketService(
-        session=mock_session, ai_service=mock_ai_svc
+        session=mock_session,
+        ai_service=mock_ai_svc,
+        candidates=mock_candidates,
+        cache=_empty_cache(),
     )
 
     current_ticket = office_hours_data.comp_110_called_ticket
@@ -100,8 +131,8 @@ def test_get_similar_tickets_no_similar():
     mock_ai_response.similar_ticket_ids = []
     mock_ai_svc.ai_for_similar_tickets.return_value = mock_ai_response
 
-    # Mock the session to return an empty list
-    mock_session.scalars.return_value.all.return_value = []
+    # Mock the candidate stage to return no candidates
+    mock_candidates.select_candidates.return_value = []
 
     # Mock the permission check (simulating that the user is a valid TA or Instructor for the course)
     mock_user_member = Mock(spec=SectionMemberEntity)
@@ -111,19 +142,66 @@ def test_get_similar_tickets_no_similar():
         mock_user_member
     ]
 
-    result: SimilarTicketsResponse = ticket_svc.find_similar_tickets(
-        subject=user, id=current_ticket.id
+    result: SimilarTicketsResponse = asyncio.run(
+        ticket_svc.find_similar_tickets(subject=user, id=current_ticket.id)
     )
 
     assert len(result.similar_tickets) == 0  # No similar tickets should be found
+    mock_ai_svc.ai_for_similar_tickets.assert_not_called()
+
+
+def test_get_similar_tickets_only_candidates_sent_to_ai():
+    """Ensures only selected candidates reach the AI and IDs outside of them are ignored."""
+    mock_session = Mock(spec=Session)
+    mock_ai_svc = MagicMock(spec=SimilarTicketAIService)
+    mock_candidates = MagicMock()
+    ticket_svc = OfficeHourSimilarTicketService(
+        session=mock_session,
+        ai_service=mock_ai_svc,
+        candidates=mock_candidates,
+        cache=_empty_cache(),
+    )
+
+    current_ticket = office_hours_data.comp_110_called_ticket
+    user = user_data.instructor
+
+    candidate = office_hours_data.comp_110_closed_ticket_1
+    mock_candidates.select_candidates.return_value = [candidate.id]
+    mock_entity = Mock()
+    mock_entity.id = candidate.id
+    mock_entity.to_overview_model.return_value = candidate
+    mock_session.scalars.return_value.all.return_value = [mock_entity]
+
+    # The AI returns the candidate plus an ID it was never shown
+    mock_ai_response = MagicMock()
+    mock_ai_response.similar_ticket_ids = [candidate.id, 999]
+    mock_ai_svc.ai_for_similar_tickets.return_value = mock_ai_response
+
+    mock_user_member = Mock(spec=SectionMemberEntity)
+    mock_user_member.member_role = RosterRole.INSTRUCTOR
+    mock_session.scalars.return_value.unique.return_value.all.return_value = [
+        mock_user_member
+    ]
+
+    result = asyncio.run(
+        ticket_svc.find_similar_tickets(subject=user, id=current_ticket.id)
+    )
+
+    assert result.similar_tickets == [candidate]
+    _, past_tickets = mock_ai_svc.ai_for_similar_tickets.call_args.args
+    assert past_tickets == [candidate]
 
 
 def test_get_similar_tickets_invalid_ticket_id():
     """Ensures an exception is raised when an invalid ticket ID is provided."""
     mock_session = Mock(spec=Session)
-    mock_ai_svc = MagicMock()
+    mock_ai_svc = MagicMock(spec=SimilarTicketAIService)
+    mock_candidates = MagicMock()
     ticket_svc = OfficeHourSimilarTicketService(
-        session=mock_session, ai_service=mock_ai_svc
+        session=mock_session,
+        ai_service=mock_ai_svc,
+        candidates=mock_candidates,
+        cache=_empty_cache(),
     )
 
     user = user_data.instructor
@@ -133,16 +211,20 @@ def test_get_similar_tickets_invalid_ticket_id():
 
     # Test that the method raises ResourceNotFoundException when no ticket is found
     with pytest.raises(ResourceNotFoundException):
-        ticket_svc.find_similar_tickets(subject=user, id=999)  # Invalid ID
+        asyncio.run(ticket_svc.find_similar_tickets(subject=user, id=999))  # Invalid ID
 
 
 def test_get_similar_tickets_permission_denied():
     """Ensures a permission exception is raised when a user doesn't have access to view similar tickets."""
 
     mock_session = Mock(spec=Session)
-    mock_ai_svc = MagicMock()
+    mock_ai_svc = MagicMock(spec=SimilarTicketAIService)
+    mock_candidates = MagicMock()
     ticket_svc = OfficeHourSimilarTicketService(
-        session=mock_session, ai_service=mock_ai_svc
+        session=mock_session,
+        ai_service=mock_ai_svc,
+        candidates=mock_candidates,
+        cache=_empty_cache(),
     )
 
     current_ticket = office_hours_data.comp_110_called_ticket
@@ -159,16 +241,20 @@ def test_get_similar_tickets_permission_denied():
 
     # Ensure that the permission exception is raised when the student tries to access the similar tickets
     with pytest.raises(CoursePermissionException):
-        ticket_svc.find_similar_tickets(subject=user, id=current_ticket.id)
+        asyncio.run(ticket_svc.find_similar_tickets(subject=user, id=current_ticket.id))
 
 
 def test_get_similar_tickets_ta_permission():
     """Ensures a TA has permission to access similar tickets."""
 
     mock_session = Mock(spec=Session)
-    mock_ai_svc = MagicMock()
+    mock_ai_svc = MagicMock(spec=SimilarTicketAIService)
+    mock_candidates = MagicMock()
     ticket_svc = OfficeHourSimilarTicketService(
-        session=mock_session, ai_service=mock_ai_svc
+        session=mock_session,
+        ai_service=mock_ai_svc,
+        candidates=mock_candidates,
+        cache=_empty_cache(),
     )
 
     current_ticket = office_hours_data.comp_110_called_ticket
@@ -182,13 +268,21 @@ def test_get_similar_tickets_ta_permission():
     ]
     mock_ai_svc.ai_for_similar_tickets.return_value = mock_ai_response
 
+    # Mock the candidate stage to return the closed tickets as candidates
+    mock_candidates.select_candidates.return_value = [
+        office_hours_data.comp_110_closed_ticket_1.id,
+        office_hours_data.comp_110_closed_ticket_2.id,
+    ]
+
     # Mock the session to return closed tickets
     mock_entity_1 = Mock()
+    mock_entity_1.id = office_hours_data.comp_110_closed_ticket_1.id
     mock_entity_1.to_overview_model.return_value = (
         office_hours_data.comp_110_closed_ticket_1
     )
 
     mock_entity_2 = Mock()
+    mock_entity_2.id = office_hours_data.comp_110_closed_ticket_2.id
     mock_entity_2.to_overview_model.return_value = (
         office_hours_data.comp_110_closed_ticket_2
     )
@@ -204,8 +298,8 @@ def test_get_similar_tickets_ta_permission():
         mock_user_member
     ]
 
-    result: SimilarTicketsResponse = ticket_svc.find_similar_tickets(
-        subject=user, id=current_ticket.id
+    result: SimilarTicketsResponse = asyncio.run(
+        ticket_svc.find_similar_tickets(subject=user, id=current_ticket.id)
     )
 
     assert len(result.similar_tickets) == 2
@@ -218,8 +312,10 @@ def test_get_similar_tickets_ta_permission():
 def test_ai_for_similar_tickets_success():
     """Test that AI service returns similar ticket IDs as expected."""
 
-    mock_openai_service = MagicMock(spec=OpenAIService)
-    ticket_svc = SimilarTicketAIService(openai=mock_openai_service)
+    mock_openai_service = MagicMock(spec=AsyncOpenAIService)
+    ticket_svc = SimilarTicketAIService(
+        openai=mock_openai_service, prompt_builder=SimilarTicketPromptBuilder()
+    )
 
     # Using existing ticket data
     current_ticket = office_hours_data.comp_110_called_ticket
@@ -240,7 +336,7 @@ def test_ai_for_similar_tickets_success():
     mock_ai_response.similar_ticket_ids = [1, 2]
     mock_openai_service.prompt.return_value = mock_ai_response
 
-    result = ticket_svc.ai_for_similar_tickets(prompt_input, past_tickets)
+    result = asyncio.run(ticket_svc.ai_for_similar_tickets(prompt_input, past_tickets))
 
     assert len(result.similar_ticket_ids) == 2
     assert result.similar_ticket_ids == [1, 2]
@@ -281,8 +377,10 @@ def test_ai_for_similar_tickets_no_matches():
     """Test that AI service returns no similar ticket IDs when no matches are found."""
 
     # Mock the OpenAI service
-    mock_openai_service = MagicMock(spec=OpenAIService)
-    ticket_svc = SimilarTicketAIService(openai=mock_openai_service)
+    mock_openai_service = MagicMock(spec=AsyncOpenAIService)
+    ticket_svc = SimilarTicketAIService(
+        openai=mock_openai_service, prompt_builder=SimilarTicketPromptBuilder()
+    )
 
     # Use existing ticket data
     current_ticket = office_hours_data.comp_110_called_ticket
@@ -303,7 +401,7 @@ def test_ai_for_similar_tickets_no_matches():
     mock_openai_service.prompt.return_value = mock_ai_response
 
     # Call the method under test
-    result = ticket_svc.ai_for_similar_tickets(prompt_input, past_tickets)
+    result = asyncio.run(ticket_svc.ai_for_similar_tickets(prompt_input, past_tickets))
 
     assert result.similar_ticket_ids == []  # No similar tickets
 
@@ -312,8 +410,10 @@ def test_ai_for_similar_tickets_no_past_tickets():
     """Test that AI service handles an empty list of past tickets gracefully."""
 
     # Mock the OpenAI service
-    mock_openai_service = MagicMock(spec=OpenAIService)
-    ticket_svc = SimilarTicketAIService(openai=mock_openai_service)
+    mock_openai_service = MagicMock(spec=AsyncOpenAIService)
+    ticket_svc = SimilarTicketAIService(
+        openai=mock_openai_service, prompt_builder=SimilarTicketPromptBuilder()
+    )
 
     # Use existing ticket data
     current_ticket = office_hours_data.comp_110_called_ticket
@@ -331,7 +431,7 @@ def test_ai_for_similar_tickets_no_past_tickets():
     mock_openai_service.prompt.return_value = mock_ai_response
 
     # Call the method under test
-    result = ticket_svc.ai_for_similar_tickets(prompt_input, past_tickets)
+    result = asyncio.run(ticket_svc.ai_for_similar_tickets(prompt_input, past_tickets))
 
     assert (
         result.similar_ticket_ids == []
@@ -344,7 +444,7 @@ def test_ai_for_similar_tickets_no_past_tickets():
 def test_real_openai_integration_with_fixture_data():
     """Sends real ticket data to OpenAI and sends it back to service."""
     # Manually create client
-    client = AzureOpenAI(
+    client = AsyncAzureOpenAI(
         api_key=getenv("UNC_OPENAI_API_KEY"),
         api_version=getenv("UNC_OPENAI_API_VERSION", default="2024-10-21"),
         azure_endpoint=getenv(
@@ -352,8 +452,12 @@ def test_real_openai_integration_with_fixture_data():
         ),
     )
 
-    openai_svc = OpenAIService(client=client)
-    ai_svc = SimilarTicketAIService(openai=openai_svc)
+    openai_svc = AsyncOpenAIService(
+        client=client, limiter=create_openai_concurrency_limiter()
+    )
+    ai_svc = SimilarTicketAIService(
+        openai=openai_svc, prompt_builder=SimilarTicketPromptBuilder()
+    )
 
     current_ticket = office_hours_data.red_black_called_ticket
 
@@ -373,8 +477,8 @@ def test_real_openai_integration_with_fixture_data():
         office_hours_data.comp_110_closed_ticket_unrelated,
     ]
 
-    response: SimilarTicketsAIResponse = ai_svc.ai_for_similar_tickets(
-        prompt_input, past_tickets
+    response: SimilarTicketsAIResponse = asyncio.run(
+        ai_svc.ai_for_similar_tickets(prompt_input, past_tickets)
     )
 
     assert isinstance(response.similar_ticket_ids, list)
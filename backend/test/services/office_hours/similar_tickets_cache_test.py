@@ -0,0 +1,273 @@
+"""Tests for the similar ticket result cache."""
+
+import asyncio
+import sys
+from unittest.mock import MagicMock, Mock
+
+import pytest
+from sqlalchemy.orm import Session
+
+from ....entities.academics.section_member_entity import SectionMemberEntity
+from ....models.office_hours.similar_tickets_ai import SimilarTicketsAIResponse
+from ....models.office_hours.ticket import OfficeHoursTicketTAResponse
+from ....models.office_hours.ticket_type import TicketType
+from ....models.roster_role import RosterRole
+from ....services.office_hours.similar_tickets import OfficeHourSimilarTicketService
+from ....services.office_hours.similar_tickets_ai import SimilarTicketAIService
+from ....services.office_hours.similar_tickets_cache import (
+    InMemoryCacheBackend,
+    RedisCacheBackend,
+    SimilarTicketCache,
+    similar_ticket_cache,
+)
+from ....services.office_hours.ticket import OfficeHourTicketService
+from ..clock import FakeClock
+
+# Imported fixtures provide dependencies injected for the tests as parameters.
+from .fixtures import oh_ticket_svc
+
+# Import the setup_teardown fixture explicitly to load entities in database
+from ..core_data import setup_insert_data_fixture as insert_order_0
+from ..academics.term_data import fake_data_fixture as insert_order_1
+from ..academics.course_data import fake_data_fixture as insert_order_2
+from ..academics.section_data import fake_data_fixture as insert_order_3
+from ..room_data import fake_data_fixture as insert_order_4
+from ..office_hours.office_hours_data import fake_data_fixture as insert_order_5
+
+# Import the fake model data in a namespace for test assertions
+from .. import user_data
+from ..office_hours import office_hours_data
+
+__authors__ = ["Riley Chapman"]
+__copyright__ = "Copyright 2025"
+__license__ = "MIT"
+
+
+prompt_input = {"concept_help_description": "How do for loops work?"}
+
+
+class FakeRedis:
+    """Minimal stand-in for the redis-py client commands used by `RedisCacheBackend`."""
+
+    def __init__(self):
+        self.values: dict[str, bytes] = {}
+        self.hashes: dict[str, dict[str, bytes]] = {}
+        self.expirations: dict[str, int] = {}
+
+    def get(self, key: str) -> bytes | None:
+        return self.values.get(key)
+
+    def set(self, key: str, value: str, ex: int) -> None:
+        self.values[key] = value.encode()
+        self.expirations[key] = ex
+
+    def hget(self, key: str, field: str) -> bytes | None:
+        return self.hashes.get(key, {}).get(field)
+
+    def hincrby(self, key: str, field: str, amount: int) -> int:
+        fields = self.hashes.setdefault(key, {})
+        value = int(fields.get(field, b"0")) + amount
+        fields[field] = str(value).encode()
+        return value
+
+
+def test_in_memory_backend_expires_entries():
+    """Ensures entries are dropped once their TTL has passed."""
+    clock = FakeClock()
+    backend = InMemoryCacheBackend(clock=clock)
+    backend.set("key", "value", ttl=10)
+
+    clock.now = 9
+    assert backend.get("key") == "value"
+    clock.now = 10
+    assert backend.get("key") is None
+    assert len(backend) == 0
+
+
+def test_in_memory_backend_evicts_least_recently_used():
+    """Ensures the least recently read entry is evicted first when the cache is full."""
+    backend = InMemoryCacheBackend(max_entries=2)
+    backend.set("a", "1", ttl=60)
+    backend.set("b", "2", ttl=60)
+    backend.get("a")
+    backend.set("c", "3", ttl=60)
+
+    assert backend.get("a") == "1"
+    assert backend.get("b") is None
+    assert backend.get("c") == "3"
+
+
+def test_in_memory_backend_never_evicts_counters():
+    """Ensures corpus version counters survive eviction of cached entries."""
+    backend = InMemoryCacheBackend(max_entries=1)
+    backend.incr("version")
+    backend.set("a", "1", ttl=60)
+    backend.set("b", "2", ttl=60)
+    assert backend.counter("version") == 1
+
+
+def test_key_depends_on_prompt_type_and_course_site():
+    """Ensures different tickets do not share cache entries."""
+    cache = SimilarTicketCache(InMemoryCacheBackend())
+    key = cache.key(1, TicketType.CONCEPTUAL_HELP, prompt_input)
+
+    assert key == cache.key(1, TicketType.CONCEPTUAL_HELP, dict(prompt_input))
+    assert key != cache.key(2, TicketType.CONCEPTUAL_HELP, prompt_input)
+    assert key != cache.key(1, TicketType.ASSIGNMENT_HELP, prompt_input)
+    assert key != cache.key(
+        1, TicketType.CONCEPTUAL_HELP, {"concept_help_description": "Recursion?"}
+    )
+
+
+def test_bump_corpus_version_invalidates_only_that_course_site():
+    """Ensures closing a ticket only invalidates results for its own course site."""
+    cache = SimilarTicketCache(InMemoryCacheBackend())
+    response = SimilarTicketsAIResponse(similar_ticket_ids=[1, 2])
+    key_1 = cache.key(1, TicketType.CONCEPTUAL_HELP, prompt_input)
+    key_2 = cache.key(2, TicketType.CONCEPTUAL_HELP, prompt_input)
+    cache.set(key_1, response)
+    cache.set(key_2, response)
+
+    cache.bump_corpus_version(1)
+
+    assert cache.key(1, TicketType.CONCEPTUAL_HELP, prompt_input) != key_1
+    assert cache.get(cache.key(1, TicketType.CONCEPTUAL_HELP, prompt_input)) is None
+    assert cache.get(cache.key(2, TicketType.CONCEPTUAL_HELP, prompt_input)) == response
+
+
+def test_precomputed_key_ignores_corpus_version():
+    """Ensures results precomputed for a ticket outlive other tickets closing, but not edits."""
+    cache = SimilarTicketCache(InMemoryCacheBackend())
+    response = SimilarTicketsAIResponse(similar_ticket_ids=[1, 2])
+    key = cache.precomputed_key(7, TicketType.CONCEPTUAL_HELP, prompt_input)
+    cache.set(key, response)
+
+    cache.bump_corpus_version(1)
+
+    assert cache.precomputed_key(7, TicketType.CONCEPTUAL_HELP, prompt_input) == key
+    assert key != cache.precomputed_key(
+        7, TicketType.CONCEPTUAL_HELP, {"concept_help_description": "Recursion?"}
+    )
+    assert (
+        cache.get(cache.key(1, TicketType.CONCEPTUAL_HELP, prompt_input), key)
+        == response
+    )
+    assert cache.stats().hits == 1
+    assert cache.stats().misses == 0
+
+
+def test_stats_count_hits_and_misses():
+    """Ensures lookups are counted as hits or misses."""
+    cache = SimilarTicketCache(InMemoryCacheBackend())
+    key = cache.key(1, TicketType.CONCEPTUAL_HELP, prompt_input)
+
+    assert cache.get(key) is None
+    cache.set(key, SimilarTicketsAIResponse(similar_ticket_ids=[3]))
+    assert cache.get(key).similar_ticket_ids == [3]
+    assert cache.get(key).similar_ticket_ids == [3]
+
+    stats = cache.stats()
+    assert stats.hits == 2
+    assert stats.misses == 1
+
+
+def test_redis_backend():
+    """Ensures the Redis backend stores entries with a TTL and shares corpus versions."""
+    client = FakeRedis()
+    cache = SimilarTicketCache(RedisCacheBackend(client), ttl=30)
+    key = cache.key(1, TicketType.CONCEPTUAL_HELP, prompt_input)
+    cache.set(key, SimilarTicketsAIResponse(similar_ticket_ids=[4]))
+
+    assert client.expirations[key] == 30
+    assert cache.get(key).similar_ticket_ids == [4]
+
+    # A second process using the same server sees the bumped version
+    other = SimilarTicketCache(RedisCacheBackend(client))
+    other.bump_corpus_version(1)
+    assert cache.key(1, TicketType.CONCEPTUAL_HELP, prompt_input) != key
+
+    # Corpus versions are kept in a hash without a TTL, apart from the evictable entries
+    assert set(client.hashes) == {"similar_tickets:counters"}
+    assert set(client.values) == set(client.expirations)
+
+
+def test_redis_url_without_redis_package(monkeypatch: pytest.MonkeyPatch):
+    """Ensures configuring Redis without its client package fails with a clear error."""
+    monkeypatch.setenv("SIMILAR_TICKETS_CACHE_URL", "redis://localhost:6379/0")
+    monkeypatch.setitem(sys.modules, "redis", None)
+    with pytest.raises(RuntimeError, match="redis package is not installed"):
+        similar_ticket_cache.__wrapped__()
+
+
+def test_find_similar_tickets_cache_hit_skips_ai():
+    """Ensures a second lookup of the same ticket is served without calling the AI."""
+    mock_session = Mock(spec=Session)
+    mock_ai_svc = MagicMock(spec=SimilarTicketAIService)
+    mock_candidates = MagicMock()
+    cache = SimilarTicketCache(InMemoryCacheBackend())
+    ticket_svc = OfficeHourSimilarTicketService(
+        session=mock_session,
+        ai_service=mock_ai_svc,
+        candidates=mock_candidates,
+        cache=cache,
+    )
+
+    current_ticket = office_hours_data.comp_110_called_ticket
+    candidate = office_hours_data.comp_110_closed_ticket_1
+
+    mock_ticket_entity = MagicMock()
+    mock_ticket_entity.type = TicketType.CONCEPTUAL_HELP
+    mock_ticket_entity.office_hours.course_site_id = 1
+    mock_ticket_entity.concept_help_description = "How do for loops work?"
+    mock_session.get.return_value = mock_ticket_entity
+
+    mock_candidates.select_candidates.return_value = [candidate.id]
+    mock_entity = Mock()
+    mock_entity.id = candidate.id
+    mock_entity.to_overview_model.return_value = candidate
+    mock_session.scalars.return_value.all.return_value = [mock_entity]
+    mock_ai_svc.ai_for_similar_tickets.return_value = SimilarTicketsAIResponse(
+        similar_ticket_ids=[candidate.id]
+    )
+
+    mock_user_member = Mock(spec=SectionMemberEntity)
+    mock_user_member.member_role = RosterRole.INSTRUCTOR
+    mock_session.scalars.return_value.unique.return_value.all.return_value = [
+        mock_user_member
+    ]
+
+    first = asyncio.run(
+        ticket_svc.find_similar_tickets(
+            subject=user_data.instructor, id=current_ticket.id
+        )
+    )
+    second = asyncio.run(
+        ticket_svc.find_similar_tickets(
+            subject=user_data.instructor, id=current_ticket.id
+        )
+    )
+
+    assert first == second
+    assert mock_ai_svc.ai_for_similar_tickets.call_count == 1
+    assert mock_candidates.select_candidates.call_count == 1
+    assert cache.stats().hits == 1
+    assert cache.stats().misses == 1
+
+
+def test_close_ticket_bumps_corpus_version(oh_ticket_svc: OfficeHourTicketService):
+    """Ensures closing a ticket invalidates cached results for its course site."""
+    cache = oh_ticket_svc._similar_ticket_cache
+    course_site_id = office_hours_data.comp_110_site.id
+    key = cache.key(course_site_id, TicketType.CONCEPTUAL_HELP, prompt_input)
+
+    oh_ticket_svc.close_ticket(
+        user_data.instructor,
+        office_hours_data.comp_110_called_ticket.id,
+        OfficeHoursTicketTAResponse(
+            meeting_summary="Walked through the loop together.",
+            solutions_used="Traced the loop on the whiteboard.",
+            concepts_for_review="for loops",
+        ),
+    )
+
+    assert cache.key(course_site_id, TicketType.CONCEPTUAL_HELP, prompt_input) != key
@@ -0,0 +1,160 @@
+"""Tests for the SimilarTicketCandidateService."""
+
+from datetime import datetime, timedelta
+
+from sqlalchemy.orm import Session
+
+from ....entities.office_hours import OfficeHoursEntity, OfficeHoursTicketEntity
+from ....models.office_hours.event_type import (
+    OfficeHoursEventModeType,
+    OfficeHoursEventType,
+)
+from ....models.office_hours.office_hours import OfficeHours
+from ....models.office_hours.ticket_state import TicketState
+from ....models.office_hours.ticket_type import TicketType
+from ....services.office_hours.similar_tickets_candidates import (
+    SimilarTicketCandidateService,
+    bm25_rank,
+    reciprocal_rank_fusion,
+)
+from ....services.office_hours.similar_tickets_index import (
+    SimilarTicketIndexService,
+    hashing_embedding,
+)
+
+# Imported fixtures provide dependencies injected for the tests as parameters.
+from .fixtures import similar_ticket_candidate_svc
+
+# Import the setup_teardown fixture explicitly to load entities in database
+from ..core_data import setup_insert_data_fixture as insert_order_0
+from ..academics.term_data import fake_data_fixture as insert_order_1
+from ..academics.course_data import fake_data_fixture as insert_order_2
+from ..academics.section_data import fake_data_fixture as insert_order_3
+from ..room_data import fake_data_fixture as insert_order_4
+from ..office_hours.office_hours_data import fake_data_fixture as insert_order_5
+
+# Import the fake model data in a namespace for test assertions
+from .. import room_data
+from ..office_hours import office_hours_data
+
+__authors__ = ["Riley Chapman"]
+__copyright__ = "Copyright 2025"
+__license__ = "MIT"
+
+
+red_black_prompt_input = {
+    "assignment_section_description": office_hours_data.red_black_called_ticket.assignment_section_description,
+    "code_to_english_description": office_hours_data.red_black_called_ticket.code_to_english_description,
+    "concepts_needed_description": office_hours_data.red_black_called_ticket.concepts_needed_description,
+    "tactics_tried": office_hours_data.red_black_called_ticket.tactics_tried,
+}
+
+red_black_ticket_ids = {
+    office_hours_data.comp_110_closed_ticket_RB1.id,
+    office_hours_data.comp_110_closed_ticket_RB2.id,
+    office_hours_data.comp_110_closed_ticket_RB3.id,
+    office_hours_data.comp_110_closed_ticket_RB4.id,
+    office_hours_data.comp_110_closed_ticket_RB5.id,
+}
+
+
+def test_bm25_rank_orders_by_relevance():
+    """Ensures BM25 ranks documents with more rare query terms first."""
+    documents = {
+        1: "how do for loops work",
+        2: "red black tree rotations after insertion",
+        3: "red black tree recoloring",
+    }
+    assert bm25_rank("red black tree rotations", documents) == [2, 3]
+
+
+def test_bm25_rank_respects_k():
+    """Ensures BM25 never returns more than k documents."""
+    documents = {ticket_id: "list loop" for ticket_id in range(10)}
+    assert len(bm25_rank("loop", documents, k=3)) == 3
+
+
+def test_bm25_rank_no_overlap():
+    """Ensures documents sharing no terms with the query are not returned."""
+    assert bm25_rank("organic chemistry", {1: "for loops"}) == []
+
+
+def test_reciprocal_rank_fusion():
+    """Ensures IDs ranked highly by several rankings come first."""
+    assert reciprocal_rank_fusion([[1, 2, 3], [2, 4]]) == [2, 1, 4, 3]
+
+
+def test_select_candidates_finds_similar_tickets(
+    session: Session, similar_ticket_candidate_svc: SimilarTicketCandidateService
+):
+    """Ensures the red-black tree tickets are the top candidates for a red-black tree question."""
+    ticket = session.get(
+        OfficeHoursTicketEntity, office_hours_data.red_black_called_ticket.id
+    )
+    candidates = similar_ticket_candidate_svc.select_candidates(
+        ticket, red_black_prompt_input, budget=5
+    )
+    assert set(candidates) == red_black_ticket_ids
+
+
+def test_select_candidates_respects_budget_and_scope(
+    session: Session, similar_ticket_candidate_svc: SimilarTicketCandidateService
+):
+    """Ensures candidates never exceed the budget and share the ticket's type."""
+    ticket = session.get(
+        OfficeHoursTicketEntity, office_hours_data.red_black_called_ticket.id
+    )
+    candidates = similar_ticket_candidate_svc.select_candidates(
+        ticket, red_black_prompt_input, budget=3
+    )
+    assert len(candidates) == 3
+    assert ticket.id not in candidates
+    for candidate_id in candidates:
+        candidate = session.get(OfficeHoursTicketEntity, candidate_id)
+        assert candidate.type == TicketType.ASSIGNMENT_HELP
+        assert candidate.state == TicketState.CLOSED
+
+
+def test_select_candidates_excludes_other_course_sites(
+    session: Session, similar_ticket_candidate_svc: SimilarTicketCandidateService
+):
+    """Ensures closed tickets from another course site are never candidates."""
+    comp_301_office_hours = OfficeHoursEntity.from_model(
+        OfficeHours(
+            id=100,
+            type=OfficeHoursEventType.OFFICE_HOURS,
+            mode=OfficeHoursEventModeType.IN_PERSON,
+            description="COMP 301 office hours",
+            location_description="SN 011",
+            start_time=datetime.now() - timedelta(hours=2),
+            end_time=datetime.now() + timedelta(hours=2),
+            course_site_id=office_hours_data.comp_301_site.id,
+            room_id=room_data.group_a.id,
+            recurrence_pattern_id=None,
+        )
+    )
+    session.add(comp_301_office_hours)
+    other_site_ticket = OfficeHoursTicketEntity(
+        id=100,
+        type=TicketType.ASSIGNMENT_HELP,
+        state=TicketState.CLOSED,
+        assignment_section_description=office_hours_data.red_black_called_ticket.assignment_section_description,
+        code_to_english_description=office_hours_data.red_black_called_ticket.code_to_english_description,
+        concepts_needed_description=office_hours_data.red_black_called_ticket.concepts_needed_description,
+        office_hours_id=comp_301_office_hours.id,
+    )
+    session.add(other_site_ticket)
+    session.commit()
+    SimilarTicketIndexService(session, hashing_embedding).index_ticket(
+        other_site_ticket
+    )
+    session.commit()
+
+    ticket = session.get(
+        OfficeHoursTicketEntity, office_hours_data.red_black_called_ticket.id
+    )
+    candidates = similar_ticket_candidate_svc.select_candidates(
+        ticket, red_black_prompt_input
+    )
+    assert other_site_ticket.id not in candidates
+    assert red_black_ticket_ids.issubset(candidates)
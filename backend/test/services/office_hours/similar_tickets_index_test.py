@@ -0,0 +1,154 @@
+"""Tests for the SimilarTicketIndexService."""
+
+import math
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from ....entities.office_hours import OfficeHoursTicketEmbeddingEntity
+from ....models.office_hours.ticket import OfficeHoursTicketTAResponse, TicketState
+from ....services.office_hours.similar_tickets_index import (
+    SimilarTicketIndexService,
+    hashing_embedding,
+    EMBEDDING_DIMENSIONS,
+)
+from ....services.office_hours.ticket import OfficeHourTicketService
+from ..query_counter import count_queries
+
+# Imported fixtures provide dependencies injected for the tests as parameters.
+from .fixtures import oh_ticket_svc, similar_ticket_index_svc
+
+# Import the setup_teardown fixture explicitly to load entities in database
+from ..core_data import setup_insert_data_fixture as insert_order_0
+from ..academics.term_data import fake_data_fixture as insert_order_1
+from ..academics.course_data import fake_data_fixture as insert_order_2
+from ..academics.section_data import fake_data_fixture as insert_order_3
+from ..room_data import fake_data_fixture as insert_order_4
+from ..office_hours.office_hours_data import fake_data_fixture as insert_order_5
+
+# Import the fake model data in a namespace for test assertions
+from .. import user_data
+from ..office_hours import office_hours_data
+
+__authors__ = ["Riley Chapman"]
+__copyright__ = "Copyright 2025"
+__license__ = "MIT"
+
+
+red_black_prompt_input = {
+    "assignment_section_description": office_hours_data.red_black_called_ticket.assignment_section_description,
+    "code_to_english_description": office_hours_data.red_black_called_ticket.code_to_english_description,
+    "concepts_needed_description": office_hours_data.red_black_called_ticket.concepts_needed_description,
+    "tactics_tried": office_hours_data.red_black_called_ticket.tactics_tried,
+}
+
+red_black_ticket_ids = {
+    office_hours_data.comp_110_closed_ticket_RB1.id,
+    office_hours_data.comp_110_closed_ticket_RB2.id,
+    office_hours_data.comp_110_closed_ticket_RB3.id,
+    office_hours_data.comp_110_closed_ticket_RB4.id,
+    office_hours_data.comp_110_closed_ticket_RB5.id,
+}
+
+
+def test_hashing_embedding_is_deterministic_unit_vector():
+    """Ensures the offline embedding is stable and normalized."""
+    vector = hashing_embedding("red-black tree rotations")
+    assert vector == hashing_embedding("Red-Black tree ROTATIONS")
+    assert len(vector) == EMBEDDING_DIMENSIONS
+    assert math.isclose(sum(value * value for value in vector), 1.0)
+
+
+def test_hashing_embedding_empty_text():
+    """Ensures empty text embeds to the zero vector."""
+    assert not any(hashing_embedding(""))
+
+
+def test_rebuild_indexes_closed_tickets(
+    session: Session, similar_ticket_index_svc: SimilarTicketIndexService
+):
+    """Ensures a rebuild embeds exactly the closed tickets."""
+    indexed = similar_ticket_index_svc.rebuild()
+    closed_ids = {
+        ticket.id
+        for ticket in office_hours_data.oh_tickets
+        if TicketState(int(ticket.state)) == TicketState.CLOSED
+    }
+    assert indexed == len(closed_ids)
+    assert (
+        set(session.scalars(select(OfficeHoursTicketEmbeddingEntity.ticket_id)))
+        == closed_ids
+    )
+
+
+def test_nearest_returns_similar_tickets_first(
+    similar_ticket_index_svc: SimilarTicketIndexService,
+):
+    """Ensures the nearest neighbours of a red-black tree question are red-black tree tickets."""
+    nearest = similar_ticket_index_svc.nearest(red_black_prompt_input, k=5)
+    assert set(nearest) == red_black_ticket_ids
+    assert office_hours_data.comp_110_closed_ticket_unrelated.id not in nearest
+
+
+def test_nearest_respects_k_and_exclude(
+    similar_ticket_index_svc: SimilarTicketIndexService,
+):
+    """Ensures at most k tickets are returned and excluded tickets are skipped."""
+    excluded = office_hours_data.comp_110_closed_ticket_RB1.id
+    nearest = similar_ticket_index_svc.nearest(
+        red_black_prompt_input, k=2, exclude=[excluded]
+    )
+    assert len(nearest) == 2
+    assert excluded not in nearest
+
+
+def test_nearest_ranks_in_one_statement(
+    session: Session, similar_ticket_index_svc: SimilarTicketIndexService
+):
+    """Ensures the database returns the top-k tickets by cosine similarity, and only those."""
+    similar_ticket_index_svc.rebuild()
+    query = hashing_embedding("\n".join(red_black_prompt_input.values()))
+    scores = sorted(
+        (
+            (sum(q * v for q, v in zip(query, entity.embedding)), entity.ticket_id)
+            for entity in session.scalars(select(OfficeHoursTicketEmbeddingEntity))
+        ),
+        reverse=True,
+    )
+    expected = [ticket_id for score, ticket_id in scores if score > 0][:3]
+
+    with count_queries(session) as queries:
+        nearest = similar_ticket_index_svc.nearest(red_black_prompt_input, k=3)
+    assert nearest == expected
+    assert len(queries) == 1
+
+
+def test_nearest_empty_prompt(similar_ticket_index_svc: SimilarTicketIndexService):
+    """Ensures a ticket without any text has no neighbours."""
+    assert similar_ticket_index_svc.nearest({"concept_help_description": None}) == []
+
+
+def test_close_ticket_updates_index(
+    session: Session,
+    oh_ticket_svc: OfficeHourTicketService,
+    similar_ticket_index_svc: SimilarTicketIndexService,
+):
+    """Ensures closing a ticket adds it to the index incrementally."""
+    ticket_id = office_hours_data.comp_110_called_ticket.id
+    assert session.get(OfficeHoursTicketEmbeddingEntity, ticket_id) is None
+
+    oh_ticket_svc.close_ticket(
+        user_data.instructor,
+        ticket_id,
+        OfficeHoursTicketTAResponse(
+            meeting_summary="Explained dictionary comprehensions.",
+            solutions_used="Rewrote the loop as a dictionary comprehension.",
+            concepts_for_review="dictionary comprehensions",
+        ),
+    )
+
+    assert session.get(OfficeHoursTicketEmbeddingEntity, ticket_id) is not None
+    nearest = similar_ticket_index_svc.nearest(
+        {"concept_help_description": "dictionary comprehensions"}, k=1
+    )
+    assert nearest == [ticket_id]
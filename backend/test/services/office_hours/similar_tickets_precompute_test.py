@@ -0,0 +1,253 @@
+"""Tests for the background precomputation of similar tickets."""
+
+import asyncio
+import contextlib
+import threading
+from unittest.mock import MagicMock, create_autospec
+
+import pytest
+from sqlalchemy import Engine
+from sqlalchemy.orm import Session
+
+from ....models.office_hours.similar_tickets_ai import SimilarTicketsAIResponse
+from ....models.office_hours.ticket import OfficeHoursTicketTAResponse
+from ....services.background_jobs import BackgroundJobRunner
+from ....services.exceptions import ResourceNotFoundException
+from ....services.office_hours import OfficeHourTicketService
+from ....services.office_hours.live_queue import LiveQueueRegistry
+from ....services.office_hours.queue_broker import OfficeHoursQueueBroker
+from ....services.office_hours.similar_tickets import OfficeHourSimilarTicketService
+from ....services.office_hours.similar_tickets_ai import SimilarTicketAIService
+from ....services.office_hours.similar_tickets_cache import (
+    InMemoryCacheBackend,
+    SimilarTicketCache,
+)
+from ....services.office_hours.similar_tickets_candidates import (
+    SimilarTicketCandidateService,
+)
+from ....services.office_hours.similar_tickets_index import (
+    SimilarTicketIndexService,
+    hashing_embedding,
+)
+from ....services.office_hours.similar_tickets_precompute import (
+    SimilarTicketPrecomputeService,
+)
+
+# Import the setup_teardown fixture explicitly to load entities in database
+from ..core_data import setup_insert_data_fixture as insert_order_0
+from ..academics.term_data import fake_data_fixture as insert_order_1
+from ..academics.course_data import fake_data_fixture as insert_order_2
+from ..academics.section_data import fake_data_fixture as insert_order_3
+from ..room_data import fake_data_fixture as insert_order_4
+from ..office_hours.office_hours_data import fake_data_fixture as insert_order_5
+
+# Import the fake model data in a namespace for test assertions
+from .. import user_data
+from ..office_hours import office_hours_data
+
+__authors__ = ["Riley Chapman"]
+__copyright__ = "Copyright 2025"
+__license__ = "MIT"
+
+
+red_black_ids = [
+    office_hours_data.comp_110_closed_ticket_RB1.id,
+    office_hours_data.comp_110_closed_ticket_RB2.id,
+]
+
+
+@pytest.fixture()
+def mock_ai_svc():
+    """Mocked SimilarTicketAIService that selects two of the red-black tree tickets."""
+    mock_ai_svc = MagicMock(spec=SimilarTicketAIService)
+    mock_ai_svc.ai_for_similar_tickets.return_value = SimilarTicketsAIResponse(
+        similar_ticket_ids=red_black_ids
+    )
+    return mock_ai_svc
+
+
+@pytest.fixture()
+def cache():
+    """SimilarTicketCache shared by the background job and the request."""
+    return SimilarTicketCache(InMemoryCacheBackend())
+
+
+@pytest.fixture()
+def runner():
+    """BackgroundJobRunner that retries without sleeping."""
+    runner = BackgroundJobRunner(max_workers=1, max_attempts=3, sleep=lambda _: None)
+    yield runner
+    runner.shutdown()
+
+
+@pytest.fixture()
+def loop():
+    """Event loop running on a thread of its own, as the API's loop serves requests."""
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    yield loop
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join()
+    loop.close()
+
+
+@pytest.fixture()
+def precompute_svc(
+    session: Session,
+    test_engine: Engine,
+    runner: BackgroundJobRunner,
+    loop: asyncio.AbstractEventLoop,
+    mock_ai_svc: MagicMock,
+    cache: SimilarTicketCache,
+):
+    """SimilarTicketPrecomputeService whose jobs open their own sessions on the test database."""
+
+    @contextlib.asynccontextmanager
+    async def service_factory():
+        assert asyncio.get_running_loop() is loop
+        with Session(test_engine) as job_session:
+            yield OfficeHourSimilarTicketService(
+                job_session,
+                mock_ai_svc,
+                SimilarTicketCandidateService(
+                    job_session,
+                    SimilarTicketIndexService(job_session, hashing_embedding),
+                ),
+                cache,
+            )
+
+    return SimilarTicketPrecomputeService(runner, service_factory, loop)
+
+
+def similar_ticket_svc(
+    session: Session, mock_ai_svc: MagicMock, cache: SimilarTicketCache
+) -> OfficeHourSimilarTicketService:
+    """Builds the request-scoped similar ticket service used by the TA view."""
+    return OfficeHourSimilarTicketService(
+        session,
+        mock_ai_svc,
+        SimilarTicketCandidateService(
+            session, SimilarTicketIndexService(session, hashing_embedding)
+        ),
+        cache,
+    )
+
+
+def test_precomputed_result_is_served_without_ai_call(
+    session: Session,
+    precompute_svc: SimilarTicketPrecomputeService,
+    runner: BackgroundJobRunner,
+    mock_ai_svc: MagicMock,
+    cache: SimilarTicketCache,
+):
+    """Ensures the TA view reads the answer computed in the background."""
+    precompute_svc.enqueue(office_hours_data.red_black_called_ticket.id)
+    runner.join(timeout=10)
+    assert runner.stats().succeeded == 1
+    assert mock_ai_svc.ai_for_similar_tickets.call_count == 1
+
+    result = asyncio.run(
+        similar_ticket_svc(session, mock_ai_svc, cache).find_similar_tickets(
+            user_data.instructor, office_hours_data.red_black_called_ticket.id
+        )
+    )
+
+    assert [ticket.id for ticket in result.similar_tickets] == red_black_ids
+    assert mock_ai_svc.ai_for_similar_tickets.call_count == 1
+    assert cache.stats().hits == 1
+
+
+def test_precomputed_result_survives_other_tickets_closing(
+    session: Session,
+    precompute_svc: SimilarTicketPrecomputeService,
+    runner: BackgroundJobRunner,
+    mock_ai_svc: MagicMock,
+    cache: SimilarTicketCache,
+):
+    """Ensures closing another ticket of the course does not discard the precomputed answer."""
+    precompute_svc.enqueue(office_hours_data.red_black_called_ticket.id)
+    runner.join(timeout=10)
+    assert runner.stats().succeeded == 1
+
+    ticket_svc = OfficeHourTicketService(
+        session,
+        SimilarTicketIndexService(session, hashing_embedding),
+        cache,
+        create_autospec(SimilarTicketPrecomputeService, instance=True),
+        create_autospec(OfficeHoursQueueBroker, instance=True),
+        LiveQueueRegistry(),
+    )
+    ticket_svc.close_ticket(
+        user_data.instructor,
+        office_hours_data.comp_110_called_ticket.id,
+        OfficeHoursTicketTAResponse(
+            meeting_summary="Walked through the loop together.",
+            solutions_used="Traced the loop on the whiteboard.",
+            concepts_for_review="for loops",
+        ),
+    )
+
+    result = asyncio.run(
+        similar_ticket_svc(session, mock_ai_svc, cache).find_similar_tickets(
+            user_data.instructor, office_hours_data.red_black_called_ticket.id
+        )
+    )
+
+    assert [ticket.id for ticket in result.similar_tickets] == red_black_ids
+    assert mock_ai_svc.ai_for_similar_tickets.call_count == 1
+    assert cache.stats().hits == 1
+
+
+def test_precompute_retries_ai_failures(
+    precompute_svc: SimilarTicketPrecomputeService,
+    runner: BackgroundJobRunner,
+    mock_ai_svc: MagicMock,
+):
+    """Ensures a failed AI call is retried by the background job."""
+    mock_ai_svc.ai_for_similar_tickets.side_effect = [
+        ValueError("Invalid response from the OpenAI API"),
+        SimilarTicketsAIResponse(similar_ticket_ids=red_black_ids),
+    ]
+    precompute_svc.enqueue(office_hours_data.red_black_called_ticket.id)
+    runner.join(timeout=10)
+
+    stats = runner.stats()
+    assert stats.retried == 1
+    assert stats.succeeded == 1
+
+
+def test_find_similar_tickets_falls_back_when_precompute_failed(
+    session: Session,
+    precompute_svc: SimilarTicketPrecomputeService,
+    runner: BackgroundJobRunner,
+    mock_ai_svc: MagicMock,
+    cache: SimilarTicketCache,
+):
+    """Ensures similar tickets are computed on demand if the background job gave up."""
+    mock_ai_svc.ai_for_similar_tickets.side_effect = ValueError("AI unavailable")
+    precompute_svc.enqueue(office_hours_data.red_black_called_ticket.id)
+    runner.join(timeout=10)
+    assert runner.stats().failed == 1
+
+    mock_ai_svc.ai_for_similar_tickets.side_effect = None
+    result = asyncio.run(
+        similar_ticket_svc(session, mock_ai_svc, cache).find_similar_tickets(
+            user_data.instructor, office_hours_data.red_black_called_ticket.id
+        )
+    )
+
+    assert [ticket.id for ticket in result.similar_tickets] == red_black_ids
+    assert cache.stats().misses == 1
+
+
+def test_precompute_similar_tickets_not_found(
+    session: Session, mock_ai_svc: MagicMock, cache: SimilarTicketCache
+):
+    """Ensures precomputing a ticket that does not exist raises an error."""
+    with pytest.raises(ResourceNotFoundException):
+        asyncio.run(
+            similar_ticket_svc(session, mock_ai_svc, cache).precompute_similar_tickets(
+                404
+            )
+        )
@@ -0,0 +1,97 @@
+"""Tests for the SimilarTicketPromptBuilder."""
+
+import pytest
+
+from ....services.office_hours.similar_tickets_prompt import (
+    RESPONSE_INSTRUCTIONS,
+    TRUNCATION_MARKER,
+    SimilarTicketPromptBuilder,
+    SimilarTicketPromptMetrics,
+)
+
+# Import the fake model data in a namespace for test assertions
+from ..office_hours import office_hours_data
+
+__authors__ = ["Riley Chapman"]
+__copyright__ = "Copyright 2025"
+__license__ = "MIT"
+
+
+current_ticket = {
+    "assignment_section_description": office_hours_data.red_black_called_ticket.assignment_section_description,
+    "tactics_tried": office_hours_data.red_black_called_ticket.tactics_tried,
+}
+
+past_tickets = [
+    office_hours_data.comp_110_closed_ticket_RB1,
+    office_hours_data.comp_110_closed_ticket_RB2,
+    office_hours_data.comp_110_closed_ticket_RB3,
+]
+
+
+def word_count(text: str) -> int:
+    """Tokenizer counting one token per whitespace-separated word."""
+    return len(text.split())
+
+
+def test_build_includes_all_tickets_within_budget():
+    """Ensures every ticket is listed, in order, when the budget allows it."""
+    prompt = SimilarTicketPromptBuilder().build(current_ticket, past_tickets)
+
+    assert prompt.startswith("Current Ticket:\n")
+    assert prompt.endswith(RESPONSE_INSTRUCTIONS)
+    positions = [prompt.index(f"ID: {ticket.id}\n") for ticket in past_tickets]
+    assert positions == sorted(positions)
+    assert TRUNCATION_MARKER not in prompt
+
+
+def test_build_drops_lowest_ranked_tickets_over_budget():
+    """Ensures tickets that do not fit the token budget are dropped from the end."""
+    two_tickets = SimilarTicketPromptMetrics()
+    SimilarTicketPromptBuilder(token_budget=None, metrics=two_tickets).build(
+        current_ticket, past_tickets[:2]
+    )
+    metrics = SimilarTicketPromptMetrics()
+    prompt = SimilarTicketPromptBuilder(
+        token_budget=two_tickets.stats().last_tokens, metrics=metrics
+    ).build(current_ticket, past_tickets)
+
+    assert f"ID: {past_tickets[0].id}\n" in prompt
+    assert f"ID: {past_tickets[1].id}\n" in prompt
+    assert f"ID: {past_tickets[2].id}\n" not in prompt
+    assert metrics.stats().tickets_included == 2
+    assert metrics.stats().tickets_dropped == 1
+
+
+def test_build_truncates_long_fields():
+    """Ensures a long field is cut to the per-field limit of the pluggable tokenizer."""
+    long_ticket = past_tickets[0].model_copy(update={"meeting_summary": "word " * 1000})
+    metrics = SimilarTicketPromptMetrics()
+    prompt = SimilarTicketPromptBuilder(
+        count_tokens=word_count, field_token_limit=20, metrics=metrics
+    ).build(current_ticket, [long_ticket])
+
+    summary_line = next(
+        line for line in prompt.splitlines() if line.startswith("Meeting Summary:")
+    )
+    assert summary_line.endswith(TRUNCATION_MARKER)
+    assert word_count(summary_line.removesuffix(TRUNCATION_MARKER)) <= 22
+    assert metrics.stats().fields_truncated == 1
+
+
+def test_build_records_metrics_instead_of_printing(
+    capsys: pytest.CaptureFixture[str],
+):
+    """Ensures prompt size is recorded as metrics and nothing is written to stdout."""
+    metrics = SimilarTicketPromptMetrics()
+    builder = SimilarTicketPromptBuilder(metrics=metrics)
+
+    prompt = builder.build(current_ticket, past_tickets)
+    builder.build(current_ticket, past_tickets)
+
+    stats = metrics.stats()
+    assert stats.prompts == 2
+    assert stats.last_chars == len(prompt)
+    assert stats.total_chars == 2 * len(prompt)
+    assert stats.last_tokens > 0
+    assert capsys.readouterr().out == ""
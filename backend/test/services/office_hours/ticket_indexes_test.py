@@ -0,0 +1,183 @@
+"""Tests that the hot office hours ticket queries are planned with the ticket indexes."""
+
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import func, insert, select, text
+from sqlalchemy.orm import Session
+
+from ....entities.academics.section_member_entity import SectionMemberEntity
+from ....entities.office_hours import OfficeHoursEntity, OfficeHoursTicketEntity
+from ....entities.office_hours.user_created_tickets_table import (
+    user_created_tickets_table,
+)
+from ....models.office_hours.event_type import (
+    OfficeHoursEventModeType,
+    OfficeHoursEventType,
+)
+from ....models.office_hours.ticket_state import TicketState
+from ....models.office_hours.ticket_type import TicketType
+from ....services.office_hours import OfficeHourTicketService, OfficeHoursService
+from ....services.office_hours.live_queue import LiveQueueRegistry
+from ....services.office_hours.similar_tickets_candidates import (
+    SimilarTicketCandidateService,
+)
+
+# Imported fixtures provide dependencies injected for the tests as parameters.
+from .fixtures import oh_ticket_svc, similar_ticket_candidate_svc
+
+# Import the setup_teardown fixture explicitly to load entities in database
+from ..core_data import setup_insert_data_fixture as insert_order_0
+from ..academics.term_data import fake_data_fixture as insert_order_1
+from ..academics.course_data import fake_data_fixture as insert_order_2
+from ..academics.section_data import fake_data_fixture as insert_order_3
+from ..room_data import fake_data_fixture as insert_order_4
+from ..office_hours.office_hours_data import fake_data_fixture as insert_order_5
+
+# Import the fake model data in a namespace for test assertions
+from .. import room_data, user_data
+from ..office_hours import office_hours_data
+from ..query_plan import explain_queries
+
+__authors__ = ["Riley Chapman"]
+__copyright__ = "Copyright 2025"
+__license__ = "MIT"
+
+
+OFFICE_HOURS_ID = office_hours_data.comp_110_current_office_hours.id
+
+SEEDED_EVENTS = 200
+SEEDED_TICKETS_PER_EVENT = 50
+
+TICKET_TABLES = {"office_hours__ticket", "office_hours__user_created_ticket"}
+
+
+@pytest.fixture(autouse=True)
+def seeded_tickets(session: Session):
+    """Seeds a semester of past COMP 301 office hours, nearly all of whose tickets are closed.
+
+    Every seeded event also has one queued ticket, so that open tickets are spread across the
+    table the way they are once several courses share it.
+    """
+    first_event_id = session.scalar(select(func.max(OfficeHoursEntity.id))) + 1
+    first_ticket_id = session.scalar(select(func.max(OfficeHoursTicketEntity.id))) + 1
+    member_ids = session.scalars(select(SectionMemberEntity.id)).all()
+    start = datetime.now() - timedelta(days=120)
+
+    session.execute(
+        insert(OfficeHoursEntity),
+        [
+            {
+                "id": first_event_id + event,
+                "type": OfficeHoursEventType.OFFICE_HOURS,
+                "mode": OfficeHoursEventModeType.IN_PERSON,
+                "description": "Seeded office hours",
+                "location_description": "In the CSXL",
+                "start_time": start + timedelta(hours=event),
+                "end_time": start + timedelta(hours=event + 1),
+                "course_site_id": office_hours_data.comp_301_site.id,
+                "room_id": room_data.group_a.id,
+            }
+            for event in range(SEEDED_EVENTS)
+        ],
+    )
+
+    tickets = []
+    for event in range(SEEDED_EVENTS):
+        for index in range(SEEDED_TICKETS_PER_EVENT):
+            tickets.append(
+                {
+                    "id": first_ticket_id + len(tickets),
+                    "office_hours_id": first_event_id + event,
+                    "type": TicketType.ASSIGNMENT_HELP,
+                    "state": (
+                        TicketState.QUEUED
+                        if index == SEEDED_TICKETS_PER_EVENT - 1
+                        else TicketState.CLOSED
+                    ),
+                    "assignment_section_description": f"Question {index}",
+                    "created_at": start + timedelta(hours=event, seconds=index),
+                    "have_concerns": False,
+                    "caller_notes": "",
+                }
+            )
+    session.execute(insert(OfficeHoursTicketEntity), tickets)
+    session.execute(
+        insert(user_created_tickets_table),
+        [
+            {"ticket_id": ticket["id"], "member_id": member_ids[i % len(member_ids)]}
+            for i, ticket in enumerate(tickets)
+        ],
+    )
+    session.commit()
+    session.execute(text("ANALYZE office_hours__ticket"))
+    session.execute(text("ANALYZE office_hours__user_created_ticket"))
+
+
+def assert_ticket_indexes(plans, *indexes: str):
+    """Asserts that no plan scans the ticket tables sequentially and every index is used."""
+    assert plans
+    for plan in plans:
+        assert not plan.sequential_scans & TICKET_TABLES, plan.statement
+    used = set().union(*(plan.indexes for plan in plans))
+    for index in indexes:
+        assert index in used
+
+
+def test_queue_uses_open_index(session: Session):
+    """The staff queue reads the open tickets of an event with the open ticket index."""
+    oh_svc = OfficeHoursService(session, LiveQueueRegistry())
+    with explain_queries(session) as plans:
+        oh_svc.get_office_hour_queue(user_data.instructor, OFFICE_HOURS_ID)
+    assert_ticket_indexes(plans, "office_hours__ticket_open_idx")
+
+
+def test_get_help_uses_indexes(session: Session):
+    """The get help overview finds the student's ticket and loads the live queue by index."""
+    oh_svc = OfficeHoursService(session, LiveQueueRegistry())
+    with explain_queries(session) as plans:
+        oh_svc.get_office_hour_get_help_overview(user_data.student, OFFICE_HOURS_ID)
+    assert_ticket_indexes(plans, "office_hours__ticket_open_idx")
+
+
+def test_live_queue_rehydrate_uses_open_index(session: Session):
+    """Rehydrating every live queue reads only the open ticket index."""
+    with explain_queries(session) as plans:
+        LiveQueueRegistry().rehydrate(session)
+    assert_ticket_indexes(plans, "office_hours__ticket_open_idx")
+
+
+def test_create_ticket_duplicate_check_uses_indexes(
+    session: Session, oh_ticket_svc: OfficeHourTicketService
+):
+    """Checking for a student's queued ticket reads the open ticket index."""
+    with explain_queries(session) as plans:
+        oh_ticket_svc.create_ticket(user_data.user, office_hours_data.new_ticket)
+    assert_ticket_indexes(plans, "office_hours__ticket_open_idx")
+
+
+def test_member_tickets_use_member_index(session: Session):
+    """Loading the tickets a section member created reads the creator index.
+
+    The seeded members each created a large share of the tickets, so only the association
+    table is required to be read by index.
+    """
+    member = session.scalars(select(SectionMemberEntity)).first()
+    with explain_queries(session) as plans:
+        member.created_oh_tickets
+    (plan,) = plans
+    assert "office_hours__user_created_ticket" not in plan.sequential_scans
+    assert "office_hours__user_created_ticket_member_idx" in plan.indexes
+
+
+def test_similar_ticket_candidates_use_closed_index(
+    session: Session, similar_ticket_candidate_svc: SimilarTicketCandidateService
+):
+    """Candidate tickets are the closed tickets of the course site's events, read by index."""
+    ticket = session.get(
+        OfficeHoursTicketEntity, office_hours_data.comp_110_queued_ticket_1.id
+    )
+    prompt_input = {"concept_help_description": ticket.concept_help_description}
+    with explain_queries(session) as plans:
+        similar_ticket_candidate_svc.select_candidates(ticket, prompt_input)
+    assert_ticket_indexes(plans, "office_hours__ticket_closed_idx")
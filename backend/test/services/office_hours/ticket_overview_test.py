@@ -0,0 +1,158 @@
+"""Tests for the shared office hours ticket overview projection."""
+
+from datetime import datetime, timedelta
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from ....entities.office_hours import OfficeHoursTicketEntity
+from ....entities.office_hours.user_created_tickets_table import (
+    user_created_tickets_table,
+)
+from ....models.office_hours.ticket_state import TicketState
+from ....models.office_hours.ticket_type import TicketType
+from ....services.office_hours import OfficeHourTicketService, OfficeHoursService
+from ....services.office_hours.ticket_overview import (
+    ticket_overview,
+    ticket_overview_query,
+    ticket_overviews,
+)
+
+# Imported fixtures provide dependencies injected for the tests as parameters.
+from .fixtures import oh_svc, oh_ticket_svc
+
+# Import the setup_teardown fixture explicitly to load entities in database
+from ..core_data import setup_insert_data_fixture as insert_order_0
+from ..academics.term_data import fake_data_fixture as insert_order_1
+from ..academics.course_data import fake_data_fixture as insert_order_2
+from ..academics.section_data import fake_data_fixture as insert_order_3
+from ..room_data import fake_data_fixture as insert_order_4
+from ..office_hours.office_hours_data import fake_data_fixture as insert_order_5
+
+# Import the fake model data in a namespace for test assertions
+from .. import user_data
+from ..academics import section_data
+from ..office_hours import office_hours_data
+from ..query_counter import count_queries
+
+__authors__ = ["Riley Chapman"]
+__copyright__ = "Copyright 2025"
+__license__ = "MIT"
+
+
+OFFICE_HOURS_ID = office_hours_data.comp_110_current_office_hours.id
+
+CREATOR_IDS = [
+    section_data.comp110_student_0.id,
+    section_data.comp110_student_1.id,
+    section_data.comp110_uta.id,
+]
+
+
+def add_tickets(session: Session, count: int, state: TicketState) -> list[int]:
+    """Adds tickets opened by every creator, called by the instructor when not queued."""
+    first_id = session.scalar(select(func.max(OfficeHoursTicketEntity.id))) + 1
+    tickets = [
+        OfficeHoursTicketEntity(
+            id=first_id + index,
+            concept_help_description=f"Question {index}",
+            type=TicketType.CONCEPTUAL_HELP,
+            state=state,
+            created_at=datetime.now() + timedelta(seconds=index),
+            caller_id=(
+                section_data.comp110_instructor.id
+                if state != TicketState.QUEUED
+                else None
+            ),
+            office_hours_id=OFFICE_HOURS_ID,
+        )
+        for index in range(count)
+    ]
+    session.add_all(tickets)
+    session.flush()
+    session.execute(
+        user_created_tickets_table.insert(),
+        [
+            {"ticket_id": ticket.id, "member_id": member_id}
+            for ticket in tickets
+            for member_id in CREATOR_IDS
+        ],
+    )
+    session.commit()
+    return [ticket.id for ticket in tickets]
+
+
+def test_overview_includes_creators_and_caller(session: Session):
+    """Ensures the projection fills the creators and caller of a ticket."""
+    ticket_id = office_hours_data.comp_110_called_ticket.id
+    entity = session.get(OfficeHoursTicketEntity, ticket_id)
+    overview = ticket_overview(session, ticket_id)
+
+    assert overview is not None
+    assert overview.state == TicketState.CALLED.to_string()
+    assert overview.creators == [
+        creator.user.to_public_model() for creator in entity.creators
+    ]
+    assert overview.caller is not None
+    assert overview.caller.id == user_data.instructor.id
+    assert overview.caller_id == section_data.comp110_instructor.id
+
+
+def test_overview_creators_follow_membership_order(session: Session):
+    """Ensures tickets with several creators list all of them in a stable order."""
+    [ticket_id] = add_tickets(session, 1, TicketState.QUEUED)
+
+    overview = ticket_overview(session, ticket_id)
+    entity = session.get(OfficeHoursTicketEntity, ticket_id)
+
+    assert overview.caller is None
+    assert len(overview.creators) == len(CREATOR_IDS)
+    assert overview.creators == [
+        creator.user.to_public_model()
+        for creator in sorted(entity.creators, key=lambda creator: creator.id)
+    ]
+
+
+def test_overviews_use_one_statement(session: Session):
+    """Ensures any number of tickets and creators is loaded with one statement."""
+    add_tickets(session, 25, TicketState.CLOSED)
+    query = ticket_overview_query().where(
+        OfficeHoursTicketEntity.office_hours_id == OFFICE_HOURS_ID
+    )
+
+    with count_queries(session) as statements:
+        overviews = ticket_overviews(session, query)
+
+    assert len(overviews) > 25
+    assert len(statements) == 1
+
+
+def test_queue_query_count_is_constant(session: Session, oh_svc: OfficeHoursService):
+    """Ensures the queue issues the same statements for a few or many tickets and creators."""
+    with count_queries(session) as few:
+        oh_svc.get_office_hour_queue(user_data.instructor, OFFICE_HOURS_ID)
+
+    add_tickets(session, 20, TicketState.QUEUED)
+    add_tickets(session, 20, TicketState.CALLED)
+    with count_queries(session) as many:
+        queue = oh_svc.get_office_hour_queue(user_data.instructor, OFFICE_HOURS_ID)
+
+    assert len(queue.queue) >= 20
+    assert all(len(ticket.creators) > 0 for ticket in queue.queue)
+    assert len(many) == len(few)
+
+
+def test_ticket_endpoints_query_count_is_constant(
+    session: Session, oh_ticket_svc: OfficeHourTicketService
+):
+    """Ensures calling a ticket issues the same statements regardless of its creators."""
+    single_creator = office_hours_data.comp_110_queued_ticket_1.id
+    [many_creators] = add_tickets(session, 1, TicketState.QUEUED)
+
+    with count_queries(session) as single:
+        oh_ticket_svc.call_ticket(user_data.instructor, single_creator)
+    with count_queries(session) as many:
+        called = oh_ticket_svc.call_ticket(user_data.instructor, many_creators)
+
+    assert len(called.creators) == len(CREATOR_IDS)
+    assert len(many) == len(single)
@@ -199,6 +199,14 @@ def test_create_ticket(oh_ticket_svc: OfficeHourTicketService):
     assert created.state == TicketState.QUEUED.to_string()
 
 
+def test_create_ticket_enqueues_similar_ticket_precompute(
+    oh_ticket_svc: OfficeHourTicketService,
+):
+    """Ensures that creating a ticket queues the precomputation of its similar tickets."""
+    created = oh_ticket_svc.create_ticket(user_data.user, office_hours_data.new_ticket)
+    oh_ticket_svc._similar_ticket_precompute.enqueue.assert_called_once_with(created.id)
+
+
 def test_create_ticket_with_one_in_queue(oh_ticket_svc: OfficeHourTicketService):
     """Ensures that users can only create one ticket at a time."""
     with pytest.raises(CoursePermissionException):
@@ -218,3 +226,45 @@ def test_create_ticket_not_student(oh_ticket_svc: OfficeHourTicketService):
     with pytest.raises(CoursePermissionException):
         oh_ticket_svc.create_ticket(user_data.instructor, office_hours_data.new_ticket)
         pytest.fail()
+
+
+# Queue Event Tests
+
+
+def test_ticket_changes_publish_queue_events(oh_ticket_svc: OfficeHourTicketService):
+    """Ensures that every committed ticket change is pushed to the queue's subscribers."""
+    created = oh_ticket_svc.create_ticket(user_data.user, office_hours_data.new_ticket)
+    oh_ticket_svc.call_ticket(user_data.instructor, created.id)
+    oh_ticket_svc.close_ticket(
+        user_data.instructor,
+        created.id,
+        OfficeHoursTicketTAResponse(
+            meeting_summary="Walked through nested loops.",
+            solutions_used="Traced the loop by hand.",
+            concepts_for_review="Loops",
+        ),
+    )
+
+    events = [
+        call.args[0] for call in oh_ticket_svc._queue_broker.publish.call_args_list
+    ]
+    assert [(e.type, e.previous_state) for e in events] == [
+        ("ticket_created", None),
+        ("ticket_called", "Queued"),
+        ("ticket_closed", "Called"),
+    ]
+    assert all(e.ticket.id == created.id for e in events)
+    assert all(e.office_hours_id == created.office_hours_id for e in events)
+    assert events[0].creator_ids == [user_data.user.id]
+
+
+def test_cancel_ticket_publishes_queue_event(oh_ticket_svc: OfficeHourTicketService):
+    """Ensures that canceling a ticket is pushed to the queue's subscribers."""
+    oh_ticket_svc.cancel_ticket(
+        user_data.instructor, office_hours_data.comp_110_queued_ticket_1.id
+    )
+
+    event = oh_ticket_svc._queue_broker.publish.call_args.args[0]
+    assert event.type == "ticket_canceled"
+    assert event.previous_state == "Queued"
+    assert event.ticket.state == TicketState.CANCELED.to_string()
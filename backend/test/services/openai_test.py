@@ -0,0 +1,102 @@
+"""Tests for the OpenAI services using the local fake transport."""
+
+import asyncio
+
+import httpx
+import pytest
+from openai import AsyncAzureOpenAI, AzureOpenAI
+
+from ...models.office_hours.similar_tickets_ai import SimilarTicketsAIResponse
+from ...models.openai_test_response import OpenAITestResponse
+from ...services.openai import AsyncOpenAIService, OpenAIService
+from ...services.openai_fake import FakeOpenAITransport
+
+__authors__ = ["Riley Chapman"]
+__copyright__ = "Copyright 2025"
+__license__ = "MIT"
+
+
+class CountingTransport(FakeOpenAITransport):
+    """Fake transport that records the largest number of requests in flight at once."""
+
+    def __init__(self, latency: float):
+        super().__init__(latency)
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            return await super().handle_async_request(request)
+        finally:
+            self.in_flight -= 1
+
+
+def async_openai_svc(
+    transport: FakeOpenAITransport, concurrency: int = 8
+) -> AsyncOpenAIService:
+    """Builds an AsyncOpenAIService whose client talks to `transport`."""
+    client = AsyncAzureOpenAI(
+        api_version="2024-10-21",
+        azure_endpoint="https://openai.test",
+        api_key="test",
+        max_retries=0,
+        http_client=httpx.AsyncClient(transport=transport),
+    )
+    return AsyncOpenAIService(client, asyncio.Semaphore(concurrency))
+
+
+def test_fake_transport_fills_ids_from_prompt():
+    """Ensures the fake transport answers with IDs listed in the user prompt."""
+    client = AzureOpenAI(
+        api_version="2024-10-21",
+        azure_endpoint="https://openai.test",
+        api_key="test",
+        http_client=httpx.Client(transport=FakeOpenAITransport()),
+    )
+    response = OpenAIService(client).prompt(
+        "Find similar tickets.",
+        "Past Tickets:\nID: 4\n---\nID: 9\n---\n",
+        SimilarTicketsAIResponse,
+    )
+    assert response.similar_ticket_ids == [4, 9]
+
+
+def test_async_prompt():
+    """Ensures an awaited prompt is parsed into the response model."""
+    svc = async_openai_svc(FakeOpenAITransport())
+    response = asyncio.run(svc.prompt("system", "Orange", OpenAITestResponse))
+    assert response == OpenAITestResponse(similar_items=["fake"])
+
+
+def test_prompt_many_preserves_order():
+    """Ensures prompt_many returns one response per prompt, in order."""
+    svc = async_openai_svc(FakeOpenAITransport())
+    user_prompts = [f"ID: {ticket_id}" for ticket_id in range(5)]
+
+    responses = asyncio.run(
+        svc.prompt_many("system", user_prompts, SimilarTicketsAIResponse)
+    )
+
+    assert [response.similar_ticket_ids for response in responses] == [
+        [ticket_id] for ticket_id in range(5)
+    ]
+
+
+def test_prompt_many_is_concurrent_and_bounded():
+    """Ensures prompt_many overlaps requests but never exceeds the concurrency limit."""
+    transport = CountingTransport(latency=0.05)
+    svc = async_openai_svc(transport, concurrency=2)
+
+    asyncio.run(svc.prompt_many("system", ["a"] * 6, OpenAITestResponse))
+
+    assert transport.requests == 6
+    assert transport.max_in_flight == 2
+
+
+def test_prompt_timeout():
+    """Ensures a completion slower than its timeout is abandoned."""
+    svc = async_openai_svc(FakeOpenAITransport(latency=1))
+    with pytest.raises(TimeoutError):
+        asyncio.run(svc.prompt("system", "a", OpenAITestResponse, timeout=0.05))
@@ -0,0 +1,178 @@
+"""Tests for the compiled, cached permission engine behind PermissionService."""
+
+import pytest
+from sqlalchemy.orm import Session
+
+from ...models import Permission
+from ...services import PermissionService, RoleService
+from ...services.permission_engine import CompiledPermissions, PermissionEngine
+
+# Data Setup and Injected Service Fixtures
+from .core_data import setup_insert_data_fixture
+from .clock import FakeClock
+from .query_counter import count_queries
+
+# Data Models for Fake Data Inserted in Setup
+from .role_data import ambassador_role
+from .user_data import root, ambassador, user
+from .permission_data import ambassador_permission
+
+__authors__ = ["Riley Chapman"]
+__copyright__ = "Copyright 2025"
+__license__ = "MIT"
+
+
+@pytest.fixture()
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+@pytest.fixture()
+def engine(clock: FakeClock) -> PermissionEngine:
+    return PermissionEngine(ttl=10, clock=clock)
+
+
+@pytest.fixture()
+def permission_svc(session: Session, engine: PermissionEngine) -> PermissionService:
+    return PermissionService(session, engine)
+
+
+@pytest.mark.parametrize(
+    "grant, action, resource",
+    [
+        (("*", "*"), "permission.grant", "checkin"),
+        (("permission.grant", "*"), "permission.revoke", "checkin.*"),
+        (("permission.grant", "checkin*"), "permission.grant", "*"),
+        (("permission.grant", "checkin*"), "permission.grant", "checkin"),
+        (("checkin.delete", "checkin/*"), "checkin.delete", "checkin/12"),
+        (("checkin.delete", "checkin/*"), "checkin.create", "checkin/12"),
+        (("coworking.reservation.*", "*"), "coworking.reservation.read", "user/1"),
+        (
+            ("organization.update", "organization/cssg"),
+            "organizationXupdate",
+            "organization/cssg",
+        ),
+    ],
+)
+def test_compiled_matches_grant_by_grant(
+    permission_svc: PermissionService, grant, action, resource
+):
+    """Compiled grants allow exactly what matching the grants one by one allows."""
+    permission = Permission(action=grant[0], resource=grant[1])
+    compiled = CompiledPermissions([permission])
+    assert compiled.allows(action, resource) == permission_svc._check_permission(
+        permission, action, resource
+    )
+
+
+def test_compiled_combines_grants_of_an_action():
+    """Resource patterns of every grant matching an action are combined."""
+    compiled = CompiledPermissions(
+        [
+            Permission(action="organization.update", resource="organization/cssg"),
+            Permission(action="organization.*", resource="organization/acm"),
+            Permission(action="event.update", resource="organization/*"),
+        ]
+    )
+    assert compiled.allows("organization.update", "organization/cssg")
+    assert compiled.allows("organization.update", "organization/acm")
+    assert compiled.allows("organization.update", "organization/hacknc") is False
+    assert compiled.allows("event.update", "organization/hacknc")
+    assert CompiledPermissions([]).allows("organization.update", "*") is False
+
+
+def test_cached_checks_issue_no_queries(session: Session, permission_svc):
+    """Only the first check of a user reads their grants."""
+    assert permission_svc.check(ambassador, "checkin.create", "checkin")
+    with count_queries(session) as statements:
+        assert permission_svc.check(ambassador, "checkin.create", "checkin")
+        assert permission_svc.check(ambassador, "coworking.reservation.read", "*")
+        assert permission_svc.check(ambassador, "user.delete", "user/1") is False
+        assert permission_svc.get_permissions(ambassador) == [
+            Permission(id=2, action="checkin.create", resource="checkin"),
+            Permission(id=3, action="coworking.reservation.*", resource="*"),
+        ]
+    assert statements == []
+
+
+def test_get_permissions_lists_direct_grants_first(permission_svc):
+    """Direct grants are listed before role grants, as before compiling."""
+    permission_svc.grant(
+        root, ambassador, Permission(action="user.list", resource="user/")
+    )
+    actions = [p.action for p in permission_svc.get_permissions(ambassador)]
+    assert actions == ["user.list", "checkin.create", "coworking.reservation.*"]
+
+
+def test_grant_to_user_invalidates(permission_svc, engine: PermissionEngine):
+    """Granting a permission to a user takes effect on their next check."""
+    assert permission_svc.check(user, "checkin.delete", "checkin") is False
+    permission_svc.grant(root, user, Permission(action="checkin.delete", resource="*"))
+    assert permission_svc.check(user, "checkin.delete", "checkin")
+
+
+def test_grant_to_user_keeps_other_users(permission_svc, engine: PermissionEngine):
+    """Granting a permission to one user keeps the compiled grants of the others."""
+    permission_svc.check(ambassador, "checkin.create", "checkin")
+    permission_svc.check(user, "checkin.create", "checkin")
+    permission_svc.grant(root, user, Permission(action="checkin.delete", resource="*"))
+    assert len(engine) == 2  # root and ambassador remain cached
+
+
+def test_grant_to_role_invalidates_members(permission_svc):
+    """Granting a permission to a role takes effect for its members."""
+    assert permission_svc.check(ambassador, "checkin.delete", "checkin") is False
+    permission_svc.grant(
+        root, ambassador_role, Permission(action="checkin.delete", resource="*")
+    )
+    assert permission_svc.check(ambassador, "checkin.delete", "checkin")
+
+
+def test_revoke_role_permission_invalidates_members(permission_svc):
+    """Revoking a role's permission takes effect for its members."""
+    assert permission_svc.check(ambassador, "checkin.create", "checkin")
+    permission_svc.revoke(root, ambassador_permission)
+    assert permission_svc.check(ambassador, "checkin.create", "checkin") is False
+
+
+def test_role_membership_invalidates(session: Session, permission_svc):
+    """Adding and removing a role member takes effect on the member's next check."""
+    role_svc = RoleService(session, permission_svc)
+    assert permission_svc.check(user, "checkin.create", "checkin") is False
+    role_svc.add_member(root, ambassador_role.id, user)
+    assert permission_svc.check(user, "checkin.create", "checkin")
+    role_svc.remove_member(root, ambassador_role.id, user.id)
+    assert permission_svc.check(user, "checkin.create", "checkin") is False
+
+
+def test_ttl_expiry_reads_changes_of_other_processes(
+    session: Session, engine: PermissionEngine, clock: FakeClock
+):
+    """Grants changed by another process are read once the cached grants expire."""
+    assert (
+        PermissionService(session, engine).check(user, "checkin.create", "checkin")
+        is False
+    )
+    other_process = PermissionService(session, PermissionEngine())
+    other_process.grant(
+        root, user, Permission(action="checkin.create", resource="checkin")
+    )
+    assert (
+        PermissionService(session, engine).check(user, "checkin.create", "checkin")
+        is False
+    )
+    clock.now = 11
+    assert PermissionService(session, engine).check(user, "checkin.create", "checkin")
+
+
+def test_least_recently_used_subjects_are_evicted(session: Session):
+    """The engine keeps at most `max_subjects` users."""
+    engine = PermissionEngine(max_subjects=2)
+    engine.permissions(session, root.id)
+    engine.permissions(session, ambassador.id)
+    engine.permissions(session, root.id)
+    engine.permissions(session, user.id)
+    assert len(engine) == 2
+    with count_queries(session) as statements:
+        engine.permissions(session, root.id)
+    assert statements == []
@@ -0,0 +1,31 @@
+"""Helper for tests asserting how many SQL statements a service issues."""
+
+import contextlib
+from typing import Iterator
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+__authors__ = ["Riley Chapman"]
+__copyright__ = "Copyright 2025"
+__license__ = "MIT"
+
+
+@contextlib.contextmanager
+def count_queries(session: Session) -> Iterator[list[str]]:
+    """Collects the SQL statements executed through a session's engine inside a `with` block.
+
+    Objects already loaded into the session are expunged first, so every count starts cold.
+    """
+    statements: list[str] = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, many):
+        statements.append(statement)
+
+    session.expunge_all()
+    engine = session.get_bind()
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
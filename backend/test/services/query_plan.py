@@ -0,0 +1,64 @@
+"""Helper for tests asserting how PostgreSQL plans the SQL statements a service issues."""
+
+import contextlib
+from dataclasses import dataclass, field
+from typing import Any, Iterator
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+__authors__ = ["Riley Chapman"]
+__copyright__ = "Copyright 2025"
+__license__ = "MIT"
+
+
+@dataclass
+class QueryPlan:
+    """The plan of one SELECT statement, reduced to the tables it reads and how."""
+
+    statement: str
+    sequential_scans: set[str] = field(default_factory=set)
+    """Tables read with a sequential scan."""
+    indexes: set[str] = field(default_factory=set)
+    """Indexes read by index, index-only, or bitmap index scans."""
+
+
+@contextlib.contextmanager
+def explain_queries(session: Session) -> Iterator[list[QueryPlan]]:
+    """Explains the SELECT statements executed through a session's engine inside a `with` block.
+
+    Statements are captured with their parameters and explained once the block exits, so the
+    yielded list is filled in after the `with` statement.
+    """
+    captured: list[tuple[str, Any]] = []
+    plans: list[QueryPlan] = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, many):
+        if statement.lstrip().upper().startswith("SELECT"):
+            captured.append((statement, parameters))
+
+    engine = session.get_bind()
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield plans
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+    connection = session.connection()
+    for statement, parameters in captured:
+        (result,) = connection.exec_driver_sql(
+            f"EXPLAIN (FORMAT JSON) {statement}", parameters
+        ).scalar_one()
+        plan = QueryPlan(statement)
+        _collect_scans(result["Plan"], plan)
+        plans.append(plan)
+
+
+def _collect_scans(node: dict, plan: QueryPlan) -> None:
+    """Records the scans of a plan node and its children."""
+    if node["Node Type"] == "Seq Scan":
+        plan.sequential_scans.add(node["Relation Name"])
+    if "Index Name" in node:
+        plan.indexes.add(node["Index Name"])
+    for child in node.get("Plans", []):
+        _collect_scans(child, plan)
@@ -6,6 +6,10 @@ from sqlalchemy import text, select
 from sqlalchemy.orm import Session
 from ...entities.coworking import ReservationEntity
 from ...models.coworking import Reservation, ReservationState, ReservationRequest
+from ...services.coworking.checkin_leaderboard import (
+    CheckinLeaderboardService,
+    month_of,
+)
 from time import *
 
 from .core_data import user_data
@@ -110,6 +114,9 @@ def insert_fake_data(session: Session):
         entity = ReservationEntity.from_model(model, session)
         session.add(entity)
 
+    # Count the check-ins of reservations inserted as checked out
+    CheckinLeaderboardService(session).rebuild(month_of(now))
+
 
 @pytest.fixture(autouse=True)
 def fake_data_fixture(session: Session):
@@ -0,0 +1,206 @@
+"""Tests for the signage snapshots served to screens from memory."""
+
+import json
+import threading
+
+import pytest
+from sqlalchemy import Engine
+from sqlalchemy.orm import Session
+
+from ...models import SignageOverviewFast, SignageOverviewSlow
+from ...services import SignageService
+from ...services.signage_snapshot import SignageSnapshotService
+from .clock import FakeClock
+from .query_counter import count_queries
+
+# Imported fixtures provide dependencies injected for the tests as parameters.
+from .fixtures import signage_svc
+from .coworking.time import time
+from .coworking.fixtures import *
+
+# Data Setup and Injected Service Fixtures
+from .core_data import setup_insert_data_fixture as insert_order_0
+from .academics.term_data import fake_data_fixture as insert_order_1
+from .academics.course_data import fake_data_fixture as insert_order_2
+from .academics.section_data import fake_data_fixture as insert_order_3
+from .room_data import fake_data_fixture as insert_order_4
+from .coworking.seat_data import fake_data_fixture as insert_order_5
+from .coworking.operating_hours_data import fake_data_fixture as insert_order_6
+from .coworking.reservation.reservation_data import (
+    fake_data_fixture as insert_order_7,
+)
+from .office_hours.office_hours_data import fake_data_fixture as insert_order_8
+from .signage_data import fake_data_fixture as insert_order_9
+from .articles.article_data import fake_data_fixture as insert_order_10
+
+__authors__ = ["Riley Chapman"]
+__copyright__ = "Copyright 2025"
+__license__ = "MIT"
+
+
+@pytest.fixture()
+def clock() -> FakeClock:
+    return FakeClock(100.0)
+
+
+class CountingSessionFactory:
+    """Opens sessions on the test engine, counting the refreshes that asked for one."""
+
+    def __init__(self, engine: Engine):
+        self.engine = engine
+        self.calls = 0
+
+    def __call__(self) -> Session:
+        self.calls += 1
+        return Session(self.engine)
+
+
+@pytest.fixture()
+def sessions(test_engine: Engine) -> CountingSessionFactory:
+    return CountingSessionFactory(test_engine)
+
+
+@pytest.fixture()
+def snapshots(
+    sessions: CountingSessionFactory, clock: FakeClock
+) -> SignageSnapshotService:
+    return SignageSnapshotService(
+        sessions,
+        fast_refresh=0.01,
+        slow_refresh=0.01,
+        clock=clock,
+    )
+
+
+def test_fast_snapshot_matches_service(
+    snapshots: SignageSnapshotService, signage_svc: SignageService
+):
+    fast_data = SignageOverviewFast.model_validate_json(snapshots.get("fast").body)
+    expected = signage_svc.get_fast_data()
+    assert fast_data.active_office_hours == expected.active_office_hours
+    assert fast_data.available_rooms == expected.available_rooms
+    assert sorted(seat.id for seat in fast_data.seat_availability) == sorted(
+        seat.id for seat in expected.seat_availability
+    )
+
+
+def test_slow_snapshot_matches_service(
+    snapshots: SignageSnapshotService, signage_svc: SignageService
+):
+    slow_data = SignageOverviewSlow.model_validate_json(snapshots.get("slow").body)
+    assert slow_data == signage_svc.get_slow_data()
+
+
+def test_polls_are_served_from_memory(
+    snapshots: SignageSnapshotService,
+    sessions: CountingSessionFactory,
+    test_engine: Engine,
+):
+    """Only the first poll computes the data, however many screens poll."""
+    snapshot = snapshots.get("slow")
+    with Session(test_engine) as session, count_queries(session) as queries:
+        for _ in range(20):
+            assert snapshots.get("slow") is snapshot
+    assert queries == []
+    assert sessions.calls == 1
+
+
+def test_concurrent_cold_polls_compute_once(
+    snapshots: SignageSnapshotService, sessions: CountingSessionFactory
+):
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(snapshots.get("fast")))
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(set(map(id, results))) == 1
+    assert sessions.calls == 1
+
+
+def test_etag_is_stable_across_refreshes(snapshots: SignageSnapshotService):
+    """Unchanged data keeps its tag, so that screens and other workers agree on it."""
+    first = snapshots.get("slow")
+    second = snapshots.refresh("slow")
+    assert second is not first
+    assert second.etag == first.etag
+    assert second.etag.startswith('"') and second.etag.endswith('"')
+
+
+def test_response_with_body(snapshots: SignageSnapshotService):
+    snapshot = snapshots.get("slow")
+    response = snapshot.response(None)
+    assert response.status_code == 200
+    assert response.body == snapshot.body
+    assert response.headers["etag"] == snapshot.etag
+    assert response.headers["content-type"] == "application/json"
+    assert json.loads(response.body)["newest_news"]
+
+
+@pytest.mark.parametrize(
+    "if_none_match",
+    ['"{etag}"', 'W/"{etag}"', '"other", "{etag}"', "*"],
+)
+def test_response_not_modified(snapshots: SignageSnapshotService, if_none_match: str):
+    snapshot = snapshots.get("slow")
+    header = if_none_match.format(etag=snapshot.etag.strip('"'))
+    response = snapshot.response(header)
+    assert response.status_code == 304
+    assert response.body == b""
+    assert response.headers["etag"] == snapshot.etag
+
+
+def test_response_with_stale_etag(snapshots: SignageSnapshotService):
+    snapshot = snapshots.get("slow")
+    response = snapshot.response('"stale"')
+    assert response.status_code == 200
+    assert response.body == snapshot.body
+
+
+def test_background_refresh(test_engine: Engine):
+    """The refresh thread computes both kinds and keeps recomputing them."""
+    sessions = CountingSessionFactory(test_engine)
+    snapshots = SignageSnapshotService(sessions, fast_refresh=0.01, slow_refresh=0.01)
+    snapshots.start()
+    try:
+        for _ in range(500):
+            if sessions.calls >= 4:
+                break
+            threading.Event().wait(0.01)
+    finally:
+        snapshots.stop()
+    assert snapshots.current("fast") is not None
+    assert snapshots.current("slow") is not None
+    assert sessions.calls >= 4
+
+
+def test_failed_refresh_keeps_snapshot(test_engine: Engine):
+    """Screens keep being served the last snapshot while the database is unavailable."""
+    available = True
+    attempts = 0
+
+    def session_factory() -> Session:
+        nonlocal attempts
+        attempts += 1
+        if not available:
+            raise ConnectionError("database unavailable")
+        return Session(test_engine)
+
+    snapshots = SignageSnapshotService(
+        session_factory, fast_refresh=0.01, slow_refresh=60
+    )
+    snapshot = snapshots.get("fast")
+    available = False
+    snapshots.start()
+    try:
+        for _ in range(500):
+            if attempts >= 3:
+                break
+            threading.Event().wait(0.01)
+    finally:
+        snapshots.stop()
+    assert attempts >= 3
+    assert snapshots.current("fast") is snapshot
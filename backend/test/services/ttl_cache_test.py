@@ -0,0 +1,79 @@
+"""Tests for the process-local cache with TTL expiry and LRU eviction."""
+
+from ...services.ttl_cache import TTLCache
+from .clock import FakeClock
+
+__authors__ = ["Riley Chapman"]
+__copyright__ = "Copyright 2025"
+__license__ = "MIT"
+
+
+def test_get_loads_once_until_expired():
+    clock = FakeClock()
+    cache: TTLCache[str, int] = TTLCache(ttl=10, max_entries=8, clock=clock)
+    loads = []
+
+    def load() -> int:
+        loads.append(clock.now)
+        return len(loads)
+
+    assert cache.get("key", load) == 1
+    clock.now = 9
+    assert cache.get("key", load) == 1
+    clock.now = 10
+    assert cache.get("key", load) == 2
+    assert loads == [0, 10]
+    assert cache.stats().model_dump() == {"hits": 1, "misses": 2, "entries": 1}
+
+
+def test_put_with_ttl():
+    clock = FakeClock()
+    cache: TTLCache[str, str] = TTLCache(ttl=10, max_entries=8, clock=clock)
+    cache.put("key", "value", ttl=60)
+    clock.now = 59
+    assert cache.lookup("key") == "value"
+    clock.now = 60
+    assert cache.lookup("key") is None
+    assert len(cache) == 0
+
+
+def test_evicts_least_recently_used():
+    cache: TTLCache[str, str] = TTLCache(ttl=60, max_entries=2)
+    cache.put("a", "1")
+    cache.put("b", "2")
+    assert cache.lookup("a") == "1"
+    cache.put("c", "3")
+    assert cache.lookup("b") is None
+    assert cache.lookup("a") == "1"
+    assert cache.lookup("c") == "3"
+
+
+def test_none_is_not_cached():
+    cache: TTLCache[str, str] = TTLCache(ttl=60, max_entries=8)
+    assert cache.get("key", lambda: None) is None
+    assert len(cache) == 0
+
+
+def test_load_racing_invalidation_is_not_cached():
+    """A value loaded while the cache was invalidated may predate the change."""
+    cache: TTLCache[str, str] = TTLCache(ttl=60, max_entries=8)
+
+    def load() -> str:
+        cache.invalidate("other")
+        return "stale"
+
+    assert cache.get("key", load) == "stale"
+    assert cache.lookup("key") is None
+
+
+def test_invalidate_where():
+    cache: TTLCache[tuple[int, int], str] = TTLCache(ttl=60, max_entries=8)
+    cache.put((1, 1), "a")
+    cache.put((1, 2), "b")
+    cache.put((2, 1), "c")
+    cache.invalidate_where(lambda key: key[0] == 1)
+    assert len(cache) == 1
+    assert cache.lookup((2, 1)) == "c"
+
+    cache.clear()
+    assert len(cache) == 0
@@ -0,0 +1,139 @@
+"""Tests for ranking users in searches, in SQL and in memory."""
+
+import pytest
+from sqlalchemy import insert, text
+from sqlalchemy.orm import Session
+
+from ...entities import UserEntity
+from ...services import UserService
+from ...services.user_search import UserSearch, in_memory_search, trigram_search
+from .query_counter import count_queries
+from .query_plan import explain_queries
+
+# Data Setup and Injected Service Fixtures
+from .core_data import setup_insert_data_fixture
+from .fixtures import user_svc_integration
+
+# Data Models for Fake Data Inserted in Setup
+from .user_data import root, ambassador, user, instructor, student
+
+__authors__ = ["Riley Chapman"]
+__copyright__ = "Copyright 2025"
+__license__ = "MIT"
+
+searches = pytest.mark.parametrize("search", [trigram_search, in_memory_search])
+
+
+def ids(session: Session, search: UserSearch, query: str, limit: int = 50):
+    """Returns the IDs of the users matching a query, best matches first."""
+    return [entity.id for entity in search(session, query, limit)]
+
+
+@searches
+def test_prefix_matches_rank_before_substring_matches(
+    session: Session, search: UserSearch
+):
+    """The students' names start with "st", while the others' onyen and name contain it."""
+    assert ids(session, search, "st") == [
+        user.id,
+        student.id,
+        ambassador.id,
+        instructor.id,
+    ]
+
+
+@searches
+def test_pid_match_ranks_first(session: Session, search: UserSearch):
+    """The PID of the new user is a prefix of the ambassador's."""
+    session.add(
+        UserEntity(
+            id=100,
+            pid=88888888,
+            onyen="zulu",
+            email="zulu@unc.edu",
+            first_name="Zed",
+            last_name="Zulu",
+        )
+    )
+    session.commit()
+    assert ids(session, search, "88888888") == [100, ambassador.id]
+
+
+@searches
+def test_query_is_normalized(session: Session, search: UserSearch):
+    assert ids(session, search, "  AMY   ambassador ") == [ambassador.id]
+
+
+@searches
+def test_wildcards_match_literally(session: Session, search: UserSearch):
+    assert ids(session, search, "%") == []
+    assert ids(session, search, "r_o") == []
+    assert ids(session, search, "root\\") == []
+
+
+@searches
+def test_limit(session: Session, search: UserSearch):
+    assert ids(session, search, "@unc.edu", limit=2) == [ambassador.id, instructor.id]
+
+
+def test_trigram_and_in_memory_searches_agree(session: Session):
+    session.execute(
+        insert(UserEntity),
+        [
+            {
+                "id": 100 + index,
+                "pid": 700_000_000 + index * 37,
+                "onyen": f"{first.lower()}{index}",
+                "email": f"{first.lower()}.{last.lower()}{index}@unc.edu",
+                "first_name": first,
+                "last_name": last,
+            }
+            for index, (first, last) in enumerate(
+                (first, last)
+                for first in ["Ana", "Sam", "Robin", "Stella"]
+                for last in ["Smith", "Rosen", "Banner", "Tran"]
+            )
+        ],
+    )
+    session.commit()
+    for query in ["s", "an", "sam ros", "Tran", "ro", "700000", "700000037", "1@"]:
+        assert ids(session, trigram_search, query) == ids(
+            session, in_memory_search, query
+        ), query
+
+
+def test_search_is_one_statement(session: Session, user_svc_integration: UserService):
+    """Users matching the query only in their email are found in the same statement."""
+    with count_queries(session) as queries:
+        assert user_svc_integration.search(root, "amam") == [ambassador]
+    assert len(queries) == 1
+
+
+def test_search_uses_trigram_index(session: Session, user_svc_integration: UserService):
+    available = session.scalar(
+        text("SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm'")
+    )
+    if available is None:
+        pytest.skip("The pg_trgm extension is not available.")
+
+    session.execute(
+        insert(UserEntity),
+        [
+            {
+                "id": 100 + index,
+                "pid": 700_000_000 + index,
+                "onyen": f"person{index}",
+                "email": f"person{index}@unc.edu",
+                "first_name": "Person",
+                "last_name": f"{index}",
+            }
+            for index in range(5000)
+        ],
+    )
+    session.commit()
+    session.execute(text('ANALYZE "user"'))
+
+    with explain_queries(session) as plans:
+        user_svc_integration.search(root, "ambassa")
+    assert all("user" not in plan.sequential_scans for plan in plans)
+    assert "user_search_trgm_idx" in set().union(*(plan.indexes for plan in plans))